@@ -7,6 +7,8 @@ Key Components:
     - Accumulators: Track deductibles, out-of-pocket maximums, and other
       benefit limits across plan years
     - Cost Sharing: Common copay, coinsurance, and deductible application logic
+    - AccumulatorEngine: In-place, integer-cent balances for many members,
+      for replaying claim streams
 
 Example:
     >>> from healthsim.benefits import (
@@ -38,11 +40,16 @@ from healthsim.benefits.accumulators import (
     create_medical_accumulators,
     create_pharmacy_accumulators,
 )
+from healthsim.benefits.engine import AccumulatorEngine, from_cents, to_cents
 
 __all__ = [
     # Core model
     "Accumulator",
     "AccumulatorSet",
+    # In-place engine for claim streams
+    "AccumulatorEngine",
+    "to_cents",
+    "from_cents",
     # Enums
     "AccumulatorType",
     "AccumulatorLevel",
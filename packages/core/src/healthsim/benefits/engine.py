@@ -0,0 +1,372 @@
+"""In-place accumulator engine for claim streams.
+
+AccumulatorSet is immutable: every apply returns a new set of pydantic
+models, which is the right shape for a single member's state but allocates
+heavily when a year of claims is replayed for a whole population.
+
+AccumulatorEngine holds the same balances as integer cents in two flat
+arrays (limit and applied), one slot per accumulator. Each member maps the
+eleven AccumulatorSet fields to slot numbers; family accumulators are keyed
+by family ID, so every member of a family rolls up into the same slot.
+Applying an amount updates the arrays in place and follows the same
+individual/family rules as AccumulatorSet. snapshot() exports a member's
+balances back to an AccumulatorSet.
+
+Example:
+    >>> from decimal import Decimal
+    >>> from healthsim.benefits import AccumulatorEngine, create_medical_accumulators, to_cents
+    >>>
+    >>> engine = AccumulatorEngine()
+    >>> for member_id in ("MEM-001", "MEM-002"):
+    ...     engine.load(
+    ...         create_medical_accumulators(
+    ...             member_id=member_id,
+    ...             plan_year=2024,
+    ...             deductible_individual=Decimal("500"),
+    ...             deductible_family=Decimal("800"),
+    ...             oop_individual=Decimal("3000"),
+    ...             oop_family=Decimal("6000"),
+    ...         ),
+    ...         family_id="FAM-001",
+    ...     )
+    >>> engine.apply_deductible("MEM-001", to_cents(Decimal("400")))
+    40000
+    >>> engine.apply_deductible("MEM-002", to_cents(Decimal("700")))
+    50000
+    >>> engine.is_deductible_met("MEM-001")
+    True
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator
+from datetime import date
+from decimal import ROUND_HALF_UP, Decimal
+
+from healthsim.benefits.accumulators import (
+    Accumulator,
+    AccumulatorLevel,
+    AccumulatorSet,
+    AccumulatorType,
+    BenefitType,
+    NetworkTier,
+)
+
+# AccumulatorSet fields, in slot-route order
+SLOT_FIELDS = (
+    "deductible_individual_in",
+    "deductible_individual_out",
+    "deductible_family_in",
+    "deductible_family_out",
+    "oop_individual_in",
+    "oop_individual_out",
+    "oop_family_in",
+    "oop_family_out",
+    "rx_deductible",
+    "rx_oop",
+    "specialty_oop",
+)
+(
+    _DED_IND_IN,
+    _DED_IND_OUT,
+    _DED_FAM_IN,
+    _DED_FAM_OUT,
+    _OOP_IND_IN,
+    _OOP_IND_OUT,
+    _OOP_FAM_IN,
+    _OOP_FAM_OUT,
+    _RX_DED,
+    _RX_OOP,
+    _SPECIALTY_OOP,
+) = range(len(SLOT_FIELDS))
+
+_FAMILY_FIELDS = frozenset({_DED_FAM_IN, _DED_FAM_OUT, _OOP_FAM_IN, _OOP_FAM_OUT})
+
+_IN_NETWORK = frozenset(
+    {
+        NetworkTier.IN_NETWORK,
+        NetworkTier.TIER_1,
+        NetworkTier.TIER_2,
+        NetworkTier.PREFERRED_PHARMACY,
+        NetworkTier.MAIL_ORDER,
+    }
+)
+
+_NO_SLOT = -1
+_CENT = Decimal("0.01")
+
+
+def to_cents(amount: Decimal) -> int:
+    """Convert a dollar amount to integer cents, rounding half up."""
+    return int(amount.quantize(_CENT, rounding=ROUND_HALF_UP).scaleb(2))
+
+
+def from_cents(cents: int) -> Decimal:
+    """Convert integer cents to a dollar amount with two decimal places."""
+    return Decimal(cents).scaleb(-2)
+
+
+class AccumulatorEngine:
+    """Mutable accumulator balances for many members, in integer cents.
+
+    Attributes:
+        limits: Limit of each slot, in cents
+        applied: Amount applied to each slot, in cents
+    """
+
+    def __init__(self) -> None:
+        self.limits: array = array("q")
+        self.applied: array = array("q")
+        self._meta: list[tuple[AccumulatorType, AccumulatorLevel, NetworkTier, BenefitType]] = []
+        self._routes: dict[str, array] = {}
+        self._plan_years: dict[str, int] = {}
+        self._family_slots: dict[tuple[str, int], int] = {}
+
+    # =========================================================================
+    # Loading and export
+    # =========================================================================
+
+    def load(self, acc_set: AccumulatorSet, family_id: str | None = None) -> None:
+        """Add a member's accumulators.
+
+        Family accumulators are shared by every member loaded with the same
+        family_id; the first member loaded sets their limit and applied
+        amount. Loading a member again replaces its individual balances.
+
+        Args:
+            acc_set: The member's accumulator set
+            family_id: Family (subscriber) the member belongs to; without it
+                the member's family accumulators are its own
+        """
+        route = array("q", [_NO_SLOT]) * len(SLOT_FIELDS)
+        for field_index, field_name in enumerate(SLOT_FIELDS):
+            acc: Accumulator | None = getattr(acc_set, field_name)
+            if acc is None:
+                continue
+            if family_id is not None and field_index in _FAMILY_FIELDS:
+                key = (family_id, field_index)
+                slot = self._family_slots.get(key)
+                if slot is None:
+                    slot = self._family_slots[key] = self._add_slot(acc)
+            else:
+                slot = self._add_slot(acc)
+            route[field_index] = slot
+        self._routes[acc_set.member_id] = route
+        self._plan_years[acc_set.member_id] = acc_set.plan_year
+
+    def _add_slot(self, acc: Accumulator) -> int:
+        self.limits.append(to_cents(acc.limit))
+        self.applied.append(to_cents(acc.applied))
+        self._meta.append((acc.accumulator_type, acc.level, acc.network_tier, acc.benefit_type))
+        return len(self._meta) - 1
+
+    def snapshot(self, member_id: str) -> AccumulatorSet:
+        """Export a member's current balances as an AccumulatorSet.
+
+        Args:
+            member_id: Member identifier
+
+        Returns:
+            AccumulatorSet with the member's individual and family accumulators
+        """
+        route = self._routes[member_id]
+        plan_year = self._plan_years[member_id]
+        today = date.today()
+        fields: dict = {}
+        for field_index, slot in enumerate(route):
+            if slot == _NO_SLOT:
+                continue
+            accumulator_type, level, network_tier, benefit_type = self._meta[slot]
+            fields[SLOT_FIELDS[field_index]] = Accumulator(
+                accumulator_type=accumulator_type,
+                level=level,
+                network_tier=network_tier,
+                benefit_type=benefit_type,
+                limit=from_cents(self.limits[slot]),
+                applied=from_cents(self.applied[slot]),
+                plan_year=plan_year,
+                last_updated=today,
+            )
+        return AccumulatorSet(member_id=member_id, plan_year=plan_year, **fields)
+
+    def export(self) -> Iterator[AccumulatorSet]:
+        """Snapshot every member, in load order."""
+        for member_id in self._routes:
+            yield self.snapshot(member_id)
+
+    def reset(self, new_plan_year: int | None = None) -> None:
+        """Zero every applied amount for a new plan year.
+
+        Args:
+            new_plan_year: New plan year (defaults to each member's current + 1)
+        """
+        self.applied = array("q", bytes(self.applied.itemsize * len(self.applied)))
+        for member_id, plan_year in self._plan_years.items():
+            self._plan_years[member_id] = new_plan_year or plan_year + 1
+
+    def __contains__(self, member_id: object) -> bool:
+        return member_id in self._routes
+
+    def __len__(self) -> int:
+        return len(self._routes)
+
+    # =========================================================================
+    # Apply (in place)
+    # =========================================================================
+
+    def apply_deductible(
+        self,
+        member_id: str,
+        cents: int,
+        network: NetworkTier = NetworkTier.IN_NETWORK,
+        benefit_type: BenefitType = BenefitType.COMBINED,
+    ) -> int:
+        """Apply an amount to the member's deductible.
+
+        Same rules as AccumulatorSet.apply_to_deductible: a carved-out
+        pharmacy deductible takes pharmacy amounts; otherwise the amount
+        goes to the individual accumulator and rolls up to the family one,
+        and nothing applies once the family deductible is met.
+
+        Args:
+            member_id: Member identifier
+            cents: Amount to apply, in cents
+            network: Network tier for the service
+            benefit_type: Type of benefit (medical, pharmacy, combined)
+
+        Returns:
+            Amount actually applied, in cents
+        """
+        route = self._routes[member_id]
+        if benefit_type == BenefitType.PHARMACY and route[_RX_DED] != _NO_SLOT:
+            return self._apply_slot(route[_RX_DED], cents)
+        if network in _IN_NETWORK:
+            return self._apply_pair(route[_DED_IND_IN], route[_DED_FAM_IN], cents)
+        return self._apply_pair(route[_DED_IND_OUT], route[_DED_FAM_OUT], cents)
+
+    def apply_oop(
+        self,
+        member_id: str,
+        cents: int,
+        network: NetworkTier = NetworkTier.IN_NETWORK,
+        benefit_type: BenefitType = BenefitType.COMBINED,
+    ) -> int:
+        """Apply an amount to the member's out-of-pocket maximum.
+
+        Same rules as AccumulatorSet.apply_to_oop.
+
+        Returns:
+            Amount actually applied, in cents
+        """
+        route = self._routes[member_id]
+        if benefit_type == BenefitType.PHARMACY and route[_RX_OOP] != _NO_SLOT:
+            return self._apply_slot(route[_RX_OOP], cents)
+        if network in _IN_NETWORK:
+            return self._apply_pair(route[_OOP_IND_IN], route[_OOP_FAM_IN], cents)
+        return self._apply_pair(route[_OOP_IND_OUT], route[_OOP_FAM_OUT], cents)
+
+    def apply_specialty_oop(self, member_id: str, cents: int) -> int:
+        """Apply an amount to the member's specialty drug OOP, if it has one.
+
+        Returns:
+            Amount actually applied, in cents
+        """
+        slot = self._routes[member_id][_SPECIALTY_OOP]
+        if slot == _NO_SLOT:
+            return 0
+        return self._apply_slot(slot, cents)
+
+    def _apply_slot(self, slot: int, cents: int) -> int:
+        taken = min(cents, max(0, self.limits[slot] - self.applied[slot]))
+        self.applied[slot] += taken
+        return taken
+
+    def _apply_pair(self, individual: int, family: int, cents: int) -> int:
+        limits = self.limits
+        applied = self.applied
+        if family != _NO_SLOT and applied[family] >= limits[family]:
+            return 0
+        taken = 0
+        if individual != _NO_SLOT and applied[individual] < limits[individual]:
+            taken = min(cents, limits[individual] - applied[individual])
+            applied[individual] += taken
+        if family != _NO_SLOT and taken > 0:
+            applied[family] += min(taken, limits[family] - applied[family])
+        return taken
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def deductible_remaining(
+        self,
+        member_id: str,
+        network: NetworkTier = NetworkTier.IN_NETWORK,
+        benefit_type: BenefitType = BenefitType.COMBINED,
+    ) -> int:
+        """Remaining deductible in cents, as AccumulatorSet.get_deductible_remaining."""
+        route = self._routes[member_id]
+        if benefit_type == BenefitType.PHARMACY and route[_RX_DED] != _NO_SLOT:
+            return self._remaining(route[_RX_DED])
+        if network in _IN_NETWORK:
+            return self._pair_remaining(route[_DED_IND_IN], route[_DED_FAM_IN])
+        return self._pair_remaining(route[_DED_IND_OUT], route[_DED_FAM_OUT])
+
+    def oop_remaining(
+        self,
+        member_id: str,
+        network: NetworkTier = NetworkTier.IN_NETWORK,
+        benefit_type: BenefitType = BenefitType.COMBINED,
+    ) -> int:
+        """Remaining out-of-pocket in cents, as AccumulatorSet.get_oop_remaining."""
+        route = self._routes[member_id]
+        if benefit_type == BenefitType.PHARMACY and route[_RX_OOP] != _NO_SLOT:
+            return self._remaining(route[_RX_OOP])
+        if network in _IN_NETWORK:
+            return self._pair_remaining(route[_OOP_IND_IN], route[_OOP_FAM_IN])
+        return self._pair_remaining(route[_OOP_IND_OUT], route[_OOP_FAM_OUT])
+
+    def is_deductible_met(
+        self,
+        member_id: str,
+        network: NetworkTier = NetworkTier.IN_NETWORK,
+        benefit_type: BenefitType = BenefitType.COMBINED,
+    ) -> bool:
+        """Whether the deductible is met, as AccumulatorSet.is_deductible_met."""
+        route = self._routes[member_id]
+        if benefit_type == BenefitType.PHARMACY and route[_RX_DED] != _NO_SLOT:
+            return self._met(route[_RX_DED])
+        if network in _IN_NETWORK:
+            return self._pair_met(route[_DED_IND_IN], route[_DED_FAM_IN])
+        return self._pair_met(route[_DED_IND_OUT], route[_DED_FAM_OUT])
+
+    def is_oop_met(
+        self,
+        member_id: str,
+        network: NetworkTier = NetworkTier.IN_NETWORK,
+        benefit_type: BenefitType = BenefitType.COMBINED,
+    ) -> bool:
+        """Whether the OOP maximum is met, as AccumulatorSet.is_oop_met."""
+        route = self._routes[member_id]
+        if benefit_type == BenefitType.PHARMACY and route[_RX_OOP] != _NO_SLOT:
+            return self._met(route[_RX_OOP])
+        if network in _IN_NETWORK:
+            return self._pair_met(route[_OOP_IND_IN], route[_OOP_FAM_IN])
+        return self._pair_met(route[_OOP_IND_OUT], route[_OOP_FAM_OUT])
+
+    def _remaining(self, slot: int) -> int:
+        return max(0, self.limits[slot] - self.applied[slot])
+
+    def _met(self, slot: int) -> bool:
+        return self.applied[slot] >= self.limits[slot]
+
+    def _pair_remaining(self, individual: int, family: int) -> int:
+        if family != _NO_SLOT and self._met(family):
+            return 0
+        return self._remaining(individual) if individual != _NO_SLOT else 0
+
+    def _pair_met(self, individual: int, family: int) -> bool:
+        if family != _NO_SLOT and self._met(family):
+            return True
+        return self._met(individual) if individual != _NO_SLOT else False
@@ -12,6 +12,9 @@ Usage:
     # Import all reference data
     results = import_all_reference_data(conn)
     
+    # Re-runs skip tables whose source CSV is unchanged
+    results = import_all_reference_data(conn)
+    
     # Check what's loaded
     status = get_reference_status(conn)
 """
@@ -32,6 +35,14 @@ from .populationsim import (
     get_populationsim_data_path,
 )
 
+from .staging import (
+    import_reference_data_staged,
+    get_import_manifest,
+    ImportResult,
+    ReferenceDataset,
+    REFERENCE_DATASETS,
+)
+
 __all__ = [
     # Main functions
     "import_all_reference_data",
@@ -45,4 +56,10 @@ __all__ = [
     "import_svi_county",
     "import_adi_blockgroup",
     "get_populationsim_data_path",
+    # Staged import pipeline
+    "import_reference_data_staged",
+    "get_import_manifest",
+    "ImportResult",
+    "ReferenceDataset",
+    "REFERENCE_DATASETS",
 ]
@@ -4,16 +4,14 @@ Reference data loader utilities.
 Provides functions to import all reference data and check loading status.
 """
 
-from typing import Dict, Any
+import logging
+from pathlib import Path
+from typing import Dict, Any, Optional
 import duckdb
 
-from .populationsim import (
-    import_places_tract,
-    import_places_county,
-    import_svi_tract,
-    import_svi_county,
-    import_adi_blockgroup,
-)
+from .staging import import_reference_data_staged
+
+logger = logging.getLogger(__name__)
 
 
 # List of all reference tables with their expected minimum row counts
@@ -29,41 +27,50 @@ REFERENCE_TABLES = {
 def import_all_reference_data(
     conn: duckdb.DuckDBPyConnection,
     replace: bool = False,
-    verbose: bool = True
+    verbose: bool = True,
+    staging_dir: Optional[Path] = None,
+    max_workers: Optional[int] = None,
 ) -> Dict[str, int]:
     """
     Import all PopulationSim reference datasets.
     
+    CSVs are staged as typed Parquet and loaded concurrently; tables whose
+    source hash matches the import manifest are skipped (see staging.py).
+    
     Args:
         conn: Database connection
-        replace: If True, drop and recreate all tables; if False, skip existing
-        verbose: If True, print progress messages
+        replace: If True, reload all tables; if False, skip tables that are current
+        verbose: If True, log progress at INFO level (DEBUG otherwise)
+        staging_dir: Parquet staging directory (uses default if not specified)
+        max_workers: Concurrent table loads (defaults to one per table)
         
     Returns:
-        Dict mapping table names to row counts
+        Dict mapping table names to row counts (-1 on error)
     """
-    results = {}
+    logger.info("Importing reference tables")
     
-    importers = [
-        ("ref_places_tract", import_places_tract),
-        ("ref_places_county", import_places_county),
-        ("ref_svi_tract", import_svi_tract),
-        ("ref_svi_county", import_svi_county),
-        ("ref_adi_blockgroup", import_adi_blockgroup),
-    ]
+    staged = import_reference_data_staged(
+        conn,
+        staging_dir=staging_dir,
+        max_workers=max_workers,
+        force=replace,
+    )
     
-    for table_name, importer in importers:
-        if verbose:
-            print(f"  Importing {table_name}...", end=" ", flush=True)
-        try:
-            count = importer(conn, replace=replace)
-            results[table_name] = count
-            if verbose:
-                print(f"{count:,} rows")
-        except Exception as e:
-            results[table_name] = -1
-            if verbose:
-                print(f"ERROR: {e}")
+    log = logger.info if verbose else logger.debug
+    results = {}
+    for table_name, result in staged.items():
+        results[table_name] = result.row_count if result.error is None else -1
+        if result.error is not None:
+            logger.error("%s: %s", table_name, result.error)
+        elif result.skipped:
+            log("%s: %s rows (unchanged, skipped)", table_name, f"{result.row_count:,}")
+        else:
+            log(
+                "%s: %s rows (%s ms)",
+                table_name,
+                f"{result.row_count:,}",
+                f"{result.duration_ms:,}",
+            )
     
     return results
 
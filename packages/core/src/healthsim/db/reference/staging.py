@@ -0,0 +1,397 @@
+"""
+Staged, parallel PopulationSim reference import.
+
+Each source CSV is converted once to a typed Parquet file named after its
+content hash, then the Parquet files are loaded into DuckDB concurrently
+(one cursor per table). Every load is recorded in the
+``reference_import_manifest`` system table, so re-running the import with
+unchanged sources is a no-op.
+
+Usage:
+    from healthsim.db.reference.staging import import_reference_data_staged
+
+    results = import_reference_data_staged(conn)
+    for table_name, result in results.items():
+        print(table_name, result.row_count, "skipped" if result.skipped else "loaded")
+"""
+
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import duckdb
+
+from ..schema import REFERENCE_IMPORT_MANIFEST_DDL
+from .populationsim import get_populationsim_data_path
+
+# Parquet staging files live outside the repo so they survive checkouts
+DEFAULT_STAGING_DIR = Path.home() / ".healthsim" / "cache" / "reference"
+
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+@dataclass(frozen=True)
+class ReferenceDataset:
+    """Specification of one reference CSV and the table it loads into.
+
+    Attributes:
+        table_name: Target DuckDB table.
+        relative_path: CSV location relative to the PopulationSim data directory.
+        column_types: Explicit types for identifier and code columns (normalized
+            names). FIPS codes must stay VARCHAR to keep their leading zeros.
+        indexes: (index suffix, column, unique) tuples created after the load.
+    """
+    table_name: str
+    relative_path: str
+    column_types: Dict[str, str] = field(default_factory=dict)
+    indexes: Tuple[Tuple[str, str, bool], ...] = ()
+
+
+_PLACES_TEXT_COLUMNS = {
+    "stateabbr": "VARCHAR",
+    "statedesc": "VARCHAR",
+    "countyname": "VARCHAR",
+    "countyfips": "VARCHAR",
+}
+
+_SVI_TEXT_COLUMNS = {
+    "st": "VARCHAR",
+    "state": "VARCHAR",
+    "st_abbr": "VARCHAR",
+    "stcnty": "VARCHAR",
+    "county": "VARCHAR",
+    "fips": "VARCHAR",
+    "location": "VARCHAR",
+}
+
+REFERENCE_DATASETS: Dict[str, ReferenceDataset] = {
+    "ref_places_tract": ReferenceDataset(
+        table_name="ref_places_tract",
+        relative_path="tract/places_tract_2024.csv",
+        column_types={**_PLACES_TEXT_COLUMNS, "tractfips": "VARCHAR"},
+        indexes=(("pk", "tractfips", True), ("county", "countyfips", False),
+                 ("state", "stateabbr", False)),
+    ),
+    "ref_places_county": ReferenceDataset(
+        table_name="ref_places_county",
+        relative_path="county/places_county_2024.csv",
+        column_types=dict(_PLACES_TEXT_COLUMNS),
+        indexes=(("pk", "countyfips", True), ("state", "stateabbr", False)),
+    ),
+    "ref_svi_tract": ReferenceDataset(
+        table_name="ref_svi_tract",
+        relative_path="tract/svi_tract_2022.csv",
+        column_types=dict(_SVI_TEXT_COLUMNS),
+        indexes=(("pk", "fips", True), ("county", "stcnty", False),
+                 ("state", "st_abbr", False)),
+    ),
+    "ref_svi_county": ReferenceDataset(
+        table_name="ref_svi_county",
+        relative_path="county/svi_county_2022.csv",
+        column_types=dict(_SVI_TEXT_COLUMNS),
+        indexes=(("pk", "stcnty", True), ("state", "st_abbr", False)),
+    ),
+    "ref_adi_blockgroup": ReferenceDataset(
+        table_name="ref_adi_blockgroup",
+        relative_path="block_group/adi_blockgroup_2023.csv",
+        # ADI ranks carry suppression codes (GQ, PH, GQ-PH, QDI)
+        column_types={
+            "gisjoin": "VARCHAR",
+            "fips": "VARCHAR",
+            "adi_natrank": "VARCHAR",
+            "adi_staternk": "VARCHAR",
+        },
+        indexes=(("pk", "fips", True),),
+    ),
+}
+
+
+@dataclass
+class ImportResult:
+    """Outcome of importing one reference table."""
+    table_name: str
+    row_count: int = -1
+    skipped: bool = False
+    source_sha256: Optional[str] = None
+    parquet_path: Optional[str] = None
+    duration_ms: int = 0
+    error: Optional[str] = None
+
+
+def file_sha256(path: Path) -> str:
+    """Compute the SHA-256 hex digest of a file, streaming in 1 MiB chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def ensure_manifest_table(conn: duckdb.DuckDBPyConnection) -> None:
+    """Create the reference_import_manifest table if it doesn't exist."""
+    conn.execute(REFERENCE_IMPORT_MANIFEST_DDL)
+
+
+def get_import_manifest(conn: duckdb.DuckDBPyConnection) -> Dict[str, Dict[str, Any]]:
+    """
+    Get the recorded import manifest for all reference tables.
+
+    Returns:
+        Dict mapping table names to their manifest entries
+    """
+    ensure_manifest_table(conn)
+    rows = conn.execute("""
+        SELECT table_name, source_path, source_sha256, source_size, source_mtime,
+               parquet_path, row_count, column_schema, duration_ms, imported_at
+        FROM reference_import_manifest
+    """).fetchall()
+    columns = [
+        "table_name", "source_path", "source_sha256", "source_size", "source_mtime",
+        "parquet_path", "row_count", "column_schema", "duration_ms", "imported_at",
+    ]
+    manifest = {}
+    for row in rows:
+        entry = dict(zip(columns, row, strict=True))
+        if entry["column_schema"]:
+            entry["column_schema"] = json.loads(entry["column_schema"])
+        manifest[entry["table_name"]] = entry
+    return manifest
+
+
+def stage_csv_to_parquet(
+    dataset: ReferenceDataset,
+    csv_path: Path,
+    staging_dir: Path,
+    source_sha256: str,
+) -> Path:
+    """
+    Convert a reference CSV to a typed Parquet file.
+
+    The file is named after the content hash, so an existing staging file
+    for the same source is reused as-is.
+
+    Args:
+        dataset: Dataset specification
+        csv_path: Source CSV
+        staging_dir: Directory holding Parquet staging files
+        source_sha256: Content hash of the CSV
+
+    Returns:
+        Path to the Parquet file
+    """
+    staging_dir.mkdir(parents=True, exist_ok=True)
+    parquet_path = staging_dir / f"{dataset.table_name}-{source_sha256[:16]}.parquet"
+    if parquet_path.exists():
+        return parquet_path
+
+    tmp_path = parquet_path.with_suffix(f".parquet.{os.getpid()}.tmp")
+    types_sql = "{" + ", ".join(
+        f"'{column}': '{col_type}'" for column, col_type in dataset.column_types.items()
+    ) + "}"
+
+    # Separate in-memory connection: conversion never touches the target database.
+    # Undeclared measure columns are typed from the full file (sample_size=-1),
+    # then pinned by the Parquet schema for every later load.
+    staging_conn = duckdb.connect()
+    try:
+        staging_conn.execute(f"""
+            COPY (
+                SELECT * FROM read_csv('{csv_path}', header=true, normalize_names=true,
+                                       sample_size=-1, types={types_sql})
+            ) TO '{tmp_path}' (FORMAT PARQUET, COMPRESSION ZSTD)
+        """)
+    finally:
+        staging_conn.close()
+
+    os.replace(tmp_path, parquet_path)
+    return parquet_path
+
+
+def _table_row_count(conn: duckdb.DuckDBPyConnection, table_name: str) -> Optional[int]:
+    """Get row count for a table, or None if it doesn't exist."""
+    exists = conn.execute(
+        "SELECT count(*) FROM information_schema.tables WHERE table_name = ?",
+        [table_name],
+    ).fetchone()[0]
+    if not exists:
+        return None
+    return conn.execute(f"SELECT count(*) FROM {table_name}").fetchone()[0]
+
+
+def _load_parquet(
+    cursor: duckdb.DuckDBPyConnection,
+    dataset: ReferenceDataset,
+    parquet_path: Path,
+) -> Tuple[int, Dict[str, str]]:
+    """Replace a reference table from its Parquet staging file and index it."""
+    table_name = dataset.table_name
+    cursor.execute("BEGIN TRANSACTION")
+    try:
+        cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
+        cursor.execute(f"CREATE TABLE {table_name} AS SELECT * FROM read_parquet('{parquet_path}')")
+        for suffix, column, unique in dataset.indexes:
+            unique_sql = "UNIQUE " if unique else ""
+            cursor.execute(
+                f"CREATE {unique_sql}INDEX IF NOT EXISTS idx_{table_name}_{suffix} "
+                f"ON {table_name}({column})"
+            )
+        cursor.execute("COMMIT")
+    except Exception:
+        cursor.execute("ROLLBACK")
+        raise
+
+    row_count = cursor.execute(f"SELECT count(*) FROM {table_name}").fetchone()[0]
+    column_schema = {
+        name: col_type
+        for name, col_type in cursor.execute(
+            "SELECT column_name, data_type FROM information_schema.columns "
+            "WHERE table_name = ? ORDER BY ordinal_position",
+            [table_name],
+        ).fetchall()
+    }
+    return row_count, column_schema
+
+
+def _import_one(
+    cursor: duckdb.DuckDBPyConnection,
+    dataset: ReferenceDataset,
+    csv_path: Path,
+    staging_dir: Path,
+    previous: Optional[Dict[str, Any]],
+    force: bool,
+) -> Tuple[ImportResult, Optional[Dict[str, Any]]]:
+    """Import one dataset on its own cursor; returns the result and a manifest row."""
+    start = time.perf_counter()
+    result = ImportResult(table_name=dataset.table_name)
+    try:
+        if not csv_path.exists():
+            raise FileNotFoundError(f"CSV file not found: {csv_path}")
+
+        stat = csv_path.stat()
+        # Unchanged size and mtime: trust the recorded hash instead of rereading the CSV
+        if (
+            previous
+            and previous["source_path"] == str(csv_path)
+            and previous["source_size"] == stat.st_size
+            and previous["source_mtime"] == stat.st_mtime
+        ):
+            source_sha256 = previous["source_sha256"]
+        else:
+            source_sha256 = file_sha256(csv_path)
+        result.source_sha256 = source_sha256
+
+        current_rows = _table_row_count(cursor, dataset.table_name)
+        if (
+            not force
+            and previous
+            and previous["source_sha256"] == source_sha256
+            and current_rows is not None
+            and current_rows == previous["row_count"]
+        ):
+            result.row_count = current_rows
+            result.skipped = True
+            result.parquet_path = previous["parquet_path"]
+            return result, None
+
+        parquet_path = stage_csv_to_parquet(dataset, csv_path, staging_dir, source_sha256)
+        row_count, column_schema = _load_parquet(cursor, dataset, parquet_path)
+
+        result.row_count = row_count
+        result.parquet_path = str(parquet_path)
+        result.duration_ms = int((time.perf_counter() - start) * 1000)
+        manifest_row = {
+            "table_name": dataset.table_name,
+            "source_path": str(csv_path),
+            "source_sha256": source_sha256,
+            "source_size": stat.st_size,
+            "source_mtime": stat.st_mtime,
+            "parquet_path": str(parquet_path),
+            "row_count": row_count,
+            "column_schema": json.dumps(column_schema),
+            "duration_ms": result.duration_ms,
+        }
+        return result, manifest_row
+    except Exception as e:
+        result.error = str(e)
+        result.duration_ms = int((time.perf_counter() - start) * 1000)
+        return result, None
+    finally:
+        cursor.close()
+
+
+def import_reference_data_staged(
+    conn: duckdb.DuckDBPyConnection,
+    tables: Optional[List[str]] = None,
+    data_path: Optional[Path] = None,
+    staging_dir: Optional[Path] = None,
+    max_workers: Optional[int] = None,
+    force: bool = False,
+) -> Dict[str, ImportResult]:
+    """
+    Import reference datasets through the Parquet staging pipeline.
+
+    Tables whose source hash matches the manifest (and whose row count is
+    intact) are skipped. Remaining tables are staged and loaded concurrently,
+    each on its own DuckDB cursor.
+
+    Args:
+        conn: Database connection
+        tables: Table names to import (defaults to all REFERENCE_DATASETS)
+        data_path: PopulationSim data directory (uses default if not specified)
+        staging_dir: Parquet staging directory (defaults to DEFAULT_STAGING_DIR)
+        max_workers: Concurrent table loads (defaults to one per table)
+        force: If True, reload even when the manifest says the table is current
+
+    Returns:
+        Dict mapping table names to ImportResult
+    """
+    table_names = tables or list(REFERENCE_DATASETS)
+    unknown = [t for t in table_names if t not in REFERENCE_DATASETS]
+    if unknown:
+        raise ValueError(f"Unknown reference tables: {', '.join(unknown)}")
+
+    data_path = data_path or get_populationsim_data_path()
+    staging_dir = staging_dir or DEFAULT_STAGING_DIR
+    manifest = get_import_manifest(conn)
+
+    jobs = []
+    for table_name in table_names:
+        dataset = REFERENCE_DATASETS[table_name]
+        jobs.append((
+            conn.cursor(),
+            dataset,
+            data_path / dataset.relative_path,
+            staging_dir,
+            manifest.get(table_name),
+            force,
+        ))
+
+    with ThreadPoolExecutor(max_workers=max_workers or len(jobs) or 1) as executor:
+        outcomes = list(executor.map(lambda job: _import_one(*job), jobs))
+
+    results = {}
+    for result, manifest_row in outcomes:
+        results[result.table_name] = result
+        if manifest_row is not None:
+            conn.execute("""
+                INSERT OR REPLACE INTO reference_import_manifest
+                    (table_name, source_path, source_sha256, source_size, source_mtime,
+                     parquet_path, row_count, column_schema, duration_ms, imported_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            """, [
+                manifest_row["table_name"],
+                manifest_row["source_path"],
+                manifest_row["source_sha256"],
+                manifest_row["source_size"],
+                manifest_row["source_mtime"],
+                manifest_row["parquet_path"],
+                manifest_row["row_count"],
+                manifest_row["column_schema"],
+                manifest_row["duration_ms"],
+            ])
+    return results
@@ -33,6 +33,21 @@ CREATE TABLE IF NOT EXISTS schema_migrations (
 );
 """
 
+REFERENCE_IMPORT_MANIFEST_DDL = """
+CREATE TABLE IF NOT EXISTS reference_import_manifest (
+    table_name      VARCHAR PRIMARY KEY,
+    source_path     VARCHAR NOT NULL,
+    source_sha256   VARCHAR NOT NULL,   -- Content hash of the source CSV
+    source_size     BIGINT,
+    source_mtime    DOUBLE,
+    parquet_path    VARCHAR,            -- Typed Parquet staging file
+    row_count       BIGINT,
+    column_schema   JSON,               -- {column: type} of the loaded table
+    duration_ms     INTEGER,
+    imported_at     TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
 # ============================================================================
 # STATE MANAGEMENT TABLES  
 # ============================================================================
@@ -613,6 +628,7 @@ CREATE INDEX IF NOT EXISTS idx_cohort_tags_tag ON cohort_tags(tag);
 ALL_DDL = [
     # System tables
     SCHEMA_MIGRATIONS_DDL,
+    REFERENCE_IMPORT_MANIFEST_DDL,
     
     # Sequences (must be created before tables that reference them)
     COHORT_ENTITIES_SEQ_DDL,
@@ -698,4 +714,4 @@ def get_state_tables() -> List[str]:
 
 def get_system_tables() -> List[str]:
     """Get list of system table names."""
-    return ['schema_migrations']
+    return ['schema_migrations', 'reference_import_manifest']
@@ -15,6 +15,9 @@ Components:
       US federal holidays for time-based analytics.
     - BaseDimensionalTransformer: Abstract base class for product-specific
       transformers (PatientSim, MemberSim, RxMemberSim).
+    - BaseInDatabaseTransformer: Abstract base class for in-database
+      transformers that build the star schema with CREATE TABLE AS SELECT
+      directly against the canonical DuckDB tables.
     - BaseDimensionalWriter: Abstract base class for target writers.
     - DuckDBDimensionalWriter: Write dimensional tables to DuckDB for
       fast local analytics.
@@ -48,6 +51,7 @@ from __future__ import annotations
 
 from healthsim.dimensional.generators.dim_date import generate_dim_date
 from healthsim.dimensional.transformers.base import BaseDimensionalTransformer
+from healthsim.dimensional.transformers.in_database import BaseInDatabaseTransformer
 from healthsim.dimensional.writers.base import BaseDimensionalWriter
 from healthsim.dimensional.writers.duckdb_writer import DuckDBDimensionalWriter
 from healthsim.dimensional.writers.registry import WriterRegistry
@@ -57,6 +61,7 @@ __all__ = [
     "generate_dim_date",
     # Transformers
     "BaseDimensionalTransformer",
+    "BaseInDatabaseTransformer",
     # Writers
     "BaseDimensionalWriter",
     "DuckDBDimensionalWriter",
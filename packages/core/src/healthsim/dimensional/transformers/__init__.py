@@ -1,9 +1,11 @@
-"""Base transformer for dimensional model transformations."""
+"""Base transformers for dimensional model transformations."""
 
 from __future__ import annotations
 
 from .base import BaseDimensionalTransformer
+from .in_database import BaseInDatabaseTransformer
 
 __all__ = [
     "BaseDimensionalTransformer",
+    "BaseInDatabaseTransformer",
 ]
@@ -7,10 +7,13 @@ canonical entities into dimensional model tables (facts and dimensions).
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Sequence
 from datetime import date, datetime
 from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+from operator import attrgetter
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 
@@ -23,7 +26,10 @@ class BaseDimensionalTransformer(ABC):
 
     The utility methods provided handle common operations like date key
     conversions, age calculations, string normalization, and safe type
-    coercion.
+    coercion. Columnar counterparts (``extract_columns``, ``dates_to_keys``,
+    ``calculate_ages``, ``age_bands``, ``map_unique``, ``lookup_keys``,
+    ``lookup_values``) operate on whole columns so large model lists are
+    converted to a DataFrame once instead of building one dict per row.
 
     Example:
         >>> class PatientTransformer(BaseDimensionalTransformer):
@@ -40,6 +46,19 @@ class BaseDimensionalTransformer(ABC):
         ...         )
     """
 
+    # Dimension -> key column. Incremental (per-cohort) writes upsert
+    # dimension rows on it.
+    KEY_COLUMNS: dict[str, str] = {}
+
+    # Dimension -> natural key column for dimensions whose key column is a
+    # surrogate key numbered per transform. Writers use this to keep keys
+    # stable across incremental (per-cohort) refreshes.
+    NATURAL_KEYS: dict[str, str] = {}
+
+    # Fact -> surrogate key column numbered per transform. Incremental writes
+    # offset these so they stay unique across cohorts.
+    FACT_KEYS: dict[str, str] = {}
+
     @abstractmethod
     def transform(self) -> tuple[dict[str, pd.DataFrame], dict[str, pd.DataFrame]]:
         """Transform canonical entities to dimensional model.
@@ -373,3 +392,274 @@ class BaseDimensionalTransformer(ABC):
                     return default
 
         return current if current is not None else default
+
+    # -------------------------------------------------------------------------
+    # Columnar Helpers
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def extract_columns(cls, items: Sequence[Any], fields: dict[str, str]) -> pd.DataFrame:
+        """Extract attribute paths from a list of models into a DataFrame.
+
+        Each column is gathered in a single pass over the models, so
+        per-row dict construction is avoided entirely. Dotted paths are
+        resolved with ``get_attr`` semantics (missing -> None).
+
+        Args:
+            items: Models (or dicts) to extract from.
+            fields: Mapping of output column name -> attribute path.
+
+        Returns:
+            DataFrame with one row per item and one column per field.
+
+        Examples:
+            >>> BaseDimensionalTransformer.extract_columns(
+            ...     [{'a': {'b': 1}}, {'a': {'b': 2}}], {'ab': 'a.b'}
+            ... )['ab'].tolist()
+            [1, 2]
+        """
+        columns: dict[str, list[Any]] = {}
+        from_dicts = bool(items) and isinstance(items[0], dict)
+        for column, path in fields.items():
+            if from_dicts:
+                columns[column] = [cls.get_attr(item, path) for item in items]
+            elif "." in path:
+                # Fast path; fall back to get_attr when an intermediate is None
+                getter = attrgetter(path)
+                try:
+                    columns[column] = [getter(item) for item in items]
+                except AttributeError:
+                    columns[column] = [cls.get_attr(item, path) for item in items]
+            else:
+                columns[column] = [getattr(item, path, None) for item in items]
+        return pd.DataFrame(columns, index=pd.RangeIndex(len(items)))
+
+    @staticmethod
+    def map_unique(values: pd.Series, func: Callable[[Any], Any]) -> pd.Series:
+        """Apply a scalar function once per distinct value and broadcast it.
+
+        Derived columns such as code categories or enum values have few
+        distinct inputs relative to row count, so the function runs
+        O(distinct) times rather than O(rows).
+
+        Args:
+            values: Input column.
+            func: Scalar function applied to each distinct value. Nulls are
+                passed to it as None (once), matching per-row semantics.
+
+        Returns:
+            Series aligned with ``values``.
+        """
+        codes, uniques = pd.factorize(values, use_na_sentinel=True)
+        mapped = np.empty(len(uniques) + 1, dtype=object)
+        mapped[:-1] = [func(v) for v in uniques]
+        mapped[-1] = func(None) if (codes < 0).any() else None
+        return pd.Series(mapped[codes], index=values.index).infer_objects()
+
+    @classmethod
+    def enum_values(cls, values: pd.Series) -> pd.Series:
+        """Replace enum members with their ``.value`` (plain values pass through)."""
+        return cls.map_unique(values, lambda v: v.value if hasattr(v, "value") else v)
+
+    @staticmethod
+    def nullable_ints(values: pd.Series | np.ndarray, valid: pd.Series | np.ndarray) -> pd.Series:
+        """Build an integer column with None where ``valid`` is False.
+
+        Matches how pandas infers a column of Python ints and Nones: int64
+        when complete, float64 with NaN when partially missing, and object
+        None when entirely missing.
+        """
+        values = pd.Series(values)
+        valid = np.asarray(valid, dtype=bool)
+        if valid.all():
+            return values.astype("int64")
+        if not valid.any():
+            return pd.Series([None] * len(values), index=values.index, dtype=object)
+        return values.astype("float64").where(valid, np.nan)
+
+    @staticmethod
+    def nullable_floats(values: pd.Series | np.ndarray, valid: pd.Series | np.ndarray) -> pd.Series:
+        """Build a float column with NaN where ``valid`` is False (object None if all)."""
+        values = pd.Series(values)
+        valid = np.asarray(valid, dtype=bool)
+        if len(values) and not valid.any():
+            return pd.Series([None] * len(values), index=values.index, dtype=object)
+        return values.astype("float64").where(valid, np.nan)
+
+    @staticmethod
+    def nullable_flags(values: pd.Series | np.ndarray, valid: pd.Series | np.ndarray) -> pd.Series:
+        """Build a boolean column with None where ``valid`` is False.
+
+        Stays bool dtype when every row is valid, object otherwise.
+        """
+        values = pd.Series(values)
+        valid = np.asarray(valid, dtype=bool)
+        if valid.all():
+            return values.astype(bool)
+        return values.astype(bool).astype(object).where(valid, None)
+
+    @classmethod
+    def dates_to_keys(cls, values: pd.Series) -> pd.Series:
+        """Vectorized ``date_to_key`` over a column of dates/datetimes/ISO strings.
+
+        Args:
+            values: Column of date, datetime, ISO string, or None values.
+
+        Returns:
+            Column of YYYYMMDD integer keys (see ``nullable_ints`` for nulls).
+        """
+        values = pd.Series(values)
+        try:
+            parsed = pd.to_datetime(values, errors="coerce", format="ISO8601")
+        except (TypeError, ValueError, OverflowError):
+            return cls.map_unique(values, cls.date_to_key)
+        keys = (
+            parsed.dt.year.fillna(0).astype("int64") * 10000
+            + parsed.dt.month.fillna(0).astype("int64") * 100
+            + parsed.dt.day.fillna(0).astype("int64")
+        ).set_axis(values.index)
+        return cls._with_scalar_fallback(values, parsed, keys, cls.date_to_key)
+
+    @classmethod
+    def calculate_ages(cls, dobs: pd.Series, as_of_date: date | None = None) -> pd.Series:
+        """Vectorized ``calculate_age`` over a column of birth dates.
+
+        Args:
+            dobs: Column of birth dates (date, datetime, ISO string, or None).
+            as_of_date: Date to calculate ages as of. Defaults to today.
+
+        Returns:
+            Column of ages in complete years (see ``nullable_ints`` for nulls).
+        """
+        as_of = as_of_date or date.today()
+        dobs = pd.Series(dobs)
+        parsed = pd.to_datetime(dobs, errors="coerce", format="ISO8601")
+        year = parsed.dt.year.fillna(0).astype("int64")
+        month = parsed.dt.month.fillna(0).astype("int64")
+        day = parsed.dt.day.fillna(0).astype("int64")
+        birthday_pending = (month > as_of.month) | ((month == as_of.month) & (day > as_of.day))
+        ages = (as_of.year - year - birthday_pending.astype("int64")).clip(lower=0)
+        return cls._with_scalar_fallback(
+            dobs, parsed, ages.set_axis(dobs.index), lambda dob: cls.calculate_age(dob, as_of)
+        )
+
+    @classmethod
+    def _with_scalar_fallback(
+        cls,
+        values: pd.Series,
+        parsed: pd.Series,
+        results: pd.Series,
+        func: Callable[[Any], int | None],
+    ) -> pd.Series:
+        """Patch vectorized date results with the scalar function where they differ.
+
+        ``pd.to_datetime`` coerces dates outside the nanosecond timestamp
+        range to NaT and accepts ISO datetime strings that
+        ``date.fromisoformat`` rejects, so those rows (strings and
+        unparsed non-null values) are recomputed with ``func``.
+        """
+        valid = parsed.notna().to_numpy(copy=True)
+        rescan = values.notna().to_numpy() & ~valid
+        if values.dtype == object:
+            rescan |= np.fromiter((isinstance(v, str) for v in values), bool, len(values))
+        elif pd.api.types.is_string_dtype(values):
+            rescan |= values.notna().to_numpy()
+        if rescan.any():
+            scalar = cls.map_unique(values[rescan], func)
+            rows = np.flatnonzero(rescan)
+            computed = scalar.notna().to_numpy()
+            results = results.copy()
+            results.iloc[rows[computed]] = scalar[computed].astype("int64").to_numpy()
+            valid[rows] = computed
+        return cls.nullable_ints(results, valid)
+
+    @staticmethod
+    def age_bands(ages: pd.Series) -> pd.Series:
+        """Vectorized ``age_band`` over a column of ages (None for null/negative)."""
+        ages = pd.Series(ages)
+        numeric = pd.to_numeric(ages, errors="coerce")
+        bands = np.select(
+            [numeric <= 17, numeric <= 34, numeric <= 49, numeric <= 64],
+            ["0-17", "18-34", "35-49", "50-64"],
+            default="65+",
+        ).astype(object)
+        bands[(numeric.isna() | (numeric < 0)).to_numpy()] = None
+        return pd.Series(bands, index=ages.index, dtype=object)
+
+    @staticmethod
+    def infer_dtypes(tables: dict[str, pd.DataFrame]) -> dict[str, pd.DataFrame]:
+        """Give output tables the dtypes pandas infers for row-dict construction.
+
+        Columnar builders assemble some columns from object arrays (surrogate
+        key indexes, ``np.select`` bands), which pandas leaves as object;
+        building the same rows from dicts would infer ``str``, bool, or
+        datetime columns. Inferring once per table keeps output dtypes stable.
+
+        Args:
+            tables: Mapping of table name -> DataFrame.
+
+        Returns:
+            Mapping with the same keys and inferred DataFrames.
+        """
+        # Column by column: DataFrame.infer_objects leaves a consolidated
+        # object block alone when it also holds genuinely mixed columns
+        return {
+            name: df.assign(
+                **{
+                    column: values.infer_objects()
+                    for column, values in df.items()
+                    if pd.api.types.is_object_dtype(values.dtype)
+                }
+            )
+            for name, df in tables.items()
+        }
+
+    @staticmethod
+    def sorted_uniques(*columns: Iterable[Any], drop_empty: bool = False) -> pd.Index:
+        """Sorted distinct non-null values across one or more columns.
+
+        This is the key order used by the dimension builders: surrogate
+        key N is the Nth value in sorted order, starting at 1.
+
+        Args:
+            *columns: Columns (or any iterables) of natural keys.
+            drop_empty: Also drop empty strings (for ``if value`` filters).
+
+        Returns:
+            Sorted Index of distinct keys.
+        """
+        series = [pd.Series(column).astype(object) for column in columns]
+        values = pd.concat(series, ignore_index=True) if series else pd.Series(dtype=object)
+        values = values.dropna()
+        if drop_empty:
+            values = values[values != ""]
+        return pd.Index(sorted(values.unique()), dtype=object)
+
+    @staticmethod
+    def lookup_keys(values: pd.Series, uniques: pd.Index, missing: int = -1) -> np.ndarray:
+        """Resolve values to 1-based surrogate keys against ``sorted_uniques``.
+
+        Args:
+            values: Natural keys to resolve.
+            uniques: Sorted dimension keys from ``sorted_uniques``.
+            missing: Key used for values not in the dimension.
+
+        Returns:
+            Integer array of surrogate keys.
+        """
+        positions = uniques.get_indexer(pd.Series(values, dtype=object))
+        return np.where(positions >= 0, positions + 1, missing).astype("int64")
+
+    @staticmethod
+    def lookup_values(values: pd.Series, mapping: pd.Series) -> pd.Series:
+        """Join an attribute onto natural keys (None where the key is absent).
+
+        Args:
+            values: Natural keys to resolve.
+            mapping: Attribute values indexed by unique natural key.
+
+        Returns:
+            Series aligned with ``values``.
+        """
+        mapped = pd.Series(values, dtype=object).map(mapping).astype(object)
+        return mapped.where(mapped.notna(), None).infer_objects()
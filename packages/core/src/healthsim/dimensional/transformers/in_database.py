@@ -0,0 +1,209 @@
+"""In-database transformer mode for dimensional model builds.
+
+The in-memory transformers pull canonical entities into Python, build
+DataFrames and write them back through a writer. When the canonical data
+already lives in DuckDB (``healthsim.duckdb``), the same star schema can be
+built with ``CREATE TABLE AS SELECT`` statements that run entirely inside
+the database, so no rows travel through Python.
+
+Product packages subclass ``BaseInDatabaseTransformer`` and supply one
+SELECT per output table; this module resolves the cohort, scopes every
+canonical table reference to it, and executes the statements.
+"""
+
+from __future__ import annotations
+
+import re
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Mapping
+from datetime import date
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import duckdb
+
+
+class BaseInDatabaseTransformer(ABC):
+    """Abstract base class for SQL (in-database) dimensional transformers.
+
+    Subclasses list the canonical tables they read in ``SOURCE_TABLES`` and
+    return ordered ``{table_name: select_template}`` definitions from
+    ``table_definitions``. Templates reference canonical tables as
+    ``{table}`` placeholders; each is expanded to a subquery over that table
+    restricted to the cohort (all rows when no cohort is given) that also
+    exposes ``source_row``, the storage row id, so "first seen" semantics of
+    the in-memory transformers can be reproduced with ``arg_min_null``.
+
+    Templates may use two named parameters: ``$cohort_id`` and
+    ``$snapshot_date`` (a DATE used for age and open-span calculations).
+
+    Output tables are written to ``schema`` with ``CREATE OR REPLACE TABLE``
+    using the same names and columns as the product's in-memory
+    transformer, so downstream queries work against either build mode.
+
+    Example:
+        >>> import duckdb
+        >>> from patientsim.dimensional import PatientInDatabaseTransformer
+        >>>
+        >>> conn = duckdb.connect('healthsim.duckdb')
+        >>> transformer = PatientInDatabaseTransformer(conn, cohort='diabetes-cohort')
+        >>> row_counts = transformer.build()
+        >>> row_counts['fact_encounters']
+        1250000
+    """
+
+    #: Canonical tables the SELECT templates may reference as ``{table}``.
+    SOURCE_TABLES: tuple[str, ...] = ()
+
+    def __init__(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        cohort: str | None = None,
+        schema: str = "analytics",
+        snapshot_date: date | None = None,
+    ) -> None:
+        """Initialize the transformer.
+
+        Args:
+            conn: DuckDB connection holding the canonical tables.
+            cohort: Cohort name or ID to build for. None builds over all
+                rows in the canonical tables.
+            schema: Schema for the dimensional tables. Defaults to 'analytics'.
+            snapshot_date: Date for age calculations. Defaults to today.
+
+        Raises:
+            ValueError: If the cohort does not exist.
+        """
+        self.conn = conn
+        self.schema = schema
+        self.snapshot_date = snapshot_date or date.today()
+        self.cohort_id = self._resolve_cohort(cohort) if cohort is not None else None
+
+    @abstractmethod
+    def table_definitions(self) -> dict[str, str]:
+        """Return the SELECT template for each output table, in build order.
+
+        Returns:
+            Ordered dict mapping output table name to a SELECT statement
+            with ``{table}`` placeholders for canonical sources.
+        """
+
+    def statements(self, tables: Iterable[str] | None = None) -> dict[str, str]:
+        """Render the ``CREATE TABLE AS SELECT`` statement for each table.
+
+        Args:
+            tables: Output tables to render. Defaults to all.
+
+        Returns:
+            Ordered dict mapping output table name to its CTAS statement.
+
+        Raises:
+            ValueError: If an unknown table is requested.
+        """
+        definitions = self.table_definitions()
+        if tables is not None:
+            requested = set(tables)
+            unknown = requested - set(definitions)
+            if unknown:
+                raise ValueError(f"Unknown dimensional tables: {sorted(unknown)}")
+            definitions = {name: sql for name, sql in definitions.items() if name in requested}
+
+        sources = {table: self._source(table) for table in self.SOURCE_TABLES}
+        return {
+            name: (
+                f"CREATE OR REPLACE TABLE {self.schema}.{name} AS\n"
+                f"{sql.strip().format_map(sources)}"
+            )
+            for name, sql in definitions.items()
+        }
+
+    def build(self, tables: Iterable[str] | None = None) -> dict[str, int]:
+        """Build dimensional tables inside the database.
+
+        Args:
+            tables: Output tables to build. Defaults to all.
+
+        Returns:
+            Dict mapping each built table name to its row count.
+        """
+        statements = self.statements(tables)
+        parameters = {"cohort_id": self.cohort_id, "snapshot_date": self.snapshot_date}
+
+        self.conn.execute(f"CREATE SCHEMA IF NOT EXISTS {self.schema}")
+        row_counts = {}
+        for name, sql in statements.items():
+            # DuckDB rejects parameters a statement does not use
+            used = set(re.findall(r"\$(\w+)", sql))
+            self.conn.execute(sql, {k: v for k, v in parameters.items() if k in used})
+            row_counts[name] = self.conn.execute(
+                f"SELECT COUNT(*) FROM {self.schema}.{name}"
+            ).fetchone()[0]
+        return row_counts
+
+    def _resolve_cohort(self, name_or_id: str) -> str:
+        """Resolve a cohort name or ID to its ID."""
+        row = self.conn.execute(
+            "SELECT id FROM cohorts WHERE name = ? OR id = ? ORDER BY name = ? DESC LIMIT 1",
+            [name_or_id, name_or_id, name_or_id],
+        ).fetchone()
+        if row is None:
+            raise ValueError(f"Cohort '{name_or_id}' not found")
+        return row[0]
+
+    def _source(self, table: str) -> str:
+        """Subquery over a canonical table, scoped to the cohort."""
+        where = " WHERE cohort_id = $cohort_id" if self.cohort_id is not None else ""
+        return f"(SELECT rowid AS source_row, * FROM {table}{where})"
+
+    # -------------------------------------------------------------------------
+    # SQL Expression Helpers
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def date_key_sql(expr: str) -> str:
+        """SQL for ``date_to_key``: YYYYMMDD integer key, NULL for NULL."""
+        return f"CAST(strftime(CAST({expr} AS DATE), '%Y%m%d') AS INTEGER)"
+
+    @staticmethod
+    def age_sql(birth_date: str) -> str:
+        """SQL for ``calculate_age`` as of ``$snapshot_date`` (complete years)."""
+        birth = f"CAST({birth_date} AS DATE)"
+        return (
+            f"greatest(year($snapshot_date) - year({birth}) - CASE WHEN "
+            f"month({birth}) > month($snapshot_date) OR (month({birth}) = month($snapshot_date)"
+            f" AND day({birth}) > day($snapshot_date)) THEN 1 ELSE 0 END, 0)"
+        )
+
+    @staticmethod
+    def age_band_sql(age: str) -> str:
+        """SQL for ``age_band`` (NULL for NULL or negative ages)."""
+        return (
+            f"CASE WHEN {age} IS NULL OR {age} < 0 THEN NULL"
+            f" WHEN {age} <= 17 THEN '0-17' WHEN {age} <= 34 THEN '18-34'"
+            f" WHEN {age} <= 49 THEN '35-49' WHEN {age} <= 64 THEN '50-64'"
+            " ELSE '65+' END"
+        )
+
+    @classmethod
+    def case_sql(cls, expr: str, mapping: Mapping[str, str], default: str | None = None) -> str:
+        """SQL CASE expression translating values through ``mapping``.
+
+        Args:
+            expr: SQL expression to translate.
+            mapping: Value to result lookup (both rendered as literals).
+            default: Result for unmapped values (NULL when None).
+
+        Returns:
+            CASE expression.
+        """
+        whens = " ".join(
+            f"WHEN {cls.literal(key)} THEN {cls.literal(value)}" for key, value in mapping.items()
+        )
+        return f"CASE {expr} {whens} ELSE {cls.literal(default)} END"
+
+    @staticmethod
+    def literal(value: str | None) -> str:
+        """Render a string as a SQL literal (NULL for None)."""
+        if value is None:
+            return "NULL"
+        return "'" + str(value).replace("'", "''") + "'"
@@ -19,6 +19,13 @@ Usage:
     >>> # Via registry
     >>> writer = WriterRegistry.create('duckdb', db_path='analytics.duckdb')
     >>>
+    >>> # Incremental refresh of one cohort's slice of the model
+    >>> writer.write_dimensional_model(
+    ...     dimensions, facts, cohort_id='c-1', data_version='2024-06-01',
+    ...     natural_keys=transformer.NATURAL_KEYS,
+    ...     key_columns=transformer.KEY_COLUMNS, fact_keys=transformer.FACT_KEYS,
+    ... )
+    >>>
     >>> # Check available writers
     >>> WriterRegistry.list_available()
     ['duckdb', 'databricks']
@@ -7,6 +7,7 @@ Writers only need to be installed if they're used.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager, nullcontext
 from typing import TYPE_CHECKING, Any
 
 import pandas as pd
@@ -14,6 +15,23 @@ import pandas as pd
 if TYPE_CHECKING:
     from healthsim.config.dimensional import TargetConfig
 
+# Bookkeeping tables for incremental (per-cohort) refreshes
+KEY_MAP_TABLE = "_dimensional_key_map"
+BUILD_STATE_TABLE = "_dimensional_builds"
+MEMBERS_TABLE = "_dimensional_members"
+
+
+def _sql_string(value: str) -> str:
+    """Quote a value as a SQL string literal."""
+    escaped = value.replace("'", "''")
+    return f"'{escaped}'"
+
+
+def _remap(column: pd.Series, key_map: dict[Any, int]) -> pd.Series:
+    """Replace keys found in key_map, leaving other values untouched."""
+    mapped = column.map(key_map)
+    return mapped.where(mapped.notna(), column).astype(column.dtype)
+
 
 class BaseDimensionalWriter(ABC):
     """Abstract base class for all dimensional writers.
@@ -25,6 +43,8 @@ class BaseDimensionalWriter(ABC):
     Class Attributes:
         TARGET_NAME: Identifier for this writer type (e.g., 'duckdb', 'databricks').
         REQUIRED_PACKAGES: List of package names required for this writer.
+        CLUSTER_COLUMNS: Fact table -> column its rows are sorted by when a
+            cohort is refreshed incrementally.
 
     Example:
         >>> class MyWriter(BaseDimensionalWriter):
@@ -37,6 +57,12 @@ class BaseDimensionalWriter(ABC):
     TARGET_NAME: str = ""  # e.g., "duckdb", "databricks"
     REQUIRED_PACKAGES: list[str] = []  # e.g., ["duckdb"]
 
+    # Fact tables written in this column's order during incremental refreshes
+    CLUSTER_COLUMNS: dict[str, str] = {
+        "fact_claims": "service_date_key",
+        "fact_prescription_fills": "service_date_key",
+    }
+
     def __init__(self, schema: str = "analytics", **kwargs: Any) -> None:
         """Initialize writer with target schema.
 
@@ -116,20 +142,99 @@ class BaseDimensionalWriter(ABC):
         """
         pass
 
+    def delete_rows(self, table_name: str, column: str, values: list[Any]) -> None:
+        """Delete rows whose column value is in values.
+
+        Used by incremental refreshes to replace one cohort's rows. Writers
+        that support ``write_dimensional_model(cohort_id=...)`` override this.
+
+        Args:
+            table_name: Name of the table (without schema/catalog prefix).
+            column: Column to match.
+            values: Values identifying the rows to delete.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support row deletes")
+
+    def transaction(self) -> AbstractContextManager[None]:
+        """Context manager making the writes inside the block atomic.
+
+        The default does nothing; writers whose target supports
+        multi-statement transactions override it.
+        """
+        return nullcontext()
+
     def write_dimensional_model(
         self,
         dimensions: dict[str, pd.DataFrame],
         facts: dict[str, pd.DataFrame],
+        cohort_id: str | None = None,
+        data_version: str | None = None,
+        natural_keys: dict[str, str] | None = None,
+        key_columns: dict[str, str] | None = None,
+        fact_keys: dict[str, str] | None = None,
     ) -> dict[str, int]:
         """Write complete dimensional model (dimensions and facts).
 
+        Without a cohort_id every table is rewritten. With a cohort_id the
+        model is treated as that cohort's slice and merged incrementally:
+
+        - Fact rows are tagged with a ``cohort_id`` column and replace only
+          that cohort's previous rows. Facts listed in ``CLUSTER_COLUMNS``
+          are written in service-date order so each cohort's rows are laid
+          out by service month. Fact surrogate keys named in fact_keys are
+          numbered per build, so they are offset past the keys already in
+          the table to stay unique across cohorts.
+        - Dimension rows are upserted on their key column from key_columns.
+          Dimensions named in natural_keys have per-build surrogate keys;
+          these are swapped for stable keys from the ``_dimensional_key_map``
+          table (assigning new keys to unseen natural keys) and fact columns
+          referencing them are rewritten to match.
+        - The dimension keys each cohort contributed are recorded in
+          ``_dimensional_members``; rows no cohort contributes any more are
+          deleted.
+        - The data_version is recorded in ``_dimensional_builds``; a later
+          call with the same cohort and version writes nothing.
+        - Fact tables left by a full rewrite have no ``cohort_id`` column, so
+          no cohort's rows can be told apart; merging into one raises
+          ValueError. Drop the table (or rewrite the whole model) first.
+
+        The incremental merge runs inside ``transaction()``, so on writers
+        that support it a failure leaves the previous tables in place.
+
         Args:
             dimensions: Dict of dimension_name -> DataFrame.
             facts: Dict of fact_name -> DataFrame.
+            cohort_id: Cohort the model was built from, for incremental refresh.
+            data_version: Version of the cohort's source data (for example its
+                ``updated_at``). None always rebuilds the cohort.
+            natural_keys: Dict of dimension_name -> natural key column for
+                dimensions with generated surrogate keys, typically the
+                transformer's ``NATURAL_KEYS``.
+            key_columns: Dict of dimension_name -> key column, typically the
+                transformer's ``KEY_COLUMNS``. Required for every dimension
+                when cohort_id is given.
+            fact_keys: Dict of fact_name -> surrogate key column numbered per
+                build, typically the transformer's ``FACT_KEYS``.
 
         Returns:
-            Dict of table_name -> row_count.
+            Dict of table_name -> row_count. Empty when the cohort's data
+            version is unchanged.
+
+        Raises:
+            ValueError: If a dimension has no key column, or a fact table
+                was written by a full rewrite (incremental mode only).
         """
+        if cohort_id is not None:
+            return self._refresh_cohort(
+                dimensions,
+                facts,
+                cohort_id,
+                data_version,
+                natural_keys or {},
+                key_columns or {},
+                fact_keys or {},
+            )
+
         results: dict[str, int] = {}
 
         # Write dimensions first (facts depend on them)
@@ -142,6 +247,204 @@ class BaseDimensionalWriter(ABC):
 
         return results
 
+    def needs_refresh(self, cohort_id: str, data_version: str | None) -> bool:
+        """Check whether a cohort's dimensional tables are out of date.
+
+        Callers can use this to skip transforming cohorts that have not
+        changed since their last incremental write.
+
+        Args:
+            cohort_id: Cohort identifier.
+            data_version: Current version of the cohort's source data.
+
+        Returns:
+            True unless the last build of the cohort recorded data_version.
+        """
+        if data_version is None or not self.table_exists(BUILD_STATE_TABLE):
+            return True
+        built = self.query(
+            f"SELECT data_version FROM {self.full_table_prefix}.{BUILD_STATE_TABLE} "
+            f"WHERE cohort_id = {_sql_string(cohort_id)}"
+        )
+        return built.empty or built["data_version"].iloc[0] != data_version
+
+    def _refresh_cohort(
+        self,
+        dimensions: dict[str, pd.DataFrame],
+        facts: dict[str, pd.DataFrame],
+        cohort_id: str,
+        data_version: str | None,
+        natural_keys: dict[str, str],
+        key_columns: dict[str, str],
+        fact_keys: dict[str, str],
+    ) -> dict[str, int]:
+        """Merge one cohort's dimensional model into the existing tables."""
+        missing = [name for name in dimensions if name not in key_columns]
+        if missing:
+            raise ValueError(f"No key column given for dimensions: {', '.join(missing)}")
+        if not self.needs_refresh(cohort_id, data_version):
+            return {}
+
+        with self.transaction():
+            return self._merge_cohort(
+                dimensions, facts, cohort_id, data_version, natural_keys, key_columns, fact_keys
+            )
+
+    def _merge_cohort(
+        self,
+        dimensions: dict[str, pd.DataFrame],
+        facts: dict[str, pd.DataFrame],
+        cohort_id: str,
+        data_version: str | None,
+        natural_keys: dict[str, str],
+        key_columns: dict[str, str],
+        fact_keys: dict[str, str],
+    ) -> dict[str, int]:
+        """Write one cohort's tables and build state (see ``write_dimensional_model``)."""
+        for name in facts:
+            if self.table_exists(name) and "cohort_id" not in self._columns(name):
+                raise ValueError(
+                    f"{self.full_table_prefix}.{name} was written by a full rewrite and has "
+                    "no cohort_id column; drop it before refreshing cohorts incrementally"
+                )
+
+        results: dict[str, int] = {}
+        facts = dict(facts)
+        members: dict[str, pd.Series] = {}
+
+        for name, df in dimensions.items():
+            key_column = key_columns[name]
+            if name in natural_keys and not df.empty:
+                key_map = self._stable_keys(name, df[key_column], df[natural_keys[name]])
+                df = df.assign(**{key_column: _remap(df[key_column], key_map)})
+                for fact_name, fact in facts.items():
+                    columns = [
+                        c for c in fact.columns if c == key_column or c.endswith(f"_{key_column}")
+                    ]
+                    if columns:
+                        facts[fact_name] = fact.assign(
+                            **{c: _remap(fact[c], key_map) for c in columns}
+                        )
+            results[name] = self._upsert(name, df, key_column)
+            members[name] = df[key_column]
+
+        for name, df in facts.items():
+            df = df.assign(cohort_id=cohort_id)
+            sort_column = self.CLUSTER_COLUMNS.get(name)
+            if sort_column in df.columns:
+                df = df.sort_values(sort_column, kind="stable")
+            exists = self.table_exists(name)
+            if exists:
+                self.delete_rows(name, "cohort_id", [cohort_id])
+            key_column = fact_keys.get(name)
+            if exists and key_column in df.columns:
+                # Per-build keys start at 1: move them past the other cohorts' keys
+                top = self.query(f"SELECT max({key_column}) AS top FROM {self._table(name)}")
+                offset = top["top"].iloc[0]
+                if not pd.isna(offset):
+                    df = df.assign(**{key_column: df[key_column] + int(offset)})
+            results[name] = self.write_table(name, df, if_exists="append")
+
+        self._prune_dimensions(cohort_id, members, key_columns)
+
+        if self.table_exists(BUILD_STATE_TABLE):
+            self.delete_rows(BUILD_STATE_TABLE, "cohort_id", [cohort_id])
+        state = pd.DataFrame(
+            {
+                "cohort_id": [cohort_id],
+                "data_version": pd.Series([data_version], dtype="object"),
+                "built_at": [pd.Timestamp.now()],
+            }
+        )
+        self.write_table(BUILD_STATE_TABLE, state, if_exists="append")
+
+        return results
+
+    def _prune_dimensions(
+        self, cohort_id: str, members: dict[str, pd.Series], key_columns: dict[str, str]
+    ) -> None:
+        """Record the cohort's dimension keys and delete rows no cohort uses any more."""
+        previous = pd.DataFrame(columns=["table_name", "member_key"])
+        if self.table_exists(MEMBERS_TABLE):
+            previous = self.query(
+                f"SELECT table_name, member_key FROM {self._table(MEMBERS_TABLE)} "
+                f"WHERE cohort_id = {_sql_string(cohort_id)}"
+            )
+            self.delete_rows(MEMBERS_TABLE, "cohort_id", [cohort_id])
+
+        current = {name: set(keys.dropna().astype(str)) for name, keys in members.items()}
+        rows = [(name, key) for name, keys in current.items() for key in sorted(keys)]
+        if rows:
+            additions = pd.DataFrame(rows, columns=["table_name", "member_key"])
+            additions.insert(1, "cohort_id", cohort_id)
+            self.write_table(MEMBERS_TABLE, additions, if_exists="append")
+
+        for name, keys in previous.groupby("table_name")["member_key"]:
+            key_column = key_columns.get(name)
+            removed = set(keys) - current.get(name, set())
+            if key_column is None or not removed or not self.table_exists(name):
+                continue
+            quoted = ", ".join(_sql_string(key) for key in sorted(removed))
+            still_used = self.query(
+                f"SELECT DISTINCT member_key FROM {self._table(MEMBERS_TABLE)} "
+                f"WHERE table_name = {_sql_string(name)} AND member_key IN ({quoted})"
+            )
+            orphans = sorted(removed - set(still_used["member_key"]))
+            if orphans:
+                dtype = self.query(f"SELECT {key_column} FROM {self._table(name)} LIMIT 0")[
+                    key_column
+                ].dtype
+                values = pd.Series(orphans).astype(dtype).tolist()
+                self.delete_rows(name, key_column, values)
+
+    def _table(self, table_name: str) -> str:
+        """Fully qualified name of a table."""
+        return f"{self.full_table_prefix}.{table_name}"
+
+    def _columns(self, table_name: str) -> list[str]:
+        """Column names of an existing table."""
+        return list(self.query(f"SELECT * FROM {self._table(table_name)} LIMIT 0"))
+
+    def _stable_keys(self, table_name: str, keys: pd.Series, natural: pd.Series) -> dict[Any, int]:
+        """Map a dimension's per-build surrogate keys to stable keys.
+
+        Negative keys (the "Unknown" member) are left as they are.
+        """
+        natural = natural.astype(str)
+        known: dict[str, int] = {}
+        if self.table_exists(KEY_MAP_TABLE):
+            existing = self.query(
+                f"SELECT natural_key, surrogate_key FROM {self.full_table_prefix}.{KEY_MAP_TABLE} "
+                f"WHERE table_name = {_sql_string(table_name)}"
+            )
+            known = dict(
+                zip(existing["natural_key"], existing["surrogate_key"].astype(int), strict=True)
+            )
+
+        next_key = max(known.values(), default=0) + 1
+        key_map: dict[Any, int] = {}
+        new_keys: list[tuple[str, int]] = []
+        for key, value in zip(keys, natural, strict=True):
+            if key < 0:
+                continue
+            if value not in known:
+                known[value] = next_key
+                new_keys.append((value, next_key))
+                next_key += 1
+            key_map[key] = known[value]
+
+        if new_keys:
+            additions = pd.DataFrame(new_keys, columns=["natural_key", "surrogate_key"])
+            additions.insert(0, "table_name", table_name)
+            self.write_table(KEY_MAP_TABLE, additions, if_exists="append")
+        return key_map
+
+    def _upsert(self, table_name: str, df: pd.DataFrame, key_column: str) -> int:
+        """Replace rows of a table that share key values with df."""
+        if self.table_exists(table_name):
+            self.delete_rows(table_name, key_column, df[key_column].dropna().tolist())
+        return self.write_table(table_name, df, if_exists="append")
+
     @abstractmethod
     def get_table_list(self) -> list[str]:
         """Get list of tables in the schema.
@@ -192,6 +192,8 @@ class DatabricksDimensionalWriter(BaseDimensionalWriter):
         full_name = f"{self.catalog}.{self.schema}.{table_name}"
 
         if df.empty:
+            if if_exists == "append" and self.table_exists(table_name):
+                return 0
             return self._create_empty_table(table_name, df)
 
         with self.connection.cursor() as cursor:
@@ -295,6 +297,23 @@ class DatabricksDimensionalWriter(BaseDimensionalWriter):
             )
         return 0
 
+    def delete_rows(self, table_name: str, column: str, values: list[Any]) -> None:
+        """Delete rows whose column value is in values.
+
+        Args:
+            table_name: Name of the table (without catalog/schema prefix).
+            column: Column to match.
+            values: Values identifying the rows to delete.
+        """
+        full_name = f"{self.catalog}.{self.schema}.{table_name}"
+        with self.connection.cursor() as cursor:
+            for i in range(0, len(values), 1000):
+                batch = values[i : i + 1000]
+                placeholders = ", ".join(["%s"] * len(batch))
+                cursor.execute(
+                    f"DELETE FROM {full_name} WHERE `{column}` IN ({placeholders})", batch
+                )
+
     def get_table_list(self) -> list[str]:
         """Get list of tables in schema.
 
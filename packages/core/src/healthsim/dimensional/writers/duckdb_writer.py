@@ -6,6 +6,8 @@ which is ideal for local analytics workloads and fast SQL queries.
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -162,20 +164,99 @@ class DuckDBDimensionalWriter(BaseDimensionalWriter):
 
         # Register the DataFrame temporarily
         conn.register("_temp_df", df)
-
-        if if_exists == "replace":
-            conn.execute(f"CREATE TABLE {full_table_name} AS SELECT * FROM _temp_df")
-        else:  # append
-            # Check if table exists
-            if self.table_exists(table_name):
-                conn.execute(f"INSERT INTO {full_table_name} SELECT * FROM _temp_df")
+        try:
+            if if_exists == "append" and self.table_exists(table_name):
+                self._append(table_name, df)
             else:
-                conn.execute(f"CREATE TABLE {full_table_name} AS SELECT * FROM _temp_df")
-
-        conn.unregister("_temp_df")
+                columns = ", ".join(
+                    f'"{name}" {sql_type}' for name, sql_type in self._frame_types().items()
+                )
+                conn.execute(f"CREATE TABLE {full_table_name} ({columns})")
+                conn.execute(f"INSERT INTO {full_table_name} BY NAME SELECT * FROM _temp_df")
+        finally:
+            conn.unregister("_temp_df")
 
         return len(df)
 
+    def _frame_types(self) -> dict[str, str]:
+        """Column name -> DuckDB type of the registered ``_temp_df``."""
+        conn = self._ensure_connection()
+        rows = conn.execute("DESCRIBE SELECT * FROM _temp_df").fetchall()
+        return {row[0]: row[1] for row in rows}
+
+    def _append(self, table_name: str, df: pd.DataFrame) -> None:
+        """Insert the registered ``_temp_df`` into an existing table by column name.
+
+        Values are cast to the table's column types. A column that has only
+        held NULLs so far was typed from an all-null DataFrame column, so it
+        takes the type of the first non-null values appended to it.
+        """
+        conn = self._ensure_connection()
+        full_table_name = f"{self.schema}.{table_name}"
+        existing = dict(
+            conn.execute(
+                """
+                SELECT column_name, data_type FROM information_schema.columns
+                WHERE table_schema = ? AND table_name = ?
+                """,
+                [self.schema, table_name],
+            ).fetchall()
+        )
+
+        select = []
+        for name, sql_type in self._frame_types().items():
+            target = existing.get(name)
+            if target is None:
+                # Not in the table: left to INSERT BY NAME to reject
+                select.append(f'"{name}"')
+                continue
+            if df[name].isna().all():
+                select.append(f'NULL::{target} AS "{name}"')
+                continue
+            if target != sql_type:
+                count = conn.execute(f'SELECT count("{name}") FROM {full_table_name}').fetchone()
+                if count is not None and count[0] == 0:
+                    conn.execute(
+                        f'ALTER TABLE {full_table_name} ALTER COLUMN "{name}" '
+                        f"SET DATA TYPE {sql_type} USING NULL"
+                    )
+                    target = sql_type
+            select.append(f'CAST("{name}" AS {target}) AS "{name}"')
+
+        conn.execute(
+            f"INSERT INTO {full_table_name} BY NAME SELECT {', '.join(select)} FROM _temp_df"
+        )
+
+    def delete_rows(self, table_name: str, column: str, values: list[Any]) -> None:
+        """Delete rows whose column value is in values.
+
+        Args:
+            table_name: Name of the table (without schema prefix).
+            column: Column to match.
+            values: Values identifying the rows to delete.
+        """
+        if not values:
+            return
+        conn = self._ensure_connection()
+        conn.register("_temp_keys", pd.DataFrame({"value": values}))
+        conn.execute(
+            f"DELETE FROM {self.schema}.{table_name} "
+            f"WHERE {column} IN (SELECT value FROM _temp_keys)"
+        )
+        conn.unregister("_temp_keys")
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Commit everything written inside the block, or nothing."""
+        conn = self._ensure_connection()
+        conn.execute("BEGIN TRANSACTION")
+        try:
+            yield
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
     def get_table_list(self) -> list[str]:
         """Get list of tables in the schema.
 
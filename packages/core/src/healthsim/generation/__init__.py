@@ -60,6 +60,7 @@ from healthsim.generation.reference_profiles import (
     merge_profile_with_reference,
     resolve_geography,
 )
+from healthsim.generation.ids import IdScheme
 from healthsim.generation.journey_engine import (
     BaseEventType,
     DelaySpec,
@@ -72,6 +73,7 @@ from healthsim.generation.journey_engine import (
     RxEventType,
     Timeline,
     TimelineEvent,
+    TimelineRetention,
     TrialEventType,
     create_journey_engine,
     create_simple_journey,
@@ -80,8 +82,12 @@ from healthsim.generation.journey_engine import (
 )
 from healthsim.generation.triggers import (
     CrossProductCoordinator,
+    EventScheduler,
     LinkedEntity,
     RegisteredTrigger,
+    TriggerEdgeMetrics,
+    TriggerEventBus,
+    TriggerGraph,
     TriggerPriority,
     TriggerRegistry,
     create_coordinator,
@@ -123,12 +129,14 @@ from healthsim.generation.journey_validation import (
     validate_journey_spec,
     validate_timeline,
     validate_events,
+    iter_event_partitions,
     create_journey_validator,
 )
 from healthsim.generation.orchestrator import (
     ProfileJourneyOrchestrator,
     EntityWithTimeline,
     OrchestratorResult,
+    ChunkedRunResult,
     orchestrate,
 )
 from healthsim.generation.skill_reference import (
@@ -228,6 +236,8 @@ __all__ = [
     "JourneySpecification",
     "Timeline",
     "TimelineEvent",
+    "TimelineRetention",
+    "IdScheme",
     "EventDefinition",
     "EventCondition",
     "DelaySpec",
@@ -244,6 +254,10 @@ __all__ = [
     "TriggerRegistry",
     "RegisteredTrigger",
     "TriggerPriority",
+    "TriggerGraph",
+    "TriggerEdgeMetrics",
+    "TriggerEventBus",
+    "EventScheduler",
     "CrossProductCoordinator",
     "LinkedEntity",
     "create_coordinator",
@@ -282,11 +296,13 @@ __all__ = [
     "validate_journey_spec",
     "validate_timeline",
     "validate_events",
+    "iter_event_partitions",
     "create_journey_validator",
     # Orchestrator
     "ProfileJourneyOrchestrator",
     "EntityWithTimeline",
     "OrchestratorResult",
+    "ChunkedRunResult",
     "orchestrate",
     # Skill Reference
     "SkillReference",
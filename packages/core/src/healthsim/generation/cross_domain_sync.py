@@ -14,10 +14,12 @@ from __future__ import annotations
 
 import hashlib
 import logging
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import date, timedelta
 from enum import Enum
-from typing import Any, Callable, Protocol
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Protocol
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
@@ -92,11 +94,63 @@ class PersonIdentity(BaseModel):
         }
 
 
+# Correlator weights used by IdentityRegistry match scoring, in the order
+# _calculate_match_score accumulates them
+MATCH_WEIGHTS = {"ssn_hash": 1.0, "dob": 0.5, "gender": 0.1, "name": 0.3}
+
+# Correlators probed for candidates, most selective first
+_BLOCKING_ORDER = ("ssn_hash", "dob", "name", "gender")
+
+
+def _identity_name(identity: PersonIdentity) -> str | None:
+    """Normalized name correlator for an identity, as in to_correlator_dict."""
+    if not identity.last_name:
+        return None
+    return f"{identity.last_name},{identity.first_name}".upper()
+
+
+def _weight(fields: Iterable[str]) -> float:
+    """Sum correlator weights in scoring order."""
+    total = 0.0
+    for field_name, weight in MATCH_WEIGHTS.items():
+        if field_name in fields:
+            total += weight
+    return total
+
+
+@lru_cache(maxsize=1024)
+def _probe_fields(shared: frozenset[str], min_confidence: float) -> tuple[str, ...]:
+    """Correlators whose blocks must be probed to find every match.
+    
+    For identities sharing the correlators in shared with the query, the
+    score is the weight of the matching ones over the weight of shared.
+    Correlators are taken from the most selective down until the ones left
+    could not reach min_confidence on their own, so any identity scoring
+    high enough matches at least one of the returned correlators.
+    """
+    total = _weight(shared)
+    remaining = set(shared)
+    fields = []
+    for field_name in _BLOCKING_ORDER:
+        if _weight(remaining) / total < min_confidence:
+            break
+        if field_name in remaining:
+            remaining.discard(field_name)
+            fields.append(field_name)
+    return tuple(fields)
+
+
 class IdentityRegistry:
     """Registry for cross-product identity correlation.
     
     Maintains a mapping of person identities across products,
     enabling consistent linking when generating related data.
+    
+    Identities are indexed into blocks by SSN hash, date of birth,
+    normalized name and gender as they are registered, so find_matches
+    only scores identities sharing a block with the correlators instead
+    of the whole registry. Correlator fields should not be changed after
+    registration; register the identity again to re-index it.
     """
     
     def __init__(self):
@@ -104,6 +158,15 @@ class IdentityRegistry:
         self._product_indexes: dict[ProductType, dict[str, str]] = {
             p: {} for p in ProductType
         }
+        # Blocking indexes: correlator -> (value, correlators present) -> IDs.
+        # Recording which correlators an identity has fixes the denominator
+        # of its match score, which find_matches uses to skip blocks.
+        self._blocks: dict[str, dict[tuple[Any, frozenset[str]], set[str]]] = {
+            field_name: {} for field_name in MATCH_WEIGHTS
+        }
+        self._presence_counts: Counter[frozenset[str]] = Counter()
+        self._names: dict[str, str | None] = {}
+        self._order: dict[str, int] = {}
     
     def register(self, identity: PersonIdentity) -> str:
         """Register a person identity.
@@ -114,19 +177,61 @@ class IdentityRegistry:
         Returns:
             Correlation ID
         """
-        self._identities[identity.correlation_id] = identity
+        correlation_id = identity.correlation_id
+        if correlation_id in self._identities:
+            self._unindex(self._identities[correlation_id])
+        else:
+            self._order[correlation_id] = len(self._order)
+        self._identities[correlation_id] = identity
+        self._index(identity)
         
         # Index by product IDs
         if identity.patient_id:
-            self._product_indexes[ProductType.PATIENTSIM][identity.patient_id] = identity.correlation_id
+            self._product_indexes[ProductType.PATIENTSIM][identity.patient_id] = correlation_id
         if identity.member_id:
-            self._product_indexes[ProductType.MEMBERSIM][identity.member_id] = identity.correlation_id
+            self._product_indexes[ProductType.MEMBERSIM][identity.member_id] = correlation_id
         if identity.rx_member_id:
-            self._product_indexes[ProductType.RXMEMBERSIM][identity.rx_member_id] = identity.correlation_id
+            self._product_indexes[ProductType.RXMEMBERSIM][identity.rx_member_id] = correlation_id
         if identity.subject_id:
-            self._product_indexes[ProductType.TRIALSIM][identity.subject_id] = identity.correlation_id
+            self._product_indexes[ProductType.TRIALSIM][identity.subject_id] = correlation_id
         
-        return identity.correlation_id
+        return correlation_id
+    
+    def _block_keys(self, identity: PersonIdentity) -> list[tuple[str, Any, frozenset[str]]]:
+        """Blocking index entries for an identity."""
+        values = {
+            "ssn_hash": identity.ssn_hash,
+            "dob": identity.date_of_birth.isoformat() if identity.date_of_birth else None,
+            "gender": identity.gender,
+            "name": _identity_name(identity),
+        }
+        present = frozenset(name for name, value in values.items() if value)
+        return [(name, values[name], present) for name in present]
+    
+    def _index(self, identity: PersonIdentity) -> None:
+        """Add an identity to the blocking indexes."""
+        self._names[identity.correlation_id] = _identity_name(identity)
+        keys = self._block_keys(identity)
+        for field_name, value, present in keys:
+            block = self._blocks[field_name].setdefault((value, present), set())
+            block.add(identity.correlation_id)
+        if keys:
+            self._presence_counts[keys[0][2]] += 1
+    
+    def _unindex(self, identity: PersonIdentity) -> None:
+        """Remove an identity from the blocking indexes."""
+        keys = self._block_keys(identity)
+        for field_name, value, present in keys:
+            index = self._blocks[field_name]
+            block = index.get((value, present))
+            if block is not None:
+                block.discard(identity.correlation_id)
+                if not block:
+                    del index[(value, present)]
+        if keys:
+            self._presence_counts[keys[0][2]] -= 1
+            if not self._presence_counts[keys[0][2]]:
+                del self._presence_counts[keys[0][2]]
     
     def get_by_correlation_id(self, correlation_id: str) -> PersonIdentity | None:
         """Get identity by correlation ID."""
@@ -190,17 +295,46 @@ class IdentityRegistry:
             min_confidence: Minimum match confidence (0-1)
             
         Returns:
-            List of (identity, confidence) tuples
+            List of (identity, confidence) tuples, highest confidence
+            first and in registration order among equal scores
         """
-        matches = []
+        if min_confidence <= 0:
+            candidates = self._identities.keys()
+        else:
+            candidates = sorted(
+                self._candidates(correlators, min_confidence), key=self._order.__getitem__
+            )
         
-        for identity in self._identities.values():
+        matches = []
+        for correlation_id in candidates:
+            identity = self._identities[correlation_id]
             score = self._calculate_match_score(identity, correlators)
             if score >= min_confidence:
                 matches.append((identity, score))
         
         return sorted(matches, key=lambda x: x[1], reverse=True)
     
+    def _candidates(self, correlators: dict[str, Any], min_confidence: float) -> set[str]:
+        """Correlation IDs that can reach min_confidence for the correlators.
+        
+        Identities are grouped by which correlators they have, which fixes
+        the denominator of their score; each group is probed only on the
+        correlators a match in that group must share (see _probe_fields).
+        """
+        query = frozenset(name for name in MATCH_WEIGHTS if correlators.get(name))
+        candidates: set[str] = set()
+        
+        for present in self._presence_counts:
+            shared = query & present
+            if not shared:
+                continue
+            for field_name in _probe_fields(shared, min_confidence):
+                block = self._blocks[field_name].get((correlators[field_name], present))
+                if block:
+                    candidates.update(block)
+        
+        return candidates
+    
     def _calculate_match_score(
         self,
         identity: PersonIdentity,
@@ -212,28 +346,31 @@ class IdentityRegistry:
         
         # SSN hash - highest weight
         if correlators.get("ssn_hash") and identity.ssn_hash:
-            total_weight += 1.0
+            total_weight += MATCH_WEIGHTS["ssn_hash"]
             if correlators["ssn_hash"] == identity.ssn_hash:
-                matched_weight += 1.0
+                matched_weight += MATCH_WEIGHTS["ssn_hash"]
         
         # DOB - high weight
         if correlators.get("dob") and identity.date_of_birth:
-            total_weight += 0.5
+            total_weight += MATCH_WEIGHTS["dob"]
             if correlators["dob"] == identity.date_of_birth.isoformat():
-                matched_weight += 0.5
+                matched_weight += MATCH_WEIGHTS["dob"]
         
         # Gender - low weight
         if correlators.get("gender") and identity.gender:
-            total_weight += 0.1
+            total_weight += MATCH_WEIGHTS["gender"]
             if correlators["gender"] == identity.gender:
-                matched_weight += 0.1
+                matched_weight += MATCH_WEIGHTS["gender"]
         
         # Name - medium weight
         if correlators.get("name") and identity.last_name:
-            total_weight += 0.3
-            identity_name = f"{identity.last_name},{identity.first_name}".upper()
+            total_weight += MATCH_WEIGHTS["name"]
+            if self._identities.get(identity.correlation_id) is identity:
+                identity_name = self._names[identity.correlation_id]
+            else:
+                identity_name = _identity_name(identity)
             if correlators["name"] == identity_name:
-                matched_weight += 0.3
+                matched_weight += MATCH_WEIGHTS["name"]
         
         if total_weight == 0:
             return 0.0
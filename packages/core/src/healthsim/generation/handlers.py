@@ -11,14 +11,13 @@ Handlers generate the actual data artifacts when events are executed.
 
 from __future__ import annotations
 
-import hashlib
 import random
-import uuid
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
-from typing import Any, Callable, Protocol
+from typing import Any, Callable, Protocol, Sequence
 
+from healthsim.generation.ids import IdScheme, deterministic_uuid, short_id, short_ids
 from healthsim.generation.journey_engine import (
     EventHandler,
     JourneyEngine,
@@ -37,21 +36,18 @@ from healthsim.generation.journey_engine import (
 class BaseEventHandler(ABC):
     """Base class for event handlers with common utilities."""
     
-    def __init__(self, seed: int | None = None):
+    def __init__(self, seed: int | None = None, id_scheme: IdScheme | str = IdScheme.LEGACY):
         self.seed = seed
+        self.id_scheme = IdScheme(id_scheme)
         self._rng = random.Random(seed)
     
     def _generate_id(self, prefix: str, entity_id: str, event_id: str) -> str:
         """Generate a deterministic ID."""
-        combined = f"{self.seed or 0}:{entity_id}:{event_id}"
-        hash_val = hashlib.md5(combined.encode()).hexdigest()[:8]
-        return f"{prefix}-{hash_val.upper()}"
+        return short_id(prefix, self.seed, entity_id, event_id, self.id_scheme)
     
     def _generate_uuid(self, entity_id: str, event_id: str) -> str:
         """Generate a deterministic UUID."""
-        combined = f"{self.seed or 0}:{entity_id}:{event_id}"
-        hash_bytes = hashlib.md5(combined.encode()).digest()
-        return str(uuid.UUID(bytes=hash_bytes[:16]))
+        return deterministic_uuid(self.seed, entity_id, event_id, self.id_scheme)
     
     @abstractmethod
     def handle(
@@ -71,6 +67,25 @@ class BaseEventHandler(ABC):
     ) -> dict[str, Any]:
         """Make handler callable for EventHandler protocol."""
         return self.handle(entity, event, context)
+    
+    def handle_batch(
+        self,
+        entities: Sequence[Any],
+        events: Sequence[TimelineEvent],
+        contexts: Sequence[dict[str, Any]],
+    ) -> list[dict[str, Any] | Exception]:
+        """Handle a batch of events (BatchEventHandler protocol).
+        
+        Subclasses override this when they can do better than one handle()
+        call per event.
+        """
+        results: list[dict[str, Any] | Exception] = []
+        for entity, event, context in zip(entities, events, contexts, strict=True):
+            try:
+                results.append(self.handle(entity, event, context))
+            except Exception as e:
+                results.append(e)
+        return results
 
 
 # =============================================================================
@@ -80,8 +95,9 @@ class BaseEventHandler(ABC):
 class PatientSimHandlers:
     """Collection of PatientSim event handlers."""
     
-    def __init__(self, seed: int | None = None):
+    def __init__(self, seed: int | None = None, id_scheme: IdScheme | str = IdScheme.LEGACY):
         self.seed = seed
+        self.id_scheme = IdScheme(id_scheme)
         self._rng = random.Random(seed)
         
         # Standard facility for generated encounters
@@ -269,32 +285,89 @@ class PatientSimHandlers:
             "interpretation": self._interpret_lab_value(loinc, value),
         }
     
+    # LOINC -> (mean, std dev, decimal places, unit); A1C depends on diabetes
+    # status and is handled separately
+    LAB_VALUE_MODELS: dict[str, tuple[float, float, int, str]] = {
+        "2345-7": (100, 25, 0, "mg/dL"),  # Glucose
+        "33914-3": (75, 20, 0, "mL/min/1.73m2"),  # eGFR
+    }
+    DEFAULT_LAB_VALUE_MODEL = (100, 10, 1, "unit")
+    
+    def _has_diabetes(self, entity: Any) -> bool:
+        """Whether an entity's conditions include type 2 diabetes (E11)."""
+        if isinstance(entity, dict):
+            conditions = entity.get("conditions", [])
+            return any("E11" in str(c) for c in conditions)
+        return False
+    
     def _generate_lab_value(self, loinc: str, entity: Any) -> tuple[float, str]:
         """Generate realistic lab value based on LOINC code."""
         # A1C
         if loinc == "4548-4":
-            # Check if entity has diabetes
-            has_diabetes = False
-            if isinstance(entity, dict):
-                conditions = entity.get("conditions", [])
-                has_diabetes = any("E11" in str(c) for c in conditions)
-            
-            if has_diabetes:
+            if self._has_diabetes(entity):
                 value = self._rng.gauss(7.8, 1.2)
             else:
                 value = self._rng.gauss(5.4, 0.3)
             return round(max(4.0, min(14.0, value)), 1), "%"
         
-        # Glucose
-        elif loinc == "2345-7":
-            return round(self._rng.gauss(100, 25), 0), "mg/dL"
-        
-        # eGFR
-        elif loinc == "33914-3":
-            return round(self._rng.gauss(75, 20), 0), "mL/min/1.73m2"
-        
-        # Default
-        return round(self._rng.gauss(100, 10), 1), "unit"
+        mean, std_dev, digits, unit = self.LAB_VALUE_MODELS.get(
+            loinc, self.DEFAULT_LAB_VALUE_MODEL
+        )
+        return round(self._rng.gauss(mean, std_dev), digits), unit
+    
+    def handle_lab_result_batch(
+        self,
+        entities: Sequence[Any],
+        events: Sequence[TimelineEvent],
+        contexts: Sequence[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """Handle many laboratory result events at once.
+        
+        Matches handle_lab_result event for event, drawing lab values in the
+        same order. IDs are generated in one pass and each entity's diabetes
+        status is checked once, however many A1C results it has.
+        """
+        patient_ids = [self._get_entity_id(entity) for entity in entities]
+        result_ids = short_ids(
+            "RES",
+            self.seed,
+            patient_ids,
+            [event.timeline_event_id for event in events],
+            self.id_scheme,
+        )
+        gauss = self._rng.gauss
+        models = self.LAB_VALUE_MODELS
+        default_model = self.DEFAULT_LAB_VALUE_MODEL
+        diabetes: dict[int, bool] = {}
+        
+        results = []
+        for entity, event, context, patient_id, result_id in zip(
+            entities, events, contexts, patient_ids, result_ids, strict=True
+        ):
+            params = event.result.get("parameters", {}) if event.result else {}
+            loinc = params.get("loinc", "4548-4")
+            if loinc == "4548-4":
+                has_diabetes = diabetes.get(id(entity))
+                if has_diabetes is None:
+                    has_diabetes = diabetes[id(entity)] = self._has_diabetes(entity)
+                value = gauss(7.8, 1.2) if has_diabetes else gauss(5.4, 0.3)
+                value, unit = round(max(4.0, min(14.0, value)), 1), "%"
+            else:
+                mean, std_dev, digits, unit = models.get(loinc, default_model)
+                value = round(gauss(mean, std_dev), digits)
+            results.append({
+                "result_id": result_id,
+                "order_id": params.get("order_id", context.get("last_order_id")),
+                "patient_id": patient_id,
+                "loinc": loinc,
+                "test_name": params.get("test_name", "Lab Test"),
+                "value": value,
+                "unit": unit,
+                "result_date": event.scheduled_date.isoformat(),
+                "status": "final",
+                "interpretation": self._interpret_lab_value(loinc, value),
+            })
+        return results
     
     def _interpret_lab_value(self, loinc: str, value: float) -> str:
         """Interpret lab value."""
@@ -358,9 +431,7 @@ class PatientSimHandlers:
     
     def _generate_id(self, prefix: str, patient_id: str, event_id: str) -> str:
         """Generate deterministic ID."""
-        combined = f"{self.seed or 0}:{patient_id}:{event_id}"
-        hash_val = hashlib.md5(combined.encode()).hexdigest()[:8]
-        return f"{prefix}-{hash_val.upper()}"
+        return short_id(prefix, self.seed, patient_id, event_id, self.id_scheme)
     
     def register_all(self, engine: JourneyEngine) -> None:
         """Register all PatientSim handlers with an engine."""
@@ -377,6 +448,8 @@ class PatientSimHandlers:
         
         for event_type, handler in handlers.items():
             engine.register_handler("patientsim", event_type, handler)
+        
+        engine.register_batch_handler("patientsim", "lab_result", self.handle_lab_result_batch)
 
 
 
@@ -387,8 +460,9 @@ class PatientSimHandlers:
 class MemberSimHandlers:
     """Collection of MemberSim event handlers."""
     
-    def __init__(self, seed: int | None = None):
+    def __init__(self, seed: int | None = None, id_scheme: IdScheme | str = IdScheme.LEGACY):
         self.seed = seed
+        self.id_scheme = IdScheme(id_scheme)
         self._rng = random.Random(seed)
         
         # Standard plan options
@@ -407,9 +481,7 @@ class MemberSimHandlers:
     
     def _generate_id(self, prefix: str, member_id: str, event_id: str) -> str:
         """Generate deterministic ID."""
-        combined = f"{self.seed or 0}:{member_id}:{event_id}"
-        hash_val = hashlib.md5(combined.encode()).hexdigest()[:8]
-        return f"{prefix}-{hash_val.upper()}"
+        return short_id(prefix, self.seed, member_id, event_id, self.id_scheme)
     
     def _select_plan(self, plan_type: str | None = None) -> dict:
         """Select a plan, optionally by type."""
@@ -659,8 +731,9 @@ class MemberSimHandlers:
 class RxMemberSimHandlers:
     """Collection of RxMemberSim event handlers."""
     
-    def __init__(self, seed: int | None = None):
+    def __init__(self, seed: int | None = None, id_scheme: IdScheme | str = IdScheme.LEGACY):
         self.seed = seed
+        self.id_scheme = IdScheme(id_scheme)
         self._rng = random.Random(seed)
         
         # Common pharmacy chains
@@ -678,9 +751,7 @@ class RxMemberSimHandlers:
     
     def _generate_id(self, prefix: str, member_id: str, event_id: str) -> str:
         """Generate deterministic ID."""
-        combined = f"{self.seed or 0}:{member_id}:{event_id}"
-        hash_val = hashlib.md5(combined.encode()).hexdigest()[:8]
-        return f"{prefix}-{hash_val.upper()}"
+        return short_id(prefix, self.seed, member_id, event_id, self.id_scheme)
     
     def _select_pharmacy(self) -> dict:
         """Select a pharmacy."""
@@ -923,8 +994,9 @@ class RxMemberSimHandlers:
 class TrialSimHandlers:
     """Collection of TrialSim event handlers."""
     
-    def __init__(self, seed: int | None = None):
+    def __init__(self, seed: int | None = None, id_scheme: IdScheme | str = IdScheme.LEGACY):
         self.seed = seed
+        self.id_scheme = IdScheme(id_scheme)
         self._rng = random.Random(seed)
         
         # Trial sites
@@ -945,9 +1017,7 @@ class TrialSimHandlers:
     
     def _generate_id(self, prefix: str, subject_id: str, event_id: str) -> str:
         """Generate deterministic ID."""
-        combined = f"{self.seed or 0}:{subject_id}:{event_id}"
-        hash_val = hashlib.md5(combined.encode()).hexdigest()[:8]
-        return f"{prefix}-{hash_val.upper()}"
+        return short_id(prefix, self.seed, subject_id, event_id, self.id_scheme)
     
     def _select_site(self) -> dict:
         """Select a trial site."""
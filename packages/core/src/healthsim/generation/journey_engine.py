@@ -14,8 +14,11 @@ from __future__ import annotations
 
 import hashlib
 import random
+import time
+import weakref
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 from enum import Enum
@@ -23,6 +26,9 @@ from typing import Any, Protocol
 
 from pydantic import BaseModel, Field
 
+from healthsim.generation.ids import IdScheme, derive_seed
+from healthsim.generation.skill_reference import compile_entity_template
+
 # Import for skill-aware parameter resolution (lazy to avoid circular imports)
 _parameter_resolver = None
 
@@ -46,6 +52,38 @@ def _get_skill_registry():
     return _skill_registry
 
 
+class _LazyEntityDict(Mapping):
+    """Read-only dict view of an entity, converted on first access.
+    
+    Most events never read entity attributes, so the model_dump() of the
+    entity is deferred until parameter resolution actually needs it.
+    """
+    
+    __slots__ = ("_entity", "_convert", "_data")
+    
+    def __init__(self, entity: Any, convert: Callable[[Any], dict[str, Any]]):
+        self._entity = entity
+        self._convert = convert
+        self._data: dict[str, Any] | None = None
+    
+    def _dict(self) -> dict[str, Any]:
+        if self._data is None:
+            self._data = self._convert(self._entity)
+        return self._data
+    
+    def __getitem__(self, key: str) -> Any:
+        return self._dict()[key]
+    
+    def __iter__(self):
+        return iter(self._dict())
+    
+    def __len__(self) -> int:
+        return len(self._dict())
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._dict().get(key, default)
+
+
 # =============================================================================
 # Event Type System
 # =============================================================================
@@ -444,11 +482,90 @@ class EventHandler(Protocol):
         ...
 
 
+class BatchEventHandler(Protocol):
+    """Protocol for handlers that execute many events of one type at once.
+    
+    The engine calls handle_batch once per (product, event_type) group with
+    parallel sequences. An item of the returned list may be an Exception
+    instance to fail just that event.
+    """
+    
+    def handle_batch(
+        self,
+        entities: Sequence[Any],
+        events: Sequence[TimelineEvent],
+        contexts: Sequence[dict[str, Any]],
+    ) -> list[dict[str, Any] | Exception]:
+        """Execute the events and return one result per event."""
+        ...
+
+
+BatchHandlerFunction = Callable[
+    [Sequence[Any], Sequence[TimelineEvent], Sequence[dict[str, Any]]],
+    list[dict[str, Any] | Exception],
+]
+
+
+@dataclass
+class _EventGroup:
+    """Due events of one (product, event_type), as parallel lists."""
+    
+    slots: list[list] = field(default_factory=list)  # Per-timeline result list
+    positions: list[int] = field(default_factory=list)  # Index into that list
+    timelines: list[Timeline] = field(default_factory=list)
+    entities: list[Any] = field(default_factory=list)
+    events: list[TimelineEvent] = field(default_factory=list)
+    
+    def chunk(self, start: int, stop: int) -> _EventGroup:
+        """Slice of the group."""
+        return _EventGroup(
+            self.slots[start:stop],
+            self.positions[start:stop],
+            self.timelines[start:stop],
+            self.entities[start:stop],
+            self.events[start:stop],
+        )
+
+
+class SingleEventBatchAdapter:
+    """Runs a single-event handler as a BatchEventHandler."""
+    
+    def __init__(self, handler: EventHandler):
+        self.handler = handler
+    
+    def handle_batch(
+        self,
+        entities: Sequence[Any],
+        events: Sequence[TimelineEvent],
+        contexts: Sequence[dict[str, Any]],
+    ) -> list[dict[str, Any] | Exception]:
+        """Call the wrapped handler per event, capturing per-event failures."""
+        results: list[dict[str, Any] | Exception] = []
+        for entity, event, context in zip(entities, events, contexts, strict=True):
+            try:
+                results.append(self.handler(entity, event, context))
+            except Exception as e:
+                results.append(e)
+        return results
+
+
 
 # =============================================================================
 # Journey Engine
 # =============================================================================
 
+# Default cap on timelines an engine keeps for cross-product lookups
+DEFAULT_MAX_TIMELINES = 10_000
+
+
+class TimelineRetention(str, Enum):
+    """How a JourneyEngine keeps the timelines it creates."""
+    
+    NONE = "none"  # Not retained; callers keep their own references
+    LRU = "lru"  # Most recently used, up to max_timelines
+    WEAK = "weak"  # Only while something else still references the timeline
+
+
 class JourneyEngine:
     """Engine for executing journeys and generating timelines.
     
@@ -467,23 +584,46 @@ class JourneyEngine:
         >>> results = engine.execute_timeline(timeline, patient, up_to_date=date.today())
     """
     
-    def __init__(self, seed: int | None = None):
+    def __init__(
+        self,
+        seed: int | None = None,
+        retention: TimelineRetention | str = TimelineRetention.LRU,
+        max_timelines: int | None = DEFAULT_MAX_TIMELINES,
+        id_scheme: IdScheme | str = IdScheme.LEGACY,
+    ):
         """Initialize the journey engine.
         
         Args:
             seed: Random seed for reproducibility
+            retention: How created timelines are kept for get_timeline()
+            max_timelines: Cap for LRU retention (None for unbounded)
+            id_scheme: How event seeds and IDs are derived (LEGACY reproduces
+                timelines from earlier releases)
         """
         self.seed = seed
+        self.id_scheme = IdScheme(id_scheme)
         self._rng = random.Random(seed)
         
         # Handlers by product and event type
         self._handlers: dict[str, dict[str, EventHandler]] = {}
         
+        # Batch handlers by product and event type; single-event handlers
+        # are adapted on demand
+        self._batch_handlers: dict[str, dict[str, BatchHandlerFunction]] = {}
+        
         # Cross-product trigger handlers
         self._trigger_handlers: dict[str, Callable] = {}
+        self._trigger_bus: Any = None  # triggers.TriggerEventBus
+        self._coordinator_bus: Any = None  # bus of a running coordinator
+        self._event_log: Any = None  # state.journey_events.JourneyEventLog
         
         # Active timelines for cross-product coordination
-        self._active_timelines: dict[str, Timeline] = {}
+        self.retention = TimelineRetention(retention)
+        self.max_timelines = max_timelines
+        self._active_timelines: OrderedDict[str, Timeline] = OrderedDict()
+        self._weak_timelines: weakref.WeakValueDictionary[str, Timeline] = (
+            weakref.WeakValueDictionary()
+        )
     
     def register_handler(
         self,
@@ -502,6 +642,38 @@ class JourneyEngine:
             self._handlers[product] = {}
         self._handlers[product][event_type] = handler
     
+    def register_batch_handler(
+        self,
+        product: str,
+        event_type: str,
+        handler: BatchEventHandler | BatchHandlerFunction,
+    ) -> None:
+        """Register a batch handler used by execute_timelines().
+        
+        execute_event() and execute_timeline() keep using the single-event
+        handler, so products should register both.
+        
+        Args:
+            product: Product identifier (e.g., "patientsim", "membersim")
+            event_type: Event type string
+            handler: Object implementing handle_batch, or the function itself
+        """
+        self._batch_handlers.setdefault(product, {})[event_type] = getattr(
+            handler, "handle_batch", handler
+        )
+    
+    def _get_batch_handler(self, product: str, event_type: str) -> BatchHandlerFunction | None:
+        """Batch function for a product/event type, adapting a single-event handler."""
+        handler = self._batch_handlers.get(product, {}).get(event_type)
+        if handler is not None:
+            return handler
+        single = self._handlers.get(product, {}).get(event_type)
+        if single is None:
+            return None
+        if hasattr(single, "handle_batch"):
+            return single.handle_batch
+        return SingleEventBatchAdapter(single).handle_batch
+    
     def register_trigger_handler(
         self,
         target_product: str,
@@ -515,6 +687,33 @@ class JourneyEngine:
         """
         self._trigger_handlers[target_product] = handler
     
+    def attach_event_log(self, log: Any) -> None:
+        """Record every executed, failed or skipped event to an event log.
+        
+        Args:
+            log: A state.journey_events.JourneyEventLog, or None to detach
+        """
+        self._event_log = log
+    
+    def attach_trigger_bus(self, bus: Any) -> None:
+        """Publish every executed event to a trigger bus.
+        
+        Args:
+            bus: A triggers.TriggerEventBus, or None to detach
+        """
+        self._trigger_bus = bus
+    
+    def attach_coordinator_bus(self, bus: Any) -> None:
+        """Mark the engine as driven by a coordinator that publishes its events.
+        
+        While a coordinator bus is attached the coordinator publishes every
+        executed event itself, so the engine's own trigger bus is skipped.
+        
+        Args:
+            bus: The coordinator's triggers.TriggerEventBus, or None to detach
+        """
+        self._coordinator_bus = bus
+    
     def create_timeline(
         self,
         entity: Any,
@@ -576,7 +775,9 @@ class JourneyEngine:
             event_date = base_date + delay
             
             # Create timeline event
-            timeline_event_id = self._generate_event_id(entity_id, event_def.event_id)
+            timeline_event_id = self._generate_event_id(
+                entity_id, event_def.event_id, event_seed
+            )
             timeline_event = TimelineEvent(
                 timeline_event_id=timeline_event_id,
                 journey_id=journey.journey_id,
@@ -601,9 +802,39 @@ class JourneyEngine:
             timeline.end_date = max(e.scheduled_date for e in timeline.events)
         
         # Register as active timeline
-        self._active_timelines[timeline.entity_id] = timeline
+        self._retain(timeline)
         
         return timeline
+    
+    def _retain(self, timeline: Timeline) -> None:
+        """Keep a timeline for get_timeline() according to the retention policy."""
+        if self.retention == TimelineRetention.WEAK:
+            self._weak_timelines[timeline.entity_id] = timeline
+        elif self.retention == TimelineRetention.LRU:
+            self._active_timelines[timeline.entity_id] = timeline
+            self._active_timelines.move_to_end(timeline.entity_id)
+            if self.max_timelines is not None:
+                while len(self._active_timelines) > self.max_timelines:
+                    self._active_timelines.popitem(last=False)
+    
+    def get_timeline(self, entity_id: str) -> Timeline | None:
+        """Get the retained timeline for an entity, if still held."""
+        if self.retention == TimelineRetention.WEAK:
+            return self._weak_timelines.get(entity_id)
+        timeline = self._active_timelines.get(entity_id)
+        if timeline is not None:
+            self._active_timelines.move_to_end(entity_id)
+        return timeline
+    
+    def release(self, entity_id: str) -> Timeline | None:
+        """Stop retaining an entity's timeline.
+        
+        Returns:
+            The released timeline, or None if it was not retained
+        """
+        if self.retention == TimelineRetention.WEAK:
+            return self._weak_timelines.pop(entity_id, None)
+        return self._active_timelines.pop(entity_id, None)
 
     
     def execute_event(
@@ -629,35 +860,69 @@ class JourneyEngine:
         
         # Find handler
         if product not in self._handlers or event_type not in self._handlers[product]:
+            if self._event_log is not None:
+                self._event_log.record_event(timeline, event, "skipped")
             return {"status": "skipped", "reason": f"No handler for {product}/{event_type}"}
         
         handler = self._handlers[product][event_type]
+        started = time.perf_counter_ns()
         
         try:
-            # Resolve skill references in parameters
-            entity_dict = self._entity_to_dict(entity)
-            resolved_params = self._resolve_event_parameters(
-                event.parameters, 
-                entity_dict,
-                event_type=event.event_type,
-                condition=event.condition,
-            )
-            event.resolved_parameters = resolved_params
-            
-            # Merge resolved parameters into context
-            exec_context = dict(context or {})
-            exec_context["event_parameters"] = resolved_params
-            
+            exec_context = self._prepare_event(event, entity, context)
             result = handler(entity, event, exec_context)
-            timeline.mark_executed(event.timeline_event_id, result)
-            
-            # Process triggers
-            self._process_triggers(event, result, exec_context)
-            
-            return {"status": "executed", "outputs": result, "parameters": resolved_params}
+            outcome = self._complete_event(timeline, event, result, exec_context)
         except Exception as e:
             event.status = "failed"
-            return {"status": "failed", "error": str(e)}
+            outcome = {"status": "failed", "error": str(e)}
+        
+        if self._event_log is not None:
+            self._event_log.record_event(
+                timeline, event, outcome["status"],
+                (time.perf_counter_ns() - started) // 1000, handler,
+            )
+        return outcome
+    
+    def _prepare_event(
+        self,
+        event: TimelineEvent,
+        entity: Any,
+        context: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        """Resolve an event's parameters and build its execution context."""
+        # Resolve skill references in parameters; the entity is only
+        # converted to a dict if resolution reads one of its attributes
+        entity_dict = _LazyEntityDict(entity, self._entity_to_dict)
+        resolved_params = self._resolve_event_parameters(
+            event.parameters, 
+            entity_dict,
+            event_type=event.event_type,
+            condition=event.condition,
+        )
+        event.resolved_parameters = resolved_params
+        
+        # Merge resolved parameters into context
+        exec_context = dict(context or {})
+        exec_context["event_parameters"] = resolved_params
+        return exec_context
+    
+    def _complete_event(
+        self,
+        timeline: Timeline,
+        event: TimelineEvent,
+        result: dict[str, Any],
+        exec_context: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Record a handler result on the timeline and process triggers."""
+        timeline.mark_executed(event.timeline_event_id, result)
+        
+        # Process triggers
+        self._process_triggers(event, result, exec_context)
+        
+        return {
+            "status": "executed",
+            "outputs": result,
+            "parameters": exec_context["event_parameters"],
+        }
     
     def _entity_to_dict(self, entity: Any) -> dict[str, Any]:
         """Convert entity to dictionary for parameter resolution."""
@@ -756,21 +1021,7 @@ class JourneyEngine:
     
     def _resolve_entity_var(self, value: str, entity: dict[str, Any]) -> Any:
         """Resolve ${entity.x} variables in a string."""
-        import re
-        pattern = r"\$\{entity\.(\w+)\}"
-        
-        def replacer(match):
-            attr = match.group(1)
-            return str(entity.get(attr, match.group(0)))
-        
-        result = re.sub(pattern, replacer, value)
-        
-        # If entire string was a variable, return the actual value
-        if value.startswith("${entity.") and value.endswith("}"):
-            attr = value[9:-1]
-            return entity.get(attr, value)
-        
-        return result
+        return compile_entity_template(value).render(entity)
     
     def execute_timeline(
         self,
@@ -804,6 +1055,175 @@ class JourneyEngine:
         
         return results
     
+    def execute_timelines(
+        self,
+        timelines: Sequence[tuple[Timeline, Any]],
+        up_to_date: date | None = None,
+        context: dict[str, Any] | None = None,
+        batch_size: int = 1024,
+    ) -> list[list[dict[str, Any]]]:
+        """Execute pending events for many entities with batch dispatch.
+        
+        Due events are grouped by (product, event_type) and each group goes to
+        its handler's handle_batch in one call. Single-event handlers run
+        through SingleEventBatchAdapter. Handlers drawing random numbers see
+        events in group order rather than per-entity order.
+        
+        Args:
+            timelines: (timeline, entity) pairs
+            up_to_date: Execute events up to this date
+            context: Additional context shared by every event
+            batch_size: Most events passed to one handle_batch call
+            
+        Returns:
+            Per timeline, the same results execute_timeline() would return
+        """
+        target_date = up_to_date or date.max
+        results: list[list[dict[str, Any] | None]] = []
+        # (product, event_type) -> parallel lists of (result slot, timeline, entity, event)
+        groups: dict[tuple[str, str], _EventGroup] = {}
+        
+        for timeline, entity in timelines:
+            due = timeline.get_events_up_to(target_date)
+            slots: list[dict[str, Any] | None] = [None] * len(due)
+            results.append(slots)
+            for j, event in enumerate(due):
+                key = (event.product, event.event_type)
+                group = groups.get(key)
+                if group is None:
+                    group = groups[key] = _EventGroup()
+                group.slots.append(slots)
+                group.positions.append(j)
+                group.timelines.append(timeline)
+                group.entities.append(entity)
+                group.events.append(event)
+        
+        for (product, event_type), group in groups.items():
+            handle_batch = self._get_batch_handler(product, event_type)
+            # Chunks keep per-event intermediates short-lived, so they do not
+            # pile up into the older GC generations on large populations
+            for start in range(0, len(group.events), batch_size):
+                chunk = group.chunk(start, start + batch_size)
+                if handle_batch is None:
+                    skipped = {
+                        "status": "skipped",
+                        "reason": f"No handler for {product}/{event_type}",
+                    }
+                    outcomes = [skipped] * len(chunk.events)
+                    if self._event_log is not None:
+                        for timeline, event in zip(chunk.timelines, chunk.events, strict=True):
+                            self._event_log.record_event(timeline, event, "skipped")
+                else:
+                    outcomes = self._execute_group(handle_batch, chunk, context)
+                for slots, j, event, outcome in zip(
+                    chunk.slots, chunk.positions, chunk.events, outcomes, strict=True
+                ):
+                    slots[j] = {
+                        "event_id": event.timeline_event_id,
+                        "event_type": event.event_type,
+                        "scheduled_date": event.scheduled_date.isoformat(),
+                        **outcome,
+                    }
+        
+        return results
+    
+    def _execute_group(
+        self,
+        handle_batch: BatchHandlerFunction,
+        group: _EventGroup,
+        context: dict[str, Any] | None,
+    ) -> list[dict[str, Any]]:
+        """Run one (product, event_type) group through a batch handler."""
+        outcomes: list[dict[str, Any] | None] = [None] * len(group.events)
+        ready: list[int] = []
+        exec_contexts: list[dict[str, Any]] = []
+        for k, (entity, event) in enumerate(zip(group.entities, group.events, strict=True)):
+            try:
+                exec_contexts.append(self._prepare_event(event, entity, context))
+                ready.append(k)
+            except Exception as e:
+                event.status = "failed"
+                outcomes[k] = {"status": "failed", "error": str(e)}
+        
+        if len(ready) == len(group.events):
+            entities, events = group.entities, group.events
+        else:
+            entities = [group.entities[k] for k in ready]
+            events = [group.events[k] for k in ready]
+        started = time.perf_counter_ns()
+        try:
+            handled = handle_batch(entities, events, exec_contexts)
+            if len(handled) != len(ready):
+                raise ValueError(
+                    f"handle_batch returned {len(handled)} results for {len(ready)} events"
+                )
+        except Exception as e:
+            handled = [e] * len(ready)
+        
+        for k, exec_context, result in zip(ready, exec_contexts, handled, strict=True):
+            event = group.events[k]
+            if isinstance(result, Exception):
+                event.status = "failed"
+                outcomes[k] = {"status": "failed", "error": str(result)}
+                continue
+            try:
+                outcomes[k] = self._complete_event(
+                    group.timelines[k], event, result, exec_context
+                )
+            except Exception as e:
+                event.status = "failed"
+                outcomes[k] = {"status": "failed", "error": str(e)}
+        
+        if self._event_log is not None:
+            # The batch is timed as a whole; each event gets an equal share
+            duration_us = (time.perf_counter_ns() - started) // 1000 // max(len(ready), 1)
+            handler = handle_batch
+            adapter = getattr(handle_batch, "__self__", None)
+            if isinstance(adapter, SingleEventBatchAdapter):
+                handler = adapter.handler
+            for timeline, event, outcome in zip(
+                group.timelines, group.events, outcomes, strict=True
+            ):
+                self._event_log.record_event(
+                    timeline, event, outcome["status"], duration_us, handler
+                )
+        return outcomes
+    
+    def simulate(
+        self,
+        entities: Iterable[Any],
+        journey: JourneySpecification,
+        entity_type: str,
+        start_date: date | None = None,
+        up_to_date: date | None = None,
+        parameters: dict[str, Any] | None = None,
+        context: dict[str, Any] | None = None,
+    ) -> Iterator[tuple[Timeline, list[dict[str, Any]]]]:
+        """Create and execute a timeline per entity, one entity at a time.
+        
+        Timelines whose every event has been run are released before they are
+        yielded, so a population of any size runs in constant engine memory.
+        Timelines cut off by up_to_date stay retained for get_timeline().
+        
+        Args:
+            entities: Entities to simulate (any iterable, consumed lazily)
+            journey: Journey specification to use
+            entity_type: Type identifier for the entities
+            start_date: When to start each timeline
+            up_to_date: Execute events up to this date
+            parameters: Override journey parameters
+            context: Additional execution context
+            
+        Yields:
+            (timeline, execution results) per entity
+        """
+        for entity in entities:
+            timeline = self.create_timeline(entity, entity_type, journey, start_date, parameters)
+            results = self.execute_timeline(timeline, entity, up_to_date, context)
+            if timeline.end_date is None or up_to_date is None or timeline.end_date <= up_to_date:
+                self.release(timeline.entity_id)
+            yield timeline, results
+    
     def _process_triggers(
         self,
         event: TimelineEvent,
@@ -811,9 +1231,8 @@ class JourneyEngine:
         context: dict[str, Any]
     ) -> None:
         """Process cross-product triggers from an executed event."""
-        # This would dispatch to trigger handlers for cross-product coordination
-        # Implementation depends on product-specific trigger definitions
-        pass
+        if self._trigger_bus is not None and self._coordinator_bus is None:
+            self._trigger_bus.publish(event, result, context)
     
     def _build_context(
         self,
@@ -848,23 +1267,35 @@ class JourneyEngine:
     def _get_entity_id(self, entity: Any) -> str:
         """Extract entity ID from entity."""
         # Try common ID field names
-        for field in ["entity_id", "patient_id", "member_id", "id"]:
-            if hasattr(entity, field):
-                return str(getattr(entity, field))
-            if isinstance(entity, dict) and field in entity:
-                return str(entity[field])
+        for attr in ["entity_id", "patient_id", "member_id", "id"]:
+            if hasattr(entity, attr):
+                return str(getattr(entity, attr))
+            if isinstance(entity, dict) and attr in entity:
+                return str(entity[attr])
         
         # Fallback to hash
         return hashlib.md5(str(entity).encode()).hexdigest()[:12]
     
     def _derive_seed(self, entity_id: str, event_id: str) -> int:
         """Derive a deterministic seed from entity and event IDs."""
-        combined = f"{self.seed or 0}:{entity_id}:{event_id}"
-        return int(hashlib.md5(combined.encode()).hexdigest()[:8], 16)
+        return derive_seed(self.seed, entity_id, event_id, self.id_scheme)
     
-    def _generate_event_id(self, entity_id: str, event_def_id: str) -> str:
-        """Generate unique timeline event ID."""
-        return f"{entity_id}_{event_def_id}_{self._derive_seed(entity_id, event_def_id)}"
+    def _generate_event_id(
+        self,
+        entity_id: str,
+        event_def_id: str,
+        event_seed: int | None = None,
+    ) -> str:
+        """Generate unique timeline event ID.
+        
+        Args:
+            entity_id: Entity the event belongs to
+            event_def_id: Event definition ID
+            event_seed: The pair's _derive_seed value, if already computed
+        """
+        if event_seed is None:
+            event_seed = self._derive_seed(entity_id, event_def_id)
+        return f"{entity_id}_{event_def_id}_{event_seed}"
 
 
 
@@ -14,10 +14,13 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 from enum import Enum
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator
 
 from pydantic import BaseModel, Field
 
+if TYPE_CHECKING:
+    import duckdb
+
 
 class ValidationSeverity(str, Enum):
     """Severity level for validation issues."""
@@ -545,6 +548,35 @@ class TimelineValidator:
 # Cross-Event Validators
 # =============================================================================
 
+# Fields whose equal, non-empty values make two events related
+CORRELATION_FIELDS = ("patient_id", "member_id", "subject_id", "encounter_id")
+
+
+def _event_id(event: dict) -> Any:
+    return event.get("id") or event.get("event_id")
+
+
+class _CorrelationIndex:
+    """Positions of one event type's events, by correlation key and by ID."""
+    
+    def __init__(self, events: list[dict]):
+        self.events = events
+        self.by_key: dict[tuple[str, Any], list[int]] = {}
+        self.by_id: dict[Any, list[int]] = {}
+        # Events with an unhashable key or ID; compared pairwise instead
+        self.unindexed: list[int] = []
+        
+        for position, event in enumerate(events):
+            try:
+                self.by_id.setdefault(_event_id(event), []).append(position)
+                for key_field in CORRELATION_FIELDS:
+                    value = event.get(key_field)
+                    if value:
+                        self.by_key.setdefault((key_field, value), []).append(position)
+            except TypeError:
+                self.unindexed.append(position)
+
+
 class CrossEventValidator:
     """Validates consistency across related events.
     
@@ -553,6 +585,10 @@ class CrossEventValidator:
     - Discharge not before admission
     - Prescription refills after initial fill
     - Lab results after lab orders
+    
+    Target events are indexed by correlation key (CORRELATION_FIELDS and
+    explicit relationships), so each source event is only compared with
+    events it shares a key with.
     """
     
     def __init__(self):
@@ -620,31 +656,123 @@ class CrossEventValidator:
         """
         result = ValidationResult(passed=True)
         
-        # Index events by type and ID
+        # Index events by type
         by_type: dict[str, list[dict]] = {}
-        by_id: dict[str, dict] = {}
-        
         for event in events:
-            event_type = event.get("event_type", "unknown")
-            by_type.setdefault(event_type, []).append(event)
-            
-            event_id = event.get("id") or event.get("event_id")
-            if event_id:
-                by_id[event_id] = event
+            by_type.setdefault(event.get("event_type", "unknown"), []).append(event)
+        
+        # A subclass with its own relatedness test gets the all-pairs scan
+        indexed = type(self)._are_related is CrossEventValidator._are_related
+        indexes: dict[str, _CorrelationIndex] = {}
         
         # Apply rules
         for source_type, target_type, check in self._rules:
-            sources = by_type.get(source_type, [])
-            targets = by_type.get(target_type, [])
+            sources = by_type.get(source_type)
+            targets = by_type.get(target_type)
+            if not sources or not targets:
+                continue
             
+            if not indexed:
+                for source in sources:
+                    for target in targets:
+                        if self._are_related(source, target, relationships):
+                            check(source, target, result)
+                continue
+            
+            index = indexes.get(target_type)
+            if index is None:
+                index = indexes[target_type] = _CorrelationIndex(targets)
             for source in sources:
-                for target in targets:
-                    # Check if related (by ID or matching fields)
-                    if self._are_related(source, target, relationships):
-                        check(source, target, result)
+                for position in self._related_positions(source, index, relationships):
+                    check(source, targets[position], result)
         
         return result
     
+    def validate_stream(
+        self,
+        partitions: Iterable[list[dict]],
+        relationships: dict[str, str] | None = None
+    ) -> ValidationResult:
+        """Validate a cohort one partition of events at a time.
+        
+        Only events in the same partition are compared, so partition by the
+        entity key the rules correlate on (e.g. all of a patient's events
+        together). Memory use is bounded by the largest partition.
+        
+        Args:
+            partitions: Lists of event dictionaries
+            relationships: Optional dict mapping event IDs to related event IDs
+            
+        Returns:
+            Combined ValidationResult
+        """
+        result = ValidationResult(passed=True)
+        for events in partitions:
+            result.merge(self.validate(events, relationships))
+        return result
+    
+    def validate_duckdb(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        source: str,
+        partition_by: str = "patient_id",
+        relationships: dict[str, str] | None = None,
+        fetch_size: int = 10_000,
+    ) -> ValidationResult:
+        """Validate events stored in DuckDB, streaming one partition at a time.
+        
+        Args:
+            conn: DuckDB connection
+            source: Table name or SELECT query; one row per event, with an
+                event_type column
+            partition_by: Column whose equal values form one partition
+            relationships: Optional dict mapping event IDs to related event IDs
+            fetch_size: Rows fetched from DuckDB per round trip
+            
+        Returns:
+            Combined ValidationResult
+        """
+        partitions = iter_event_partitions(conn, source, partition_by, fetch_size)
+        return self.validate_stream(partitions, relationships)
+    
+    def _related_positions(
+        self,
+        source: dict,
+        index: _CorrelationIndex,
+        relationships: dict[str, str] | None
+    ) -> list[int]:
+        """Positions of the indexed targets related to a source, in order."""
+        hits: list[list[int]] = []
+        try:
+            if relationships:
+                source_id = _event_id(source)
+                if source_id:
+                    related = index.by_id.get(relationships.get(source_id))
+                    if related:
+                        hits.append(related)
+            for key_field in CORRELATION_FIELDS:
+                value = source.get(key_field)
+                if value:
+                    related = index.by_key.get((key_field, value))
+                    if related:
+                        hits.append(related)
+        except TypeError:
+            # Unhashable key value on the source: fall back to a full scan
+            return [
+                position for position, target in enumerate(index.events)
+                if self._are_related(source, target, relationships)
+            ]
+        
+        if index.unindexed:
+            hits.append([
+                position for position in index.unindexed
+                if self._are_related(source, index.events[position], relationships)
+            ])
+        
+        if len(hits) == 1:
+            return hits[0]
+        return sorted({position for related in hits for position in related})
+    
     def _are_related(
         self,
         source: dict,
@@ -654,13 +782,13 @@ class CrossEventValidator:
         """Check if two events are related."""
         # Check explicit relationships
         if relationships:
-            source_id = source.get("id") or source.get("event_id")
-            target_id = target.get("id") or target.get("event_id")
+            source_id = _event_id(source)
+            target_id = _event_id(target)
             if source_id and relationships.get(source_id) == target_id:
                 return True
         
         # Check common identifiers
-        for field in ["patient_id", "member_id", "subject_id", "encounter_id"]:
+        for field in CORRELATION_FIELDS:
             if source.get(field) and source.get(field) == target.get(field):
                 return True
         
@@ -752,6 +880,58 @@ class CrossEventValidator:
         return None
 
 
+def iter_event_partitions(
+    conn: duckdb.DuckDBPyConnection,
+    source: str,
+    partition_by: str = "patient_id",
+    fetch_size: int = 10_000,
+) -> Iterator[list[dict]]:
+    """Stream events from DuckDB as lists sharing one partition_by value.
+    
+    Rows are ordered by partition_by in DuckDB and fetched fetch_size at a
+    time, so only the current partition is held in memory. NULL columns are
+    left out of the event dicts.
+    
+    Args:
+        conn: DuckDB connection
+        source: Table name or SELECT query
+        partition_by: Column to partition on
+        fetch_size: Rows fetched per round trip
+        
+    Yields:
+        Lists of event dictionaries
+    """
+    stripped = source.strip()
+    if stripped.lower().startswith(("select", "with")):
+        relation = f"({stripped})"
+    else:
+        relation = stripped
+    column = '"' + partition_by.replace('"', '""') + '"'
+    cursor = conn.execute(
+        f"SELECT * FROM {relation} AS events ORDER BY {column} NULLS LAST"
+    )
+    columns = [description[0] for description in cursor.description]
+    key_position = columns.index(partition_by)
+    
+    partition: list[dict] = []
+    current: Any = None
+    while True:
+        rows = cursor.fetchmany(fetch_size)
+        if not rows:
+            break
+        for row in rows:
+            key = row[key_position]
+            if partition and key != current:
+                yield partition
+                partition = []
+            current = key
+            partition.append({
+                name: value for name, value in zip(columns, row, strict=True) if value is not None
+            })
+    if partition:
+        yield partition
+
+
 # =============================================================================
 # Combined Validator
 # =============================================================================
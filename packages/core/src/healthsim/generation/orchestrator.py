@@ -21,6 +21,8 @@ Example:
 
 from __future__ import annotations
 
+import hashlib
+import json
 import time
 from dataclasses import dataclass, field
 from datetime import date, timedelta
@@ -101,6 +103,38 @@ class OrchestratorResult:
         return results
 
 
+@dataclass
+class ChunkedRunResult:
+    """Result from a chunked, checkpointed orchestrator run.
+    
+    Entities and events are in DuckDB rather than in memory; query
+    orchestration_entities and journey_events for entity_id prefix
+    "{run_id}:".
+    """
+    
+    run_id: str
+    profile_id: str
+    journey_ids: list[str]
+    seed: int
+    chunk_size: int
+    
+    chunks_total: int = 0
+    chunks_run: int = 0
+    chunks_skipped: int = 0
+    
+    entity_count: int = 0
+    event_count: int = 0
+    
+    duration_seconds: float = 0.0
+    
+    @property
+    def entities_per_second(self) -> float:
+        """Entities generated and persisted per second in this call."""
+        if self.duration_seconds <= 0:
+            return 0.0
+        return self.entity_count / self.duration_seconds
+
+
 class ProfileJourneyOrchestrator:
     """Orchestrate profile generation with journey assignment.
     
@@ -201,46 +235,15 @@ class ProfileJourneyOrchestrator:
         timeline_start = start_date or date.today()
         entities_with_timelines = []
         
+        entity_type = self._get_entity_type(profile_spec)
         for entity in profile_result.entities:
-            # Create entity-specific seed
-            entity_seed = self.seed_manager.get_entity_seed(entity.index)
-            
-            # Build entity context for journey
-            entity_context = self._build_entity_context(entity)
-            
-            # Create combined timeline for all journeys
-            combined_timeline = Timeline(
-                entity_id=str(entity.index),
-                entity_type=self._get_entity_type(profile_spec),
-                journey_ids=journey_ids,
-                start_date=timeline_start,
-            )
-            
-            # Add events from each journey
-            for journey_spec in journeys:
-                timeline = self.journey_engine.create_timeline(
-                    entity=entity_context,
-                    entity_type=self._get_entity_type(profile_spec),
-                    journey=journey_spec,
-                    start_date=timeline_start,
-                )
-                # Merge events into combined timeline
-                for event in timeline.events:
-                    combined_timeline.add_event(event)
-            
-            # Optionally execute events
-            if execute_events and combined_timeline.events:
-                exec_date = up_to_date or timeline_start
-                self.journey_engine.execute_timeline(
-                    combined_timeline,
-                    entity_context,
-                    up_to_date=exec_date,
-                )
-            
-            entities_with_timelines.append(EntityWithTimeline(
-                entity=entity,
-                timeline=combined_timeline,
-                journey_ids=journey_ids,
+            entities_with_timelines.append(self._build_entity_timeline(
+                entity,
+                entity_type,
+                journeys,
+                timeline_start,
+                execute_events=execute_events,
+                up_to_date=up_to_date,
             ))
         
         duration = time.time() - start_time
@@ -253,6 +256,216 @@ class ProfileJourneyOrchestrator:
             duration_seconds=duration,
         )
     
+    def _build_entity_timeline(
+        self,
+        entity: GeneratedEntity,
+        entity_type: str,
+        journeys: list[JourneySpecification],
+        timeline_start: date,
+        execute_events: bool = False,
+        up_to_date: date | None = None,
+    ) -> EntityWithTimeline:
+        """Build (and optionally execute) one entity's combined timeline."""
+        journey_ids = [j.journey_id for j in journeys]
+        
+        # Build entity context for journey
+        entity_context = self._build_entity_context(entity)
+        
+        # Create combined timeline for all journeys
+        combined_timeline = Timeline(
+            entity_id=str(entity.index),
+            entity_type=entity_type,
+            journey_ids=journey_ids,
+            start_date=timeline_start,
+        )
+        
+        # Add events from each journey
+        for journey_spec in journeys:
+            timeline = self.journey_engine.create_timeline(
+                entity=entity_context,
+                entity_type=entity_type,
+                journey=journey_spec,
+                start_date=timeline_start,
+            )
+            # Merge events into combined timeline
+            for event in timeline.events:
+                combined_timeline.add_event(event)
+            # Only the combined timeline is used from here on
+            self.journey_engine.release(timeline.entity_id)
+        
+        # Optionally execute events
+        if execute_events and combined_timeline.events:
+            exec_date = up_to_date or timeline_start
+            self.journey_engine.execute_timeline(
+                combined_timeline,
+                entity_context,
+                up_to_date=exec_date,
+            )
+        
+        return EntityWithTimeline(
+            entity=entity,
+            timeline=combined_timeline,
+            journey_ids=journey_ids,
+        )
+    
+    def execute_chunked(
+        self,
+        profile: str | ProfileSpecification | dict,
+        journey: str | JourneySpecification | dict | list | None = None,
+        count: int | None = None,
+        start_date: date | None = None,
+        execute_events: bool = False,
+        up_to_date: date | None = None,
+        conn: Any = None,
+        chunk_size: int = 10_000,
+        resume: bool = False,
+        run_id: str | None = None,
+    ) -> ChunkedRunResult:
+        """Generate a population in checkpointed chunks persisted to DuckDB.
+        
+        Entity indices are processed in ranges of chunk_size. Each chunk's
+        entities (orchestration_entities) and timeline events
+        (journey_events, pending events included) are written in one
+        transaction together with a completed checkpoint, then dropped from
+        memory. Entities are order-independent, so the stored population
+        matches what execute() returns for the same arguments.
+        
+        If a chunk raises, its writes are rolled back, its checkpoint is
+        marked failed and the exception propagates. Calling again with
+        resume=True and the same arguments skips completed chunks.
+        
+        Args:
+            profile: Profile template name, spec object, or dict
+            journey: Journey template name, spec object, dict, or list of journeys
+            count: Override entity count
+            start_date: Base date for journey timelines (pass it explicitly
+                when resuming on a later day; it defaults to today)
+            execute_events: If True, execute events up to up_to_date
+            up_to_date: Date to execute events up to (defaults to start_date)
+            conn: DuckDB connection (defaults to the shared HealthSim database)
+            chunk_size: Entities per chunk
+            resume: Skip chunks already completed for this run; otherwise
+                any earlier output of the run is deleted first
+            run_id: Run identifier (defaults to a hash of the arguments and seed)
+            
+        Returns:
+            ChunkedRunResult with counts for the chunks run by this call
+            
+        Raises:
+            ValueError: If chunk_size is not positive, or resume finds
+                checkpoints written with a different chunk_size
+        """
+        from healthsim.state.checkpoints import CheckpointStore
+        from healthsim.state.journey_events import JourneyEventLog
+        
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        start_time = time.time()
+        
+        if conn is None:
+            from healthsim.db import get_connection
+            conn = get_connection()
+        
+        profile_spec = self._resolve_profile(profile)
+        journeys = self._resolve_journeys(journey) if journey else []
+        if count:
+            profile_spec.generation.count = count
+        total = profile_spec.generation.count
+        timeline_start = start_date or date.today()
+        run_id = run_id or self._run_id(
+            profile_spec, journeys, timeline_start, execute_events, up_to_date
+        )
+        
+        store = CheckpointStore(conn)
+        if resume:
+            completed = store.completed_ranges(run_id)
+            for chunk_start, chunk_stop in completed:
+                if chunk_start % chunk_size or chunk_stop != min(chunk_start + chunk_size, total):
+                    raise ValueError(
+                        f"Run {run_id} was checkpointed with a different chunk_size; "
+                        f"resume with the original chunk_size or start over"
+                    )
+        else:
+            store.clear_run(run_id)
+            completed = set()
+        
+        executor = ProfileExecutor(profile_spec, seed=self.seed)
+        entity_type = self._get_entity_type(profile_spec)
+        result = ChunkedRunResult(
+            run_id=run_id,
+            profile_id=profile_spec.id,
+            journey_ids=[j.journey_id for j in journeys],
+            seed=self.seed,
+            chunk_size=chunk_size,
+        )
+        
+        for chunk_start in range(0, total, chunk_size):
+            chunk_stop = min(chunk_start + chunk_size, total)
+            result.chunks_total += 1
+            if (chunk_start, chunk_stop) in completed:
+                result.chunks_skipped += 1
+                continue
+            
+            store.mark_running(run_id, chunk_start, chunk_stop, self.seed)
+            try:
+                with store.transaction():
+                    entities = executor.generate_range(chunk_start, chunk_stop)
+                    store.write_entities(run_id, entities)
+                    event_log = JourneyEventLog(conn)
+                    event_count = 0
+                    for entity in entities:
+                        built = self._build_entity_timeline(
+                            entity,
+                            entity_type,
+                            journeys,
+                            timeline_start,
+                            execute_events=execute_events,
+                            up_to_date=up_to_date,
+                        )
+                        event_count += event_log.record_timeline(
+                            built.timeline,
+                            include_pending=True,
+                            entity_id=f"{run_id}:{entity.index}",
+                        )
+                    event_log.flush()
+                    store.mark_completed(
+                        run_id, chunk_start, chunk_stop, self.seed, len(entities), event_count
+                    )
+            except Exception as exc:
+                store.mark_failed(run_id, chunk_start, chunk_stop, self.seed, str(exc))
+                raise
+            
+            result.chunks_run += 1
+            result.entity_count += len(entities)
+            result.event_count += event_count
+            del entities
+        
+        result.duration_seconds = time.time() - start_time
+        return result
+    
+    def _run_id(
+        self,
+        profile: ProfileSpecification,
+        journeys: list[JourneySpecification],
+        timeline_start: date,
+        execute_events: bool,
+        up_to_date: date | None,
+    ) -> str:
+        """Deterministic run identifier for a chunked run's inputs."""
+        payload = json.dumps(
+            {
+                "profile": profile.model_dump(mode="json"),
+                "journeys": [j.model_dump(mode="json") for j in journeys],
+                "seed": self.seed,
+                "start_date": timeline_start.isoformat(),
+                "execute_events": execute_events,
+                "up_to_date": up_to_date.isoformat() if up_to_date else None,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return f"run-{hashlib.sha1(payload.encode()).hexdigest()[:12]}"
+    
     def _resolve_profile(
         self,
         profile: str | ProfileSpecification | dict,
@@ -368,5 +581,6 @@ __all__ = [
     "ProfileJourneyOrchestrator",
     "EntityWithTimeline",
     "OrchestratorResult",
+    "ChunkedRunResult",
     "orchestrate",
 ]
@@ -11,6 +11,7 @@ it produces identical output.
 from __future__ import annotations
 
 import random
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 from typing import Any
@@ -27,6 +28,7 @@ from healthsim.generation.distributions import (
     UniformDistribution,
     create_distribution,
 )
+from healthsim.generation.ids import IdScheme, entity_seed, entity_seeds
 from healthsim.generation.profile_schema import (
     DistributionSpec,
     DistributionType,
@@ -44,13 +46,22 @@ class HierarchicalSeedManager:
     - Parallel generation with deterministic results
     """
 
-    def __init__(self, master_seed: int | None = None):
+    def __init__(
+        self,
+        master_seed: int | None = None,
+        id_scheme: IdScheme | str = IdScheme.LEGACY,
+    ):
         """Initialize with master seed.
 
         Args:
             master_seed: Root seed (None for random)
+            id_scheme: LEGACY draws entity seeds sequentially from one RNG, as
+                earlier releases did. FAST derives each entity's seed from its
+                index directly, so any entity can be seeded without its
+                predecessors.
         """
         self.master_seed = master_seed or random.randint(0, 2**31 - 1)
+        self.id_scheme = IdScheme(id_scheme)
         self._master_rng = random.Random(self.master_seed)
         self._entity_seeds: dict[int, int] = {}
 
@@ -63,6 +74,8 @@ class HierarchicalSeedManager:
         Returns:
             Seed value for this entity
         """
+        if self.id_scheme is IdScheme.FAST:
+            return entity_seed(self.master_seed, entity_index)
         if entity_index not in self._entity_seeds:
             # Generate seeds sequentially to ensure determinism
             while len(self._entity_seeds) <= entity_index:
@@ -70,6 +83,19 @@ class HierarchicalSeedManager:
                 self._entity_seeds[idx] = self._master_rng.randint(0, 2**31 - 1)
         return self._entity_seeds[entity_index]
 
+    def get_entity_seeds(self, entity_indices: Sequence[int]) -> list[int]:
+        """Get seeds for many entities at once.
+
+        Args:
+            entity_indices: 0-based entity indices, in any order
+
+        Returns:
+            Seed values, in the order of entity_indices
+        """
+        if self.id_scheme is IdScheme.FAST:
+            return entity_seeds(self.master_seed, entity_indices)
+        return [self.get_entity_seed(index) for index in entity_indices]
+
     def get_entity_rng(self, entity_index: int) -> random.Random:
         """Get a Random instance for a specific entity.
 
@@ -218,10 +244,7 @@ class ProfileExecutor:
         if dry_run:
             count = min(count, 5)  # Sample only
 
-        entities: list[GeneratedEntity] = []
-        for i in range(count):
-            entity = self._generate_entity(i)
-            entities.append(entity)
+        entities = self.generate_range(0, count)
 
         duration = time.time() - start_time
         validation = self._validate(entities)
@@ -236,6 +259,21 @@ class ProfileExecutor:
         )
 
 
+    def generate_range(self, start: int, stop: int) -> list[GeneratedEntity]:
+        """Generate the entities with indices in [start, stop).
+
+        Entities are order-independent, so a population can be generated in
+        chunks that match a single execute() call entity for entity.
+
+        Args:
+            start: First entity index
+            stop: One past the last entity index
+
+        Returns:
+            Generated entities, in index order
+        """
+        return [self._generate_entity(i) for i in range(start, stop)]
+
     def _generate_entity(self, index: int) -> GeneratedEntity:
         """Generate a single entity at the given index.
 
@@ -28,12 +28,15 @@ Example - After (skill reference):
 
 from __future__ import annotations
 
+import copy
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from pydantic import BaseModel, Field
 
+from healthsim.skills.index import SkillIndex
 from healthsim.skills.loader import SkillLoader
 from healthsim.skills.schema import Skill
 
@@ -67,6 +70,63 @@ class ResolvedParameters(BaseModel):
     resolved_from: str = "direct"  # "direct", "skill", "fallback"
 
 
+# =============================================================================
+# Entity Variable Templates
+# =============================================================================
+
+_ENTITY_VAR_PATTERN = re.compile(r"\$\{entity\.(\w+)\}")
+
+
+class EntityTemplate:
+    """A parameter string with ${entity.x} references, parsed once.
+    
+    Rendering substitutes entity attributes into the literal segments
+    found at parse time, so repeated events do not re-run the regex.
+    A string that is a single reference renders to the attribute's value
+    itself rather than its string form.
+    
+    Example:
+        >>> EntityTemplate("Stage ${entity.stage}").render({"stage": 3})
+        'Stage 3'
+        >>> EntityTemplate("${entity.stage}").render({"stage": 3})
+        3
+    """
+    
+    __slots__ = ("source", "_segments", "_whole")
+    
+    def __init__(self, source: str):
+        self.source = source
+        # (literal text, attribute name or None, original reference text)
+        self._segments: list[tuple[str, str | None, str]] = []
+        position = 0
+        for match in _ENTITY_VAR_PATTERN.finditer(source):
+            self._segments.append((source[position:match.start()], match.group(1), match.group(0)))
+            position = match.end()
+        self._segments.append((source[position:], None, ""))
+        
+        if source.startswith("${entity.") and source.endswith("}"):
+            self._whole: str | None = source[9:-1]
+        else:
+            self._whole = None
+    
+    def render(self, entity: dict[str, Any]) -> Any:
+        """Substitute entity attributes; unknown attributes are left as-is."""
+        if self._whole is not None:
+            return entity.get(self._whole, self.source)
+        parts = []
+        for literal, attr, reference in self._segments:
+            parts.append(literal)
+            if attr is not None:
+                parts.append(str(entity.get(attr, reference)))
+        return "".join(parts)
+
+
+@lru_cache(maxsize=4096)
+def compile_entity_template(value: str) -> EntityTemplate:
+    """Get the parsed EntityTemplate for a parameter string (memoized)."""
+    return EntityTemplate(value)
+
+
 # =============================================================================
 # Skills Directory Configuration
 # =============================================================================
@@ -170,8 +230,23 @@ class SkillResolver:
             skills_root: Root directory for skills. Defaults to auto-detect.
         """
         self.skills_root = skills_root or get_skills_root()
+        self.index = SkillIndex.for_root(self.skills_root)
         self.loader = SkillLoader()
         self._cache: dict[str, Skill] = {}
+        # (skill, lookup, context value) -> lookup result; entity-independent
+        # apart from the one context value a lookup reads
+        self._lookup_cache: dict[tuple[str, str, Any], dict[str, Any] | None] = {}
+    
+    def clear_cache(self) -> None:
+        """Forget loaded skills and memoized lookup results, and re-scan the index."""
+        self._cache.clear()
+        self._lookup_cache.clear()
+        self.index.refresh()
+    
+    def lookup_context_key(self, lookup: str) -> str | None:
+        """Name of the context value a lookup depends on, if any."""
+        mapping = self.LOOKUP_MAPPINGS.get(lookup)
+        return mapping.get("context_key") if mapping else None
     
     def load_skill(self, skill_name: str) -> Skill | None:
         """Load a skill by name.
@@ -203,22 +278,10 @@ class SkillResolver:
         Searches in order:
         1. Direct match: skills/{product}/{skill_name}.md
         2. Search all subdirectories
-        """
-        # Normalize name
-        normalized = skill_name.lower().replace("_", "-")
-        
-        # Try common locations
-        for product in ["patientsim", "membersim", "rxmembersim", "trialsim", "common", "networksim", "populationsim"]:
-            path = self.skills_root / product / f"{normalized}.md"
-            if path.exists():
-                return path
-        
-        # Search all .md files
-        for md_file in self.skills_root.rglob("*.md"):
-            if md_file.stem.lower() == normalized:
-                return md_file
         
-        return None
+        Both steps are answered from the prebuilt SkillIndex, misses included.
+        """
+        return self.index.find(skill_name)
     
     def resolve(
         self,
@@ -243,10 +306,12 @@ class SkillResolver:
             )
         
         # Resolve context variables
-        resolved_context = self._resolve_context(ref.context, entity_context or {})
+        resolved_context = self._resolve_context(
+            ref.context, entity_context if entity_context is not None else {}
+        )
         
         # Look up the value
-        result = self._lookup_value(skill, ref.lookup, resolved_context)
+        result = self._cached_lookup(ref.skill, skill, ref.lookup, resolved_context)
         
         if result:
             return ResolvedParameters(
@@ -280,6 +345,31 @@ class SkillResolver:
         
         return resolved
     
+    def _cached_lookup(
+        self,
+        skill_name: str,
+        skill: Skill,
+        lookup: str,
+        context: dict[str, Any],
+    ) -> dict[str, Any] | None:
+        """Memoized _lookup_value; returns a copy callers may modify."""
+        context_key = self.lookup_context_key(lookup)
+        key = (skill_name, lookup, context.get(context_key, "") if context_key else None)
+        try:
+            result = self._lookup_cache[key]
+        except KeyError:
+            result = self._lookup_value(skill, lookup, context)
+            self._lookup_cache[key] = result
+        except TypeError:
+            # Unhashable context value
+            return self._lookup_value(skill, lookup, context)
+        if result is None:
+            return None
+        # Nested values (parsed JSON) are copied too; scalars are shared
+        return {
+            k: copy.deepcopy(v) if isinstance(v, (dict, list)) else v for k, v in result.items()
+        }
+    
     def _lookup_value(
         self,
         skill: Skill,
@@ -417,12 +507,7 @@ class SkillResolver:
     
     def list_skills(self) -> list[str]:
         """List available skills."""
-        skills = []
-        if self.skills_root.exists():
-            for md_file in self.skills_root.rglob("*.md"):
-                if md_file.stem not in ("README", "SKILL"):
-                    skills.append(md_file.stem)
-        return sorted(set(skills))
+        return self.index.names()
 
 
 # =============================================================================
@@ -473,7 +558,9 @@ class ParameterResolver:
         Returns:
             Resolved parameters with concrete values
         """
-        entity = entity or {}
+        # Not truth-tested: that would size (and so convert) a lazy entity view
+        if entity is None:
+            entity = {}
         resolved = {}
         
         for key, value in parameters.items():
@@ -495,20 +582,7 @@ class ParameterResolver:
     
     def _resolve_entity_var(self, value: str, entity: dict[str, Any]) -> Any:
         """Resolve ${entity.x} variables."""
-        pattern = r"\$\{entity\.(\w+)\}"
-        
-        def replacer(match):
-            attr = match.group(1)
-            return str(entity.get(attr, match.group(0)))
-        
-        result = re.sub(pattern, replacer, value)
-        
-        # If entire string was a variable, return the actual value (not stringified)
-        if value.startswith("${entity.") and value.endswith("}"):
-            attr = value[9:-1]
-            return entity.get(attr, value)
-        
-        return result
+        return compile_entity_template(value).render(entity)
 
 
 # =============================================================================
@@ -565,6 +639,8 @@ def resolve_skill_ref(
 
 
 __all__ = [
+    "EntityTemplate",
+    "compile_entity_template",
     "SkillReference",
     "ResolvedParameters",
     "SkillResolver",
@@ -241,6 +241,8 @@ class SkillRegistry:
         self._registrations: dict[str, SkillRegistration] = {}
         self._condition_index: dict[str, list[str]] = {}  # condition -> skill_names
         self._skill_resolver = None  # Lazy loaded
+        # (event_type, condition, product) -> (skill_name, lookup_key) or None
+        self._target_cache: dict[tuple[str, str, str | None], tuple[str, str] | None] = {}
         
         # Load default registrations
         for reg_dict in DEFAULT_REGISTRATIONS:
@@ -253,6 +255,7 @@ class SkillRegistry:
             registration: The skill registration
         """
         self._registrations[registration.skill_name] = registration
+        self._target_cache.clear()
         
         # Index by conditions
         for condition in registration.conditions:
@@ -386,36 +389,58 @@ class SkillRegistry:
             >>> print(params["icd10"])
             'E11.65'
         """
-        # Find the skill
-        registration = self.find_skill_for_condition(condition, product)
-        if not registration:
+        target = self._resolution_target(event_type, condition, product)
+        if not target:
             return {}
-        
-        # Map event type to capability
-        capability = self._event_type_to_capability(event_type)
-        if not capability:
-            return {}
-        
-        # Get the lookup key for this capability
-        lookup_key = self.get_capability_lookup(registration.skill_name, capability)
-        if not lookup_key:
-            # Try to use the capability name as lookup key
-            lookup_key = capability.value
+        skill_name, lookup_key = target
         
         # Resolve using SkillResolver
         resolver = self._get_skill_resolver()
         
+        # Registered skills without a file on disk resolve to nothing; the
+        # resolver's index answers that without building a reference
+        if resolver.index.find(skill_name) is None:
+            return {}
+        
         from healthsim.generation.skill_reference import SkillReference
         
-        skill_ref = SkillReference(
-            skill=registration.skill_name,
-            lookup=lookup_key,
-            context=context or {},
-        )
+        # Only the context value the lookup reads affects the result, so
+        # large contexts (such as a whole entity) are not copied per event
+        context_key = resolver.lookup_context_key(lookup_key)
+        if context is not None and context_key and context_key in context:
+            context = {context_key: context[context_key]}
+        else:
+            context = {}
         
-        result = resolver.resolve(skill_ref, entity or {})
+        skill_ref = SkillReference(skill=skill_name, lookup=lookup_key, context=context)
+        
+        result = resolver.resolve(skill_ref, entity if entity is not None else {})
         return result.parameters
     
+    def _resolution_target(
+        self,
+        event_type: str,
+        condition: str,
+        product: str | None,
+    ) -> tuple[str, str] | None:
+        """Find the (skill_name, lookup_key) for an event, memoized."""
+        cache_key = (event_type, condition, product)
+        if cache_key in self._target_cache:
+            return self._target_cache[cache_key]
+        
+        target = None
+        registration = self.find_skill_for_condition(condition, product)
+        # Map event type to capability
+        capability = self._event_type_to_capability(event_type) if registration else None
+        if registration and capability:
+            # Get the lookup key for this capability
+            lookup_key = self.get_capability_lookup(registration.skill_name, capability)
+            # Fall back to the capability name as lookup key
+            target = (registration.skill_name, lookup_key or capability.value)
+        
+        self._target_cache[cache_key] = target
+        return target
+    
     def _event_type_to_capability(self, event_type: str) -> SkillCapability | None:
         """Map an event type to a skill capability."""
         mapping = {
@@ -13,9 +13,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import date, timedelta
-from typing import Any, Callable, Protocol
+from typing import Any, Callable, Iterator, Protocol
 from enum import Enum
+import heapq
 import logging
+import operator
+import time
 
 from healthsim.generation.journey_engine import (
     DelaySpec,
@@ -59,6 +62,234 @@ class RegisteredTrigger:
     
     # Handler for custom logic
     handler: Callable | None = None
+    
+    @property
+    def edge(self) -> str:
+        """Edge label, e.g. "patientsim.diagnosis->membersim.claim_professional"."""
+        return (
+            f"{self.source_product}.{self.source_event_type}"
+            f"->{self.target_product}.{self.target_event_type}"
+        )
+
+
+@dataclass
+class TriggerEdgeMetrics:
+    """Throughput counters for one trigger edge."""
+    
+    evaluated: int = 0     # Source events that reached the edge
+    fired: int = 0         # Evaluations whose condition passed
+    suppressed: int = 0    # Evaluations whose condition failed
+    errors: int = 0        # Target handler failures
+    enqueued: int = 0      # Target events placed on a scheduler
+    seconds: float = 0.0   # Time spent evaluating and dispatching
+    
+    @property
+    def fires_per_second(self) -> float:
+        """Fired triggers per second of edge processing time."""
+        return self.fired / self.seconds if self.seconds else 0.0
+    
+    def reset(self) -> None:
+        """Zero all counters."""
+        self.evaluated = self.fired = self.suppressed = self.errors = self.enqueued = 0
+        self.seconds = 0.0
+    
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a plain dict for reporting."""
+        return {
+            "evaluated": self.evaluated,
+            "fired": self.fired,
+            "suppressed": self.suppressed,
+            "errors": self.errors,
+            "enqueued": self.enqueued,
+            "seconds": self.seconds,
+            "fires_per_second": self.fires_per_second,
+        }
+
+
+_CONDITION_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+    "in": lambda actual, value: actual in value,
+    "not_in": lambda actual, value: actual not in value,
+    "contains": lambda actual, value: value in actual,
+}
+
+
+def compile_condition(condition: EventCondition | None) -> Callable[[dict], bool] | None:
+    """Compile an EventCondition into a closure with the same result as evaluate().
+    
+    The field path is split and the operator looked up once, instead of on
+    every evaluation.
+    
+    Returns:
+        Predicate over the context dict, or None if there is no condition
+    """
+    if condition is None:
+        return None
+    compare = _CONDITION_OPERATORS.get(condition.operator)
+    if compare is None:
+        return lambda context: False
+    parts = tuple(condition.field.split("."))
+    value = condition.value
+    
+    def matches(context: dict) -> bool:
+        current = context
+        for part in parts:
+            if isinstance(current, dict) and part in current:
+                current = current[part]
+            else:
+                return False
+        if current is None:
+            return False
+        return compare(current, value)
+    
+    return matches
+
+
+def compile_parameter_map(
+    parameter_map: dict[str, str],
+) -> Callable[[dict, dict], dict[str, Any]]:
+    """Compile a parameter map into a projector over (source_result, context).
+    
+    Each target key takes the source key from the source result, falling back
+    to the context, and is omitted if neither has it.
+    """
+    pairs = tuple(parameter_map.items())
+    if not pairs:
+        return lambda source_result, context: {}
+    
+    def project(source_result: dict, context: dict) -> dict[str, Any]:
+        params = {}
+        for target_key, source_key in pairs:
+            if source_key in source_result:
+                params[target_key] = source_result[source_key]
+            elif source_key in context:
+                params[target_key] = context[source_key]
+        return params
+    
+    return project
+
+
+@dataclass
+class CompiledTrigger:
+    """A registered trigger with its condition, projector and delay precompiled."""
+    
+    trigger: RegisteredTrigger
+    matches: Callable[[dict], bool] | None
+    project: Callable[[dict, dict], dict[str, Any]]
+    delay: Callable[[], timedelta]
+    metrics: TriggerEdgeMetrics
+    index: int = 0
+    
+    @classmethod
+    def compile(
+        cls,
+        trigger: RegisteredTrigger,
+        metrics: TriggerEdgeMetrics | None = None,
+        index: int = 0,
+    ) -> CompiledTrigger:
+        """Compile a registered trigger.
+        
+        Args:
+            trigger: Registered trigger to compile
+            metrics: Edge metrics to accumulate into
+            index: Position among the edges leaving the same source event type
+        """
+        if trigger.delay.distribution == "fixed":
+            fixed = timedelta(days=trigger.delay.days)
+            delay = lambda: fixed  # noqa: E731
+        else:
+            delay = trigger.delay.to_timedelta
+        return cls(
+            trigger=trigger,
+            matches=compile_condition(trigger.condition),
+            project=compile_parameter_map(trigger.parameter_map),
+            delay=delay,
+            metrics=metrics or TriggerEdgeMetrics(),
+            index=index,
+        )
+
+
+@dataclass
+class TriggerFiring:
+    """One trigger edge that fired for a source event."""
+    
+    compiled: CompiledTrigger
+    target_date: date
+    parameters: dict[str, Any]
+    target_event: TimelineEvent | None = None  # Set by TriggerEventBus
+    
+    @property
+    def trigger(self) -> RegisteredTrigger:
+        return self.compiled.trigger
+
+
+class TriggerGraph:
+    """Compiled (product, event_type) -> trigger edges lookup.
+    
+    Built from a TriggerRegistry's triggers. Evaluating a source event costs
+    one dict lookup plus the precompiled closures of its outgoing edges.
+    """
+    
+    def __init__(
+        self,
+        triggers: dict[tuple[str, str], list[RegisteredTrigger]],
+        metrics: dict[str, TriggerEdgeMetrics] | None = None,
+    ):
+        """Compile the graph.
+        
+        Args:
+            triggers: Triggers indexed by (source product, source event type)
+            metrics: Per-edge metrics to keep accumulating into, by edge label
+        """
+        self.metrics = metrics if metrics is not None else {}
+        self._edges: dict[tuple[str, str], tuple[CompiledTrigger, ...]] = {}
+        for key, registered in triggers.items():
+            compiled = []
+            for index, trigger in enumerate(registered):
+                edge_metrics = self.metrics.setdefault(trigger.edge, TriggerEdgeMetrics())
+                compiled.append(CompiledTrigger.compile(trigger, edge_metrics, index))
+            self._edges[key] = tuple(compiled)
+    
+    def edges(self, source_product: str, source_event_type: str) -> tuple[CompiledTrigger, ...]:
+        """Compiled edges leaving a source event type."""
+        return self._edges.get((source_product, source_event_type), ())
+    
+    def fan_out(
+        self,
+        source_event: TimelineEvent,
+        source_result: dict[str, Any],
+        context: dict[str, Any],
+    ) -> list[TriggerFiring]:
+        """Evaluate every edge leaving a source event.
+        
+        Returns:
+            The edges whose condition passed, with target date and parameters
+        """
+        edges = self._edges.get((source_event.product, source_event.event_type))
+        if not edges:
+            return []
+        perf_counter = time.perf_counter
+        firings = []
+        for compiled in edges:
+            started = perf_counter()
+            metrics = compiled.metrics
+            metrics.evaluated += 1
+            if compiled.matches is not None and not compiled.matches(context):
+                metrics.suppressed += 1
+            else:
+                metrics.fired += 1
+                firings.append(TriggerFiring(
+                    compiled=compiled,
+                    target_date=source_event.scheduled_date + compiled.delay(),
+                    parameters=compiled.project(source_result, context),
+                ))
+            metrics.seconds += perf_counter() - started
+        return firings
 
 
 class TriggerRegistry:
@@ -84,6 +315,10 @@ class TriggerRegistry:
         
         # Target handlers by product
         self._target_handlers: dict[str, Callable] = {}
+        
+        # Compiled on first use, dropped whenever a trigger is registered
+        self._graph: TriggerGraph | None = None
+        self._metrics: dict[str, TriggerEdgeMetrics] = {}
     
     def register(
         self,
@@ -127,6 +362,7 @@ class TriggerRegistry:
         if key not in self._triggers:
             self._triggers[key] = []
         self._triggers[key].append(trigger)
+        self._graph = None
     
     def register_target_handler(
         self,
@@ -149,6 +385,43 @@ class TriggerRegistry:
         """Get triggers for a source event."""
         return self._triggers.get((source_product, source_event_type), [])
     
+    @property
+    def graph(self) -> TriggerGraph:
+        """The compiled trigger graph, rebuilt after registrations."""
+        if self._graph is None:
+            self._graph = TriggerGraph(self._triggers, self._metrics)
+        return self._graph
+    
+    def get_metrics(self) -> dict[str, TriggerEdgeMetrics]:
+        """Throughput metrics per trigger edge, keyed by edge label."""
+        return dict(self.graph.metrics)
+    
+    def reset_metrics(self) -> None:
+        """Zero every edge's metrics."""
+        for metrics in self._metrics.values():
+            metrics.reset()
+    
+    def dispatch(
+        self,
+        source_event: TimelineEvent,
+        firing: TriggerFiring,
+    ) -> None:
+        """Send a fired trigger to its target product's handler, if registered."""
+        handler = self._target_handlers.get(firing.trigger.target_product)
+        if handler is None:
+            return
+        started = time.perf_counter()
+        try:
+            handler(firing.trigger.target_event_type, source_event, {
+                "target_date": firing.target_date,
+                "parameters": firing.parameters,
+                "source_event_id": source_event.timeline_event_id,
+            })
+        except Exception as e:
+            firing.compiled.metrics.errors += 1
+            logger.error(f"Trigger handler failed: {e}")
+        firing.compiled.metrics.seconds += time.perf_counter() - started
+    
     def fire_triggers(
         self,
         source_event: TimelineEvent,
@@ -166,47 +439,167 @@ class TriggerRegistry:
             List of triggered event info dicts
         """
         triggered = []
-        triggers = self.get_triggers(source_event.product, source_event.event_type)
+        for firing in self.graph.fan_out(source_event, source_result, context):
+            self.dispatch(source_event, firing)
+            triggered.append(_triggered_info(source_event, firing))
+        return triggered
+
+
+def _triggered_info(source_event: TimelineEvent, firing: TriggerFiring) -> dict[str, Any]:
+    trigger = firing.trigger
+    return {
+        "source_event_id": source_event.timeline_event_id,
+        "target_product": trigger.target_product,
+        "target_event_type": trigger.target_event_type,
+        "target_date": firing.target_date.isoformat(),
+        "priority": trigger.priority.name,
+    }
+
+
+# =============================================================================
+# Event Scheduler and Bus
+# =============================================================================
+
+@dataclass(order=True)
+class ScheduledEvent:
+    """An event waiting in an EventScheduler.
+    
+    Ordered by date, then priority, then insertion order, so events on the
+    same date and priority run first-in first-out.
+    """
+    
+    scheduled_date: date
+    priority: int
+    sequence: int
+    product: str = field(compare=False)
+    event: TimelineEvent = field(compare=False)
+    timeline: Timeline | None = field(default=None, compare=False)
+
+
+class EventScheduler:
+    """Priority queue of pending events across products and entities.
+    
+    Journey events and trigger targets share one heap, so a target event is
+    executed in date order with everything else instead of waiting for a
+    second pass.
+    
+    Example:
+        >>> scheduler = EventScheduler()
+        >>> scheduler.push("patientsim", event, timeline)
+        >>> for item in scheduler.drain(date(2024, 12, 31)):
+        ...     engine.execute_event(item.timeline, item.event, entity)
+    """
+    
+    def __init__(self):
+        self._heap: list[ScheduledEvent] = []
+        self._sequence = 0
+    
+    def push(
+        self,
+        product: str,
+        event: TimelineEvent,
+        timeline: Timeline | None = None,
+        priority: TriggerPriority = TriggerPriority.NORMAL,
+    ) -> None:
+        """Queue an event.
         
-        for trigger in triggers:
-            # Check condition if present
-            if trigger.condition and not trigger.condition.evaluate(context):
-                continue
-            
-            # Calculate target date
-            target_date = source_event.scheduled_date + trigger.delay.to_timedelta()
-            
-            # Build target parameters
-            target_params = {}
-            for target_key, source_key in trigger.parameter_map.items():
-                if source_key in source_result:
-                    target_params[target_key] = source_result[source_key]
-                elif source_key in context:
-                    target_params[target_key] = context[source_key]
-            
-            # Dispatch to target handler if registered
-            if trigger.target_product in self._target_handlers:
-                handler = self._target_handlers[trigger.target_product]
-                try:
-                    handler(trigger.target_event_type, source_event, {
-                        "target_date": target_date,
-                        "parameters": target_params,
-                        "source_event_id": source_event.timeline_event_id,
-                    })
-                except Exception as e:
-                    logger.error(f"Trigger handler failed: {e}")
-            
-            triggered.append({
-                "source_event_id": source_event.timeline_event_id,
-                "target_product": trigger.target_product,
-                "target_event_type": trigger.target_event_type,
-                "target_date": target_date.isoformat(),
-                "priority": trigger.priority.name,
-            })
+        Args:
+            product: Product that executes the event
+            event: The event
+            timeline: Timeline the event belongs to, if already known
+            priority: Tie-breaker among events on the same date
+        """
+        heapq.heappush(self._heap, ScheduledEvent(
+            event.scheduled_date, priority.value, self._sequence, product, event, timeline
+        ))
+        self._sequence += 1
+    
+    def pop(self) -> ScheduledEvent:
+        """Remove and return the earliest event."""
+        return heapq.heappop(self._heap)
+    
+    def drain(self, up_to_date: date | None = None) -> Iterator[ScheduledEvent]:
+        """Pop events in order up to and including a date.
         
-        return triggered
+        Events pushed while draining are picked up if they are due.
+        """
+        target_date = up_to_date or date.max
+        heap = self._heap
+        while heap and heap[0].scheduled_date <= target_date:
+            yield heapq.heappop(heap)
+    
+    def __len__(self) -> int:
+        return len(self._heap)
 
 
+class TriggerEventBus:
+    """In-process bus that turns executed events into scheduled target events.
+    
+    Each published event is fanned out through the registry's compiled
+    trigger graph. Every fired edge is sent to the target product's handler
+    (as fire_triggers does) and, when the bus has a scheduler, enqueued on it
+    as a pending TimelineEvent.
+    
+    Example:
+        >>> bus = TriggerEventBus(registry, EventScheduler())
+        >>> engine.attach_trigger_bus(bus)
+        >>> engine.execute_timeline(timeline, patient)
+        >>> len(bus.scheduler)  # claims, fills, ... waiting to run
+        3
+    """
+    
+    def __init__(
+        self,
+        registry: TriggerRegistry,
+        scheduler: EventScheduler | None = None,
+    ):
+        self.registry = registry
+        self.scheduler = scheduler
+    
+    def publish(
+        self,
+        source_event: TimelineEvent,
+        source_result: dict[str, Any],
+        context: dict[str, Any],
+    ) -> list[TriggerFiring]:
+        """Fan an executed event out to its trigger targets.
+        
+        Args:
+            source_event: The event that executed
+            source_result: Its handler's outputs
+            context: Execution context conditions are evaluated against
+            
+        Returns:
+            The fired edges, each with the target event it created
+        """
+        firings = self.registry.graph.fan_out(source_event, source_result, context)
+        for firing in firings:
+            self.registry.dispatch(source_event, firing)
+            target = firing.target_event = self._target_event(source_event, firing)
+            source_event.triggered_events.append(target.timeline_event_id)
+            if self.scheduler is not None:
+                self.scheduler.push(
+                    firing.trigger.target_product, target, priority=firing.trigger.priority
+                )
+                firing.compiled.metrics.enqueued += 1
+        return firings
+    
+    def _target_event(self, source_event: TimelineEvent, firing: TriggerFiring) -> TimelineEvent:
+        trigger = firing.trigger
+        return TimelineEvent(
+            timeline_event_id=(
+                f"{source_event.timeline_event_id}>{trigger.target_product}"
+                f".{trigger.target_event_type}#{firing.compiled.index}"
+            ),
+            journey_id=source_event.journey_id,
+            event_definition_id=f"trigger:{trigger.edge}",
+            scheduled_date=firing.target_date,
+            event_type=trigger.target_event_type,
+            event_name=trigger.target_event_type.replace("_", " ").title(),
+            product=trigger.target_product,
+            parameters=firing.parameters,
+        )
+
 
 # =============================================================================
 # Cross-Product Coordinator
@@ -330,6 +723,7 @@ class CrossProductCoordinator:
         self,
         linked: LinkedEntity,
         up_to_date: date,
+        cascade: bool = False,
     ) -> dict[str, list[dict]]:
         """Execute all pending events across products.
         
@@ -339,6 +733,10 @@ class CrossProductCoordinator:
         Args:
             linked: The linked entity
             up_to_date: Execute events up to this date
+            cascade: Also execute the events triggers create. Target events
+                join the same schedule, on the linked entity's timeline for
+                the target product; those due after up_to_date stay pending
+                on that timeline.
             
         Returns:
             Dict of product -> list of execution results
@@ -346,50 +744,73 @@ class CrossProductCoordinator:
         results: dict[str, list[dict]] = {}
         
         # Collect all pending events across products
-        all_events: list[tuple[str, Timeline, TimelineEvent]] = []
-        
+        scheduler = EventScheduler()
         for product, timeline in linked.timelines.items():
             for event in timeline.get_events_up_to(up_to_date):
-                all_events.append((product, timeline, event))
-        
-        # Sort by scheduled date
-        all_events.sort(key=lambda x: x[2].scheduled_date)
+                scheduler.push(product, event, timeline)
+        bus = TriggerEventBus(self._trigger_registry, scheduler if cascade else None)
+        trigger_context = {"linked_entity": linked}
         
-        # Execute in order
-        for product, timeline, event in all_events:
-            if product not in results:
-                results[product] = []
-            
-            engine = self._product_engines.get(product)
-            if not engine:
+        # Engines skip their own trigger bus while this one publishes
+        for engine in self._product_engines.values():
+            engine.attach_coordinator_bus(bus)
+        try:
+            # Execute in order
+            for item in scheduler.drain(up_to_date):
+                product, timeline, event = item.product, item.timeline, item.event
+                if product not in results:
+                    results[product] = []
+                
+                engine = self._product_engines.get(product)
+                if not engine:
+                    results[product].append({
+                        "event_id": event.timeline_event_id,
+                        "status": "skipped",
+                        "reason": f"No engine registered for {product}"
+                    })
+                    continue
+                
+                if timeline is None:
+                    # Trigger target: lives on the entity's timeline for its product
+                    timeline = linked.timelines.get(product)
+                    if timeline is None:
+                        results[product].append({
+                            "event_id": event.timeline_event_id,
+                            "status": "skipped",
+                            "reason": f"No {product} timeline for {linked.core_id}"
+                        })
+                        continue
+                    timeline.add_event(event)
+                
+                # Get entity for this product
+                entity = self._get_product_entity(linked, product)
+                
+                # Execute event
+                result = engine.execute_event(timeline, event, entity)
                 results[product].append({
                     "event_id": event.timeline_event_id,
-                    "status": "skipped",
-                    "reason": f"No engine registered for {product}"
+                    "event_type": event.event_type,
+                    "scheduled_date": event.scheduled_date.isoformat(),
+                    **result
                 })
-                continue
-            
-            # Get entity for this product
-            entity = self._get_product_entity(linked, product)
-            
-            # Execute event
-            result = engine.execute_event(timeline, event, entity)
-            results[product].append({
-                "event_id": event.timeline_event_id,
-                "event_type": event.event_type,
-                "scheduled_date": event.scheduled_date.isoformat(),
-                **result
-            })
-            
-            # Fire cross-product triggers
-            if result.get("status") == "executed":
-                triggered = self._trigger_registry.fire_triggers(
-                    event, 
-                    result.get("outputs", {}),
-                    {"linked_entity": linked}
-                )
-                if triggered:
-                    results[product][-1]["triggered"] = triggered
+                
+                # Fire cross-product triggers
+                if result.get("status") == "executed":
+                    firings = bus.publish(event, result.get("outputs", {}), trigger_context)
+                    if firings:
+                        results[product][-1]["triggered"] = [
+                            _triggered_info(event, firing) for firing in firings
+                        ]
+        finally:
+            for engine in self._product_engines.values():
+                engine.attach_coordinator_bus(None)
+        
+        # Triggered events beyond the horizon wait on their product's timeline
+        while len(scheduler):
+            item = scheduler.pop()
+            timeline = item.timeline or linked.timelines.get(item.product)
+            if item.timeline is None and timeline is not None:
+                timeline.add_event(item.event)
         
         return results
     
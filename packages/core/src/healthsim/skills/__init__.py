@@ -5,6 +5,7 @@ that guide Claude in generating domain-specific data.
 """
 
 from healthsim.skills.composer import SkillComposer, SkillCompositionError
+from healthsim.skills.index import SkillIndex, SkillIndexEntry
 from healthsim.skills.loader import SkillLoader, SkillParseError
 from healthsim.skills.schema import (
     ParameterType,
@@ -26,6 +27,9 @@ __all__ = [
     # Loader
     "SkillLoader",
     "SkillParseError",
+    # Index
+    "SkillIndex",
+    "SkillIndexEntry",
     # Composer
     "SkillComposer",
     "SkillCompositionError",
@@ -0,0 +1,354 @@
+"""Prebuilt index of the skill files under a skills root.
+
+Resolving a skill by name used to walk the whole tree with ``rglob`` on every
+lookup, including every lookup for a skill that does not exist. SkillIndex
+scans the tree once and records each skill file's path, modification time and
+YAML frontmatter. Results are cached until refresh(). A cached hit is
+re-checked against its file's mtime and size, so an edited or deleted file
+triggers a re-scan; a cached miss is re-checked (at most every
+MISS_RECHECK_SECONDS) against the mtimes of the scanned directories, so a
+skill file added later is found without a refresh.
+
+The index is persisted as JSON under ~/.healthsim/cache/skills. A later
+process re-stats the tree and re-parses only the files whose mtime or size
+changed, so startup stays cheap while edited skills are still picked up.
+
+Usage:
+    from healthsim.skills.index import SkillIndex
+
+    index = SkillIndex.for_root(Path("skills"))
+    path = index.find("diabetes-management")
+    frontmatter = index.frontmatter("diabetes-management")
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+# Index files live outside the repo so they survive checkouts
+DEFAULT_INDEX_DIR = Path.home() / ".healthsim" / "cache" / "skills"
+
+INDEX_VERSION = 2
+
+# Minimum interval between directory mtime checks made for cached misses
+MISS_RECHECK_SECONDS = 1.0
+
+# Product directories whose top-level files win over matches elsewhere
+PRODUCT_DIRS = (
+    "patientsim",
+    "membersim",
+    "rxmembersim",
+    "trialsim",
+    "common",
+    "networksim",
+    "populationsim",
+)
+
+# File stems that describe a directory rather than define a skill
+EXCLUDED_STEMS = frozenset({"README", "SKILL"})
+
+_FRONTMATTER_PATTERN = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
+
+
+def normalize_skill_name(name: str) -> str:
+    """Normalize a skill name the way skill files are named on disk."""
+    return name.lower().replace("_", "-")
+
+
+def read_frontmatter(path: Path) -> dict[str, Any]:
+    """Parse the YAML frontmatter of a skill file.
+
+    Values are round-tripped through JSON so a freshly parsed entry looks the
+    same as one loaded from a persisted index (dates become ISO strings).
+
+    Returns:
+        Frontmatter mapping, or an empty dict if there is none or it is invalid
+    """
+    try:
+        content = path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return {}
+    match = _FRONTMATTER_PATTERN.match(content)
+    if not match:
+        return {}
+    try:
+        data = yaml.safe_load(match.group(1))
+    except yaml.YAMLError:
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return json.loads(json.dumps(data, default=str))
+
+
+@dataclass
+class SkillIndexEntry:
+    """One skill file in the index.
+
+    Attributes:
+        name: File stem as written on disk
+        relative_path: POSIX path relative to the skills root
+        mtime_ns: Modification time when the frontmatter was parsed
+        size: File size in bytes when the frontmatter was parsed
+        frontmatter: Parsed YAML frontmatter
+    """
+
+    name: str
+    relative_path: str
+    mtime_ns: int
+    size: int
+    frontmatter: dict[str, Any] = field(default_factory=dict)
+
+
+class SkillIndex:
+    """Name -> file index over a skills directory tree.
+
+    Lookups follow the original search order: ``{product}/{name}.md`` in
+    PRODUCT_DIRS order first, then any file in the tree with a matching stem
+    (case-insensitive), taking the first in path order.
+
+    Example:
+        >>> index = SkillIndex(Path("skills"), persist=False)
+        >>> index.find("diabetes_management")
+        PosixPath('skills/patientsim/diabetes-management.md')
+        >>> index.find("no-such-skill") is None
+        True
+    """
+
+    _shared: dict[Path, "SkillIndex"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        root: Path,
+        cache_dir: Path | None = None,
+        persist: bool = True,
+    ) -> None:
+        """Initialize the index. The tree is scanned on first use.
+
+        Args:
+            root: Skills root directory
+            cache_dir: Directory for the persisted index. Defaults to
+                DEFAULT_INDEX_DIR.
+            persist: Whether to read and write the persisted index
+        """
+        self.root = Path(root)
+        self.cache_dir = cache_dir or DEFAULT_INDEX_DIR
+        self.persist = persist
+        self._entries: dict[str, SkillIndexEntry] | None = None
+        self._by_name: dict[str, list[SkillIndexEntry]] = {}
+        # normalized name -> resolved entry, None for a cached miss
+        self._resolved: dict[str, SkillIndexEntry | None] = {}
+        # directory -> mtime at the last scan (None if it did not exist)
+        self._dir_mtimes: dict[str, int | None] = {}
+        self._checked_at = 0.0
+        self._lock = threading.RLock()
+
+    @classmethod
+    def for_root(cls, root: Path) -> "SkillIndex":
+        """Shared index for a skills root, so every resolver scans it once."""
+        key = Path(root).resolve()
+        with cls._shared_lock:
+            index = cls._shared.get(key)
+            if index is None:
+                index = cls._shared[key] = cls(root)
+            return index
+
+    @property
+    def cache_path(self) -> Path:
+        """Location of the persisted index for this root."""
+        digest = hashlib.sha1(str(self.root.resolve()).encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{digest[:16]}.json"
+
+    def find(self, skill_name: str) -> Path | None:
+        """Find the file defining a skill.
+
+        Args:
+            skill_name: Skill name, e.g. "diabetes-management" or "diabetes_management"
+
+        Returns:
+            Path to the skill file, or None if there is no such skill
+        """
+        entry = self.entry(skill_name)
+        return None if entry is None else self.root / entry.relative_path
+
+    def entry(self, skill_name: str) -> SkillIndexEntry | None:
+        """Index entry for a skill, or None if it does not exist."""
+        normalized = normalize_skill_name(skill_name)
+        try:
+            entry = self._resolved[normalized]
+        except KeyError:
+            with self._lock:
+                self._ensure_built()
+                entry = self._resolved[normalized] = self._resolve(normalized)
+        if entry is None:
+            # Adding a file bumps its directory's mtime; re-scan for it
+            if not self._tree_changed():
+                return None
+        elif self._is_current(entry):
+            return entry
+        with self._lock:
+            self.refresh()
+            entry = self._resolved[normalized] = self._resolve(normalized)
+        return entry
+
+    def frontmatter(self, skill_name: str) -> dict[str, Any]:
+        """Parsed frontmatter for a skill (empty if missing)."""
+        entry = self.entry(skill_name)
+        return entry.frontmatter if entry else {}
+
+    def names(self) -> list[str]:
+        """Sorted, de-duplicated skill file stems, excluding READMEs."""
+        with self._lock:
+            self._ensure_built()
+            return sorted({entry.name for entry in self._entries.values()} - EXCLUDED_STEMS)
+
+    def refresh(self) -> None:
+        """Re-scan the tree, re-parsing only files whose mtime or size changed."""
+        with self._lock:
+            self._build(self._entries or {})
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._ensure_built()
+            return len(self._entries)
+
+    def _resolve(self, normalized: str) -> SkillIndexEntry | None:
+        candidates = self._by_name.get(normalized)
+        if not candidates:
+            return None
+        for product in PRODUCT_DIRS:
+            exact = f"{product}/{normalized}.md"
+            for entry in candidates:
+                if entry.relative_path == exact:
+                    return entry
+        return candidates[0]
+
+    def _is_current(self, entry: SkillIndexEntry) -> bool:
+        """Whether an entry's file still has the mtime and size it was indexed with."""
+        try:
+            stat = os.stat(self.root / entry.relative_path)
+        except OSError:
+            return False
+        return stat.st_mtime_ns == entry.mtime_ns and stat.st_size == entry.size
+
+    def _tree_changed(self) -> bool:
+        """Whether any directory seen by the last scan has changed since.
+
+        Checks are throttled to one per MISS_RECHECK_SECONDS.
+        """
+        now = time.monotonic()
+        if now - self._checked_at < MISS_RECHECK_SECONDS:
+            return False
+        self._checked_at = now
+        for directory, mtime_ns in self._dir_mtimes.items():
+            try:
+                current = os.stat(directory).st_mtime_ns
+            except OSError:
+                current = None
+            if current != mtime_ns:
+                return True
+        return False
+
+    def _ensure_built(self) -> None:
+        if self._entries is None:
+            self._build(self._load_persisted())
+
+    def _build(self, previous: dict[str, SkillIndexEntry]) -> None:
+        entries: dict[str, SkillIndexEntry] = {}
+        changed = False
+        for relative_path, path, mtime_ns, size in self._scan():
+            entry = previous.get(relative_path)
+            if entry is None or entry.mtime_ns != mtime_ns or entry.size != size:
+                entry = SkillIndexEntry(
+                    name=path.stem,
+                    relative_path=relative_path,
+                    mtime_ns=mtime_ns,
+                    size=size,
+                    frontmatter=read_frontmatter(path),
+                )
+                changed = True
+            entries[relative_path] = entry
+        changed = changed or entries.keys() != previous.keys()
+
+        by_name: dict[str, list[SkillIndexEntry]] = {}
+        for relative_path in sorted(entries):
+            entry = entries[relative_path]
+            by_name.setdefault(entry.name.lower(), []).append(entry)
+
+        self._entries = entries
+        self._by_name = by_name
+        self._resolved = {}
+        if changed:
+            self._save()
+
+    def _scan(self) -> list[tuple[str, Path, int, int]]:
+        """(relative path, path, mtime, size) for every .md file under the root.
+
+        Also records each directory's mtime for ``_tree_changed``.
+        """
+        found = []
+        self._dir_mtimes = {str(self.root): None}
+        if not self.root.is_dir():
+            return found
+        for dirpath, _dirnames, filenames in os.walk(self.root):
+            try:
+                self._dir_mtimes[dirpath] = os.stat(dirpath).st_mtime_ns
+            except OSError:
+                continue
+            for filename in filenames:
+                if not filename.endswith(".md"):
+                    continue
+                path = Path(dirpath) / filename
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                found.append(
+                    (path.relative_to(self.root).as_posix(), path, stat.st_mtime_ns, stat.st_size)
+                )
+        return found
+
+    def _load_persisted(self) -> dict[str, SkillIndexEntry]:
+        if not self.persist:
+            return {}
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+            if data.get("version") != INDEX_VERSION:
+                return {}
+            return {item["relative_path"]: SkillIndexEntry(**item) for item in data["skills"]}
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+
+    def _save(self) -> None:
+        if not self.persist:
+            return
+        data = {
+            "version": INDEX_VERSION,
+            "root": str(self.root.resolve()),
+            "skills": [
+                {
+                    "name": entry.name,
+                    "relative_path": entry.relative_path,
+                    "mtime_ns": entry.mtime_ns,
+                    "size": entry.size,
+                    "frontmatter": entry.frontmatter,
+                }
+                for entry in self._entries.values()
+            ],
+        }
+        # A read-only home directory only costs the next process a re-parse
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            pass
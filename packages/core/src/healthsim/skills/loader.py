@@ -1,8 +1,16 @@
 """Skill loader for parsing skill files.
 
-Loads and parses skill definitions from markdown files.
+Loads and parses skill definitions from markdown files. Parsed skills are
+pickled under ~/.healthsim/cache/skills/parsed (or the cache_dir argument, or
+the HEALTHSIM_SKILL_CACHE_DIR environment variable), keyed by file path and
+validated against the file's mtime, size and LOADER_VERSION, so a new process
+deserializes unchanged skills instead of re-parsing them. Entries beyond
+MAX_CACHE_ENTRIES are pruned, oldest first.
 """
 
+import hashlib
+import os
+import pickle
 import re
 from pathlib import Path
 from typing import Any
@@ -18,6 +26,21 @@ from healthsim.skills.schema import (
     SkillVariation,
 )
 
+# Bump whenever parsing or the Skill schema changes to invalidate cached skills
+LOADER_VERSION = 1
+
+# Parsed skills sit beside the SkillIndex files in the workspace cache
+DEFAULT_CACHE_DIR = Path.home() / ".healthsim" / "cache" / "skills" / "parsed"
+
+# Environment variable overriding the parsed-skill cache directory
+CACHE_DIR_ENV = "HEALTHSIM_SKILL_CACHE_DIR"
+
+# Cache files kept after pruning; one per skill file path
+MAX_CACHE_ENTRIES = 1000
+
+# New cache files written between prunes by one loader
+PRUNE_INTERVAL = 100
+
 
 class SkillParseError(Exception):
     """Error parsing a skill file."""
@@ -51,6 +74,20 @@ class SkillLoader:
         "when to use",
     ]
 
+    def __init__(self, cache_dir: Path | None = None) -> None:
+        """Initialize the loader.
+
+        Args:
+            cache_dir: Directory for parsed-skill cache files. Defaults to
+                $HEALTHSIM_SKILL_CACHE_DIR, then DEFAULT_CACHE_DIR.
+        """
+        if cache_dir is None:
+            env_dir = os.environ.get(CACHE_DIR_ENV)
+            cache_dir = Path(env_dir).expanduser() if env_dir else DEFAULT_CACHE_DIR
+        self.cache_dir: Path = cache_dir
+        # Prune on the first new cache file, then every PRUNE_INTERVAL more
+        self._writes_until_prune = 1
+
     def load_file(self, path: Path) -> Skill:
         """Load a skill from a file.
 
@@ -67,8 +104,65 @@ class SkillLoader:
         if not path.exists():
             raise FileNotFoundError(f"Skill file not found: {path}")
 
-        content = path.read_text(encoding="utf-8")
-        return self.load_string(content, source_path=str(path))
+        stat = path.stat()
+        stamp = (LOADER_VERSION, stat.st_mtime_ns, stat.st_size)
+        cache_path = self._cache_path(path)
+        skill = self._read_cached(cache_path, stamp)
+        if skill is None:
+            content = path.read_text(encoding="utf-8")
+            skill = self.load_string(content, source_path=str(path))
+            self._write_cached(cache_path, stamp, skill)
+        return skill
+
+    def _cache_path(self, path: Path) -> Path:
+        """Cache file for a skill file; one per path, overwritten on change."""
+        digest = hashlib.sha1(str(path.resolve()).encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{digest[:24]}.pickle"
+
+    def _read_cached(self, cache_path: Path, stamp: tuple[int, int, int]) -> Skill | None:
+        """Cached skill if it was parsed from the same file version, else None."""
+        try:
+            with open(cache_path, "rb") as f:
+                cached_stamp, skill = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Truncated file or a Skill schema the pickle no longer matches
+            return None
+        if cached_stamp != stamp or not isinstance(skill, Skill):
+            return None
+        return skill
+
+    def _write_cached(self, cache_path: Path, stamp: tuple[int, int, int], skill: Skill) -> None:
+        """Store a parsed skill; failures only cost a re-parse next time."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            is_new = not cache_path.exists()
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump((stamp, skill), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            return
+        if is_new:
+            self._writes_until_prune -= 1
+            if self._writes_until_prune <= 0:
+                self._writes_until_prune = PRUNE_INTERVAL
+                self._prune_cache()
+
+    def _prune_cache(self) -> None:
+        """Delete the least recently written cache files beyond MAX_CACHE_ENTRIES."""
+        entries = []
+        for cache_path in self.cache_dir.glob("*.pickle"):
+            try:
+                entries.append((cache_path.stat().st_mtime_ns, cache_path))
+            except OSError:
+                continue
+        if len(entries) <= MAX_CACHE_ENTRIES:
+            return
+        entries.sort()
+        for _, cache_path in entries[: len(entries) - MAX_CACHE_ENTRIES]:
+            cache_path.unlink(missing_ok=True)
 
     def load_string(self, content: str, source_path: str = "<string>") -> Skill:
         """Load a skill from a string.
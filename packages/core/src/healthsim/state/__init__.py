@@ -126,6 +126,8 @@ from .journey_manager import (
     JourneyExecutionRecord,
     get_journey_manager,
 )
+from .journey_events import JourneyEventLog
+from .checkpoints import CheckpointStore, ChunkCheckpoint
 
 __all__ = [
     # Provenance
@@ -193,4 +195,7 @@ __all__ = [
     "JourneySummary",
     "JourneyExecutionRecord",
     "get_journey_manager",
+    "JourneyEventLog",
+    "CheckpointStore",
+    "ChunkCheckpoint",
 ]
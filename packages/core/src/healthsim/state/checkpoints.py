@@ -0,0 +1,287 @@
+"""Chunk checkpoints and entity storage for resumable orchestration runs.
+
+ProfileJourneyOrchestrator.execute_chunked generates a population one entity
+index range at a time. Each chunk's entities go to ``orchestration_entities``
+and its events to ``journey_events``. A row in ``orchestration_checkpoints``
+records the chunk's range, seed and status. Everything a chunk writes is
+committed in one transaction, so a crash never leaves half a chunk behind,
+and a resumed run skips every chunk marked completed.
+
+Usage:
+    from healthsim.state.checkpoints import CheckpointStore
+
+    store = CheckpointStore(conn)
+    done = store.completed_ranges("run-3f2a9c")
+"""
+
+import json
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+import duckdb
+
+from .journey_events import JOURNEY_EVENTS_TABLE, _utc_now
+
+CHECKPOINTS_TABLE = "orchestration_checkpoints"
+ENTITIES_TABLE = "orchestration_entities"
+
+# Column name -> DuckDB type, in table order
+ENTITY_COLUMNS: Dict[str, str] = {
+    "run_id": "VARCHAR",
+    "entity_index": "BIGINT",
+    "entity_id": "VARCHAR",
+    "seed": "BIGINT",
+    "age": "INTEGER",
+    "gender": "VARCHAR",
+    "birth_date": "DATE",
+    "race": "VARCHAR",
+    "ethnicity": "VARCHAR",
+    "state": "VARCHAR",
+    "county_fips": "VARCHAR",
+    "city": "VARCHAR",
+    "zip_code": "VARCHAR",
+    "conditions": "VARCHAR[]",
+    "severity": "VARCHAR",
+    "lab_values": "JSON",
+    "coverage_type": "VARCHAR",
+    "plan_type": "VARCHAR",
+    "identifiers": "JSON",
+    "attributes": "JSON",
+}
+
+_JSON_FIELDS = ("lab_values", "identifiers", "attributes")
+
+
+@dataclass
+class ChunkCheckpoint:
+    """Progress record for one chunk of a run."""
+
+    run_id: str
+    chunk_start: int
+    chunk_stop: int
+    seed: int
+    status: str  # running, completed, failed
+    entity_count: int = 0
+    event_count: int = 0
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    error_message: Optional[str] = None
+
+
+class CheckpointStore:
+    """DuckDB storage for chunked orchestration runs."""
+
+    def __init__(self, conn: duckdb.DuckDBPyConnection):
+        """Initialize the store, creating its tables if needed.
+
+        Args:
+            conn: DuckDB connection
+        """
+        self.conn = conn
+        self._ensure_tables()
+
+    def _ensure_tables(self) -> None:
+        """Ensure checkpoint and entity tables exist."""
+        self.conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {CHECKPOINTS_TABLE} (
+                run_id          VARCHAR NOT NULL,
+                chunk_start     BIGINT NOT NULL,
+                chunk_stop      BIGINT NOT NULL,
+                seed            BIGINT,
+                status          VARCHAR NOT NULL,
+                entity_count    INTEGER DEFAULT 0,
+                event_count     INTEGER DEFAULT 0,
+                started_at      TIMESTAMP,
+                completed_at    TIMESTAMP,
+                error_message   VARCHAR,
+                PRIMARY KEY (run_id, chunk_start)
+            )
+        """)
+        columns = ",\n                ".join(
+            f"{name:<15} {sql_type}" for name, sql_type in ENTITY_COLUMNS.items()
+        )
+        self.conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {ENTITIES_TABLE} (
+                {columns}
+            )
+        """)
+
+    # =========================================================================
+    # Checkpoints
+    # =========================================================================
+
+    def get_checkpoints(self, run_id: str) -> List[ChunkCheckpoint]:
+        """All checkpoints of a run, in chunk order."""
+        rows = self.conn.execute(
+            f"""
+            SELECT run_id, chunk_start, chunk_stop, seed, status, entity_count,
+                   event_count, started_at, completed_at, error_message
+            FROM {CHECKPOINTS_TABLE}
+            WHERE run_id = ?
+            ORDER BY chunk_start
+            """,
+            [run_id],
+        ).fetchall()
+        return [ChunkCheckpoint(*row) for row in rows]
+
+    def completed_ranges(self, run_id: str) -> Set[Tuple[int, int]]:
+        """(start, stop) index ranges of a run's completed chunks."""
+        rows = self.conn.execute(
+            f"""
+            SELECT chunk_start, chunk_stop FROM {CHECKPOINTS_TABLE}
+            WHERE run_id = ? AND status = 'completed'
+            """,
+            [run_id],
+        ).fetchall()
+        return {(start, stop) for start, stop in rows}
+
+    def mark_running(self, run_id: str, start: int, stop: int, seed: int) -> None:
+        """Record that a chunk has started."""
+        self._upsert(
+            ChunkCheckpoint(run_id, start, stop, seed, "running", started_at=_utc_now())
+        )
+
+    def mark_completed(
+        self,
+        run_id: str,
+        start: int,
+        stop: int,
+        seed: int,
+        entity_count: int,
+        event_count: int,
+    ) -> None:
+        """Record that a chunk's output has been written."""
+        self.conn.execute(
+            f"""
+            UPDATE {CHECKPOINTS_TABLE}
+            SET status = 'completed', chunk_stop = ?, seed = ?, entity_count = ?,
+                event_count = ?, completed_at = ?, error_message = NULL
+            WHERE run_id = ? AND chunk_start = ?
+            """,
+            [stop, seed, entity_count, event_count, _utc_now(), run_id, start],
+        )
+
+    def mark_failed(self, run_id: str, start: int, stop: int, seed: int, error: str) -> None:
+        """Record that a chunk failed; a resumed run retries it."""
+        self._upsert(
+            ChunkCheckpoint(
+                run_id,
+                start,
+                stop,
+                seed,
+                "failed",
+                completed_at=_utc_now(),
+                error_message=error,
+            )
+        )
+
+    def _upsert(self, checkpoint: ChunkCheckpoint) -> None:
+        self.conn.execute(
+            f"""
+            INSERT OR REPLACE INTO {CHECKPOINTS_TABLE}
+            (run_id, chunk_start, chunk_stop, seed, status, entity_count, event_count,
+             started_at, completed_at, error_message)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                checkpoint.run_id,
+                checkpoint.chunk_start,
+                checkpoint.chunk_stop,
+                checkpoint.seed,
+                checkpoint.status,
+                checkpoint.entity_count,
+                checkpoint.event_count,
+                checkpoint.started_at,
+                checkpoint.completed_at,
+                checkpoint.error_message,
+            ],
+        )
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Commit everything written inside the block, or nothing."""
+        self.conn.execute("BEGIN TRANSACTION")
+        try:
+            yield
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+
+    def clear_run(self, run_id: str) -> None:
+        """Delete a run's checkpoints, entities and journey events."""
+        self.conn.execute(f"DELETE FROM {CHECKPOINTS_TABLE} WHERE run_id = ?", [run_id])
+        self.conn.execute(f"DELETE FROM {ENTITIES_TABLE} WHERE run_id = ?", [run_id])
+        events_table = self.conn.execute(
+            "SELECT COUNT(*) FROM information_schema.tables WHERE table_name = ?",
+            [JOURNEY_EVENTS_TABLE],
+        ).fetchone()[0]
+        if events_table:
+            self.conn.execute(
+                f"DELETE FROM {JOURNEY_EVENTS_TABLE} WHERE starts_with(entity_id, ?)",
+                [f"{run_id}:"],
+            )
+
+    # =========================================================================
+    # Entities
+    # =========================================================================
+
+    def write_entities(self, run_id: str, entities: List[Any]) -> int:
+        """Append generated entities in one batch.
+
+        Args:
+            run_id: Run the entities belong to
+            entities: GeneratedEntity objects; entity_id is "{run_id}:{index}"
+
+        Returns:
+            Number of rows written
+        """
+        if not entities:
+            return 0
+        columns: Dict[str, List[Any]] = {name: [] for name in ENTITY_COLUMNS}
+        for entity in entities:
+            columns["run_id"].append(run_id)
+            columns["entity_index"].append(entity.index)
+            columns["entity_id"].append(f"{run_id}:{entity.index}")
+            for name in list(ENTITY_COLUMNS)[3:]:
+                value = getattr(entity, name)
+                if name in _JSON_FIELDS:
+                    value = json.dumps(value, default=str)
+                columns[name].append(value)
+
+        view = f"_{ENTITIES_TABLE}_batch"
+        column_list = ", ".join(ENTITY_COLUMNS)
+        self.conn.register(view, _to_batch(columns))
+        try:
+            self.conn.execute(
+                f"INSERT INTO {ENTITIES_TABLE} ({column_list}) SELECT {column_list} FROM {view}"
+            )
+        finally:
+            self.conn.unregister(view)
+        return len(entities)
+
+
+def _to_batch(columns: Dict[str, List[Any]]) -> Any:
+    try:
+        import pyarrow as pa
+    except ImportError:
+        import pandas as pd
+
+        return pd.DataFrame(columns, columns=list(ENTITY_COLUMNS))
+    return pa.table(columns, schema=_arrow_schema())
+
+
+def _arrow_schema() -> Any:
+    import pyarrow as pa
+
+    types = {
+        "BIGINT": pa.int64(),
+        "INTEGER": pa.int32(),
+        "DATE": pa.date32(),
+        "VARCHAR[]": pa.list_(pa.string()),
+    }
+    return pa.schema(
+        [(name, types.get(sql_type, pa.string())) for name, sql_type in ENTITY_COLUMNS.items()]
+    )
@@ -0,0 +1,253 @@
+"""Columnar, append-only log of journey event executions.
+
+JourneyManager.record_execution stores one row per journey run with JSON
+blobs. This module records one row per executed event in a ``journey_events``
+fact table, so event-level analytics and replays are plain SQL:
+
+    SELECT handler, status, count(*), avg(duration_us)
+    FROM journey_events
+    GROUP BY ALL
+
+Rows are buffered column by column and written in batches as an Arrow table
+(or a pandas DataFrame when pyarrow is not installed).
+
+Usage:
+    from healthsim.state.journey_events import JourneyEventLog
+
+    with JourneyEventLog(conn) as log:
+        engine.attach_event_log(log)
+        for timeline, results in engine.simulate(patients, journey, "patient"):
+            ...
+"""
+
+from datetime import date, datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import duckdb
+
+JOURNEY_EVENTS_TABLE = "journey_events"
+
+# Column name -> DuckDB type, in table order
+JOURNEY_EVENT_COLUMNS: Dict[str, str] = {
+    "entity_id": "VARCHAR",
+    "journey_id": "VARCHAR",
+    "event_def_id": "VARCHAR",
+    "scheduled_date": "DATE",
+    "executed_at": "TIMESTAMP",
+    "status": "VARCHAR",
+    "duration_us": "BIGINT",
+    "handler": "VARCHAR",
+}
+
+_COLUMN_LIST = ", ".join(JOURNEY_EVENT_COLUMNS)
+
+DEFAULT_BATCH_SIZE = 50_000
+
+
+def _utc_now() -> datetime:
+    """Current UTC time as a naive datetime, matching the TIMESTAMP column.
+
+    An aware value would be shifted into the session time zone on insert.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def handler_name(handler: Any) -> Optional[str]:
+    """Readable name for an event handler, e.g. "PatientSimHandlers.handle_encounter"."""
+    if handler is None:
+        return None
+    return getattr(handler, "__qualname__", None) or type(handler).__qualname__
+
+
+class JourneyEventLog:
+    """Append-only writer for the journey_events table.
+
+    Attach it to a JourneyEngine with ``engine.attach_event_log(log)`` and
+    every executed, failed or skipped event is recorded. Call flush() (or
+    use the log as a context manager) to write the last partial batch.
+    """
+
+    def __init__(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        table: str = JOURNEY_EVENTS_TABLE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        """Initialize the log, creating the table if needed.
+
+        Args:
+            conn: DuckDB connection
+            table: Table to append to
+            batch_size: Buffered rows that trigger a write
+        """
+        self.conn = conn
+        self.table = table
+        self.batch_size = batch_size
+        self.rows_written = 0
+        self._columns: Dict[str, List[Any]] = {name: [] for name in JOURNEY_EVENT_COLUMNS}
+        self._ensure_table()
+
+    def _ensure_table(self) -> None:
+        """Ensure the journey events table exists."""
+        columns = ",\n                ".join(
+            f"{name:<15} {sql_type}" for name, sql_type in JOURNEY_EVENT_COLUMNS.items()
+        )
+        self.conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {self.table} (
+                {columns}
+            )
+        """)
+
+    def record(
+        self,
+        entity_id: Optional[str],
+        journey_id: Optional[str],
+        event_def_id: Optional[str],
+        scheduled_date: Optional[date],
+        status: str,
+        executed_at: Optional[datetime] = None,
+        duration_us: Optional[int] = 0,
+        handler: Optional[str] = None,
+    ) -> None:
+        """Buffer one event row, writing the batch when it is full."""
+        if executed_at is None and status != "pending":
+            executed_at = _utc_now()
+        columns = self._columns
+        columns["entity_id"].append(entity_id)
+        columns["journey_id"].append(journey_id)
+        columns["event_def_id"].append(event_def_id)
+        columns["scheduled_date"].append(scheduled_date)
+        columns["executed_at"].append(executed_at)
+        columns["status"].append(status)
+        columns["duration_us"].append(duration_us)
+        columns["handler"].append(handler)
+        if len(columns["status"]) >= self.batch_size:
+            self.flush()
+
+    def record_event(
+        self,
+        timeline: Any,
+        event: Any,
+        status: str,
+        duration_us: int = 0,
+        handler: Any = None,
+    ) -> None:
+        """Buffer a row for a TimelineEvent executed on a Timeline.
+
+        Args:
+            timeline: The entity's Timeline
+            event: The TimelineEvent
+            status: Outcome ("executed", "failed", "skipped")
+            duration_us: Handler time in microseconds
+            handler: The handler callable
+        """
+        self.record(
+            entity_id=timeline.entity_id,
+            journey_id=event.journey_id,
+            event_def_id=event.event_definition_id,
+            scheduled_date=event.scheduled_date,
+            status=status,
+            executed_at=event.executed_at,
+            duration_us=duration_us,
+            handler=handler_name(handler),
+        )
+
+    def record_timeline(
+        self,
+        timeline: Any,
+        include_pending: bool = False,
+        entity_id: Optional[str] = None,
+    ) -> int:
+        """Buffer a row for every event on a timeline.
+
+        For timelines executed without a log attached; duration and handler
+        are unknown and left empty.
+
+        Args:
+            timeline: The Timeline
+            include_pending: Also record events that have not run yet (executed_at
+                is left empty); by default they are skipped
+            entity_id: Entity ID to record instead of timeline.entity_id
+
+        Returns:
+            Number of rows buffered
+        """
+        entity_id = entity_id or timeline.entity_id
+        count = 0
+        for event in timeline.events:
+            if event.status == "pending" and not include_pending:
+                continue
+            self.record(
+                entity_id=entity_id,
+                journey_id=event.journey_id,
+                event_def_id=event.event_definition_id,
+                scheduled_date=event.scheduled_date,
+                status=event.status,
+                executed_at=event.executed_at,
+                duration_us=None,
+            )
+            count += 1
+        return count
+
+    @property
+    def pending(self) -> int:
+        """Rows buffered but not yet written."""
+        return len(self._columns["status"])
+
+    def flush(self) -> int:
+        """Write buffered rows to the table in one batch.
+
+        Returns:
+            Number of rows written
+        """
+        count = self.pending
+        if not count:
+            return 0
+        batch = self._to_batch()
+        view = f"_{self.table}_batch"
+        self.conn.register(view, batch)
+        try:
+            self.conn.execute(
+                f"INSERT INTO {self.table} ({_COLUMN_LIST}) SELECT {_COLUMN_LIST} FROM {view}"
+            )
+        finally:
+            self.conn.unregister(view)
+        for values in self._columns.values():
+            values.clear()
+        self.rows_written += count
+        return count
+
+    def _to_batch(self) -> Any:
+        try:
+            import pyarrow as pa
+        except ImportError:
+            import pandas as pd
+
+            return pd.DataFrame(self._columns, columns=list(JOURNEY_EVENT_COLUMNS))
+        return pa.table(
+            {name: self._columns[name] for name in JOURNEY_EVENT_COLUMNS},
+            schema=_arrow_schema(),
+        )
+
+    def __enter__(self) -> "JourneyEventLog":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.flush()
+
+
+def _arrow_schema() -> Any:
+    import pyarrow as pa
+
+    return pa.schema(
+        [
+            ("entity_id", pa.string()),
+            ("journey_id", pa.string()),
+            ("event_def_id", pa.string()),
+            ("scheduled_date", pa.date32()),
+            ("executed_at", pa.timestamp("us")),
+            ("status", pa.string()),
+            ("duration_us", pa.int64()),
+            ("handler", pa.string()),
+        ]
+    )
@@ -15,6 +15,8 @@ import json
 
 import duckdb
 
+from .journey_events import DEFAULT_BATCH_SIZE, JourneyEventLog
+
 
 @dataclass
 class JourneyRecord:
@@ -498,6 +500,20 @@ class JourneyManager:
         
         return result[0]
     
+    def event_log(self, batch_size: int = DEFAULT_BATCH_SIZE) -> JourneyEventLog:
+        """Open an append-only log of per-event outcomes.
+        
+        Rows go to the columnar journey_events table, one per executed event.
+        Attach the log to a JourneyEngine with engine.attach_event_log().
+        
+        Args:
+            batch_size: Buffered rows written per batch
+            
+        Returns:
+            JourneyEventLog on this manager's connection
+        """
+        return JourneyEventLog(self.conn, batch_size=batch_size)
+    
     def get_executions(
         self,
         journey_id: str,
@@ -0,0 +1,151 @@
+"""Tests for the in-place accumulator engine."""
+
+from decimal import Decimal
+
+from healthsim.benefits import (
+    AccumulatorEngine,
+    BenefitType,
+    NetworkTier,
+    create_medical_accumulators,
+    create_pharmacy_accumulators,
+    from_cents,
+    to_cents,
+)
+
+
+def _medical(member_id: str, deductible_family: str = "1500"):
+    return create_medical_accumulators(
+        member_id=member_id,
+        plan_year=2024,
+        deductible_individual=Decimal("500"),
+        deductible_family=Decimal(deductible_family),
+        oop_individual=Decimal("3000"),
+        oop_family=Decimal("6000"),
+    )
+
+
+class TestCents:
+    """Tests for cent conversion."""
+
+    def test_round_trip(self):
+        """Test dollars to cents and back."""
+        assert to_cents(Decimal("123.45")) == 12345
+        assert to_cents(Decimal("0.005")) == 1
+        assert from_cents(12345) == Decimal("123.45")
+
+
+class TestAccumulatorEngine:
+    """Tests for AccumulatorEngine."""
+
+    def test_matches_accumulator_set(self):
+        """Test the engine applies amounts as AccumulatorSet does."""
+        acc_set = _medical("MEM-001")
+        engine = AccumulatorEngine()
+        engine.load(acc_set)
+
+        for amount, network in [
+            ("200", NetworkTier.IN_NETWORK),
+            ("450", NetworkTier.IN_NETWORK),
+            ("300", NetworkTier.OUT_OF_NETWORK),
+        ]:
+            acc_set, applied = acc_set.apply_to_deductible(Decimal(amount), network=network)
+            assert engine.apply_deductible("MEM-001", to_cents(Decimal(amount)), network) == (
+                to_cents(applied)
+            )
+            acc_set, applied = acc_set.apply_to_oop(Decimal(amount), network=network)
+            assert engine.apply_oop("MEM-001", to_cents(Decimal(amount)), network) == (
+                to_cents(applied)
+            )
+
+        for network in (NetworkTier.IN_NETWORK, NetworkTier.OUT_OF_NETWORK):
+            assert from_cents(engine.deductible_remaining("MEM-001", network)) == (
+                acc_set.get_deductible_remaining(network)
+            )
+            assert from_cents(engine.oop_remaining("MEM-001", network)) == (
+                acc_set.get_oop_remaining(network)
+            )
+            assert engine.is_deductible_met("MEM-001", network) == (
+                acc_set.is_deductible_met(network)
+            )
+
+    def test_family_rollup(self):
+        """Test members loaded under one family share family accumulators."""
+        engine = AccumulatorEngine()
+        for member_id in ("MEM-001", "MEM-002", "MEM-003"):
+            engine.load(_medical(member_id, deductible_family="800"), family_id="FAM-001")
+
+        engine.apply_deductible("MEM-001", 40000)
+        engine.apply_deductible("MEM-002", 40000)
+
+        # Family deductible met: nobody in the family owes more
+        assert engine.is_deductible_met("MEM-003")
+        assert engine.deductible_remaining("MEM-003") == 0
+        assert engine.apply_deductible("MEM-003", 10000) == 0
+
+        snapshot = engine.snapshot("MEM-003")
+        assert snapshot.deductible_individual_in.applied == Decimal("0")
+        assert snapshot.deductible_family_in.applied == Decimal("800.00")
+
+    def test_without_family_id(self):
+        """Test members without a family ID keep their own family accumulators."""
+        engine = AccumulatorEngine()
+        engine.load(_medical("MEM-001", deductible_family="800"))
+        engine.load(_medical("MEM-002", deductible_family="800"))
+
+        engine.apply_deductible("MEM-001", 50000)
+
+        assert engine.deductible_remaining("MEM-002") == 50000
+
+    def test_pharmacy_carve_out(self):
+        """Test pharmacy amounts go to the rx accumulators when present."""
+        engine = AccumulatorEngine()
+        engine.load(
+            create_pharmacy_accumulators(
+                member_id="MEM-001",
+                plan_year=2024,
+                deductible=Decimal("100"),
+                oop_max=Decimal("2000"),
+                specialty_oop=Decimal("500"),
+            )
+        )
+
+        applied = engine.apply_deductible(
+            "MEM-001",
+            15000,
+            network=NetworkTier.PREFERRED_PHARMACY,
+            benefit_type=BenefitType.PHARMACY,
+        )
+        assert applied == 10000
+        assert engine.is_deductible_met("MEM-001", benefit_type=BenefitType.PHARMACY)
+        assert engine.apply_specialty_oop("MEM-001", 60000) == 50000
+
+        snapshot = engine.snapshot("MEM-001")
+        assert snapshot.rx_deductible.met is True
+        assert snapshot.specialty_oop.remaining == Decimal("0")
+
+    def test_snapshot_round_trip(self):
+        """Test loading a set and snapshotting it gives the same balances."""
+        acc_set, _ = _medical("MEM-001").apply_to_deductible(Decimal("125.50"))
+        engine = AccumulatorEngine()
+        engine.load(acc_set)
+
+        snapshot = engine.snapshot("MEM-001")
+
+        assert snapshot.member_id == "MEM-001"
+        assert snapshot.plan_year == 2024
+        assert snapshot.deductible_individual_in.applied == Decimal("125.50")
+        assert snapshot.oop_family_out.limit == acc_set.oop_family_out.limit
+        assert [s.member_id for s in engine.export()] == ["MEM-001"]
+
+    def test_reset(self):
+        """Test resetting zeroes balances and advances the plan year."""
+        engine = AccumulatorEngine()
+        engine.load(_medical("MEM-001"), family_id="FAM-001")
+        engine.apply_deductible("MEM-001", 50000)
+
+        engine.reset()
+
+        assert engine.deductible_remaining("MEM-001") == 50000
+        assert engine.snapshot("MEM-001").plan_year == 2025
+        assert "MEM-001" in engine
+        assert len(engine) == 1
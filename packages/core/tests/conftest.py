@@ -0,0 +1,11 @@
+"""Pytest configuration for HealthSim core tests."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def skill_cache_dir(tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch):
+    """Keep parsed-skill cache files out of the home directory."""
+    cache_dir = tmp_path_factory.getbasetemp() / "skill-cache"
+    monkeypatch.setenv("HEALTHSIM_SKILL_CACHE_DIR", str(cache_dir))
+    return cache_dir
@@ -0,0 +1,154 @@
+"""Tests for the staged, parallel reference data import pipeline."""
+
+import pytest
+
+from healthsim.db import DatabaseConnection
+from healthsim.db.reference import (
+    REFERENCE_DATASETS,
+    get_import_manifest,
+    import_reference_data_staged,
+)
+
+PLACES_TRACT_CSV = """\
+StateAbbr,StateDesc,CountyName,CountyFIPS,TractFIPS,TotalPopulation,\
+DIABETES_CrudePrev,DIABETES_Crude95CI
+CA,California,San Diego,06073,06073000100,4000,10.5,"(9.8, 11.2)"
+CA,California,San Diego,06073,06073000200,3500,12.1,"(11.0, 13.3)"
+AL,Alabama,Autauga,01001,01001020100,1900,14.2,"(13.1, 15.4)"
+"""
+
+ADI_CSV = """GISJOIN,FIPS,ADI_NATRANK,ADI_STATERNK
+G01000102010001,010010201001,73,4
+G01000102010002,010010201002,GQ,GQ
+"""
+
+
+@pytest.fixture
+def test_db(tmp_path):
+    """Create a temporary test database."""
+    db_conn = DatabaseConnection(tmp_path / "test.duckdb")
+    conn = db_conn.connect()
+    yield conn
+    db_conn.close()
+
+
+@pytest.fixture
+def data_path(tmp_path):
+    """Write small PopulationSim-shaped CSVs."""
+    root = tmp_path / "data"
+    (root / "tract").mkdir(parents=True)
+    (root / "block_group").mkdir(parents=True)
+    (root / "tract" / "places_tract_2024.csv").write_text(PLACES_TRACT_CSV)
+    (root / "block_group" / "adi_blockgroup_2023.csv").write_text(ADI_CSV)
+    return root
+
+
+TABLES = ["ref_places_tract", "ref_adi_blockgroup"]
+
+
+class TestStagedImport:
+    """Tests for import_reference_data_staged."""
+
+    def test_imports_tables_concurrently(self, test_db, data_path, tmp_path):
+        results = import_reference_data_staged(
+            test_db, tables=TABLES, data_path=data_path, staging_dir=tmp_path / "stage"
+        )
+
+        assert results["ref_places_tract"].row_count == 3
+        assert results["ref_adi_blockgroup"].row_count == 2
+        assert not any(r.skipped for r in results.values())
+        assert all(r.error is None for r in results.values())
+
+    def test_explicit_types_preserve_fips(self, test_db, data_path, tmp_path):
+        import_reference_data_staged(
+            test_db, tables=TABLES, data_path=data_path, staging_dir=tmp_path / "stage"
+        )
+
+        count = test_db.execute(
+            "SELECT count(*) FROM ref_places_tract WHERE countyfips = '06073'"
+        ).fetchone()[0]
+        assert count == 2
+
+        natrank = test_db.execute(
+            "SELECT adi_natrank FROM ref_adi_blockgroup WHERE fips = '010010201002'"
+        ).fetchone()[0]
+        assert natrank == "GQ"
+
+    def test_writes_parquet_staging_files(self, test_db, data_path, tmp_path):
+        results = import_reference_data_staged(
+            test_db, tables=TABLES, data_path=data_path, staging_dir=tmp_path / "stage"
+        )
+
+        for result in results.values():
+            assert result.parquet_path.endswith(".parquet")
+            assert result.source_sha256[:16] in result.parquet_path
+        assert len(list((tmp_path / "stage").glob("*.parquet"))) == 2
+
+    def test_records_manifest(self, test_db, data_path, tmp_path):
+        import_reference_data_staged(
+            test_db, tables=TABLES, data_path=data_path, staging_dir=tmp_path / "stage"
+        )
+
+        manifest = get_import_manifest(test_db)
+        entry = manifest["ref_places_tract"]
+        assert entry["row_count"] == 3
+        assert len(entry["source_sha256"]) == 64
+        assert entry["column_schema"]["tractfips"] == "VARCHAR"
+        assert entry["column_schema"]["diabetes_crudeprev"] == "DOUBLE"
+
+    def test_rerun_is_noop(self, test_db, data_path, tmp_path):
+        stage = tmp_path / "stage"
+        import_reference_data_staged(test_db, tables=TABLES, data_path=data_path, staging_dir=stage)
+
+        results = import_reference_data_staged(
+            test_db, tables=TABLES, data_path=data_path, staging_dir=stage
+        )
+
+        assert all(r.skipped for r in results.values())
+        assert results["ref_places_tract"].row_count == 3
+
+    def test_changed_source_is_reimported(self, test_db, data_path, tmp_path):
+        stage = tmp_path / "stage"
+        import_reference_data_staged(test_db, tables=TABLES, data_path=data_path, staging_dir=stage)
+
+        csv_path = data_path / "tract" / "places_tract_2024.csv"
+        csv_path.write_text(
+            PLACES_TRACT_CSV + "AL,Alabama,Autauga,01001,01001020200,2100,13.0,\"(12.0, 14.0)\"\n"
+        )
+        results = import_reference_data_staged(
+            test_db, tables=TABLES, data_path=data_path, staging_dir=stage
+        )
+
+        assert not results["ref_places_tract"].skipped
+        assert results["ref_places_tract"].row_count == 4
+        assert results["ref_adi_blockgroup"].skipped
+
+    def test_force_reimports(self, test_db, data_path, tmp_path):
+        stage = tmp_path / "stage"
+        import_reference_data_staged(test_db, tables=TABLES, data_path=data_path, staging_dir=stage)
+
+        results = import_reference_data_staged(
+            test_db, tables=TABLES, data_path=data_path, staging_dir=stage, force=True
+        )
+
+        assert not any(r.skipped for r in results.values())
+
+    def test_missing_csv_reports_error(self, test_db, data_path, tmp_path):
+        results = import_reference_data_staged(
+            test_db,
+            tables=["ref_svi_tract"],
+            data_path=data_path,
+            staging_dir=tmp_path / "stage",
+        )
+
+        assert results["ref_svi_tract"].row_count == -1
+        assert "not found" in results["ref_svi_tract"].error
+
+    def test_unknown_table_raises(self, test_db, data_path):
+        with pytest.raises(ValueError, match="Unknown reference tables"):
+            import_reference_data_staged(test_db, tables=["ref_nope"], data_path=data_path)
+
+    def test_all_reference_tables_have_datasets(self):
+        from healthsim.db.reference import REFERENCE_TABLES
+
+        assert set(REFERENCE_DATASETS) == set(REFERENCE_TABLES)
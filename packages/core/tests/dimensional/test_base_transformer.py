@@ -362,6 +362,102 @@ class TestGetAttr:
         assert BaseDimensionalTransformer.get_attr(data, "a.b.c.d") == "value"
 
 
+class TestColumnarHelpers:
+    """Tests for the columnar counterparts of the scalar utilities."""
+
+    def test_extract_columns_nested_paths(self):
+        """Dotted paths resolve per row, with None for missing parents."""
+        items = [{"name": {"first": "Ann"}}, {"name": None}]
+        df = BaseDimensionalTransformer.extract_columns(items, {"first": "name.first"})
+        assert df["first"].iloc[0] == "Ann"
+        assert pd.isna(df["first"].iloc[1])
+
+    def test_dates_to_keys_matches_scalar(self):
+        """Column keys match date_to_key for dates, datetimes and strings."""
+        values = pd.Series([date(2024, 3, 15), datetime(2023, 12, 31, 23, 59), "2020-02-29"])
+        keys = BaseDimensionalTransformer.dates_to_keys(values)
+        assert keys.tolist() == [BaseDimensionalTransformer.date_to_key(v) for v in values]
+
+    def test_dates_to_keys_with_nulls(self):
+        """Missing dates become NaN while present dates keep their key."""
+        keys = BaseDimensionalTransformer.dates_to_keys(pd.Series([date(2024, 1, 1), None]))
+        assert keys.iloc[0] == 20240101
+        assert pd.isna(keys.iloc[1])
+
+    def test_calculate_ages_matches_scalar(self):
+        """Vectorized ages match calculate_age around birthdays."""
+        as_of = date(2024, 6, 15)
+        dobs = [date(1990, 6, 15), date(1990, 6, 16), date(2000, 12, 31), date(2025, 1, 1)]
+        ages = BaseDimensionalTransformer.calculate_ages(pd.Series(dobs), as_of)
+        assert ages.tolist() == [BaseDimensionalTransformer.calculate_age(d, as_of) for d in dobs]
+
+    def test_out_of_bounds_dates_match_scalar(self):
+        """Dates outside the pandas timestamp range keep their scalar results."""
+        as_of = date(2024, 6, 15)
+        values = [date(1600, 1, 1), "1200-05-05", date(2300, 1, 1), "2024-01-01T10:00"]
+        keys = BaseDimensionalTransformer.dates_to_keys(pd.Series(values))
+        ages = BaseDimensionalTransformer.calculate_ages(pd.Series(values), as_of)
+        assert keys.iloc[:3].tolist() == [16000101, 12000505, 23000101]
+        assert pd.isna(keys.iloc[3])
+        assert ages.iloc[:3].tolist() == [424, 824, 0]
+        assert pd.isna(ages.iloc[3])
+
+    def test_infer_dtypes_matches_row_construction(self):
+        """Object columns get the dtypes pandas infers for row dicts."""
+        bands = pd.Series(["18-34", None], dtype=object)
+        df = pd.DataFrame({"band": bands, "dob": [date(1990, 1, 1), None]})
+        inferred = BaseDimensionalTransformer.infer_dtypes({"t": df})["t"]
+        expected = pd.DataFrame(
+            [{"band": "18-34", "dob": date(1990, 1, 1)}, {"band": None, "dob": None}]
+        )
+        assert inferred.dtypes.to_dict() == expected.dtypes.to_dict()
+
+    def test_age_bands_matches_scalar(self):
+        """Vectorized bands match age_band, including None."""
+        ages = [0, 17, 18, 34, 35, 49, 50, 64, 65, 100, None]
+        bands = BaseDimensionalTransformer.age_bands(pd.Series(ages, dtype=object))
+        assert bands.tolist() == [BaseDimensionalTransformer.age_band(a) for a in ages]
+
+    def test_map_unique_calls_once_per_value(self):
+        """The mapped function runs once per distinct value."""
+        calls = []
+
+        def upper(value):
+            calls.append(value)
+            return value.upper() if value else "?"
+
+        result = BaseDimensionalTransformer.map_unique(
+            pd.Series(["a", "b", "a", None, "b"]), upper
+        )
+        assert result.tolist() == ["A", "B", "A", "?", "B"]
+        assert len(calls) == 3
+
+    def test_sorted_uniques_and_lookup_keys(self):
+        """Surrogate keys are 1-based positions in sorted order; unknowns get -1."""
+        uniques = BaseDimensionalTransformer.sorted_uniques(
+            ["b", "a", None], ["c", "", "a"], drop_empty=True
+        )
+        assert list(uniques) == ["a", "b", "c"]
+
+        keys = BaseDimensionalTransformer.lookup_keys(pd.Series(["c", "a", "z", None]), uniques)
+        assert keys.tolist() == [3, 1, -1, -1]
+
+    def test_lookup_values_missing_is_none(self):
+        """Joined attributes are None for keys absent from the mapping."""
+        mapping = pd.Series([True, False], index=["x", "y"])
+        result = BaseDimensionalTransformer.lookup_values(pd.Series(["y", "q"]), mapping)
+        assert result.tolist() == [False, None]
+
+    def test_nullable_ints_dtypes(self):
+        """Complete columns stay integer; partial and empty ones become nullable."""
+        values = pd.Series([1, 2])
+        assert BaseDimensionalTransformer.nullable_ints(values, [True, True]).dtype == "int64"
+        partial = BaseDimensionalTransformer.nullable_ints(values, [True, False])
+        assert partial.iloc[0] == 1 and pd.isna(partial.iloc[1])
+        empty = BaseDimensionalTransformer.nullable_ints(values, [False, False])
+        assert empty.tolist() == [None, None]
+
+
 class TestConcreteTransformer:
     """Tests for transformer interface."""
 
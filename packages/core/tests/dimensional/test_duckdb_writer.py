@@ -9,6 +9,7 @@ import pandas as pd
 import pytest
 
 from healthsim.dimensional import DuckDBDimensionalWriter, generate_dim_date
+from healthsim.dimensional.writers.base import BUILD_STATE_TABLE
 
 
 class TestDuckDBWriterInit:
@@ -175,6 +176,223 @@ class TestDuckDBWriterWriteDimensionalModel:
             assert result["dim_date"] == 366  # Leap year
 
 
+def _cohort_model(codes: list[str], claims: list[tuple[str, str, int]]):
+    """Build a small per-cohort model: a diagnosis dimension and claim facts."""
+    dim_diagnosis = pd.DataFrame(
+        {
+            "diagnosis_key": [-1, *range(1, len(codes) + 1)],
+            "diagnosis_code": ["UNKNOWN", *codes],
+        }
+    )
+    keys = {code: key for key, code in enumerate(codes, start=1)}
+    fact_claims = pd.DataFrame(
+        {
+            "claim_fact_key": range(1, len(claims) + 1),
+            "claim_id": [claim_id for claim_id, _, _ in claims],
+            "diagnosis_key": [keys.get(code, -1) for _, code, _ in claims],
+            "service_date_key": [date_key for _, _, date_key in claims],
+        }
+    )
+    return {"dim_diagnosis": dim_diagnosis}, {"fact_claims": fact_claims}
+
+
+class TestDuckDBWriterIncrementalRefresh:
+    """Tests for per-cohort incremental write_dimensional_model."""
+
+    KEYS = {
+        "natural_keys": {"dim_diagnosis": "diagnosis_code"},
+        "key_columns": {"dim_diagnosis": "diagnosis_key"},
+        "fact_keys": {"fact_claims": "claim_fact_key"},
+    }
+
+    def _claims(self, writer: DuckDBDimensionalWriter) -> list[tuple]:
+        return [
+            tuple(row)
+            for row in writer.query(
+                """
+                SELECT f.cohort_id, f.claim_id, d.diagnosis_code
+                FROM analytics.fact_claims f
+                JOIN analytics.dim_diagnosis d USING (diagnosis_key)
+                ORDER BY f.cohort_id, f.claim_id
+                """
+            ).itertuples(index=False)
+        ]
+
+    def test_cohorts_keep_stable_surrogate_keys(self):
+        """Test a second cohort reuses keys for shared natural keys."""
+        with DuckDBDimensionalWriter(":memory:") as writer:
+            dims, facts = _cohort_model(["E11.9", "I10"], [("A1", "I10", 20240301)])
+            writer.write_dimensional_model(dims, facts, cohort_id="a", **self.KEYS)
+            dims, facts = _cohort_model(
+                ["I10", "J44.1"], [("B1", "J44.1", 20240105), ("B2", "I10", 20240210)]
+            )
+            writer.write_dimensional_model(dims, facts, cohort_id="b", **self.KEYS)
+
+            keys = writer.query(
+                "SELECT diagnosis_code, diagnosis_key FROM analytics.dim_diagnosis "
+                "ORDER BY diagnosis_key"
+            )
+            assert keys.values.tolist() == [
+                ["UNKNOWN", -1],
+                ["E11.9", 1],
+                ["I10", 2],
+                ["J44.1", 3],
+            ]
+            assert self._claims(writer) == [
+                ("a", "A1", "I10"),
+                ("b", "B1", "J44.1"),
+                ("b", "B2", "I10"),
+            ]
+
+    def test_refresh_replaces_only_that_cohort(self):
+        """Test rewriting a cohort leaves other cohorts' facts alone."""
+        with DuckDBDimensionalWriter(":memory:") as writer:
+            for cohort_id, claim_id in [("a", "A1"), ("b", "B1")]:
+                dims, facts = _cohort_model(["I10"], [(claim_id, "I10", 20240301)])
+                writer.write_dimensional_model(dims, facts, cohort_id=cohort_id, **self.KEYS)
+
+            dims, facts = _cohort_model(["E11.9"], [("A2", "E11.9", 20240401)])
+            result = writer.write_dimensional_model(dims, facts, cohort_id="a", **self.KEYS)
+
+            assert result == {"dim_diagnosis": 2, "fact_claims": 1}
+            assert self._claims(writer) == [("a", "A2", "E11.9"), ("b", "B1", "I10")]
+
+    def test_unchanged_data_version_is_skipped(self):
+        """Test a cohort is not rewritten when its data version is unchanged."""
+        with DuckDBDimensionalWriter(":memory:") as writer:
+            dims, facts = _cohort_model(["I10"], [("A1", "I10", 20240301)])
+            writer.write_dimensional_model(
+                dims, facts, cohort_id="a", data_version="v1", **self.KEYS
+            )
+
+            assert not writer.needs_refresh("a", "v1")
+            assert writer.needs_refresh("a", "v2")
+            assert writer.needs_refresh("b", "v1")
+            assert (
+                writer.write_dimensional_model(
+                    dims, facts, cohort_id="a", data_version="v1", **self.KEYS
+                )
+                == {}
+            )
+
+            dims, facts = _cohort_model(["I10"], [("A2", "I10", 20240301)])
+            writer.write_dimensional_model(
+                dims, facts, cohort_id="a", data_version="v2", **self.KEYS
+            )
+            assert self._claims(writer) == [("a", "A2", "I10")]
+
+    def test_refresh_rejects_fact_table_without_cohort_column(self):
+        """Test a fact table from a full rewrite is not silently replaced."""
+        with DuckDBDimensionalWriter(":memory:") as writer:
+            dims, facts = _cohort_model(["I10"], [("B1", "I10", 20240301)])
+            writer.write_dimensional_model(dims, facts)
+
+            dims, facts = _cohort_model(["I10"], [("A1", "I10", 20240301)])
+            with pytest.raises(ValueError, match="full rewrite"):
+                writer.write_dimensional_model(dims, facts, cohort_id="a", **self.KEYS)
+
+            rows = writer.query("SELECT claim_id FROM analytics.fact_claims")
+            assert rows["claim_id"].tolist() == ["B1"]
+
+    def test_dimension_key_column_required(self):
+        """Test incremental writes need an explicit key column per dimension."""
+        with DuckDBDimensionalWriter(":memory:") as writer:
+            dims, facts = _cohort_model(["I10"], [("A1", "I10", 20240301)])
+            with pytest.raises(ValueError, match="dim_diagnosis"):
+                writer.write_dimensional_model(dims, facts, cohort_id="a")
+
+    def test_fact_keys_unique_across_cohorts(self):
+        """Test per-build fact keys do not collide between cohorts."""
+        with DuckDBDimensionalWriter(":memory:") as writer:
+            for cohort_id, claims in [
+                ("a", [("A1", "I10", 20240301), ("A2", "I10", 20240302)]),
+                ("b", [("B1", "I10", 20240301)]),
+                ("a", [("A3", "I10", 20240303)]),
+            ]:
+                dims, facts = _cohort_model(["I10"], claims)
+                writer.write_dimensional_model(dims, facts, cohort_id=cohort_id, **self.KEYS)
+
+            rows = writer.query(
+                "SELECT claim_id, claim_fact_key FROM analytics.fact_claims ORDER BY claim_id"
+            )
+            assert rows["claim_id"].tolist() == ["A3", "B1"]
+            assert rows["claim_fact_key"].is_unique
+
+    def test_removed_dimension_rows_deleted(self):
+        """Test dimension rows are deleted once no cohort contributes them."""
+        with DuckDBDimensionalWriter(":memory:") as writer:
+            for cohort_id, codes in [("a", ["E11.9", "I10"]), ("b", ["I10"])]:
+                dims, facts = _cohort_model(codes, [(f"{cohort_id}1", "I10", 20240301)])
+                writer.write_dimensional_model(dims, facts, cohort_id=cohort_id, **self.KEYS)
+
+            dims, facts = _cohort_model(["J44.1"], [("a2", "J44.1", 20240301)])
+            writer.write_dimensional_model(dims, facts, cohort_id="a", **self.KEYS)
+            codes = writer.query(
+                "SELECT diagnosis_code FROM analytics.dim_diagnosis ORDER BY diagnosis_key"
+            )
+            assert codes["diagnosis_code"].tolist() == ["UNKNOWN", "I10", "J44.1"]
+
+            dims, facts = _cohort_model(["J44.1"], [("b2", "J44.1", 20240301)])
+            writer.write_dimensional_model(dims, facts, cohort_id="b", **self.KEYS)
+            codes = writer.query(
+                "SELECT diagnosis_code FROM analytics.dim_diagnosis ORDER BY diagnosis_key"
+            )
+            assert codes["diagnosis_code"].tolist() == ["UNKNOWN", "J44.1"]
+
+    def test_column_empty_in_first_cohort(self):
+        """Test a column that was all null for the first cohort takes later values."""
+        with DuckDBDimensionalWriter(":memory:") as writer:
+            for cohort_id, discharged in [
+                ("a", [None]),
+                ("b", [pd.Timestamp("2024-03-02 10:00")]),
+                ("c", [None]),
+            ]:
+                dims, facts = _cohort_model(["I10"], [(f"{cohort_id}1", "I10", 20240301)])
+                facts["fact_claims"]["discharge_datetime"] = pd.Series(discharged, dtype=object)
+                writer.write_dimensional_model(dims, facts, cohort_id=cohort_id, **self.KEYS)
+
+            rows = writer.query(
+                "SELECT claim_id, discharge_datetime FROM analytics.fact_claims ORDER BY claim_id"
+            )
+            assert rows["claim_id"].tolist() == ["a1", "b1", "c1"]
+            assert rows["discharge_datetime"].tolist()[1] == pd.Timestamp("2024-03-02 10:00")
+            assert rows["discharge_datetime"].isna().tolist() == [True, False, True]
+
+    def test_failed_refresh_rolls_back(self, monkeypatch):
+        """Test a failure mid-refresh leaves the previous cohort rows in place."""
+        with DuckDBDimensionalWriter(":memory:") as writer:
+            dims, facts = _cohort_model(["I10"], [("A1", "I10", 20240301)])
+            writer.write_dimensional_model(
+                dims, facts, cohort_id="a", data_version="v1", **self.KEYS
+            )
+
+            write_table = writer.write_table
+
+            def failing_write(table_name, df, if_exists="replace"):
+                if table_name == BUILD_STATE_TABLE:
+                    raise RuntimeError("disk full")
+                return write_table(table_name, df, if_exists)
+
+            monkeypatch.setattr(writer, "write_table", failing_write)
+            dims, facts = _cohort_model(["I10"], [("A2", "I10", 20240301)])
+            with pytest.raises(RuntimeError, match="disk full"):
+                writer.write_dimensional_model(
+                    dims, facts, cohort_id="a", data_version="v2", **self.KEYS
+                )
+
+            assert self._claims(writer) == [("a", "A1", "I10")]
+            assert not writer.needs_refresh("a", "v1")
+
+    def test_claims_written_in_service_date_order(self):
+        """Test claim facts are clustered by service date within a cohort."""
+        with DuckDBDimensionalWriter(":memory:") as writer:
+            dims, facts = _cohort_model(["I10"], [("A1", "I10", 20240301), ("A2", "I10", 20240105)])
+            writer.write_dimensional_model(dims, facts, cohort_id="a", **self.KEYS)
+
+            rows = writer.query("SELECT claim_id FROM analytics.fact_claims")
+            assert rows["claim_id"].tolist() == ["A2", "A1"]
+
+
 class TestDuckDBWriterGetTableList:
     """Tests for get_table_list method."""
 
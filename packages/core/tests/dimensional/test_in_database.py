@@ -0,0 +1,107 @@
+"""Tests for BaseInDatabaseTransformer."""
+
+from datetime import date
+
+import pytest
+
+from healthsim.db import DatabaseConnection
+from healthsim.dimensional import BaseInDatabaseTransformer
+
+
+class PatientAgeTransformer(BaseInDatabaseTransformer):
+    """Minimal in-database transformer over the canonical patients table."""
+
+    SOURCE_TABLES = ("patients",)
+
+    def table_definitions(self) -> dict[str, str]:
+        age = self.age_sql("birth_date")
+        return {
+            "dim_patient_age": f"""
+                SELECT
+                    mrn,
+                    {self.date_key_sql("birth_date")} AS birth_date_key,
+                    {age} AS age_at_snapshot,
+                    {self.age_band_sql(age)} AS age_band,
+                    {self.case_sql("gender", {"M": "Male", "F": "Female"}, "Unknown")}
+                        AS gender_description,
+                    arg_min_null(source_row, source_row) AS first_row
+                FROM {{patients}}
+                GROUP BY ALL
+                ORDER BY mrn
+            """,
+            "patient_count": "SELECT COUNT(*) AS n FROM {patients}",
+        }
+
+
+@pytest.fixture
+def conn(tmp_path):
+    """Canonical database with patients in two cohorts."""
+    db = DatabaseConnection(tmp_path / "test.duckdb")
+    conn = db.connect()
+    conn.execute("INSERT INTO cohorts (id, name) VALUES ('c-1', 'alpha'), ('c-2', 'beta')")
+    conn.execute(
+        """
+        INSERT INTO patients (id, mrn, given_name, family_name, birth_date, gender, cohort_id)
+        VALUES
+            ('p1', 'MRN1', 'Ann', 'Lee', '1960-06-15', 'F', 'c-1'),
+            ('p2', 'MRN2', 'Bob', 'Kim', '2010-06-16', 'M', 'c-1'),
+            ('p3', 'MRN3', 'Cy', 'Doe', '1990-01-01', 'X', 'c-2')
+        """
+    )
+    yield conn
+    db.close()
+
+
+class TestBaseInDatabaseTransformer:
+    """Tests for the CTAS build driver."""
+
+    def test_builds_tables_for_cohort(self, conn):
+        transformer = PatientAgeTransformer(conn, cohort="alpha", snapshot_date=date(2025, 6, 15))
+
+        counts = transformer.build()
+
+        assert counts == {"dim_patient_age": 2, "patient_count": 1}
+        rows = conn.execute("SELECT * FROM analytics.dim_patient_age").fetchall()
+        assert [r[:5] for r in rows] == [
+            ("MRN1", 19600615, 65, "65+", "Female"),
+            ("MRN2", 20100616, 14, "0-17", "Male"),
+        ]
+
+    def test_cohort_resolves_by_id(self, conn):
+        transformer = PatientAgeTransformer(conn, cohort="c-2")
+
+        assert transformer.cohort_id == "c-2"
+        transformer.build(["dim_patient_age"])
+        row = conn.execute("SELECT mrn, gender_description FROM analytics.dim_patient_age")
+        assert row.fetchall() == [("MRN3", "Unknown")]
+
+    def test_no_cohort_reads_all_rows(self, conn):
+        counts = PatientAgeTransformer(conn).build(["dim_patient_age"])
+
+        assert counts == {"dim_patient_age": 3}
+
+    def test_unknown_cohort_raises(self, conn):
+        with pytest.raises(ValueError, match="not found"):
+            PatientAgeTransformer(conn, cohort="gamma")
+
+    def test_unknown_table_raises(self, conn):
+        with pytest.raises(ValueError, match="Unknown dimensional tables"):
+            PatientAgeTransformer(conn).build(["dim_nope"])
+
+    def test_statements_are_ctas_into_schema(self, conn):
+        statements = PatientAgeTransformer(conn, cohort="alpha", schema="mart").statements()
+
+        sql = statements["patient_count"]
+        assert sql.startswith("CREATE OR REPLACE TABLE mart.patient_count AS")
+        assert "WHERE cohort_id = $cohort_id" in sql
+
+    def test_rebuild_replaces_tables(self, conn):
+        transformer = PatientAgeTransformer(conn, cohort="alpha")
+        transformer.build()
+        conn.execute("DELETE FROM patients WHERE mrn = 'MRN2'")
+
+        assert transformer.build()["dim_patient_age"] == 1
+
+    def test_literal_escapes_quotes(self):
+        assert BaseInDatabaseTransformer.literal("O'Brien") == "'O''Brien'"
+        assert BaseInDatabaseTransformer.literal(None) == "NULL"
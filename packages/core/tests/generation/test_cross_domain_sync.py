@@ -164,6 +164,67 @@ class TestIdentityRegistry:
         
         assert len(matches) == 0
 
+    def test_find_matches_gender_only_identity(self):
+        """Test a gender-only match is found when nothing else is shared."""
+        registry = IdentityRegistry()
+        sparse = PersonIdentity(gender="F")
+        full = PersonIdentity(
+            ssn_hash="abc123",
+            date_of_birth=date(1965, 3, 15),
+            gender="F",
+            first_name="Jane",
+            last_name="Doe",
+        )
+        registry.register(full)
+        registry.register(sparse)
+        
+        matches = registry.find_matches(
+            {"ssn_hash": "xyz789", "dob": "1970-01-01", "gender": "F"},
+            min_confidence=0.8,
+        )
+        
+        assert [(m[0].correlation_id, m[1]) for m in matches] == [
+            (sparse.correlation_id, 1.0)
+        ]
+
+    def test_find_matches_name_and_dob(self):
+        """Test partial matches are scored and ordered like a full scan."""
+        registry = IdentityRegistry()
+        first = PersonIdentity(
+            date_of_birth=date(1965, 3, 15), gender="M", first_name="John", last_name="Doe"
+        )
+        second = PersonIdentity(
+            date_of_birth=date(1965, 3, 15), gender="F", first_name="John", last_name="Doe"
+        )
+        other = PersonIdentity(
+            date_of_birth=date(1980, 1, 1), gender="M", first_name="John", last_name="Doe"
+        )
+        for identity in (first, second, other):
+            registry.register(identity)
+        
+        matches = registry.find_matches(
+            {"dob": "1965-03-15", "gender": "M", "name": "DOE,JOHN"},
+            min_confidence=0.5,
+        )
+        
+        assert [m[0].correlation_id for m in matches] == [
+            first.correlation_id,
+            second.correlation_id,
+        ]
+        assert matches[1][1] == pytest.approx(0.8 / 0.9)
+
+    def test_register_again_reindexes(self):
+        """Test re-registering an identity replaces its blocking entries."""
+        registry = IdentityRegistry()
+        identity = PersonIdentity(ssn_hash="abc123")
+        registry.register(identity)
+        
+        registry.register(identity.model_copy(update={"ssn_hash": "def456"}))
+        
+        assert registry.find_matches({"ssn_hash": "abc123"}) == []
+        assert len(registry.find_matches({"ssn_hash": "def456"})) == 1
+        assert registry.count() == 1
+
     def test_get_all(self):
         """Test getting all identities."""
         registry = IdentityRegistry()
@@ -10,6 +10,7 @@ from healthsim.generation.handlers import (
     RxMemberSimHandlers,
     TrialSimHandlers,
 )
+from healthsim.generation.ids import short_ids
 from healthsim.generation.journey_engine import (
     JourneyEngine,
     TimelineEvent,
@@ -244,6 +245,43 @@ class TestPatientSimHandlers:
         assert "encounter" in engine._handlers["patientsim"]
         assert "admission" in engine._handlers["patientsim"]
         assert "lab_order" in engine._handlers["patientsim"]
+        assert "lab_result" in engine._batch_handlers["patientsim"]
+
+    def test_short_ids_matches_generate_id(self, handlers):
+        """Test batch ID generation matches the per-event IDs."""
+        ids = short_ids("RES", 42, ["P001", "P002"], ["evt1", "evt2"])
+        
+        assert ids == [
+            handlers._generate_id("RES", "P001", "evt1"),
+            handlers._generate_id("RES", "P002", "evt2"),
+        ]
+
+    def test_handle_lab_result_batch_matches_single(self, patient_entity):
+        """Test the lab result batch draws the same values as per-event calls."""
+        events = [
+            TimelineEvent(
+                timeline_event_id=f"te-{i}",
+                journey_id="j1",
+                event_definition_id="e1",
+                scheduled_date=date(2024, 1, 15),
+                event_type="lab_result",
+                event_name="Lab",
+                result={"parameters": {"loinc": loinc}},
+            )
+            for i, loinc in enumerate(["4548-4", "2345-7", "33914-3", "1234-5"])
+        ]
+        entities = [patient_entity] * len(events)
+        contexts = [{"last_order_id": "ORD-1"}] * len(events)
+        
+        single = PatientSimHandlers(seed=7)
+        expected = [
+            single.handle_lab_result(*args)
+            for args in zip(entities, events, contexts, strict=True)
+        ]
+        
+        assert PatientSimHandlers(seed=7).handle_lab_result_batch(
+            entities, events, contexts
+        ) == expected
 
 
 # =============================================================================
@@ -785,6 +823,72 @@ class TestHandlerIntegration:
         assert "rxmembersim" in engine._handlers
         assert "trialsim" in engine._handlers
 
+    def test_batch_execution_matches_per_timeline(self):
+        """Test execute_timelines gives the same results as execute_timeline."""
+        from healthsim.generation.journey_engine import create_simple_journey
+        
+        journey = create_simple_journey(
+            journey_id="labs",
+            name="Labs",
+            events=[
+                {"event_id": "e1", "name": "Visit", "event_type": "diagnosis",
+                 "product": "patientsim", "delay": {"days": 0}},
+                {"event_id": "e2", "name": "A1C", "event_type": "lab_result",
+                 "product": "patientsim", "delay": {"days": 7}, "depends_on": "e1"},
+                {"event_id": "e3", "name": "Unknown", "event_type": "nope",
+                 "product": "patientsim", "delay": {"days": 7}, "depends_on": "e2"},
+            ],
+            products=["patientsim"],
+        )
+        patients = [{"patient_id": f"P{i:03d}"} for i in range(5)]
+        
+        def run(batch):
+            engine = JourneyEngine(seed=42)
+            # Diagnosis draws no random numbers, so batch order cannot matter
+            PatientSimHandlers(seed=42).register_all(engine)
+            pairs = [
+                (engine.create_timeline(p, "patient", journey, date(2024, 1, 1)), p)
+                for p in patients
+            ]
+            if batch:
+                return engine.execute_timelines(pairs, batch_size=2), pairs
+            return [engine.execute_timeline(t, p) for t, p in pairs], pairs
+        
+        batched, pairs = run(batch=True)
+        
+        assert batched == run(batch=False)[0]
+        assert [r["status"] for r in batched[0]] == ["executed", "executed", "skipped"]
+        # Only the unhandled event is left pending
+        assert [len(t.get_pending_events()) for t, _ in pairs] == [1] * len(patients)
+
+    def test_batch_failures_are_per_event(self):
+        """Test an exception returned for one event fails only that event."""
+        from healthsim.generation.journey_engine import create_simple_journey
+        
+        engine = JourneyEngine(seed=42)
+        
+        def handler(entity, event, context):
+            if entity["patient_id"] == "P1":
+                raise ValueError("bad patient")
+            return {"ok": True}
+        
+        engine.register_handler("patientsim", "encounter", handler)
+        journey = create_simple_journey(
+            "j", "J",
+            events=[{"event_id": "e1", "name": "Visit", "event_type": "encounter",
+                     "product": "patientsim", "delay": {"days": 0}}],
+        )
+        pairs = [
+            (engine.create_timeline(p, "patient", journey, date(2024, 1, 1)), p)
+            for p in [{"patient_id": "P0"}, {"patient_id": "P1"}]
+        ]
+        
+        results = engine.execute_timelines(pairs)
+        
+        assert [r[0]["status"] for r in results] == ["executed", "failed"]
+        assert results[1][0]["error"] == "bad patient"
+        assert pairs[1][0].events[0].status == "failed"
+
     def test_handler_reproducibility(self):
         """Test handlers produce reproducible results."""
         patient = {"patient_id": "P001", "conditions": ["E11"]}
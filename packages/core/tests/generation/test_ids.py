@@ -0,0 +1,122 @@
+"""Tests for deterministic ID and seed derivation."""
+
+import hashlib
+import uuid
+
+import pytest
+
+from healthsim.generation.handlers import MemberSimHandlers
+from healthsim.generation.ids import (
+    IdScheme,
+    derive_seed,
+    derive_seeds,
+    deterministic_uuid,
+    entity_seed,
+    entity_seeds,
+    short_id,
+    short_ids,
+)
+from healthsim.generation.journey_engine import JourneyEngine
+from healthsim.generation.profile_executor import HierarchicalSeedManager
+
+ENTITY_IDS = ["P001", "P002", "P003", "P001"]
+EVENT_IDS = ["e1", "e1", "e2", "e3"]
+PAIRS = list(zip(ENTITY_IDS, EVENT_IDS, strict=True))
+
+
+class TestLegacyScheme:
+    """LEGACY must reproduce the values earlier releases derived."""
+
+    def test_derive_seed_matches_md5(self):
+        expected = int(hashlib.md5(b"42:P001:e1").hexdigest()[:8], 16)
+        assert derive_seed(42, "P001", "e1") == expected
+
+    def test_none_seed_is_zero(self):
+        assert derive_seed(None, "P001", "e1") == derive_seed(0, "P001", "e1")
+
+    def test_short_id_matches_md5(self):
+        expected = "CLM-" + hashlib.md5(b"7:M1:evt").hexdigest()[:8].upper()
+        assert short_id("CLM", 7, "M1", "evt") == expected
+
+    def test_uuid_matches_md5(self):
+        expected = str(uuid.UUID(bytes=hashlib.md5(b"7:M1:evt").digest()))
+        assert deterministic_uuid(7, "M1", "evt") == expected
+
+
+@pytest.mark.parametrize("scheme", list(IdScheme))
+class TestBatchMatchesSingle:
+    """Batch forms return exactly the per-pair values."""
+
+    def test_derive_seeds(self, scheme):
+        expected = [derive_seed(42, e, v, scheme) for e, v in PAIRS]
+        assert derive_seeds(42, ENTITY_IDS, EVENT_IDS, scheme) == expected
+
+    def test_shared_event_id(self, scheme):
+        expected = [derive_seed(42, e, "e1", scheme) for e in ENTITY_IDS]
+        assert derive_seeds(42, ENTITY_IDS, "e1", scheme) == expected
+
+    def test_short_ids(self, scheme):
+        expected = [short_id("RX", 42, e, v, scheme) for e, v in PAIRS]
+        assert short_ids("RX", 42, ENTITY_IDS, EVENT_IDS, scheme) == expected
+
+    def test_empty(self, scheme):
+        assert derive_seeds(42, [], [], scheme) == []
+
+
+class TestFastScheme:
+    """Tests for the FAST scheme."""
+
+    def test_deterministic_and_distinct(self):
+        value = derive_seed(42, "P001", "e1", IdScheme.FAST)
+
+        assert value == derive_seed(42, "P001", "e1", "fast")
+        assert value != derive_seed(42, "P001", "e1")
+        assert value != derive_seed(43, "P001", "e1", IdScheme.FAST)
+        assert value != derive_seed(42, "P001", "e2", IdScheme.FAST)
+
+    def test_ids_are_unique(self):
+        entity_ids = [f"M{i:05d}" for i in range(2000)]
+        ids = short_ids("CLM", 1, entity_ids, "claim", IdScheme.FAST)
+        assert len(set(ids)) == len(ids)
+
+    def test_entity_seeds(self):
+        seeds = entity_seeds(42, [5, 0, 3])
+
+        assert seeds == [entity_seed(42, 5), entity_seed(42, 0), entity_seed(42, 3)]
+        assert all(0 <= seed <= 2**31 - 1 for seed in seeds)
+        assert entity_seed(42, 0) != entity_seed(43, 0)
+
+
+class TestSchemeWiring:
+    """Engine, handlers and seed manager honour id_scheme."""
+
+    def test_engine_default_is_legacy(self):
+        engine = JourneyEngine(seed=42)
+        assert engine._derive_seed("P001", "e1") == derive_seed(42, "P001", "e1")
+
+    def test_engine_fast(self):
+        engine = JourneyEngine(seed=42, id_scheme="fast")
+
+        assert engine._derive_seed("P001", "e1") == derive_seed(42, "P001", "e1", IdScheme.FAST)
+        assert engine._generate_event_id("P001", "e1").endswith(
+            str(derive_seed(42, "P001", "e1", IdScheme.FAST))
+        )
+
+    def test_handlers_fast(self):
+        handlers = MemberSimHandlers(seed=42, id_scheme=IdScheme.FAST)
+        assert handlers._generate_id("CLM", "M1", "e1") == short_id(
+            "CLM", 42, "M1", "e1", IdScheme.FAST
+        )
+
+    def test_seed_manager_legacy_unchanged(self):
+        manager = HierarchicalSeedManager(42)
+        assert manager.get_entity_seeds([2, 0]) == [
+            HierarchicalSeedManager(42).get_entity_seed(2),
+            HierarchicalSeedManager(42).get_entity_seed(0),
+        ]
+
+    def test_seed_manager_fast_random_access(self):
+        manager = HierarchicalSeedManager(42, id_scheme=IdScheme.FAST)
+
+        assert manager.get_entity_seed(1_000_000) == entity_seed(42, 1_000_000)
+        assert manager.get_entity_seeds([3, 1]) == entity_seeds(42, [3, 1])
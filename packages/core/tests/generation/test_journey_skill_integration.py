@@ -107,6 +107,78 @@ class TestJourneyEngineSkillIntegration:
         assert result["id"] == "123"
         assert result["name"] == "Test"
 
+    def test_entity_converted_only_when_read(self, engine):
+        """Test events without entity references skip the entity conversion."""
+        conversions = []
+        
+        class Entity:
+            def __init__(self):
+                self.id = "123"
+                self.name = "Test"
+            
+            def model_dump(self):
+                conversions.append(self.id)
+                return {"id": self.id, "name": self.name}
+        
+        journey = JourneySpecification(
+            journey_id="lazy",
+            name="Lazy",
+            events=[
+                EventDefinition(
+                    event_id="static", name="Static", event_type="visit",
+                    parameters={"kind": "office"},
+                ),
+                EventDefinition(
+                    event_id="named", name="Named", event_type="visit",
+                    parameters={"note": "Seen ${entity.name}"},
+                ),
+            ],
+        )
+        engine.register_handler("core", "visit", lambda entity, event, context: {})
+        entity = Entity()
+        timeline = engine.create_timeline(entity, "patient", journey, date(2024, 1, 1))
+        
+        results = engine.execute_timeline(timeline, entity)
+        
+        assert [r["parameters"] for r in results] == [{"kind": "office"}, {"note": "Seen Test"}]
+        assert conversions == ["123"]
+
+    def test_skill_resolution_does_not_convert_entity(self, engine):
+        """Test skill lookups that never read the entity leave it unconverted."""
+        conversions = []
+
+        class Entity:
+            id = "123"
+
+            def model_dump(self):
+                conversions.append(self.id)
+                return {"id": self.id}
+
+        journey = JourneySpecification(
+            journey_id="lazy-skills",
+            name="Lazy skills",
+            events=[
+                EventDefinition(
+                    event_id="explicit", name="Explicit", event_type="diagnosis",
+                    parameters={
+                        "skill_ref": {"skill": "diabetes-management", "lookup": "diagnosis_code"}
+                    },
+                ),
+                EventDefinition(
+                    event_id="auto", name="Auto", event_type="diagnosis",
+                    condition="diabetes",
+                ),
+            ],
+        )
+        engine.register_handler("core", "diagnosis", lambda entity, event, context: {})
+        entity = Entity()
+        timeline = engine.create_timeline(entity, "patient", journey, date(2024, 1, 1))
+
+        results = engine.execute_timeline(timeline, entity)
+
+        assert len(results) == 2
+        assert conversions == []
+
 
 class TestJourneyWithSkillRefs:
     """Tests for journeys that use skill references."""
@@ -11,6 +11,7 @@ from healthsim.generation.journey_validation import (
     JourneySpecValidator,
     TimelineValidator,
     CrossEventValidator,
+    iter_event_partitions,
     JourneyValidator,
     validate_journey_spec,
     validate_timeline,
@@ -539,6 +540,67 @@ class TestCrossEventValidator:
         
         assert any(i.code == "PROVIDER_MISMATCH" for i in result.warnings)
 
+    def test_explicit_relationship(self):
+        """Test events related only through the relationships mapping."""
+        events = [
+            {"event_type": "lab_order", "id": "ORD-1", "order_date": "2025-01-15"},
+            {"event_type": "lab_result", "id": "RES-1", "result_date": "2025-01-10"},
+            {"event_type": "lab_result", "id": "RES-2", "result_date": "2025-01-01"},
+        ]
+        
+        result = CrossEventValidator().validate(events, {"ORD-1": "RES-1"})
+        
+        assert [i.code for i in result.errors] == ["RESULT_BEFORE_ORDER"]
+        assert "2025-01-10" in result.errors[0].message
+
+    def test_indexed_matches_all_pairs(self):
+        """Test the correlation index finds exactly the all-pairs matches."""
+        class AllPairsValidator(CrossEventValidator):
+            def _are_related(self, source, target, relationships):
+                return super()._are_related(source, target, relationships)
+        
+        events = []
+        for i in range(60):
+            event = {
+                "event_type": ["encounter", "claim", "lab_order", "lab_result"][i % 4],
+                "id": f"E{i}",
+                "date": f"2025-01-{(i * 5) % 28 + 1:02d}",
+                "patient_id": f"P{i % 5}",
+            }
+            if i % 3 == 0:
+                event["encounter_id"] = f"ENC{i % 4}"
+            if i % 10 == 0:
+                event["patient_id"] = ""
+            events.append(event)
+        relationships = {f"E{i}": f"E{(i * 11) % 60}" for i in range(0, 60, 6)}
+        
+        indexed = CrossEventValidator().validate(events, relationships)
+        all_pairs = AllPairsValidator().validate(events, relationships)
+        
+        assert indexed.issues
+        assert [i.message for i in indexed.issues] == [i.message for i in all_pairs.issues]
+
+    def test_validate_duckdb_streams_partitions(self):
+        """Test validating DuckDB-resident events one patient at a time."""
+        duckdb = pytest.importorskip("duckdb")
+        conn = duckdb.connect()
+        conn.execute("""
+            CREATE TABLE events AS SELECT * FROM (VALUES
+                ('encounter', 'PAT-002', DATE '2025-01-15'),
+                ('claim', 'PAT-001', DATE '2025-01-12'),
+                ('encounter', 'PAT-001', DATE '2025-01-10'),
+                ('claim', 'PAT-002', DATE '2025-01-10')
+            ) AS t(event_type, patient_id, date)
+        """)
+        
+        result = CrossEventValidator().validate_duckdb(conn, "events", fetch_size=1)
+        
+        assert [i.code for i in result.errors] == ["CLAIM_BEFORE_ENCOUNTER"]
+        partitions = list(iter_event_partitions(
+            conn, "SELECT * FROM events WHERE event_type = 'claim'"
+        ))
+        assert [[e["patient_id"] for e in p] for p in partitions] == [["PAT-001"], ["PAT-002"]]
+
 
 class TestJourneyValidator:
     """Tests for combined JourneyValidator."""
@@ -173,8 +173,12 @@ class TestProfileJourneyOrchestrator:
             journey_id="test",
             name="Test",
             events=[
-                EventDefinition(event_id="e1", name="Day0", event_type="milestone", delay=DelaySpec(days=0)),
-                EventDefinition(event_id="e2", name="Day7", event_type="milestone", delay=DelaySpec(days=7)),
+                EventDefinition(
+                    event_id="e1", name="Day0", event_type="milestone", delay=DelaySpec(days=0)
+                ),
+                EventDefinition(
+                    event_id="e2", name="Day7", event_type="milestone", delay=DelaySpec(days=7)
+                ),
             ],
         )
         
@@ -267,3 +271,147 @@ class TestMultipleJourneys:
         # Each entity should have events from both journeys
         for entity in result.entities:
             assert len(entity.timeline.events) == 2
+
+
+class TestChunkedExecution:
+    """Tests for checkpointed, chunked orchestration."""
+
+    @pytest.fixture
+    def conn(self):
+        import duckdb
+
+        connection = duckdb.connect(":memory:")
+        yield connection
+        connection.close()
+
+    @pytest.fixture
+    def profile(self):
+        from healthsim.generation.profile_schema import PROFILE_TEMPLATES
+
+        return ProfileSpecification.model_validate(PROFILE_TEMPLATES["medicare-diabetic"])
+
+    @pytest.fixture
+    def journey(self):
+        return JourneySpecification(
+            journey_id="chunk-journey",
+            name="Chunk Journey",
+            events=[
+                EventDefinition(
+                    event_id="e1",
+                    name="Event 1",
+                    event_type="milestone",
+                    delay=DelaySpec(days=0),
+                ),
+                EventDefinition(
+                    event_id="e2",
+                    name="Event 2",
+                    event_type="milestone",
+                    delay=DelaySpec(days=7, days_min=3, days_max=14, distribution="uniform"),
+                    depends_on="e1",
+                ),
+            ],
+        )
+
+    def test_matches_execute(self, conn, profile, journey):
+        """Chunked output holds the same entities and events as execute()."""
+        start = date(2025, 1, 1)
+        expected = ProfileJourneyOrchestrator(seed=42).execute(
+            profile=profile.model_copy(deep=True), journey=journey, count=25, start_date=start
+        )
+        result = ProfileJourneyOrchestrator(seed=42).execute_chunked(
+            profile=profile, journey=journey, count=25, start_date=start,
+            conn=conn, chunk_size=10,
+        )
+
+        assert result.chunks_total == 3
+        assert result.chunks_run == 3
+        assert result.entity_count == 25
+        assert result.event_count == expected.event_count
+
+        rows = conn.execute(
+            "SELECT entity_index, seed, age, gender, conditions FROM orchestration_entities "
+            "WHERE run_id = ? ORDER BY entity_index",
+            [result.run_id],
+        ).fetchall()
+        assert rows == [
+            (e.entity.index, e.entity.seed, e.entity.age, e.entity.gender, e.entity.conditions)
+            for e in expected.entities
+        ]
+
+        events = conn.execute(
+            "SELECT entity_id, event_def_id, scheduled_date, status FROM journey_events "
+            "ORDER BY ALL"
+        ).fetchall()
+        assert events == sorted(
+            (
+                f"{result.run_id}:{e.entity.index}",
+                ev.event_definition_id,
+                ev.scheduled_date,
+                ev.status,
+            )
+            for e in expected.entities
+            for ev in e.timeline.events
+        )
+
+    def test_resume_skips_completed_chunks(self, conn, profile, journey, monkeypatch):
+        """A failed chunk rolls back, and resume finishes only what is left."""
+        start = date(2025, 1, 1)
+        orch = ProfileJourneyOrchestrator(seed=7)
+        original = orch._build_entity_timeline
+
+        def fail_on_entity_12(entity, *args, **kwargs):
+            if entity.index == 12:
+                raise RuntimeError("disk full")
+            return original(entity, *args, **kwargs)
+
+        monkeypatch.setattr(orch, "_build_entity_timeline", fail_on_entity_12)
+        with pytest.raises(RuntimeError, match="disk full"):
+            orch.execute_chunked(
+                profile=profile.model_copy(deep=True), journey=journey, count=25,
+                start_date=start, conn=conn, chunk_size=10,
+            )
+
+        from healthsim.state import CheckpointStore
+
+        store = CheckpointStore(conn)
+        (run_id,) = conn.execute(
+            "SELECT DISTINCT run_id FROM orchestration_checkpoints"
+        ).fetchone()
+        checkpoints = store.get_checkpoints(run_id)
+        assert [(c.chunk_start, c.chunk_stop, c.status) for c in checkpoints] == [
+            (0, 10, "completed"),
+            (10, 20, "failed"),
+        ]
+        assert checkpoints[1].error_message == "disk full"
+        # Nothing from the failed chunk was kept
+        assert conn.execute("SELECT count(*) FROM orchestration_entities").fetchone()[0] == 10
+
+        monkeypatch.undo()
+        result = orch.execute_chunked(
+            profile=profile.model_copy(deep=True), journey=journey, count=25,
+            start_date=start, conn=conn, chunk_size=10, resume=True,
+        )
+        assert result.run_id == run_id
+        assert result.chunks_skipped == 1
+        assert result.chunks_run == 2
+        assert result.entity_count == 15
+
+        indices = conn.execute(
+            "SELECT entity_index FROM orchestration_entities ORDER BY entity_index"
+        ).fetchall()
+        assert [i for (i,) in indices] == list(range(25))
+        assert {c.status for c in store.get_checkpoints(run_id)} == {"completed"}
+
+    def test_resume_rejects_different_chunk_size(self, conn, profile):
+        """Resuming with another chunk_size would duplicate entities."""
+        orch = ProfileJourneyOrchestrator(seed=7)
+        kwargs = dict(profile=profile, count=20, start_date=date(2025, 1, 1), conn=conn)
+        orch.execute_chunked(chunk_size=10, **kwargs)
+
+        with pytest.raises(ValueError, match="chunk_size"):
+            orch.execute_chunked(chunk_size=8, resume=True, **kwargs)
+
+        rerun = orch.execute_chunked(chunk_size=8, **kwargs)
+        assert rerun.chunks_run == 3
+        assert conn.execute("SELECT count(*) FROM orchestration_entities").fetchone()[0] == 20
+
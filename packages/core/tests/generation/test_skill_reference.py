@@ -10,6 +10,7 @@ from healthsim.generation import (
     ParameterResolver,
     resolve_skill_ref,
 )
+from healthsim.generation.skill_reference import EntityTemplate, compile_entity_template
 
 
 class TestSkillReference:
@@ -117,6 +118,43 @@ class TestSkillResolver:
         # Should match E11.x pattern
         assert result.parameters["value"].startswith("E")
 
+    def test_lookup_results_are_memoized(self, resolver, monkeypatch):
+        """Test repeated lookups reuse the cached result."""
+        ref = SkillReference(skill="diabetes-management", lookup="diagnosis_code")
+        first = resolver.resolve(ref).parameters
+        
+        def fail(*args):
+            raise AssertionError("lookup should be cached")
+        
+        monkeypatch.setattr(resolver, "_lookup_value", fail)
+        second = resolver.resolve(ref).parameters
+        
+        assert second == first
+        second["icd10"] = "changed"
+        assert resolver.resolve(ref).parameters == first
+
+    def test_context_lookups_cached_per_context_value(self, resolver):
+        """Test context-keyed lookups are cached by the context value only."""
+        calls = []
+        original = resolver._lookup_value
+        
+        def counting(skill, lookup, context):
+            calls.append(context.get("control_status"))
+            return original(skill, lookup, context)
+        
+        resolver._lookup_value = counting
+        for status in ["well-controlled", "poorly-controlled", "well-controlled"]:
+            resolver.resolve(
+                SkillReference(
+                    skill="diabetes-management",
+                    lookup="lab_order",
+                    context={"control_status": "${entity.status}"},
+                ),
+                {"status": status, "member_id": status},
+            )
+        
+        assert calls == ["well-controlled", "poorly-controlled"]
+
     def test_list_skills(self, resolver):
         """Test listing available skills."""
         skills = resolver.list_skills()
@@ -226,3 +264,25 @@ class TestResolvedParameters:
         )
         assert result.parameters["icd10"] == "E11.9"
         assert result.skill_used == "diabetes-management"
+
+
+class TestEntityTemplate:
+    """Tests for precompiled ${entity.x} templates."""
+
+    def test_render_embedded_references(self):
+        template = EntityTemplate("${entity.first} ${entity.last} (${entity.age})")
+        
+        assert template.render({"first": "Ann", "last": "Lee", "age": 70}) == "Ann Lee (70)"
+
+    def test_whole_reference_keeps_value_type(self):
+        assert EntityTemplate("${entity.age}").render({"age": 70}) == 70
+        assert EntityTemplate("${entity.age}").render({}) == "${entity.age}"
+
+    def test_missing_attribute_left_unresolved(self):
+        template = EntityTemplate("Stage ${entity.stage}")
+        
+        assert template.render({}) == "Stage ${entity.stage}"
+
+    def test_compile_is_memoized(self):
+        assert compile_entity_template("${entity.x}!") is compile_entity_template("${entity.x}!")
+
@@ -226,6 +226,53 @@ class TestAutoResolution:
         assert "icd10" in params or "value" in params or params == {}
 
 
+    def test_resolution_target_cached_until_register(self, registry):
+        """Test skill/lookup targets are memoized and reset by register()."""
+        assert registry._resolution_target("diagnosis", "diabetes", None) == (
+            "diabetes-management",
+            "diagnosis_code",
+        )
+        
+        registry.register(
+            SkillRegistration(
+                skill_name="diabetes-custom",
+                conditions=["diabetes"],
+                capabilities=[{"capability": "diagnosis", "lookup_key": "icd10"}],
+                products=["patientsim"],
+                priority=20,
+            )
+        )
+        
+        assert registry._resolution_target("diagnosis", "diabetes", None) == (
+            "diabetes-custom",
+            "icd10",
+        )
+
+    def test_context_narrowed_to_lookup_key(self, registry):
+        """Test only the context value a lookup reads is passed on."""
+        seen = []
+        resolver = registry._get_skill_resolver()
+        original = resolver.resolve
+        
+        def recording(ref, entity=None):
+            seen.append(ref.context)
+            return original(ref, entity)
+        
+        resolver.resolve = recording
+        registry.resolve_for_event(
+            event_type="lab_order",
+            condition="diabetes",
+            context={"control_status": "well-controlled", "member_id": "M1"},
+        )
+        registry.resolve_for_event(
+            event_type="diagnosis",
+            condition="diabetes",
+            context={"control_status": "well-controlled", "member_id": "M1"},
+        )
+        
+        assert seen == [{"control_status": "well-controlled"}, {}]
+
+
 class TestConvenienceFunctions:
     """Tests for convenience functions."""
 
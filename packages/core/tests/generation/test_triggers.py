@@ -1,24 +1,27 @@
 """Tests for cross-product trigger system."""
 
+from datetime import date
+
 import pytest
-from datetime import date, timedelta
 
-from healthsim.generation.triggers import (
-    TriggerPriority,
-    RegisteredTrigger,
-    TriggerRegistry,
-    LinkedEntity,
-    CrossProductCoordinator,
-    create_coordinator,
-)
 from healthsim.generation.journey_engine import (
     DelaySpec,
     EventCondition,
+    JourneyEngine,
     Timeline,
     TimelineEvent,
-    JourneyEngine,
 )
-
+from healthsim.generation.triggers import (
+    CrossProductCoordinator,
+    EventScheduler,
+    LinkedEntity,
+    RegisteredTrigger,
+    TriggerEventBus,
+    TriggerPriority,
+    TriggerRegistry,
+    compile_condition,
+    create_coordinator,
+)
 
 # =============================================================================
 # TriggerPriority Tests
@@ -568,6 +571,249 @@ class TestCrossProductCoordinator:
         assert "patientsim" in results or "membersim" in results
 
 
+    def test_execute_coordinated_cascade(self, coordinator):
+        """Test cascade executes trigger targets in the same pass."""
+        from healthsim.generation.handlers import MemberSimHandlers, PatientSimHandlers
+        
+        patient_engine = JourneyEngine(seed=42)
+        PatientSimHandlers(seed=42).register_all(patient_engine)
+        coordinator.register_product_engine("patientsim", patient_engine)
+        member_engine = JourneyEngine(seed=42)
+        MemberSimHandlers(seed=42).register_all(member_engine)
+        coordinator.register_product_engine("membersim", member_engine)
+        
+        linked = coordinator.create_linked_entity("E001", {
+            "patient_id": "P001",
+            "member_id": "M001"
+        })
+        patient_timeline = Timeline(entity_id="P001", entity_type="patient")
+        patient_timeline.add_event(TimelineEvent(
+            timeline_event_id="te-dx",
+            journey_id="j1",
+            event_definition_id="e1",
+            scheduled_date=date(2024, 1, 15),
+            event_type="diagnosis",
+            event_name="Diagnosis",
+            product="patientsim"
+        ))
+        member_timeline = Timeline(entity_id="M001", entity_type="member")
+        coordinator.add_timeline(linked, "patientsim", patient_timeline)
+        coordinator.add_timeline(linked, "membersim", member_timeline)
+        
+        results = coordinator.execute_coordinated(linked, date(2024, 12, 31), cascade=True)
+        
+        assert results["membersim"][0]["event_type"] == "claim_professional"
+        assert results["membersim"][0]["status"] == "executed"
+        assert member_timeline.events[0].status == "executed"
+        assert patient_timeline.events[0].triggered_events == [
+            member_timeline.events[0].timeline_event_id
+        ]
+        
+        metrics = coordinator._trigger_registry.get_metrics()
+        edge = metrics["patientsim.diagnosis->membersim.claim_professional"]
+        assert (edge.evaluated, edge.fired, edge.enqueued) == (1, 1, 1)
+
+    def test_cascade_beyond_horizon_stays_pending(self, coordinator):
+        """Test targets due after up_to_date wait on their timeline."""
+        from healthsim.generation.handlers import PatientSimHandlers
+        
+        engine = JourneyEngine(seed=42)
+        PatientSimHandlers(seed=42).register_all(engine)
+        coordinator.register_product_engine("patientsim", engine)
+        linked = coordinator.create_linked_entity("E001", {"patient_id": "P001"})
+        timeline = Timeline(entity_id="P001", entity_type="patient")
+        timeline.add_event(TimelineEvent(
+            timeline_event_id="te-lab",
+            journey_id="j1",
+            event_definition_id="e1",
+            scheduled_date=date(2024, 1, 15),
+            event_type="lab_order",
+            event_name="Lab Order",
+            product="patientsim"
+        ))
+        coordinator.add_timeline(linked, "patientsim", timeline)
+        
+        results = coordinator.execute_coordinated(linked, date(2024, 1, 15), cascade=True)
+        
+        assert len(results["patientsim"]) == 1
+        assert [e.event_type for e in timeline.get_pending_events()] == ["lab_result"]
+
+
+# =============================================================================
+# Compiled Graph and Event Bus Tests
+# =============================================================================
+
+class TestTriggerGraph:
+    """Tests for the compiled trigger graph, metrics and event bus."""
+
+    @pytest.mark.parametrize("operator,value,context", [
+        ("eq", 5, {"a": {"b": 5}}),
+        ("ne", 5, {"a": {"b": 5}}),
+        ("gt", 3, {"a": {"b": 5}}),
+        ("lte", 3, {"a": {"b": 5}}),
+        ("in", [1, 2], {"a": {"b": 2}}),
+        ("not_in", [1, 2], {"a": {"b": 2}}),
+        ("contains", "x", {"a": {"b": "xyz"}}),
+        ("eq", 5, {"a": {}}),
+        ("eq", None, {"a": {"b": None}}),
+        ("bogus", 5, {"a": {"b": 5}}),
+    ])
+    def test_compiled_condition_matches_evaluate(self, operator, value, context):
+        """Test compiled conditions agree with EventCondition.evaluate."""
+        condition = EventCondition(field="a.b", operator=operator, value=value)
+        
+        assert compile_condition(condition)(context) == condition.evaluate(context)
+
+    def test_graph_recompiled_after_register(self):
+        """Test registering a trigger invalidates the compiled graph."""
+        registry = TriggerRegistry()
+        registry.register("patientsim", "diagnosis", "membersim", "claim_professional")
+        assert len(registry.graph.edges("patientsim", "diagnosis")) == 1
+        
+        registry.register("patientsim", "diagnosis", "rxmembersim", "fill")
+        
+        assert len(registry.graph.edges("patientsim", "diagnosis")) == 2
+
+    def test_metrics_count_suppressed(self):
+        """Test per-edge metrics count evaluations, fires and suppressions."""
+        registry = TriggerRegistry()
+        registry.register(
+            "patientsim", "diagnosis", "membersim", "claim_professional",
+            condition=EventCondition(field="age", operator="gte", value=65),
+        )
+        event = TimelineEvent(
+            timeline_event_id="te-1",
+            journey_id="j1",
+            event_definition_id="e1",
+            scheduled_date=date(2024, 1, 1),
+            event_type="diagnosis",
+            event_name="Diagnosis",
+            product="patientsim",
+        )
+        
+        registry.fire_triggers(event, {}, {"age": 70})
+        registry.fire_triggers(event, {}, {"age": 40})
+        
+        metrics = registry.get_metrics()["patientsim.diagnosis->membersim.claim_professional"]
+        assert (metrics.evaluated, metrics.fired, metrics.suppressed) == (2, 1, 1)
+        
+        registry.reset_metrics()
+        assert registry.get_metrics()[
+            "patientsim.diagnosis->membersim.claim_professional"
+        ].evaluated == 0
+
+    def test_engine_publishes_to_bus(self):
+        """Test an engine with a bus enqueues trigger targets on the scheduler."""
+        from healthsim.generation.handlers import PatientSimHandlers
+        
+        registry = TriggerRegistry()
+        registry.register(
+            "patientsim", "lab_order", "patientsim", "lab_result",
+            delay=DelaySpec(days=2),
+            parameter_map={"loinc": "loinc"},
+        )
+        scheduler = EventScheduler()
+        engine = JourneyEngine(seed=42)
+        PatientSimHandlers(seed=42).register_all(engine)
+        engine.attach_trigger_bus(TriggerEventBus(registry, scheduler))
+        timeline = Timeline(entity_id="P001", entity_type="patient")
+        timeline.add_event(TimelineEvent(
+            timeline_event_id="te-lab",
+            journey_id="j1",
+            event_definition_id="e1",
+            scheduled_date=date(2024, 1, 15),
+            event_type="lab_order",
+            event_name="Lab Order",
+            product="patientsim",
+            parameters={"loinc": "4548-4"},
+        ))
+        
+        engine.execute_timeline(timeline, {"patient_id": "P001"})
+        
+        assert len(scheduler) == 1
+        item = scheduler.pop()
+        assert item.product == "patientsim"
+        assert item.event.event_type == "lab_result"
+        assert item.event.scheduled_date == date(2024, 1, 17)
+        assert item.event.parameters == {"loinc": "4548-4"}
+
+    def test_target_ids_unique_per_edge(self):
+        """Test two edges with the same target type give distinct target events."""
+        registry = TriggerRegistry()
+        for loinc in ("4548-4", "2345-7"):
+            registry.register(
+                "patientsim", "lab_order", "patientsim", "lab_result",
+                parameter_map={"loinc": loinc},
+            )
+        source = TimelineEvent(
+            timeline_event_id="te-lab",
+            journey_id="j1",
+            event_definition_id="e1",
+            scheduled_date=date(2024, 1, 15),
+            event_type="lab_order",
+            event_name="Lab Order",
+            product="patientsim",
+        )
+        
+        firings = TriggerEventBus(registry).publish(source, {}, {})
+        
+        assert len(firings) == 2
+        assert len(set(source.triggered_events)) == 2
+        assert [f.target_event.timeline_event_id for f in firings] == source.triggered_events
+    
+    def test_engine_defers_to_coordinator_bus(self):
+        """Test a coordinated engine does not publish to its own bus as well."""
+        from healthsim.generation.handlers import PatientSimHandlers
+        
+        coordinator = CrossProductCoordinator()
+        scheduler = EventScheduler()
+        engine = JourneyEngine(seed=42)
+        PatientSimHandlers(seed=42).register_all(engine)
+        engine.attach_trigger_bus(TriggerEventBus(coordinator._trigger_registry, scheduler))
+        coordinator.register_product_engine("patientsim", engine)
+        linked = coordinator.create_linked_entity("E001", {"patient_id": "P001"})
+        timeline = Timeline(entity_id="P001", entity_type="patient")
+        timeline.add_event(TimelineEvent(
+            timeline_event_id="te-lab",
+            journey_id="j1",
+            event_definition_id="e1",
+            scheduled_date=date(2024, 1, 15),
+            event_type="lab_order",
+            event_name="Lab Order",
+            product="patientsim",
+        ))
+        coordinator.add_timeline(linked, "patientsim", timeline)
+        
+        coordinator.execute_coordinated(linked, date(2024, 1, 15))
+        
+        assert len(scheduler) == 0
+        assert len(timeline.events[0].triggered_events) == 1
+        assert engine._coordinator_bus is None
+
+    def test_scheduler_orders_by_date_then_priority(self):
+        """Test the scheduler pops by date, priority, then insertion order."""
+        def event(event_id, day):
+            return TimelineEvent(
+                timeline_event_id=event_id,
+                journey_id="j1",
+                event_definition_id=event_id,
+                scheduled_date=date(2024, 1, day),
+                event_type="encounter",
+                event_name="Visit",
+            )
+        
+        scheduler = EventScheduler()
+        scheduler.push("patientsim", event("late", 9))
+        scheduler.push("patientsim", event("normal", 2))
+        scheduler.push("patientsim", event("urgent", 2), priority=TriggerPriority.IMMEDIATE)
+        scheduler.push("patientsim", event("normal-2", 2))
+        
+        drained = [item.event.timeline_event_id for item in scheduler.drain(date(2024, 1, 5))]
+        
+        assert drained == ["urgent", "normal", "normal-2"]
+        assert len(scheduler) == 1
+
+
 # =============================================================================
 # Convenience Function Tests
 # =============================================================================
@@ -620,8 +866,8 @@ class TestTriggerIntegration:
     def test_full_cross_product_flow(self):
         """Test a complete cross-product trigger flow."""
         from healthsim.generation.handlers import (
-            PatientSimHandlers,
             MemberSimHandlers,
+            PatientSimHandlers,
         )
         
         coordinator = CrossProductCoordinator()
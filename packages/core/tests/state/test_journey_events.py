@@ -0,0 +1,164 @@
+"""Tests for the columnar journey_events log."""
+
+import sys
+from datetime import date
+
+import duckdb
+import pytest
+
+from healthsim.generation.handlers import PatientSimHandlers
+from healthsim.generation.journey_engine import (
+    EventDefinition,
+    JourneyEngine,
+    JourneySpecification,
+    Timeline,
+    TimelineEvent,
+)
+from healthsim.state.journey_events import JOURNEY_EVENT_COLUMNS, JourneyEventLog
+from healthsim.state.journey_manager import JourneyManager
+
+
+@pytest.fixture
+def conn():
+    """Create in-memory DuckDB connection."""
+    return duckdb.connect(":memory:")
+
+
+@pytest.fixture
+def journey():
+    """Journey with a handled encounter, lab result and an unhandled event."""
+    return JourneySpecification(
+        journey_id="j1",
+        name="Test Journey",
+        events=[
+            EventDefinition(
+                event_id="visit", name="Visit", event_type="encounter", product="patientsim"
+            ),
+            EventDefinition(
+                event_id="a1c",
+                name="A1C",
+                event_type="lab_result",
+                product="patientsim",
+                parameters={"loinc": "4548-4"},
+            ),
+            EventDefinition(
+                event_id="other", name="Other", event_type="unhandled", product="patientsim"
+            ),
+        ],
+    )
+
+
+@pytest.fixture
+def engine():
+    """Engine with PatientSim handlers."""
+    engine = JourneyEngine(seed=42)
+    PatientSimHandlers(seed=42).register_all(engine)
+    return engine
+
+
+def test_table_schema(conn):
+    """Test the table is created with the fact table schema."""
+    JourneyEventLog(conn)
+
+    columns = conn.execute("DESCRIBE journey_events").fetchall()
+
+    assert [(name, sql_type) for name, sql_type, *_ in columns] == list(
+        JOURNEY_EVENT_COLUMNS.items()
+    )
+
+
+def test_engine_records_every_event(conn, engine, journey):
+    """Test an attached log records executed and skipped events."""
+    patients = [{"patient_id": f"P{i}"} for i in range(3)]
+
+    with JourneyEventLog(conn) as log:
+        engine.attach_event_log(log)
+        for _timeline, _results in engine.simulate(
+            patients, journey, "patient", start_date=date(2024, 1, 1)
+        ):
+            pass
+
+    rows = conn.execute("""
+        SELECT status, handler, count(*), min(duration_us) >= 0
+        FROM journey_events GROUP BY ALL ORDER BY ALL
+    """).fetchall()
+    assert rows == [
+        ("executed", "PatientSimHandlers.handle_encounter", 3, True),
+        ("executed", "PatientSimHandlers.handle_lab_result", 3, True),
+        ("skipped", None, 3, True),
+    ]
+    assert log.rows_written == 9
+    assert conn.execute(
+        "SELECT DISTINCT journey_id, scheduled_date FROM journey_events "
+        "WHERE event_def_id = 'visit'"
+    ).fetchall() == [("j1", date(2024, 1, 1))]
+
+
+def test_batch_execution_is_logged(conn, engine, journey):
+    """Test batch dispatch records one row per event under the batch handler."""
+    timelines = [
+        (
+            engine.create_timeline({"patient_id": f"P{i}"}, "patient", journey, date(2024, 1, 1)),
+            {"patient_id": f"P{i}"},
+        )
+        for i in range(4)
+    ]
+    log = JourneyEventLog(conn, batch_size=5)
+    engine.attach_event_log(log)
+
+    engine.execute_timelines(timelines)
+    log.flush()
+
+    handlers = dict(
+        conn.execute(
+            "SELECT event_def_id, any_value(handler) FROM journey_events GROUP BY ALL"
+        ).fetchall()
+    )
+    assert handlers["a1c"] == "PatientSimHandlers.handle_lab_result_batch"
+    assert handlers["visit"] == "PatientSimHandlers.handle_encounter"
+    assert conn.execute("SELECT count(*) FROM journey_events").fetchone()[0] == 12
+
+
+def test_record_timeline(conn):
+    """Test logging a timeline executed without a log attached."""
+    timeline = Timeline(entity_id="P001", entity_type="patient")
+    for event_id, status in [("e1", "executed"), ("e2", "failed"), ("e3", "pending")]:
+        event = TimelineEvent(
+            timeline_event_id=event_id,
+            journey_id="j1",
+            event_definition_id=event_id,
+            scheduled_date=date(2024, 1, 1),
+            event_type="encounter",
+            event_name="Visit",
+        )
+        event.status = status
+        timeline.add_event(event)
+    log = JourneyEventLog(conn)
+
+    assert log.record_timeline(timeline) == 2
+    assert log.pending == 2
+    log.flush()
+
+    assert conn.execute(
+        "SELECT event_def_id, status, duration_us FROM journey_events ORDER BY 1"
+    ).fetchall() == [("e1", "executed", None), ("e2", "failed", None)]
+
+
+def test_flush_without_pyarrow(conn, monkeypatch):
+    """Test batches fall back to pandas when pyarrow is unavailable."""
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    log = JourneyEventLog(conn)
+    log.record("P001", "j1", "e1", date(2024, 1, 1), "executed", duration_us=12, handler="h")
+
+    assert log.flush() == 1
+    assert conn.execute("SELECT entity_id, duration_us FROM journey_events").fetchall() == [
+        ("P001", 12)
+    ]
+
+
+def test_journey_manager_event_log(conn):
+    """Test JourneyManager opens a log on its connection."""
+    log = JourneyManager(conn).event_log(batch_size=1)
+    log.record("P001", "j1", "e1", date(2024, 1, 1), "executed")
+
+    assert conn.execute("SELECT count(*) FROM journey_events").fetchone()[0] == 1
@@ -14,6 +14,7 @@ from healthsim.generation.journey_engine import (
     MemberEventType,
     Timeline,
     TimelineEvent,
+    TimelineRetention,
     create_journey_engine,
     create_simple_journey,
     get_journey_template,
@@ -318,6 +319,80 @@ class TestJourneyEngine:
         assert len(timeline2.events) == 1
 
 
+class TestTimelineRetention:
+    """Tests for timeline retention, release and streaming simulation."""
+    
+    @pytest.fixture
+    def journey(self):
+        """Two-event journey a month apart."""
+        return create_simple_journey(
+            "test", "Test",
+            events=[
+                {"event_id": "e1", "name": "Start", "event_type": "enc", "delay": {"days": 0}},
+                {"event_id": "e2", "name": "Follow-up", "event_type": "enc",
+                 "delay": {"days": 30}, "depends_on": "e1"},
+            ]
+        )
+    
+    def test_lru_evicts_least_recently_used(self, journey):
+        """Test LRU retention keeps at most max_timelines."""
+        engine = JourneyEngine(seed=42, max_timelines=2)
+        for patient_id in ["P1", "P2"]:
+            engine.create_timeline({"patient_id": patient_id}, "patient", journey)
+        assert engine.get_timeline("P1") is not None  # P1 is now most recent
+        
+        engine.create_timeline({"patient_id": "P3"}, "patient", journey)
+        
+        assert list(engine._active_timelines) == ["P1", "P3"]
+        assert engine.get_timeline("P2") is None
+    
+    def test_weak_and_none_retention(self, journey):
+        """Test weak retention follows caller references and none keeps nothing."""
+        weak = JourneyEngine(retention="weak")
+        timeline = weak.create_timeline({"patient_id": "P1"}, "patient", journey)
+        assert weak.get_timeline("P1") is timeline
+        del timeline
+        assert weak.get_timeline("P1") is None
+        
+        engine = JourneyEngine(retention=TimelineRetention.NONE)
+        engine.create_timeline({"patient_id": "P1"}, "patient", journey)
+        assert engine.get_timeline("P1") is None
+    
+    def test_release(self, journey):
+        """Test releasing a timeline."""
+        engine = JourneyEngine()
+        timeline = engine.create_timeline({"patient_id": "P1"}, "patient", journey)
+        
+        assert engine.release("P1") is timeline
+        assert engine.release("P1") is None
+        assert engine.get_timeline("P1") is None
+    
+    def test_simulate_streams_and_releases(self, journey):
+        """Test simulate yields per entity and drops completed timelines."""
+        engine = JourneyEngine(seed=42)
+        entities = ({"patient_id": f"P{i}"} for i in range(3))
+        
+        stream = engine.simulate(entities, journey, "patient", start_date=date(2025, 1, 1))
+        timeline, results = next(stream)
+        
+        assert timeline.entity_id == "P0"
+        assert [r["scheduled_date"] for r in results] == ["2025-01-01", "2025-01-31"]
+        assert engine.get_timeline("P0") is None
+        assert [t.entity_id for t, _ in stream] == ["P1", "P2"]
+    
+    def test_simulate_keeps_unfinished_timelines(self, journey):
+        """Test timelines cut off by up_to_date remain available."""
+        engine = JourneyEngine(seed=42)
+        
+        [(timeline, results)] = engine.simulate(
+            [{"patient_id": "P1"}], journey, "patient",
+            start_date=date(2025, 1, 1), up_to_date=date(2025, 1, 15),
+        )
+        
+        assert len(results) == 1
+        assert engine.get_timeline("P1") is timeline
+
+
 class TestConvenienceFunctions:
     """Tests for convenience functions."""
     
@@ -1,5 +1,6 @@
 """Tests for healthsim.skills module."""
 
+import os
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 
@@ -10,12 +11,14 @@ from healthsim.skills import (
     Skill,
     SkillComposer,
     SkillCompositionError,
+    SkillIndex,
     SkillLoader,
     SkillMetadata,
     SkillParameter,
     SkillType,
     SkillVariation,
 )
+from healthsim.skills import loader as skill_loader
 
 
 class TestSkillType:
@@ -319,6 +322,81 @@ Testing file loading.
         with pytest.raises(FileNotFoundError):
             loader.load_file(Path("/nonexistent/file.md"))
 
+    def test_load_file_uses_parsed_cache(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test unchanged files are unpickled and edited files re-parsed."""
+        path = tmp_path / "cached.md"
+        path.write_text("---\nname: Cached\n---\n\n## Purpose\n\nFirst.\n")
+        first = SkillLoader(cache_dir=tmp_path / "cache").load_file(path)
+
+        loader = SkillLoader(cache_dir=tmp_path / "cache")
+        parsed = []
+        original = loader.load_string
+        monkeypatch.setattr(
+            loader,
+            "load_string",
+            lambda *args, **kwargs: parsed.append(1) or original(*args, **kwargs),
+        )
+        assert loader.load_file(path) == first
+        assert parsed == []
+
+        path.write_text("---\nname: Cached\n---\n\n## Purpose\n\nSecond.\n")
+        os.utime(path, ns=(1, 1))
+        assert loader.load_file(path).purpose == "Second."
+        assert parsed == [1]
+
+    def test_cache_defaults_to_workspace_dir(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the cache is on by default, under DEFAULT_CACHE_DIR."""
+        monkeypatch.delenv("HEALTHSIM_SKILL_CACHE_DIR", raising=False)
+        monkeypatch.setattr(skill_loader, "DEFAULT_CACHE_DIR", tmp_path / "default")
+        path = tmp_path / "plain.md"
+        path.write_text("---\nname: Plain\n---\n")
+
+        loader = SkillLoader()
+        skill = loader.load_file(path)
+
+        assert skill.name == "Plain"
+        assert loader.cache_dir == tmp_path / "default"
+        assert len(list((tmp_path / "default").glob("*.pickle"))) == 1
+
+    def test_cache_pruned_to_max_entries(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the oldest cache files beyond MAX_CACHE_ENTRIES are deleted."""
+        monkeypatch.setattr(skill_loader, "MAX_CACHE_ENTRIES", 3)
+        monkeypatch.setattr(skill_loader, "PRUNE_INTERVAL", 2)
+        cache_dir = tmp_path / "cache"
+        loader = SkillLoader(cache_dir=cache_dir)
+        paths = []
+        for i in range(6):
+            path = tmp_path / f"skill{i}.md"
+            path.write_text(f"---\nname: Skill {i}\n---\n")
+            paths.append(path)
+            loader.load_file(path)
+            for cache_path in cache_dir.glob("*.pickle"):
+                # Age every file written so far, so earlier writes are older
+                mtime_ns = cache_path.stat().st_mtime_ns - 10**9
+                os.utime(cache_path, ns=(mtime_ns, mtime_ns))
+
+        kept = {p.name for p in cache_dir.glob("*.pickle")}
+        # Pruned after the 1st, 3rd and 5th new files; the 6th is written after
+        assert kept == {loader._cache_path(p).name for p in paths[2:]}
+
+    def test_cache_dir_from_environment(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test HEALTHSIM_SKILL_CACHE_DIR overrides the cache directory."""
+        monkeypatch.setenv("HEALTHSIM_SKILL_CACHE_DIR", str(tmp_path / "cache"))
+        path = tmp_path / "env.md"
+        path.write_text("---\nname: Env\n---\n")
+
+        SkillLoader().load_file(path)
+
+        assert len(list((tmp_path / "cache").glob("*.pickle"))) == 1
+
     def test_load_skill_no_frontmatter(self) -> None:
         """Test loading skill without frontmatter."""
         content = """# My Skill
@@ -335,6 +413,100 @@ A skill without YAML frontmatter.
         assert "skill without yaml frontmatter" in skill.purpose.lower()
 
 
+class TestSkillIndex:
+    """Tests for SkillIndex."""
+
+    @pytest.fixture
+    def root(self, tmp_path: Path) -> Path:
+        """Skills tree with a product-level and a nested skill of the same name."""
+        root = tmp_path / "skills"
+        for relative in ("common/deep/diabetes.md", "patientsim/diabetes.md", "README.md"):
+            (root / relative).parent.mkdir(parents=True, exist_ok=True)
+        (root / "common/deep/diabetes.md").write_text("# Nested\n")
+        (root / "patientsim/diabetes.md").write_text("---\nname: Diabetes\n---\n# Diabetes\n")
+        (root / "README.md").write_text("# Skills\n")
+        (root / "trialsim" / "scenarios").mkdir(parents=True)
+        (root / "trialsim/scenarios/Oncology-Trial.md").write_text(
+            "---\nversion: 2024-01-02\n---\n"
+        )
+        return root
+
+    def test_find_prefers_product_dirs(self, root: Path, tmp_path: Path) -> None:
+        """Test product-level files win over nested matches."""
+        index = SkillIndex(root, cache_dir=tmp_path / "cache")
+
+        assert index.find("diabetes") == root / "patientsim" / "diabetes.md"
+        assert index.find("oncology_trial") == root / "trialsim/scenarios/Oncology-Trial.md"
+        assert index.names() == ["Oncology-Trial", "diabetes"]
+
+    def test_frontmatter_is_json_safe(self, root: Path, tmp_path: Path) -> None:
+        """Test frontmatter values are stored as they will be persisted."""
+        index = SkillIndex(root, cache_dir=tmp_path / "cache")
+
+        assert index.frontmatter("diabetes") == {"name": "Diabetes"}
+        assert index.frontmatter("oncology-trial") == {"version": "2024-01-02"}
+        assert index.frontmatter("missing") == {}
+
+    def test_misses_rechecked_when_tree_changes(
+        self, root: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test cached misses re-scan only after a directory changes."""
+        import healthsim.skills.index as index_module
+
+        monkeypatch.setattr(index_module, "MISS_RECHECK_SECONDS", 0.0)
+        index = SkillIndex(root, persist=False)
+        assert index.find("asthma") is None
+
+        scans = []
+        original = index._scan
+        monkeypatch.setattr(index, "_scan", lambda: scans.append(1) or original())
+        assert index.find("asthma") is None
+        assert scans == []
+
+        (root / "common" / "deep" / "asthma.md").write_text("# Asthma\n")
+        assert index.find("asthma") == root / "common" / "deep" / "asthma.md"
+        assert scans == [1]
+
+    def test_hits_rechecked_against_file(self, root: Path) -> None:
+        """Test cached hits re-scan when their file is edited or deleted."""
+        index = SkillIndex(root, persist=False)
+        assert index.frontmatter("diabetes") == {"name": "Diabetes"}
+
+        edited = root / "patientsim" / "diabetes.md"
+        edited.write_text("---\nname: Diabetes, edited\n---\n")
+        assert index.frontmatter("diabetes") == {"name": "Diabetes, edited"}
+
+        edited.unlink()
+        assert index.find("diabetes") == root / "common" / "deep" / "diabetes.md"
+
+    def test_persisted_index_reparses_only_changed_files(
+        self, root: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a new process reuses frontmatter for files whose mtime is unchanged."""
+        import healthsim.skills.index as index_module
+
+        cache_dir = tmp_path / "cache"
+        assert len(SkillIndex(root, cache_dir=cache_dir)) == 4
+        assert SkillIndex(root, cache_dir=cache_dir).cache_path.exists()
+
+        edited = root / "patientsim" / "diabetes.md"
+        edited.write_text("---\nname: Diabetes v2\n---\n")
+        os.utime(edited, ns=(1, 1))
+        parsed = []
+        original = index_module.read_frontmatter
+        monkeypatch.setattr(
+            index_module, "read_frontmatter", lambda path: parsed.append(path) or original(path)
+        )
+
+        index = SkillIndex(root, cache_dir=cache_dir)
+        assert index.frontmatter("diabetes") == {"name": "Diabetes v2"}
+        assert parsed == [edited]
+
+    def test_shared_index_per_root(self, root: Path) -> None:
+        """Test for_root returns one index per skills root."""
+        assert SkillIndex.for_root(root) is SkillIndex.for_root(root / ".." / "skills")
+
+
 class TestSkillComposer:
     """Tests for SkillComposer."""
 
@@ -1,9 +1,12 @@
 """MemberSim Dimensional Output.
 
 Transforms MemberSim canonical models into dimensional (star schema) format
-for analytics, reporting, and BI tools.
+for analytics, reporting, and BI tools. MemberSimInDatabaseTransformer builds
+the same tables with CREATE TABLE AS SELECT against the canonical DuckDB
+tables for a cohort.
 """
 
+from .in_database import MemberSimInDatabaseTransformer
 from .transformer import MemberSimDimensionalTransformer
 
-__all__ = ["MemberSimDimensionalTransformer"]
+__all__ = ["MemberSimDimensionalTransformer", "MemberSimInDatabaseTransformer"]
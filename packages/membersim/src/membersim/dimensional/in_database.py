@@ -0,0 +1,330 @@
+"""MemberSim In-Database Dimensional Transformer.
+
+Builds the MemberSim star schema with ``CREATE TABLE AS SELECT`` statements
+against the canonical DuckDB tables, mirroring the tables and columns of
+``MemberSimDimensionalTransformer`` without moving rows through Python.
+"""
+
+from __future__ import annotations
+
+from healthsim.dimensional import BaseInDatabaseTransformer
+
+from .transformer import (
+    GENDER_DESCRIPTIONS,
+    ICD10_CATEGORIES,
+    PLACE_OF_SERVICE_CODES,
+    RELATIONSHIP_DESCRIPTIONS,
+    SERVICE_CATEGORIES,
+)
+
+# Claims with all diagnoses (principal first) as a list
+_CLAIMS = """
+    clm AS (
+        SELECT
+            *,
+            list_prepend(
+                principal_diagnosis, coalesce(from_json(other_diagnoses, '["VARCHAR"]'), [])
+            ) AS all_diagnoses
+        FROM {claims}
+    )
+"""
+
+# Sorted distinct NPIs per claim column; the key is the 1-based position
+_NPI_KEYS = """
+    {name}_keys AS (
+        SELECT npi, row_number() OVER (ORDER BY npi) AS {name}_key
+        FROM (SELECT DISTINCT {column} AS npi FROM clm WHERE {column} <> '')
+    )
+"""
+
+# Sorted principal and secondary diagnosis codes across all claims
+_DIAGNOSIS_KEYS = """
+    diagnosis_keys AS (
+        SELECT code, row_number() OVER (ORDER BY code) AS diagnosis_key
+        FROM (SELECT DISTINCT unnest(all_diagnoses) AS code FROM clm)
+        WHERE code IS NOT NULL
+    )
+"""
+
+# Sorted procedure codes across all claim lines
+_PROCEDURE_KEYS = """
+    procedure_keys AS (
+        SELECT procedure_code, row_number() OVER (ORDER BY procedure_code) AS procedure_key
+        FROM (SELECT DISTINCT procedure_code FROM {claim_lines} WHERE procedure_code IS NOT NULL)
+    )
+"""
+
+# Sorted place of service codes from claim headers and lines
+_SERVICE_CATEGORY_KEYS = """
+    service_category_keys AS (
+        SELECT code, row_number() OVER (ORDER BY code) AS service_category_key
+        FROM (
+            SELECT place_of_service AS code FROM clm WHERE place_of_service IS NOT NULL
+            UNION
+            SELECT place_of_service FROM {claim_lines} WHERE place_of_service IS NOT NULL
+        )
+    )
+"""
+
+
+def _npi_keys(name: str, column: str) -> str:
+    """CTE of sorted distinct NPIs in a claims column."""
+    return _NPI_KEYS.replace("{name}", name).replace("{column}", column)
+
+
+class MemberSimInDatabaseTransformer(BaseInDatabaseTransformer):
+    """Build the MemberSim star schema inside DuckDB.
+
+    Reads the canonical members, claims and claim_lines tables for one
+    cohort and writes the same dimension and fact tables as
+    ``MemberSimDimensionalTransformer``. The canonical store has no plan,
+    provider or payment tables, so in this mode:
+
+    - dim_plan is not built and eligibility spans carry plan_key -1.
+    - Providers and facilities are the placeholder entries derived from
+      claim NPIs.
+    - Payment amounts come from the claim line's stored charge, allowed
+      and paid amounts; payment-only columns (paid date, deductible,
+      copay, coinsurance, member responsibility, adjustment reason) are
+      NULL.
+
+    Example:
+        >>> from healthsim.db import get_connection
+        >>> from membersim.dimensional import MemberSimInDatabaseTransformer
+        >>>
+        >>> transformer = MemberSimInDatabaseTransformer(
+        ...     get_connection(), cohort='commercial-2024'
+        ... )
+        >>> row_counts = transformer.build(['dim_member', 'fact_claims'])
+    """
+
+    SOURCE_TABLES = ("members", "claims", "claim_lines")
+
+    def table_definitions(self) -> dict[str, str]:
+        """Return the SELECT for each MemberSim dimension and fact table."""
+        return {
+            "dim_member": self._dim_member(),
+            "dim_provider": self._dim_provider(),
+            "dim_facility": self._dim_facility(),
+            "dim_diagnosis": self._dim_diagnosis(),
+            "dim_procedure": self._dim_procedure(),
+            "dim_service_category": self._dim_service_category(),
+            "fact_claims": self._fact_claims(),
+            "fact_eligibility_spans": self._fact_eligibility_spans(),
+        }
+
+    # -------------------------------------------------------------------------
+    # Dimensions
+    # -------------------------------------------------------------------------
+
+    def _dim_member(self) -> str:
+        age = self.age_sql("birth_date")
+        return f"""
+            SELECT
+                member_id AS member_key,
+                member_id,
+                subscriber_id,
+                id AS person_id,
+                given_name,
+                family_name,
+                given_name || ' ' || family_name AS full_name,
+                {self.date_key_sql("birth_date")} AS birth_date_key,
+                birth_date,
+                gender AS gender_code,
+                {self.case_sql("gender", GENDER_DESCRIPTIONS, "Unknown")} AS gender_description,
+                relationship_code,
+                {self.case_sql("relationship_code", RELATIONSHIP_DESCRIPTIONS, "Other")}
+                    AS relationship_description,
+                group_id,
+                plan_code,
+                pcp_npi,
+                {age} AS age_at_snapshot,
+                {self.age_band_sql(age)} AS age_band,
+                city,
+                state,
+                postal_code,
+                coalesce(relationship_code = '18', FALSE) AS is_subscriber,
+                {self._coverage_active_sql()} AS is_active
+            FROM {{members}}
+            ORDER BY source_row
+        """
+
+    def _dim_provider(self) -> str:
+        return f"""
+            WITH {_CLAIMS}, {_npi_keys("provider", "provider_npi")}
+            SELECT
+                provider_key,
+                npi AS provider_npi,
+                CAST(NULL AS VARCHAR) AS tax_id,
+                npi AS provider_name,
+                CAST(NULL AS VARCHAR) AS specialty,
+                'INDIVIDUAL' AS provider_type,
+                'UNKNOWN' AS network_status,
+                CAST(NULL AS VARCHAR) AS city,
+                CAST(NULL AS VARCHAR) AS state
+            FROM provider_keys
+            ORDER BY provider_key
+        """
+
+    def _dim_facility(self) -> str:
+        return f"""
+            WITH {_CLAIMS}, {_npi_keys("facility", "facility_npi")}
+            SELECT
+                facility_key,
+                npi AS facility_npi,
+                CAST(NULL AS VARCHAR) AS tax_id,
+                npi AS facility_name,
+                CAST(NULL AS VARCHAR) AS facility_type,
+                'UNKNOWN' AS network_status,
+                CAST(NULL AS VARCHAR) AS city,
+                CAST(NULL AS VARCHAR) AS state
+            FROM facility_keys
+            ORDER BY facility_key
+        """
+
+    def _dim_diagnosis(self) -> str:
+        category = self.case_sql("upper(left(code, 1))", ICD10_CATEGORIES, "Other")
+        return f"""
+            WITH {_CLAIMS}, {_DIAGNOSIS_KEYS}
+            SELECT
+                diagnosis_key,
+                code AS diagnosis_code,
+                CAST(NULL AS VARCHAR) AS diagnosis_description,
+                CASE WHEN code = '' THEN 'Unknown' ELSE {category} END AS diagnosis_category,
+                'ICD-10-CM' AS code_system
+            FROM diagnosis_keys
+            ORDER BY diagnosis_key
+        """
+
+    def _dim_procedure(self) -> str:
+        code = "trim(procedure_code)"
+        return f"""
+            WITH {_PROCEDURE_KEYS}
+            SELECT
+                procedure_key,
+                procedure_code,
+                CAST(NULL AS VARCHAR) AS procedure_description,
+                CASE
+                    WHEN procedure_code = '' THEN 'Unknown'
+                    WHEN length({code}) = 5 AND regexp_full_match({code}, '[0-9]+') THEN 'CPT'
+                    WHEN length({code}) = 5 AND regexp_full_match({code}, '[A-Za-z][0-9]+')
+                        THEN 'HCPCS'
+                    WHEN length({code}) = 7 AND regexp_full_match({code}, '[A-Za-z0-9]+')
+                        THEN 'ICD-10-PCS'
+                    ELSE 'Unknown'
+                END AS code_system
+            FROM procedure_keys
+            ORDER BY procedure_key
+        """
+
+    def _dim_service_category(self) -> str:
+        description = self.case_sql("code", PLACE_OF_SERVICE_CODES, "Unknown")
+        category = self.case_sql("code", SERVICE_CATEGORIES, "Other")
+        return f"""
+            WITH {_CLAIMS}, {_SERVICE_CATEGORY_KEYS}
+            SELECT
+                service_category_key,
+                code AS place_of_service_code,
+                {description} AS place_of_service_description,
+                {category} AS service_category
+            FROM service_category_keys
+            ORDER BY service_category_key
+        """
+
+    # -------------------------------------------------------------------------
+    # Facts
+    # -------------------------------------------------------------------------
+
+    def _fact_claims(self) -> str:
+        return f"""
+            WITH {_CLAIMS},
+            {_npi_keys("provider", "provider_npi")},
+            {_npi_keys("facility", "facility_npi")},
+            {_DIAGNOSIS_KEYS},
+            {_PROCEDURE_KEYS},
+            {_SERVICE_CATEGORY_KEYS},
+            lines AS (
+                SELECT
+                    l.*,
+                    c.source_row AS claim_row,
+                    -- Diagnosis referenced by the line's first pointer (usually 1)
+                    coalesce(
+                        c.all_diagnoses[from_json(l.diagnosis_pointers, '["INTEGER"]')[1]],
+                        c.principal_diagnosis
+                    ) AS primary_diagnosis
+                FROM {{claim_lines}} l
+                JOIN clm c USING (claim_id)
+            )
+            SELECT
+                row_number() OVER (ORDER BY l.claim_row, l.source_row) AS claim_fact_key,
+                c.claim_id,
+                l.line_number AS claim_line_number,
+                c.member_id AS member_key,
+                c.subscriber_id AS subscriber_key,
+                coalesce(pk.provider_key, -1) AS provider_key,
+                CASE WHEN c.facility_npi <> '' THEN coalesce(fk.facility_key, -1) END
+                    AS facility_key,
+                coalesce(dk.diagnosis_key, -1) AS diagnosis_key,
+                coalesce(prk.procedure_key, -1) AS procedure_key,
+                coalesce(sk.service_category_key, -1) AS service_category_key,
+                {self.date_key_sql("l.service_date")} AS service_date_key,
+                l.service_date,
+                CAST(NULL AS INTEGER) AS paid_date_key,
+                CAST(NULL AS DATE) AS paid_date,
+                c.claim_type,
+                l.place_of_service AS place_of_service_code,
+                l.revenue_code,
+                l.procedure_code,
+                nullif(
+                    array_to_string(from_json(l.procedure_modifiers, '["VARCHAR"]'), ','), ''
+                ) AS procedure_modifiers,
+                l.ndc_code,
+                CAST(l.units AS DOUBLE) AS units,
+                CAST(l.charge_amount * l.units AS DOUBLE) AS line_charge_amount,
+                CAST(l.charge_amount AS DOUBLE) AS charged_amount,
+                CAST(l.allowed_amount AS DOUBLE) AS allowed_amount,
+                CAST(l.paid_amount AS DOUBLE) AS paid_amount,
+                CAST(NULL AS DOUBLE) AS deductible_amount,
+                CAST(NULL AS DOUBLE) AS copay_amount,
+                CAST(NULL AS DOUBLE) AS coinsurance_amount,
+                CAST(NULL AS DOUBLE) AS member_responsibility,
+                CAST(NULL AS VARCHAR) AS adjustment_reason,
+                c.principal_diagnosis AS principal_diagnosis_code,
+                c.authorization_number
+            FROM lines l
+            JOIN clm c USING (claim_id)
+            LEFT JOIN provider_keys pk ON pk.npi = c.provider_npi
+            LEFT JOIN facility_keys fk ON fk.npi = c.facility_npi
+            LEFT JOIN diagnosis_keys dk ON dk.code = l.primary_diagnosis
+            LEFT JOIN procedure_keys prk ON prk.procedure_code = l.procedure_code
+            LEFT JOIN service_category_keys sk ON sk.code = l.place_of_service
+            ORDER BY l.claim_row, l.source_row
+        """
+
+    def _fact_eligibility_spans(self) -> str:
+        return f"""
+            SELECT
+                row_number() OVER (ORDER BY source_row) AS eligibility_span_key,
+                member_id AS member_key,
+                -1 AS plan_key,
+                {self.date_key_sql("coverage_start")} AS effective_date_key,
+                coverage_start AS effective_date,
+                {self.date_key_sql("coverage_end")} AS termination_date_key,
+                coverage_end AS termination_date,
+                -- Open-ended coverage is measured through the snapshot date
+                date_diff('day', coverage_start, coalesce(coverage_end, $snapshot_date)) + 1
+                    AS coverage_days,
+                {self._coverage_active_sql()} AS is_active,
+                group_id,
+                relationship_code
+            FROM {{members}}
+            ORDER BY source_row
+        """
+
+    @staticmethod
+    def _coverage_active_sql() -> str:
+        """SQL for ``Member.is_active``: coverage includes today."""
+        return (
+            "coalesce(coverage_start <= current_date"
+            " AND (coverage_end IS NULL OR current_date <= coverage_end), FALSE)"
+        )
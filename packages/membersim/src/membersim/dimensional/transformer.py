@@ -6,14 +6,15 @@ for analytics and BI tools.
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from datetime import date
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import pandas as pd
 from healthsim.dimensional import BaseDimensionalTransformer
 
 if TYPE_CHECKING:
-    from membersim.claims.claim import Claim
+    from membersim.claims.claim import Claim, ClaimLine
     from membersim.claims.payment import Payment
     from membersim.core.member import Member
     from membersim.core.plan import Plan
@@ -51,11 +52,157 @@ PLACE_OF_SERVICE_CODES = {
 }
 
 
+# Service category by place of service code
+SERVICE_CATEGORIES = {
+    "21": "Inpatient",
+    "51": "Inpatient",
+    "61": "Inpatient",
+    "22": "Outpatient",
+    "24": "Outpatient",
+    "52": "Outpatient",
+    "62": "Outpatient",
+    "11": "Office",
+    "02": "Office",
+    "23": "Emergency",
+    "31": "Skilled Nursing",
+    "32": "Skilled Nursing",
+    "33": "Skilled Nursing",
+    "34": "Skilled Nursing",
+    "54": "Skilled Nursing",
+    "12": "Home Health",
+    "41": "Ambulance",
+    "42": "Ambulance",
+    "50": "Clinic",
+    "71": "Clinic",
+    "72": "Clinic",
+}
+
+# Gender code descriptions
+GENDER_DESCRIPTIONS = {
+    "M": "Male",
+    "F": "Female",
+    "MALE": "Male",
+    "FEMALE": "Female",
+    "O": "Other",
+    "U": "Unknown",
+}
+
+# X12 individual relationship code descriptions
+RELATIONSHIP_DESCRIPTIONS = {
+    "18": "Self",
+    "01": "Spouse",
+    "19": "Child",
+    "20": "Employee",
+    "21": "Unknown",
+    "39": "Organ Donor",
+    "40": "Cadaver Donor",
+    "53": "Life Partner",
+    "G8": "Other Relationship",
+}
+
+# ICD-10-CM category by chapter letter
+ICD10_CATEGORIES = {
+    "A": "Infectious",
+    "B": "Infectious",
+    "C": "Neoplasm",
+    "D": "Neoplasm/Blood",
+    "E": "Endocrine/Metabolic",
+    "F": "Mental/Behavioral",
+    "G": "Nervous System",
+    "H": "Eye/Ear",
+    "I": "Circulatory",
+    "J": "Respiratory",
+    "K": "Digestive",
+    "L": "Skin",
+    "M": "Musculoskeletal",
+    "N": "Genitourinary",
+    "O": "Pregnancy",
+    "P": "Perinatal",
+    "Q": "Congenital",
+    "R": "Symptoms",
+    "S": "Injury",
+    "T": "Injury/Poisoning",
+    "V": "External Causes",
+    "W": "External Causes",
+    "X": "External Causes",
+    "Y": "External Causes",
+    "Z": "Health Status",
+}
+
+
+# Source attributes extracted (once per transform) for each model list
+_SOURCE_FIELDS: dict[str, dict[str, str]] = {
+    "members": {
+        "member_id": "member_id",
+        "subscriber_id": "subscriber_id",
+        "id": "id",
+        "given_name": "name.given_name",
+        "family_name": "name.family_name",
+        "birth_date": "birth_date",
+        "gender": "gender",
+        "relationship_code": "relationship_code",
+        "group_id": "group_id",
+        "plan_code": "plan_code",
+        "pcp_npi": "pcp_npi",
+        "city": "address.city",
+        "state": "address.state",
+        "postal_code": "address.zip_code",
+        "is_subscriber": "is_subscriber",
+        "is_active": "is_active",
+        "coverage_start": "coverage_start",
+        "coverage_end": "coverage_end",
+    },
+    "plans": {
+        "plan_code": "plan_code",
+        "plan_name": "plan_name",
+        "plan_type": "plan_type",
+        "coverage_type": "coverage_type",
+        "deductible_individual": "deductible_individual",
+        "deductible_family": "deductible_family",
+        "oop_max_individual": "oop_max_individual",
+        "oop_max_family": "oop_max_family",
+        "copay_pcp": "copay_pcp",
+        "copay_specialist": "copay_specialist",
+        "copay_er": "copay_er",
+        "coinsurance": "coinsurance",
+        "requires_pcp": "requires_pcp",
+        "requires_referral": "requires_referral",
+    },
+    "providers": {
+        "npi": "npi",
+        "tax_id": "tax_id",
+        "name": "name",
+        "specialty": "specialty",
+        "provider_type": "provider_type",
+        "network_status": "network_status",
+        "city": "address.city",
+        "state": "address.state",
+    },
+    "claims": {
+        "claim_id": "claim_id",
+        "claim_type": "claim_type",
+        "member_id": "member_id",
+        "subscriber_id": "subscriber_id",
+        "provider_npi": "provider_npi",
+        "facility_npi": "facility_npi",
+        "place_of_service": "place_of_service",
+        "principal_diagnosis": "principal_diagnosis",
+        "other_diagnoses": "other_diagnoses",
+        "authorization_number": "authorization_number",
+    },
+    "payments": {
+        "claim_id": "claim_id",
+        "payment_date": "payment_date",
+    },
+}
+
+
 class MemberSimDimensionalTransformer(BaseDimensionalTransformer):
     """Transform MemberSim canonical models into dimensional format.
 
     Creates star schema with dimensions and fact tables optimized for
-    payer/claims analytics.
+    payer/claims analytics. Each model list is converted to columns once;
+    surrogate keys and derived columns are computed column-wise.
 
     Dimensions:
         - dim_member: Member demographics with coverage info
@@ -87,6 +234,30 @@ class MemberSimDimensionalTransformer(BaseDimensionalTransformer):
         >>> dimensions, facts = transformer.transform()
     """
 
+    KEY_COLUMNS = {
+        "dim_member": "member_key",
+        "dim_plan": "plan_key",
+        "dim_provider": "provider_key",
+        "dim_facility": "facility_key",
+        "dim_diagnosis": "diagnosis_key",
+        "dim_procedure": "procedure_key",
+        "dim_service_category": "service_category_key",
+    }
+
+    NATURAL_KEYS = {
+        "dim_plan": "plan_code",
+        "dim_provider": "provider_npi",
+        "dim_facility": "facility_npi",
+        "dim_diagnosis": "diagnosis_code",
+        "dim_procedure": "procedure_code",
+        "dim_service_category": "place_of_service_code",
+    }
+
+    FACT_KEYS = {
+        "fact_claims": "claim_fact_key",
+        "fact_eligibility_spans": "eligibility_span_key",
+    }
+
     def __init__(
         self,
         members: list[Member] | None = None,
@@ -113,8 +284,7 @@ class MemberSimDimensionalTransformer(BaseDimensionalTransformer):
         self.payments = payments or []
         self.snapshot_date = snapshot_date or date.today()
 
-        # Build payment lookup by claim_id for efficient joining
-        self._payment_lookup: dict[str, Payment] = {p.claim_id: p for p in self.payments}
+        self._frame_cache: dict[str, pd.DataFrame | pd.Index] = {}
 
     def transform(self) -> tuple[dict[str, pd.DataFrame], dict[str, pd.DataFrame]]:
         """Transform canonical models into dimensional format.
@@ -126,6 +296,9 @@ class MemberSimDimensionalTransformer(BaseDimensionalTransformer):
         dimensions = {}
         facts = {}
 
+        # Model lists are converted to columns once per transform
+        self._frame_cache.clear()
+
         # Build dimensions
         if self.members:
             dimensions["dim_member"] = self._build_dim_member()
@@ -153,7 +326,15 @@ class MemberSimDimensionalTransformer(BaseDimensionalTransformer):
         if self.members:
             facts["fact_eligibility_spans"] = self._build_fact_eligibility_spans()
 
-        return dimensions, facts
+        return self.infer_dtypes(dimensions), self.infer_dtypes(facts)
+
+    def _frame(self, name: str) -> pd.DataFrame:
+        """Get the columnar form of one model list, extracting it on first use."""
+        if name not in self._frame_cache:
+            self._frame_cache[name] = self.extract_columns(
+                getattr(self, name), _SOURCE_FIELDS[name]
+            )
+        return self._frame_cache[name]
 
     # -------------------------------------------------------------------------
     # Dimension Builders
@@ -161,67 +342,44 @@ class MemberSimDimensionalTransformer(BaseDimensionalTransformer):
 
     def _build_dim_member(self) -> pd.DataFrame:
         """Build member dimension with demographics and coverage info."""
-        records = []
-        for member in self.members:
-            age = self.calculate_age(member.birth_date, self.snapshot_date)
-            gender_value = member.gender.value if hasattr(member.gender, "value") else member.gender
-
-            records.append(
-                {
-                    "member_key": member.member_id,
-                    "member_id": member.member_id,
-                    "subscriber_id": member.subscriber_id,
-                    "person_id": member.id,
-                    "given_name": member.name.given_name,
-                    "family_name": member.name.family_name,
-                    "full_name": f"{member.name.given_name} {member.name.family_name}",
-                    "birth_date_key": self.date_to_key(member.birth_date),
-                    "birth_date": member.birth_date,
-                    "gender_code": gender_value,
-                    "gender_description": self._get_gender_description(gender_value),
-                    "relationship_code": member.relationship_code,
-                    "relationship_description": self._get_relationship_description(
-                        member.relationship_code
-                    ),
-                    "group_id": member.group_id,
-                    "plan_code": member.plan_code,
-                    "pcp_npi": member.pcp_npi,
-                    "age_at_snapshot": age,
-                    "age_band": self.age_band(age),
-                    "city": self.get_attr(member, "address.city"),
-                    "state": self.get_attr(member, "address.state"),
-                    "postal_code": self.get_attr(member, "address.zip_code"),
-                    "is_subscriber": member.is_subscriber,
-                    "is_active": member.is_active,
-                }
-            )
-        return pd.DataFrame(records)
+        df = self._frame("members")
+        age = self.calculate_ages(df["birth_date"], self.snapshot_date)
+        gender_code = self.enum_values(df["gender"])
+
+        return pd.DataFrame(
+            {
+                "member_key": df["member_id"],
+                "member_id": df["member_id"],
+                "subscriber_id": df["subscriber_id"],
+                "person_id": df["id"],
+                "given_name": df["given_name"],
+                "family_name": df["family_name"],
+                "full_name": df["given_name"].astype(str) + " " + df["family_name"].astype(str),
+                "birth_date_key": self.dates_to_keys(df["birth_date"]),
+                "birth_date": df["birth_date"],
+                "gender_code": gender_code,
+                "gender_description": self.map_unique(gender_code, self._get_gender_description),
+                "relationship_code": df["relationship_code"],
+                "relationship_description": self.map_unique(
+                    df["relationship_code"], self._get_relationship_description
+                ),
+                "group_id": df["group_id"],
+                "plan_code": df["plan_code"],
+                "pcp_npi": df["pcp_npi"],
+                "age_at_snapshot": age,
+                "age_band": self.age_bands(age),
+                "city": df["city"],
+                "state": df["state"],
+                "postal_code": df["postal_code"],
+                "is_subscriber": df["is_subscriber"],
+                "is_active": df["is_active"],
+            }
+        )
 
     def _build_dim_plan(self) -> pd.DataFrame:
         """Build plan dimension with benefit details."""
-        records = []
-        for idx, plan in enumerate(self.plans, start=1):
-            records.append(
-                {
-                    "plan_key": idx,
-                    "plan_code": plan.plan_code,
-                    "plan_name": plan.plan_name,
-                    "plan_type": plan.plan_type,
-                    "coverage_type": plan.coverage_type,
-                    "deductible_individual": float(plan.deductible_individual),
-                    "deductible_family": float(plan.deductible_family),
-                    "oop_max_individual": float(plan.oop_max_individual),
-                    "oop_max_family": float(plan.oop_max_family),
-                    "copay_pcp": float(plan.copay_pcp),
-                    "copay_specialist": float(plan.copay_specialist),
-                    "copay_er": float(plan.copay_er),
-                    "coinsurance_pct": float(plan.coinsurance) * 100,  # Store as percentage
-                    "requires_pcp": plan.requires_pcp,
-                    "requires_referral": plan.requires_referral,
-                }
-            )
-
-        if not records:
+        df = self._frame("plans")
+        if df.empty:
             return pd.DataFrame(columns=[
                 "plan_key", "plan_code", "plan_name", "plan_type", "coverage_type",
                 "deductible_individual", "deductible_family", "oop_max_individual",
@@ -229,194 +387,130 @@ class MemberSimDimensionalTransformer(BaseDimensionalTransformer):
                 "coinsurance_pct", "requires_pcp", "requires_referral"
             ])
 
-        return pd.DataFrame(records)
+        return pd.DataFrame(
+            {
+                "plan_key": range(1, len(df) + 1),
+                "plan_code": df["plan_code"],
+                "plan_name": df["plan_name"],
+                "plan_type": df["plan_type"],
+                "coverage_type": df["coverage_type"],
+                "deductible_individual": df["deductible_individual"].astype(float),
+                "deductible_family": df["deductible_family"].astype(float),
+                "oop_max_individual": df["oop_max_individual"].astype(float),
+                "oop_max_family": df["oop_max_family"].astype(float),
+                "copay_pcp": df["copay_pcp"].astype(float),
+                "copay_specialist": df["copay_specialist"].astype(float),
+                "copay_er": df["copay_er"].astype(float),
+                "coinsurance_pct": df["coinsurance"].astype(float) * 100,  # Store as percentage
+                "requires_pcp": df["requires_pcp"],
+                "requires_referral": df["requires_referral"],
+            }
+        )
 
     def _build_provider_and_facility_dims(self) -> tuple[pd.DataFrame, pd.DataFrame]:
         """Build provider and facility dimensions from providers and claims."""
-        # Collect provider NPIs from explicit providers and claims
-        provider_npis: dict[str, dict] = {}
-        facility_npis: dict[str, dict] = {}
-
-        # From explicit providers
-        for provider in self.providers:
-            if provider.provider_type == "FACILITY":
-                facility_npis[provider.npi] = {
-                    "npi": provider.npi,
-                    "tax_id": provider.tax_id,
-                    "name": provider.name,
-                    "specialty": provider.specialty,
-                    "provider_type": provider.provider_type,
-                    "network_status": provider.network_status,
-                    "city": self.get_attr(provider, "address.city"),
-                    "state": self.get_attr(provider, "address.state"),
-                }
-            else:
-                provider_npis[provider.npi] = {
-                    "npi": provider.npi,
-                    "tax_id": provider.tax_id,
-                    "name": provider.name,
-                    "specialty": provider.specialty,
-                    "provider_type": provider.provider_type,
-                    "network_status": provider.network_status,
-                    "city": self.get_attr(provider, "address.city"),
-                    "state": self.get_attr(provider, "address.state"),
-                }
+        providers = self._provider_entries(facility=False)
+        facilities = self._provider_entries(facility=True)
 
-        # From claims (add NPIs we don't have details for)
-        for claim in self.claims:
-            if claim.provider_npi and claim.provider_npi not in provider_npis:
-                provider_npis[claim.provider_npi] = {
-                    "npi": claim.provider_npi,
-                    "tax_id": None,
-                    "name": claim.provider_npi,
-                    "specialty": None,
-                    "provider_type": "INDIVIDUAL",
-                    "network_status": "UNKNOWN",
-                    "city": None,
-                    "state": None,
-                }
-
-            if claim.facility_npi and claim.facility_npi not in facility_npis:
-                facility_npis[claim.facility_npi] = {
-                    "npi": claim.facility_npi,
-                    "tax_id": None,
-                    "name": claim.facility_npi,
-                    "specialty": None,
-                    "provider_type": "FACILITY",
-                    "network_status": "UNKNOWN",
-                    "city": None,
-                    "state": None,
-                }
-
-        # Build provider DataFrame
-        provider_records = []
-        for idx, (_npi, info) in enumerate(sorted(provider_npis.items()), start=1):
-            provider_records.append(
+        if providers.empty:
+            provider_df = pd.DataFrame(columns=[
+                "provider_key", "provider_npi", "tax_id", "provider_name", "specialty",
+                "provider_type", "network_status", "city", "state"
+            ])
+        else:
+            provider_df = pd.DataFrame(
                 {
-                    "provider_key": idx,
-                    "provider_npi": info["npi"],
-                    "tax_id": info["tax_id"],
-                    "provider_name": info["name"],
-                    "specialty": info["specialty"],
-                    "provider_type": info["provider_type"],
-                    "network_status": info["network_status"],
-                    "city": info["city"],
-                    "state": info["state"],
+                    "provider_key": range(1, len(providers) + 1),
+                    "provider_npi": providers["npi"],
+                    "tax_id": providers["tax_id"],
+                    "provider_name": providers["name"],
+                    "specialty": providers["specialty"],
+                    "provider_type": providers["provider_type"],
+                    "network_status": providers["network_status"],
+                    "city": providers["city"],
+                    "state": providers["state"],
                 }
             )
 
-        # Build facility DataFrame
-        facility_records = []
-        for idx, (_npi, info) in enumerate(sorted(facility_npis.items()), start=1):
-            facility_records.append(
+        if facilities.empty:
+            facility_df = pd.DataFrame(columns=[
+                "facility_key", "facility_npi", "tax_id", "facility_name", "facility_type",
+                "network_status", "city", "state"
+            ])
+        else:
+            facility_df = pd.DataFrame(
                 {
-                    "facility_key": idx,
-                    "facility_npi": info["npi"],
-                    "tax_id": info["tax_id"],
-                    "facility_name": info["name"],
-                    "facility_type": info["specialty"],  # Taxonomy code
-                    "network_status": info["network_status"],
-                    "city": info["city"],
-                    "state": info["state"],
+                    "facility_key": range(1, len(facilities) + 1),
+                    "facility_npi": facilities["npi"],
+                    "tax_id": facilities["tax_id"],
+                    "facility_name": facilities["name"],
+                    "facility_type": facilities["specialty"],  # Taxonomy code
+                    "network_status": facilities["network_status"],
+                    "city": facilities["city"],
+                    "state": facilities["state"],
                 }
             )
 
-        provider_df = pd.DataFrame(provider_records) if provider_records else pd.DataFrame(columns=[
-            "provider_key", "provider_npi", "tax_id", "provider_name", "specialty",
-            "provider_type", "network_status", "city", "state"
-        ])
-
-        facility_df = pd.DataFrame(facility_records) if facility_records else pd.DataFrame(columns=[
-            "facility_key", "facility_npi", "tax_id", "facility_name", "facility_type",
-            "network_status", "city", "state"
-        ])
-
         return provider_df, facility_df
 
     def _build_dim_diagnosis(self) -> pd.DataFrame:
         """Build diagnosis dimension from claim diagnoses."""
-        diagnosis_codes: set[str] = set()
-
-        for claim in self.claims:
-            diagnosis_codes.add(claim.principal_diagnosis)
-            for dx in claim.other_diagnoses:
-                diagnosis_codes.add(dx)
-
-        records = []
-        for idx, code in enumerate(sorted(diagnosis_codes), start=1):
-            records.append(
-                {
-                    "diagnosis_key": idx,
-                    "diagnosis_code": code,
-                    "diagnosis_description": None,  # Would need lookup table
-                    "diagnosis_category": self._get_icd10_category(code),
-                    "code_system": "ICD-10-CM",
-                }
-            )
-
-        if not records:
+        codes = self._diagnosis_keys()
+        if len(codes) == 0:
             return pd.DataFrame(columns=[
                 "diagnosis_key", "diagnosis_code", "diagnosis_description",
                 "diagnosis_category", "code_system"
             ])
 
-        return pd.DataFrame(records)
+        code_column = pd.Series(codes, dtype=object)
+        return pd.DataFrame(
+            {
+                "diagnosis_key": range(1, len(codes) + 1),
+                "diagnosis_code": code_column,
+                "diagnosis_description": None,  # Would need lookup table
+                "diagnosis_category": self.map_unique(code_column, self._get_icd10_category),
+                "code_system": "ICD-10-CM",
+            }
+        )
 
     def _build_dim_procedure(self) -> pd.DataFrame:
         """Build procedure dimension from claim lines."""
-        procedure_codes: set[str] = set()
-
-        for claim in self.claims:
-            for line in claim.claim_lines:
-                procedure_codes.add(line.procedure_code)
-
-        records = []
-        for idx, code in enumerate(sorted(procedure_codes), start=1):
-            records.append(
-                {
-                    "procedure_key": idx,
-                    "procedure_code": code,
-                    "procedure_description": None,  # Would need lookup table
-                    "code_system": self._infer_procedure_code_system(code),
-                }
-            )
-
-        if not records:
+        codes = self._procedure_keys()
+        if len(codes) == 0:
             return pd.DataFrame(columns=[
                 "procedure_key", "procedure_code", "procedure_description", "code_system"
             ])
 
-        return pd.DataFrame(records)
+        code_column = pd.Series(codes, dtype=object)
+        return pd.DataFrame(
+            {
+                "procedure_key": range(1, len(codes) + 1),
+                "procedure_code": code_column,
+                "procedure_description": None,  # Would need lookup table
+                "code_system": self.map_unique(code_column, self._infer_procedure_code_system),
+            }
+        )
 
     def _build_dim_service_category(self) -> pd.DataFrame:
         """Build service category dimension from place of service codes."""
-        pos_codes: set[str] = set()
-
-        for claim in self.claims:
-            pos_codes.add(claim.place_of_service)
-            for line in claim.claim_lines:
-                pos_codes.add(line.place_of_service)
-
-        records = []
-        for idx, code in enumerate(sorted(pos_codes), start=1):
-            description = PLACE_OF_SERVICE_CODES.get(code, "Unknown")
-            category = self._get_service_category(code)
-            records.append(
-                {
-                    "service_category_key": idx,
-                    "place_of_service_code": code,
-                    "place_of_service_description": description,
-                    "service_category": category,
-                }
-            )
-
-        if not records:
+        codes = self._service_category_keys()
+        if len(codes) == 0:
             return pd.DataFrame(columns=[
                 "service_category_key", "place_of_service_code",
                 "place_of_service_description", "service_category"
             ])
 
-        return pd.DataFrame(records)
+        code_column = pd.Series(codes, dtype=object)
+        return pd.DataFrame(
+            {
+                "service_category_key": range(1, len(codes) + 1),
+                "place_of_service_code": code_column,
+                "place_of_service_description": self.map_unique(
+                    code_column, lambda code: PLACE_OF_SERVICE_CODES.get(code, "Unknown")
+                ),
+                "service_category": self.map_unique(code_column, self._get_service_category),
+            }
+        )
 
     # -------------------------------------------------------------------------
     # Fact Builders
@@ -424,203 +518,279 @@ class MemberSimDimensionalTransformer(BaseDimensionalTransformer):
 
     def _build_fact_claims(self) -> pd.DataFrame:
         """Build claim line-level fact table (claim line explosion)."""
-        # Build lookups
-        provider_lookup = self._build_provider_lookup()
-        facility_lookup = self._build_facility_lookup()
-        diagnosis_lookup = self._build_diagnosis_lookup()
-        procedure_lookup = self._build_procedure_lookup()
-        service_category_lookup = self._build_service_category_lookup()
-
-        records = []
-        fact_key = 0
-
-        for claim in self.claims:
-            # Get payment if available
-            payment = self._payment_lookup.get(claim.claim_id)
-
-            # Build line payment lookup
-            line_payment_lookup: dict[int, dict] = {}
-            if payment:
-                for lp in payment.line_payments:
-                    line_payment_lookup[lp.line_number] = {
-                        "charged_amount": float(lp.charged_amount),
-                        "allowed_amount": float(lp.allowed_amount),
-                        "paid_amount": float(lp.paid_amount),
-                        "deductible_amount": float(lp.deductible_amount),
-                        "copay_amount": float(lp.copay_amount),
-                        "coinsurance_amount": float(lp.coinsurance_amount),
-                        "member_responsibility": float(lp.patient_responsibility),
-                        "adjustment_reason": lp.adjustment_reason,
-                    }
-
-            # One row per claim LINE (claim line explosion)
-            for line in claim.claim_lines:
-                fact_key += 1
-
-                # Get line payment details if available
-                line_pay = line_payment_lookup.get(line.line_number, {})
-
-                # Get primary diagnosis key (first diagnosis pointer, usually 1)
-                primary_dx_idx = line.diagnosis_pointers[0] - 1 if line.diagnosis_pointers else 0
-                all_dx = claim.all_diagnoses
-                primary_dx = (
-                    all_dx[primary_dx_idx]
-                    if primary_dx_idx < len(all_dx)
-                    else claim.principal_diagnosis
-                )
-
-                records.append(
-                    {
-                        "claim_fact_key": fact_key,
-                        "claim_id": claim.claim_id,
-                        "claim_line_number": line.line_number,
-                        "member_key": claim.member_id,
-                        "subscriber_key": claim.subscriber_id,
-                        "provider_key": provider_lookup.get(claim.provider_npi, -1),
-                        "facility_key": (
-                            facility_lookup.get(claim.facility_npi, -1)
-                            if claim.facility_npi
-                            else None
-                        ),
-                        "diagnosis_key": diagnosis_lookup.get(primary_dx, -1),
-                        "procedure_key": procedure_lookup.get(line.procedure_code, -1),
-                        "service_category_key": service_category_lookup.get(
-                            line.place_of_service, -1
-                        ),
-                        "service_date_key": self.date_to_key(line.service_date),
-                        "service_date": line.service_date,
-                        "paid_date_key": (
-                            self.date_to_key(payment.payment_date) if payment else None
-                        ),
-                        "paid_date": payment.payment_date if payment else None,
-                        "claim_type": claim.claim_type,
-                        "place_of_service_code": line.place_of_service,
-                        "revenue_code": line.revenue_code,
-                        "procedure_code": line.procedure_code,
-                        "procedure_modifiers": (
-                            ",".join(line.procedure_modifiers)
-                            if line.procedure_modifiers
-                            else None
-                        ),
-                        "ndc_code": line.ndc_code,
-                        "units": float(line.units),
-                        "line_charge_amount": float(line.charge_amount * line.units),
-                        "charged_amount": line_pay.get("charged_amount"),
-                        "allowed_amount": line_pay.get("allowed_amount"),
-                        "paid_amount": line_pay.get("paid_amount"),
-                        "deductible_amount": line_pay.get("deductible_amount"),
-                        "copay_amount": line_pay.get("copay_amount"),
-                        "coinsurance_amount": line_pay.get("coinsurance_amount"),
-                        "member_responsibility": line_pay.get("member_responsibility"),
-                        "adjustment_reason": line_pay.get("adjustment_reason"),
-                        "principal_diagnosis_code": claim.principal_diagnosis,
-                        "authorization_number": claim.authorization_number,
-                    }
-                )
-
-        return pd.DataFrame(records) if records else pd.DataFrame(columns=[
-            "claim_fact_key", "claim_id", "claim_line_number", "member_key",
-            "subscriber_key", "provider_key", "facility_key", "diagnosis_key",
-            "procedure_key", "service_category_key", "service_date_key", "service_date",
-            "paid_date_key", "paid_date", "claim_type", "place_of_service_code",
-            "revenue_code", "procedure_code", "procedure_modifiers", "ndc_code",
-            "units", "line_charge_amount", "charged_amount", "allowed_amount",
-            "paid_amount", "deductible_amount", "copay_amount", "coinsurance_amount",
-            "member_responsibility", "adjustment_reason", "principal_diagnosis_code",
-            "authorization_number"
-        ])
+        lines = self._claim_lines()
+        if lines.empty:
+            return pd.DataFrame(columns=[
+                "claim_fact_key", "claim_id", "claim_line_number", "member_key",
+                "subscriber_key", "provider_key", "facility_key", "diagnosis_key",
+                "procedure_key", "service_category_key", "service_date_key", "service_date",
+                "paid_date_key", "paid_date", "claim_type", "place_of_service_code",
+                "revenue_code", "procedure_code", "procedure_modifiers", "ndc_code",
+                "units", "line_charge_amount", "charged_amount", "allowed_amount",
+                "paid_amount", "deductible_amount", "copay_amount", "coinsurance_amount",
+                "member_responsibility", "adjustment_reason", "principal_diagnosis_code",
+                "authorization_number"
+            ])
+
+        # Claim-level attributes broadcast to their lines
+        claims = self._frame("claims").take(lines["claim_index"]).reset_index(drop=True)
+
+        # Payment for each claim (later payments for the same claim win)
+        payments = self._frame("payments").drop_duplicates("claim_id", keep="last")
+        payment_dates = pd.Series(
+            payments["payment_date"].to_numpy(dtype=object), index=payments["claim_id"]
+        )
+        paid_date = claims["claim_id"].map(payment_dates).astype(object)
+        paid_date = paid_date.where(paid_date.notna(), None)
+
+        # Line payment details joined on (claim_id, line_number)
+        line_pay = lines[["claim_id", "line_number"]].merge(
+            self._line_payments(), on=["claim_id", "line_number"], how="left"
+        )
+        if line_pay["charged_amount"].isna().all():
+            # No line was paid: payment columns are all None
+            line_pay = pd.DataFrame(
+                {column: [None] * len(line_pay) for column in line_pay.columns}, dtype=object
+            )
+        has_facility = claims["facility_npi"].fillna("").astype(bool).to_numpy()
+
+        return pd.DataFrame(
+            {
+                "claim_fact_key": range(1, len(lines) + 1),
+                "claim_id": claims["claim_id"],
+                "claim_line_number": lines["line_number"],
+                "member_key": claims["member_id"],
+                "subscriber_key": claims["subscriber_id"],
+                "provider_key": self.lookup_keys(claims["provider_npi"], self._provider_keys()),
+                "facility_key": self.nullable_ints(
+                    self.lookup_keys(claims["facility_npi"], self._facility_keys()), has_facility
+                ),
+                "diagnosis_key": self.lookup_keys(
+                    lines["primary_diagnosis"], self._diagnosis_keys()
+                ),
+                "procedure_key": self.lookup_keys(lines["procedure_code"], self._procedure_keys()),
+                "service_category_key": self.lookup_keys(
+                    lines["place_of_service"], self._service_category_keys()
+                ),
+                "service_date_key": self.dates_to_keys(lines["service_date"]),
+                "service_date": lines["service_date"],
+                "paid_date_key": self.dates_to_keys(paid_date),
+                "paid_date": paid_date,
+                "claim_type": claims["claim_type"],
+                "place_of_service_code": lines["place_of_service"],
+                "revenue_code": lines["revenue_code"],
+                "procedure_code": lines["procedure_code"],
+                "procedure_modifiers": lines["procedure_modifiers"],
+                "ndc_code": lines["ndc_code"],
+                "units": lines["units"].astype(float),
+                "line_charge_amount": (lines["charge_amount"] * lines["units"]).astype(float),
+                "charged_amount": line_pay["charged_amount"],
+                "allowed_amount": line_pay["allowed_amount"],
+                "paid_amount": line_pay["paid_amount"],
+                "deductible_amount": line_pay["deductible_amount"],
+                "copay_amount": line_pay["copay_amount"],
+                "coinsurance_amount": line_pay["coinsurance_amount"],
+                "member_responsibility": line_pay["member_responsibility"],
+                "adjustment_reason": line_pay["adjustment_reason"],
+                "principal_diagnosis_code": claims["principal_diagnosis"],
+                "authorization_number": claims["authorization_number"],
+            }
+        )
 
     def _build_fact_eligibility_spans(self) -> pd.DataFrame:
         """Build eligibility spans fact table."""
-        plan_lookup = self._build_plan_lookup()
-
-        records = []
-        for idx, member in enumerate(self.members, start=1):
-            coverage_start = member.coverage_start
-            coverage_end = member.coverage_end or self.snapshot_date
-
-            # Calculate coverage days
-            coverage_days = (coverage_end - coverage_start).days + 1
-
-            records.append(
-                {
-                    "eligibility_span_key": idx,
-                    "member_key": member.member_id,
-                    "plan_key": plan_lookup.get(member.plan_code, -1),
-                    "effective_date_key": self.date_to_key(coverage_start),
-                    "effective_date": coverage_start,
-                    "termination_date_key": (
-                        self.date_to_key(coverage_end) if member.coverage_end else None
-                    ),
-                    "termination_date": member.coverage_end,
-                    "coverage_days": coverage_days,
-                    "is_active": member.is_active,
-                    "group_id": member.group_id,
-                    "relationship_code": member.relationship_code,
-                }
-            )
+        df = self._frame("members")
+        if df.empty:
+            return pd.DataFrame(columns=[
+                "eligibility_span_key", "member_key", "plan_key", "effective_date_key",
+                "effective_date", "termination_date_key", "termination_date",
+                "coverage_days", "is_active", "group_id", "relationship_code"
+            ])
 
-        return pd.DataFrame(records) if records else pd.DataFrame(columns=[
-            "eligibility_span_key", "member_key", "plan_key", "effective_date_key",
-            "effective_date", "termination_date_key", "termination_date",
-            "coverage_days", "is_active", "group_id", "relationship_code"
-        ])
+        # Open-ended coverage is measured through the snapshot date
+        coverage_start = pd.to_datetime(df["coverage_start"])
+        coverage_end = pd.to_datetime(df["coverage_end"]).fillna(
+            pd.Timestamp(self.snapshot_date)
+        )
+
+        # Later plans with a duplicate plan_code take the key
+        plans = self._frame("plans")
+        plan_keys = pd.Series(range(1, len(plans) + 1), index=plans["plan_code"], dtype="int64")
+        plan_keys = plan_keys[~plan_keys.index.duplicated(keep="last")]
+
+        return pd.DataFrame(
+            {
+                "eligibility_span_key": range(1, len(df) + 1),
+                "member_key": df["member_id"],
+                "plan_key": df["plan_code"].map(plan_keys).fillna(-1).astype("int64"),
+                "effective_date_key": self.dates_to_keys(df["coverage_start"]),
+                "effective_date": df["coverage_start"],
+                "termination_date_key": self.dates_to_keys(df["coverage_end"]),
+                "termination_date": df["coverage_end"],
+                "coverage_days": (coverage_end - coverage_start).dt.days + 1,
+                "is_active": df["is_active"],
+                "group_id": df["group_id"],
+                "relationship_code": df["relationship_code"],
+            }
+        )
 
     # -------------------------------------------------------------------------
-    # Lookup Builders
+    # Key Builders
     # -------------------------------------------------------------------------
 
-    def _build_provider_lookup(self) -> dict[str, int]:
-        """Build provider NPI to key lookup."""
-        provider_npis: set[str] = set()
-        for provider in self.providers:
-            if provider.provider_type != "FACILITY":
-                provider_npis.add(provider.npi)
-        for claim in self.claims:
-            if claim.provider_npi:
-                provider_npis.add(claim.provider_npi)
-        return {npi: idx for idx, npi in enumerate(sorted(provider_npis), start=1)}
-
-    def _build_facility_lookup(self) -> dict[str, int]:
-        """Build facility NPI to key lookup."""
-        facility_npis: set[str] = set()
-        for provider in self.providers:
-            if provider.provider_type == "FACILITY":
-                facility_npis.add(provider.npi)
-        for claim in self.claims:
-            if claim.facility_npi:
-                facility_npis.add(claim.facility_npi)
-        return {npi: idx for idx, npi in enumerate(sorted(facility_npis), start=1)}
-
-    def _build_diagnosis_lookup(self) -> dict[str, int]:
-        """Build diagnosis code to key lookup."""
-        diagnosis_codes: set[str] = set()
-        for claim in self.claims:
-            diagnosis_codes.add(claim.principal_diagnosis)
-            for dx in claim.other_diagnoses:
-                diagnosis_codes.add(dx)
-        return {code: idx for idx, code in enumerate(sorted(diagnosis_codes), start=1)}
-
-    def _build_procedure_lookup(self) -> dict[str, int]:
-        """Build procedure code to key lookup."""
-        procedure_codes: set[str] = set()
-        for claim in self.claims:
-            for line in claim.claim_lines:
-                procedure_codes.add(line.procedure_code)
-        return {code: idx for idx, code in enumerate(sorted(procedure_codes), start=1)}
-
-    def _build_service_category_lookup(self) -> dict[str, int]:
-        """Build place of service code to key lookup."""
-        pos_codes: set[str] = set()
-        for claim in self.claims:
-            pos_codes.add(claim.place_of_service)
-            for line in claim.claim_lines:
-                pos_codes.add(line.place_of_service)
-        return {code: idx for idx, code in enumerate(sorted(pos_codes), start=1)}
-
-    def _build_plan_lookup(self) -> dict[str, int]:
-        """Build plan code to key lookup."""
-        return {plan.plan_code: idx for idx, plan in enumerate(self.plans, start=1)}
+    def _provider_entries(self, facility: bool) -> pd.DataFrame:
+        """Provider or facility entries keyed by NPI, sorted by NPI.
+
+        Explicit providers supply details (later duplicates win); NPIs seen
+        only on claims get placeholder rows.
+        """
+        df = self._frame("providers")
+        is_facility = (df["provider_type"] == "FACILITY").to_numpy(dtype=bool)
+        explicit = df[is_facility if facility else ~is_facility]
+        explicit = explicit.drop_duplicates("npi", keep="last")
+
+        claim_column = "facility_npi" if facility else "provider_npi"
+        claim_npis = self.sorted_uniques(self._frame("claims")[claim_column], drop_empty=True)
+        claim_npis = claim_npis.difference(pd.Index(explicit["npi"], dtype=object), sort=False)
+        placeholders = pd.DataFrame(
+            {
+                "npi": claim_npis,
+                "tax_id": None,
+                "name": claim_npis,
+                "specialty": None,
+                "provider_type": "FACILITY" if facility else "INDIVIDUAL",
+                "network_status": "UNKNOWN",
+                "city": None,
+                "state": None,
+            }
+        )
+
+        frames = [frame for frame in (explicit[placeholders.columns], placeholders) if len(frame)]
+        if not frames:
+            return placeholders
+        return (
+            pd.concat(frames, ignore_index=True)
+            .infer_objects()
+            .sort_values("npi", kind="stable")
+            .reset_index(drop=True)
+        )
+
+    def _cached(self, name: str, build: Callable[[], pd.DataFrame | pd.Index]) -> Any:
+        """Build a derived frame or key index once per transform."""
+        if name not in self._frame_cache:
+            self._frame_cache[name] = build()
+        return self._frame_cache[name]
+
+    def _provider_keys(self) -> pd.Index:
+        """Sorted individual provider NPIs; provider_key is the 1-based position."""
+        return self._cached(
+            "provider_keys",
+            lambda: pd.Index(self._provider_entries(facility=False)["npi"], dtype=object),
+        )
+
+    def _facility_keys(self) -> pd.Index:
+        """Sorted facility NPIs; facility_key is the 1-based position."""
+        return self._cached(
+            "facility_keys",
+            lambda: pd.Index(self._provider_entries(facility=True)["npi"], dtype=object),
+        )
+
+    def _diagnosis_keys(self) -> pd.Index:
+        """Sorted principal and secondary diagnosis codes across all claims."""
+        claims = self._frame("claims")
+        return self._cached(
+            "diagnosis_keys",
+            lambda: self.sorted_uniques(
+                claims["principal_diagnosis"], claims["other_diagnoses"].explode().dropna()
+            ),
+        )
+
+    def _procedure_keys(self) -> pd.Index:
+        """Sorted procedure codes across all claim lines."""
+        return self._cached(
+            "procedure_keys", lambda: self.sorted_uniques(self._claim_lines()["procedure_code"])
+        )
+
+    def _service_category_keys(self) -> pd.Index:
+        """Sorted place of service codes from claim headers and lines."""
+        return self._cached(
+            "service_category_keys",
+            lambda: self.sorted_uniques(
+                self._frame("claims")["place_of_service"],
+                self._claim_lines()["place_of_service"],
+            ),
+        )
+
+    def _claim_lines(self) -> pd.DataFrame:
+        """Flatten claim lines into one row per line, in claim order."""
+        return self._cached("claim_lines", self._flatten_claim_lines)
+
+    def _flatten_claim_lines(self) -> pd.DataFrame:
+        """One row per claim line with the attributes the fact table needs."""
+        rows = [
+            (
+                claim_index,
+                claim.claim_id,
+                line.line_number,
+                line.procedure_code,
+                ",".join(line.procedure_modifiers) if line.procedure_modifiers else None,
+                line.ndc_code,
+                line.revenue_code,
+                line.place_of_service,
+                line.service_date,
+                line.units,
+                line.charge_amount,
+                self._primary_diagnosis(claim, line),
+            )
+            for claim_index, claim in enumerate(self.claims)
+            for line in claim.claim_lines
+        ]
+        return pd.DataFrame.from_records(
+            rows,
+            columns=[
+                "claim_index", "claim_id", "line_number", "procedure_code",
+                "procedure_modifiers", "ndc_code", "revenue_code", "place_of_service",
+                "service_date", "units", "charge_amount", "primary_diagnosis",
+            ],
+        )
+
+    def _line_payments(self) -> pd.DataFrame:
+        """Flatten line payments into one row per (claim_id, line_number)."""
+        payments: dict[str, Payment] = {p.claim_id: p for p in self.payments}
+        rows = [
+            (
+                claim_id,
+                lp.line_number,
+                lp.charged_amount,
+                lp.allowed_amount,
+                lp.paid_amount,
+                lp.deductible_amount,
+                lp.copay_amount,
+                lp.coinsurance_amount,
+                lp.patient_responsibility,
+                lp.adjustment_reason,
+            )
+            for claim_id, payment in payments.items()
+            for lp in payment.line_payments
+        ]
+        amount_columns = [
+            "charged_amount", "allowed_amount", "paid_amount", "deductible_amount",
+            "copay_amount", "coinsurance_amount", "member_responsibility",
+        ]
+        df = pd.DataFrame.from_records(
+            rows, columns=["claim_id", "line_number", *amount_columns, "adjustment_reason"]
+        )
+        df["line_number"] = df["line_number"].astype("int64")
+        df[amount_columns] = df[amount_columns].astype(float)
+        # A repeated line number within one payment keeps its last entry
+        return df.drop_duplicates(["claim_id", "line_number"], keep="last")
+
+    @staticmethod
+    def _primary_diagnosis(claim: Claim, line: ClaimLine) -> str:
+        """Diagnosis referenced by a line's first pointer (usually 1)."""
+        primary_dx_idx = line.diagnosis_pointers[0] - 1 if line.diagnosis_pointers else 0
+        all_dx = claim.all_diagnoses
+        return all_dx[primary_dx_idx] if primary_dx_idx < len(all_dx) else claim.principal_diagnosis
 
     # -------------------------------------------------------------------------
     # Helper Methods
@@ -628,30 +798,11 @@ class MemberSimDimensionalTransformer(BaseDimensionalTransformer):
 
     def _get_gender_description(self, gender_code: str) -> str:
         """Get human-readable gender description."""
-        descriptions = {
-            "M": "Male",
-            "F": "Female",
-            "MALE": "Male",
-            "FEMALE": "Female",
-            "O": "Other",
-            "U": "Unknown",
-        }
-        return descriptions.get(gender_code, "Unknown")
+        return GENDER_DESCRIPTIONS.get(gender_code, "Unknown")
 
     def _get_relationship_description(self, relationship_code: str) -> str:
         """Get human-readable relationship description."""
-        descriptions = {
-            "18": "Self",
-            "01": "Spouse",
-            "19": "Child",
-            "20": "Employee",
-            "21": "Unknown",
-            "39": "Organ Donor",
-            "40": "Cadaver Donor",
-            "53": "Life Partner",
-            "G8": "Other Relationship",
-        }
-        return descriptions.get(relationship_code, "Other")
+        return RELATIONSHIP_DESCRIPTIONS.get(relationship_code, "Other")
 
     def _get_icd10_category(self, code: str) -> str:
         """Get ICD-10 category from code.
@@ -680,35 +831,7 @@ class MemberSimDimensionalTransformer(BaseDimensionalTransformer):
         if not code:
             return "Unknown"
 
-        first_char = code[0].upper()
-        categories = {
-            "A": "Infectious",
-            "B": "Infectious",
-            "C": "Neoplasm",
-            "D": "Neoplasm/Blood",
-            "E": "Endocrine/Metabolic",
-            "F": "Mental/Behavioral",
-            "G": "Nervous System",
-            "H": "Eye/Ear",
-            "I": "Circulatory",
-            "J": "Respiratory",
-            "K": "Digestive",
-            "L": "Skin",
-            "M": "Musculoskeletal",
-            "N": "Genitourinary",
-            "O": "Pregnancy",
-            "P": "Perinatal",
-            "Q": "Congenital",
-            "R": "Symptoms",
-            "S": "Injury",
-            "T": "Injury/Poisoning",
-            "V": "External Causes",
-            "W": "External Causes",
-            "X": "External Causes",
-            "Y": "External Causes",
-            "Z": "Health Status",
-        }
-        return categories.get(first_char, "Other")
+        return ICD10_CATEGORIES.get(code[0].upper(), "Other")
 
     def _infer_procedure_code_system(self, code: str) -> str:
         """Infer procedure code system from code format.
@@ -738,30 +861,4 @@ class MemberSimDimensionalTransformer(BaseDimensionalTransformer):
 
     def _get_service_category(self, pos_code: str) -> str:
         """Categorize place of service into broader service categories."""
-        inpatient_codes = {"21", "51", "61"}
-        outpatient_codes = {"22", "24", "52", "62"}
-        office_codes = {"11", "02"}
-        er_codes = {"23"}
-        snf_codes = {"31", "32", "33", "34", "54"}
-        home_codes = {"12"}
-        ambulance_codes = {"41", "42"}
-        clinic_codes = {"50", "71", "72"}
-
-        if pos_code in inpatient_codes:
-            return "Inpatient"
-        elif pos_code in outpatient_codes:
-            return "Outpatient"
-        elif pos_code in office_codes:
-            return "Office"
-        elif pos_code in er_codes:
-            return "Emergency"
-        elif pos_code in snf_codes:
-            return "Skilled Nursing"
-        elif pos_code in home_codes:
-            return "Home Health"
-        elif pos_code in ambulance_codes:
-            return "Ambulance"
-        elif pos_code in clinic_codes:
-            return "Clinic"
-        else:
-            return "Other"
+        return SERVICE_CATEGORIES.get(pos_code, "Other")
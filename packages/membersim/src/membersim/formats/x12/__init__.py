@@ -1,50 +1,77 @@
 """X12 EDI transaction formats."""
 
-from membersim.formats.x12.base import X12Config, X12Generator
+from membersim.formats.x12.base import X12Config, X12Generator, X12Writer, X12WriteSummary
+from membersim.formats.x12.bulk import (
+    BulkExportFile,
+    BulkExportManifest,
+    ControlNumberAllocator,
+    export_bulk_edi,
+)
 from membersim.formats.x12.edi_270_271 import (
     EDI270Generator,
     EDI271Generator,
     generate_270,
     generate_271,
+    write_270,
+    write_271,
 )
 from membersim.formats.x12.edi_278 import (
     EDI278RequestGenerator,
     EDI278ResponseGenerator,
     generate_278_request,
     generate_278_response,
+    write_278_requests,
+    write_278_responses,
 )
-from membersim.formats.x12.edi_834 import EDI834Generator, generate_834
-from membersim.formats.x12.edi_835 import EDI835Generator, generate_835
+from membersim.formats.x12.edi_834 import EDI834Generator, generate_834, write_834
+from membersim.formats.x12.edi_835 import EDI835Generator, generate_835, write_835
 from membersim.formats.x12.edi_837 import (
     EDI837IGenerator,
     EDI837PGenerator,
     generate_837i,
     generate_837p,
+    write_837i,
+    write_837p,
 )
 
 __all__ = [
     # Base
     "X12Config",
     "X12Generator",
+    "X12Writer",
+    "X12WriteSummary",
     # 834 Enrollment
     "EDI834Generator",
     "generate_834",
+    "write_834",
     # 837 Claims
     "EDI837PGenerator",
     "EDI837IGenerator",
     "generate_837p",
     "generate_837i",
+    "write_837p",
+    "write_837i",
     # 835 Remittance
     "EDI835Generator",
     "generate_835",
+    "write_835",
     # 270/271 Eligibility
     "EDI270Generator",
     "EDI271Generator",
     "generate_270",
     "generate_271",
+    "write_270",
+    "write_271",
     # 278 Prior Authorization
     "EDI278RequestGenerator",
     "EDI278ResponseGenerator",
     "generate_278_request",
     "generate_278_response",
+    "write_278_requests",
+    "write_278_responses",
+    # Bulk export
+    "ControlNumberAllocator",
+    "BulkExportFile",
+    "BulkExportManifest",
+    "export_bulk_edi",
 ]
@@ -0,0 +1,5 @@
+"""Bulk X12 export command: python -m membersim.formats.x12 --help"""
+
+from membersim.formats.x12.bulk import main
+
+main()
@@ -1,6 +1,10 @@
 """Base classes for X12 EDI generation."""
 
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from datetime import datetime
+from itertools import islice
+from typing import Any, TextIO
 
 from pydantic import BaseModel, Field
 
@@ -19,15 +23,36 @@ class X12Config(BaseModel):
     st_control_number: int = Field(1, description="ST02 Transaction Set Control Number")
 
 
+def chunked(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """Split an iterable into lists of at most size items, reading it lazily."""
+    if size < 1:
+        raise ValueError("size must be at least 1")
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
 class X12Generator:
-    """Base class for X12 transaction generators."""
+    """Base class for X12 transaction generators.
+
+    Subclasses set FUNCTIONAL_ID and TRANSACTION_CODE and implement _body(),
+    which emits the segments between ST and SE. generate() wraps the body in a
+    single ISA/GS/ST envelope in memory; write_transactions() streams any number
+    of transaction sets to a file through an X12Writer.
+    """
 
     ELEMENT_SEPARATOR = "*"
     SEGMENT_TERMINATOR = "~"
 
+    FUNCTIONAL_ID = ""
+    TRANSACTION_CODE = ""
+
     def __init__(self, config: X12Config | None = None):
         self.config = config or X12Config()
         self._segments: list[str] = []
+        self._emit = self._segments.append
+        self._segment_count = 0
+        self._st_position = 0
 
     def _segment(self, *elements) -> str:
         """Create a segment from elements."""
@@ -37,9 +62,10 @@ class X12Generator:
 
     def _add(self, *elements) -> None:
         """Add a segment to the transaction."""
-        self._segments.append(self._segment(*elements))
+        self._emit(self._segment(*elements))
+        self._segment_count += 1
 
-    def _isa_segment(self, _functional_group_id: str) -> None:
+    def _isa_segment(self, _functional_group_id: str, control_number: int | None = None) -> None:
         """Generate ISA Interchange Control Header."""
         now = datetime.now()
         self._add(
@@ -56,13 +82,15 @@ class X12Generator:
             now.strftime("%H%M"),  # Time
             "^",  # Repetition Separator
             "00501",  # Version
-            str(self.config.isa_control_number).zfill(9),
+            str(self._control(control_number, self.config.isa_control_number)).zfill(9),
             "0",  # Acknowledgment Requested
             "P",  # Usage Indicator (P=Production)
             ":",  # Component Separator
         )
 
-    def _gs_segment(self, functional_id: str, sender: str, receiver: str) -> None:
+    def _gs_segment(
+        self, functional_id: str, sender: str, receiver: str, control_number: int | None = None
+    ) -> None:
         """Generate GS Functional Group Header."""
         now = datetime.now()
         self._add(
@@ -72,34 +100,92 @@ class X12Generator:
             receiver,
             now.strftime("%Y%m%d"),
             now.strftime("%H%M"),
-            str(self.config.gs_control_number),
+            str(self._control(control_number, self.config.gs_control_number)),
             "X",
             "005010X220A1",
         )
 
-    def _st_segment(self, transaction_code: str) -> None:
+    def _st_segment(self, transaction_code: str, control_number: int | None = None) -> None:
         """Generate ST Transaction Set Header."""
+        self._st_position = self._segment_count
         self._add(
             "ST",
             transaction_code,
-            str(self.config.st_control_number).zfill(4),
+            str(self._control(control_number, self.config.st_control_number)).zfill(4),
         )
 
-    def _se_segment(self) -> None:
+    def _se_segment(self, control_number: int | None = None) -> None:
         """Generate SE Transaction Set Trailer."""
         # Count segments from ST to SE (inclusive)
-        segment_count = len(
-            [s for s in self._segments if s.startswith("ST") or not s.startswith(("ISA", "GS"))]
+        segment_count = self._segment_count - self._st_position + 1
+        self._add(
+            "SE",
+            str(segment_count),
+            str(self._control(control_number, self.config.st_control_number)).zfill(4),
         )
-        self._add("SE", str(segment_count + 1), str(self.config.st_control_number).zfill(4))
 
-    def _ge_segment(self) -> None:
+    def _ge_segment(self, transaction_count: int = 1, control_number: int | None = None) -> None:
         """Generate GE Functional Group Trailer."""
-        self._add("GE", "1", str(self.config.gs_control_number))
+        self._add(
+            "GE",
+            str(transaction_count),
+            str(self._control(control_number, self.config.gs_control_number)),
+        )
 
-    def _iea_segment(self) -> None:
+    def _iea_segment(self, group_count: int = 1, control_number: int | None = None) -> None:
         """Generate IEA Interchange Control Trailer."""
-        self._add("IEA", "1", str(self.config.isa_control_number).zfill(9))
+        self._add(
+            "IEA",
+            str(group_count),
+            str(self._control(control_number, self.config.isa_control_number)).zfill(9),
+        )
+
+    @staticmethod
+    def _control(control_number: int | None, default: int) -> int:
+        """Use an explicit control number, falling back to the configured one."""
+        return default if control_number is None else control_number
+
+    def _body(self, *args: Any, **kwargs: Any) -> None:
+        """Generate the segments between ST and SE."""
+        raise NotImplementedError
+
+    def _build(self, *args: Any, **kwargs: Any) -> str:
+        """Generate one transaction set in a single interchange."""
+        self.reset()
+
+        self._isa_segment(self.FUNCTIONAL_ID)
+        self._gs_segment(self.FUNCTIONAL_ID, self.config.sender_id, self.config.receiver_id)
+        self._st_segment(self.TRANSACTION_CODE)
+
+        self._body(*args, **kwargs)
+
+        self._se_segment()
+        self._ge_segment()
+        self._iea_segment()
+
+        return self.to_string()
+
+    def write_transactions(
+        self,
+        sink: TextIO,
+        transactions: Iterable[tuple],
+        transactions_per_interchange: int | None = None,
+    ) -> "X12WriteSummary":
+        """Stream transaction sets to a file.
+
+        Args:
+            sink: Text file (or any object with write()) to write to
+            transactions: Argument tuples, one per transaction set, passed to _body()
+            transactions_per_interchange: Start a new ISA/GS envelope after this
+                many transaction sets (None for a single envelope)
+
+        Returns:
+            Counts of what was written
+        """
+        with X12Writer(sink, self, transactions_per_interchange) as writer:
+            for args in transactions:
+                writer.write_transaction(*args)
+        return writer.summary
 
     def to_string(self) -> str:
         """Convert segments to X12 string."""
@@ -108,3 +194,151 @@ class X12Generator:
     def reset(self) -> None:
         """Clear segments for new transaction."""
         self._segments = []
+        self._emit = self._segments.append
+        self._segment_count = 0
+        self._st_position = 0
+
+
+class X12WriteSummary(BaseModel):
+    """Counts from a streamed X12 file."""
+
+    interchanges: int = 0
+    transactions: int = 0
+    segments: int = 0
+
+
+class X12Writer:
+    """Write X12 transaction sets to a text sink as they are generated.
+
+    Segments go straight to the sink, so memory use does not grow with the
+    file. Each transaction set gets its own ST/SE pair; a new ISA/GS envelope
+    is started every transactions_per_interchange sets. Control numbers count
+    up from the generator's X12Config.
+
+    If generating a transaction set fails, its ST is left without an SE and
+    no trailers are written, so the output stays visibly truncated; the
+    writer refuses further transactions.
+
+    Example:
+        >>> generator = EDI837PGenerator()
+        >>> with open("claims.x12", "w") as f, X12Writer(f, generator, 1000) as writer:
+        ...     for chunk in claim_chunks:
+        ...         writer.write_transaction(chunk)
+    """
+
+    def __init__(
+        self,
+        sink: TextIO,
+        generator: X12Generator,
+        transactions_per_interchange: int | None = None,
+    ):
+        if transactions_per_interchange is not None and transactions_per_interchange < 1:
+            raise ValueError("transactions_per_interchange must be at least 1")
+
+        self.sink = sink
+        self.generator = generator
+        self.transactions_per_interchange = transactions_per_interchange
+        self.interchanges = 0
+        self.transactions = 0
+        self.segments = 0
+
+        config = generator.config
+        self._isa_control_number = config.isa_control_number
+        self._gs_control_number = config.gs_control_number
+        self._st_control_number = config.st_control_number
+        self._open_transactions: int | None = None
+        self._failed = False
+        self._separator = ""
+
+    @property
+    def summary(self) -> X12WriteSummary:
+        """Counts of what has been written so far."""
+        return X12WriteSummary(
+            interchanges=self.interchanges, transactions=self.transactions, segments=self.segments
+        )
+
+    def __enter__(self) -> "X12Writer":
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *exc_info: object) -> None:
+        if exc_type is None:
+            self.close()
+
+    def _write(self, segment: str) -> None:
+        """Write one segment to the sink."""
+        self.sink.write(self._separator + segment)
+        self._separator = "\n"
+        self.segments += 1
+
+    def _open_interchange(self) -> None:
+        """Write ISA and GS headers."""
+        generator = self.generator
+        generator._isa_segment(generator.FUNCTIONAL_ID, self._isa_control_number)
+        generator._gs_segment(
+            generator.FUNCTIONAL_ID,
+            generator.config.sender_id,
+            generator.config.receiver_id,
+            self._gs_control_number,
+        )
+        self._open_transactions = 0
+        self.interchanges += 1
+
+    def _close_interchange(self) -> None:
+        """Write GE and IEA trailers for the open envelope."""
+        generator = self.generator
+        generator._ge_segment(self._open_transactions, self._gs_control_number)
+        generator._iea_segment(1, self._isa_control_number)
+        self._isa_control_number += 1
+        self._gs_control_number += 1
+        self._open_transactions = None
+
+    @contextmanager
+    def _to_sink(self) -> Iterator[None]:
+        """Route the generator's segments to the sink."""
+        generator = self.generator
+        emit = generator._emit
+        generator._emit = self._write
+        try:
+            yield
+        finally:
+            generator._emit = emit
+
+    def write_transaction(self, *args: Any, **kwargs: Any) -> None:
+        """Generate one transaction set and write it.
+
+        Args:
+            *args: Passed to the generator's _body()
+            **kwargs: Passed to the generator's _body()
+        """
+        if self._failed:
+            raise ValueError("an earlier transaction set failed; the output is truncated")
+        generator = self.generator
+        control_number = self._st_control_number
+
+        with self._to_sink():
+            if (
+                self._open_transactions is not None
+                and self._open_transactions == self.transactions_per_interchange
+            ):
+                self._close_interchange()
+            if self._open_transactions is None:
+                self._open_interchange()
+
+            self._failed = True
+            generator._st_segment(generator.TRANSACTION_CODE, control_number)
+            generator._body(*args, **kwargs)
+            generator._se_segment(control_number)
+            self._failed = False
+
+        self._st_control_number += 1
+        self._open_transactions += 1
+        self.transactions += 1
+
+    def close(self) -> None:
+        """Close the open envelope, if any. Does not close the sink.
+
+        Nothing is written after a failed transaction set.
+        """
+        if self._open_transactions is not None and not self._failed:
+            with self._to_sink():
+                self._close_interchange()
@@ -0,0 +1,526 @@
+"""Parallel bulk X12 export from the canonical DuckDB tables.
+
+Reads members or claims of one cohort in chunks, renders each chunk as its own
+ISA/GS interchange in a process pool, and writes one gzip-compressed file per
+chunk plus a manifest.json index. Interchange control numbers come from a single
+ControlNumberAllocator, so they are unique across all files of an export (and
+across exports that share the allocator).
+
+Example:
+    >>> conn = get_read_only_connection()
+    >>> manifest = export_bulk_edi(conn, "837P", "out/837p", cohort_id="cohort-1")
+    >>> manifest.files[0].path
+    '837p_000000001.x12.gz'
+
+Or from the command line:
+    python -m membersim.formats.x12 --cohort cohort-1 --type 837P --out out/837p
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import os
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from healthsim.person import Address, Gender, PersonName
+from pydantic import BaseModel, Field
+
+from membersim.claims.claim import Claim, ClaimLine
+from membersim.claims.payment import LinePayment, Payment
+from membersim.core.member import Member
+from membersim.formats.x12.base import X12Config, chunked
+from membersim.formats.x12.edi_834 import EDI834Generator
+from membersim.formats.x12.edi_835 import EDI835Generator
+from membersim.formats.x12.edi_837 import EDI837IGenerator, EDI837PGenerator
+
+if TYPE_CHECKING:
+    from duckdb import DuckDBPyConnection
+
+# ISA13 is nine digits
+MAX_CONTROL_NUMBER = 999_999_999
+
+MANIFEST_NAME = "manifest.json"
+
+GENERATORS = {
+    "834": EDI834Generator,
+    "835": EDI835Generator,
+    "837P": EDI837PGenerator,
+    "837I": EDI837IGenerator,
+}
+
+# claims.claim_type for each claim transaction
+_CLAIM_TYPES = {"837P": "PROFESSIONAL", "837I": "INSTITUTIONAL"}
+
+# Dates and amounts are read as text, which DuckDB hands to Python several times
+# faster than date and Decimal objects; the models parse them in the workers
+_MEMBERS_SQL = """
+    SELECT id, member_id, subscriber_id, relationship_code, given_name, middle_name,
+        family_name, birth_date::VARCHAR, gender, street_address, city, state, postal_code,
+        group_id, plan_code, coverage_start::VARCHAR, coverage_end::VARCHAR, pcp_npi
+    FROM members
+    {where}
+    ORDER BY member_id
+"""
+
+_CLAIMS_SQL = """
+    SELECT claim_id, claim_type, member_id, subscriber_id, provider_npi, facility_npi,
+        service_date::VARCHAR, admission_date::VARCHAR, discharge_date::VARCHAR,
+        place_of_service, principal_diagnosis, other_diagnoses, authorization_number
+    FROM claims c
+    {where}
+    ORDER BY claim_id
+"""
+
+# Lines of the claims selected by _CLAIMS_SQL, in the same claim order
+_CLAIM_LINES_SQL = """
+    SELECT claim_id, line_number, procedure_code, procedure_modifiers,
+        service_date::VARCHAR, units::VARCHAR, charge_amount::VARCHAR,
+        allowed_amount::VARCHAR, paid_amount::VARCHAR, diagnosis_pointers, revenue_code,
+        ndc_code, place_of_service
+    FROM claim_lines
+    WHERE claim_id IN (SELECT claim_id FROM claims c {where})
+    ORDER BY claim_id, line_number
+"""
+
+_GENDERS = {gender.value: gender for gender in Gender}
+
+
+class ControlNumberAllocator:
+    """Hand out interchange control numbers from one increasing sequence.
+
+    Each allocated number is used as both the ISA13 and GS06 of one interchange.
+    Allocation happens in the exporting process, so workers never need to
+    coordinate.
+    """
+
+    def __init__(self, start: int = 1):
+        if not 1 <= start <= MAX_CONTROL_NUMBER:
+            raise ValueError(f"start must be between 1 and {MAX_CONTROL_NUMBER}")
+        self._next = start
+
+    @property
+    def next_number(self) -> int:
+        """The number the next allocate() call returns."""
+        return self._next
+
+    def allocate(self) -> int:
+        """Take the next control number."""
+        number = self._next
+        if number > MAX_CONTROL_NUMBER:
+            raise ValueError("interchange control numbers exhausted")
+        self._next += 1
+        return number
+
+
+class BulkExportFile(BaseModel):
+    """One interchange file of a bulk export."""
+
+    path: str = Field(..., description="File name within the output directory")
+    control_number: int = Field(..., description="ISA13/GS06 of the interchange")
+    first_key: str = Field(..., description="First member_id or claim_id in the file")
+    last_key: str = Field(..., description="Last member_id or claim_id in the file")
+    items: int = Field(..., description="Members, claims or payments in the file")
+    transactions: int = Field(..., description="ST/SE transaction sets")
+    segments: int = Field(..., description="Segments including envelopes")
+    bytes: int = Field(..., description="Compressed file size")
+
+
+class BulkExportManifest(BaseModel):
+    """Index of the files written by a bulk export."""
+
+    transaction: str
+    cohort_id: str | None = None
+    created_at: datetime
+    items: int = 0
+    transactions: int = 0
+    segments: int = 0
+    bytes: int = 0
+    next_control_number: int = Field(..., description="First unused control number")
+    files: list[BulkExportFile] = Field(default_factory=list)
+
+
+class _Chunk(NamedTuple):
+    """Work for one worker: the rows of one interchange and where to write it."""
+
+    transaction: str
+    rows: list[Any]
+    path: str
+    config: X12Config
+    items_per_transaction: int
+    compresslevel: int
+    payment_date: date
+
+
+def _json_list(value: str | None) -> list:
+    """Parse a JSON array column, treating NULL as empty."""
+    return json.loads(value) if value else []
+
+
+def _member(row: tuple) -> Member:
+    """Build a Member from a _MEMBERS_SQL row."""
+    (
+        person_id,
+        member_id,
+        subscriber_id,
+        relationship_code,
+        given_name,
+        middle_name,
+        family_name,
+        birth_date,
+        gender,
+        street_address,
+        city,
+        state,
+        postal_code,
+        group_id,
+        plan_code,
+        coverage_start,
+        coverage_end,
+        pcp_npi,
+    ) = row
+    return Member(
+        id=person_id,
+        name=PersonName(given_name=given_name, middle_name=middle_name, family_name=family_name),
+        birth_date=birth_date,
+        gender=_GENDERS.get((gender or "U")[:1].upper(), Gender.UNKNOWN),
+        address=Address(
+            street_address=street_address, city=city, state=state, postal_code=postal_code
+        )
+        if street_address or city
+        else None,
+        member_id=member_id,
+        subscriber_id=subscriber_id,
+        relationship_code=relationship_code or "18",
+        group_id=group_id,
+        coverage_start=coverage_start,
+        coverage_end=coverage_end,
+        plan_code=plan_code,
+        pcp_npi=pcp_npi,
+    )
+
+
+def _claim(header: tuple, lines: list[tuple]) -> Claim:
+    """Build a Claim from a claim header and its line columns."""
+    return Claim(
+        claim_id=header[0],
+        claim_type=header[1].upper(),
+        member_id=header[2],
+        subscriber_id=header[3] or header[2],
+        provider_npi=header[4],
+        facility_npi=header[5],
+        service_date=header[6],
+        admission_date=header[7],
+        discharge_date=header[8],
+        place_of_service=header[9] or "11",
+        principal_diagnosis=header[10],
+        other_diagnoses=_json_list(header[11]),
+        authorization_number=header[12],
+        claim_lines=[
+            ClaimLine(
+                line_number=line[0],
+                procedure_code=line[1],
+                procedure_modifiers=_json_list(line[2]),
+                service_date=line[3],
+                units=line[4] or "1",
+                charge_amount=line[5],
+                diagnosis_pointers=_json_list(line[8]) or [1],
+                revenue_code=line[9],
+                ndc_code=line[10],
+                place_of_service=line[11] or "11",
+            )
+            for line in lines
+        ],
+    )
+
+
+def _payment(header: tuple, lines: list[tuple], payment_date: date, check_number: str) -> Payment:
+    """Build a Payment from the adjudicated amounts on a claim's lines."""
+    line_payments = []
+    for line in lines:
+        charged = Decimal(line[5])
+        allowed = Decimal(line[6]) if line[6] is not None else charged
+        paid = Decimal(line[7]) if line[7] is not None else Decimal("0")
+        line_payments.append(
+            LinePayment(
+                line_number=line[0],
+                charged_amount=charged,
+                allowed_amount=allowed,
+                paid_amount=paid,
+                # Canonical lines don't split the member share; report it as coinsurance
+                coinsurance_amount=max(allowed - paid, Decimal("0")),
+            )
+        )
+    return Payment(
+        payment_id=f"PAY-{header[0]}",
+        claim_id=header[0],
+        payment_date=payment_date,
+        check_number=check_number,
+        line_payments=line_payments,
+    )
+
+
+def _member_key(row: tuple) -> str:
+    """member_id of a _MEMBERS_SQL row."""
+    return row[1]
+
+
+def _claim_key(item: tuple[tuple, list[tuple]]) -> str:
+    """claim_id of a (header, lines) pair."""
+    return item[0][0]
+
+
+def _render_chunk(chunk: _Chunk) -> tuple[int, int, int]:
+    """Write one chunk as a gzip-compressed interchange.
+
+    Returns:
+        Transaction sets, segments and compressed bytes written
+    """
+    if chunk.transaction == "834":
+        items = [_member(row) for row in chunk.rows]
+    elif chunk.transaction == "835":
+        check_number = str(chunk.config.isa_control_number).zfill(9)
+        items = [
+            _payment(header, lines, chunk.payment_date, check_number)
+            for header, lines in chunk.rows
+        ]
+    else:
+        items = [_claim(header, lines) for header, lines in chunk.rows]
+
+    generator = GENERATORS[chunk.transaction](chunk.config)
+    with gzip.open(chunk.path, "wt", encoding="utf-8", compresslevel=chunk.compresslevel) as sink:
+        summary = generator.write_transactions(
+            sink, ((batch,) for batch in chunked(items, chunk.items_per_transaction))
+        )
+    return summary.transactions, summary.segments, Path(chunk.path).stat().st_size
+
+
+def _member_rows(
+    conn: DuckDBPyConnection, cohort_id: str | None, chunk_size: int
+) -> Iterator[list[tuple]]:
+    """Yield member rows in member_id order, chunk_size at a time."""
+    where, parameters = ("", [])
+    if cohort_id is not None:
+        where, parameters = "WHERE cohort_id = ?", [cohort_id]
+    cursor = conn.execute(_MEMBERS_SQL.format(where=where), parameters)
+    while rows := cursor.fetchmany(chunk_size):
+        yield rows
+
+
+def _claim_rows(
+    conn: DuckDBPyConnection,
+    cohort_id: str | None,
+    chunk_size: int,
+    claim_type: str | None = None,
+    paid_only: bool = False,
+) -> Iterator[list[tuple[tuple, list[tuple]]]]:
+    """Yield (header, lines) pairs in claim_id order, chunk_size claims at a time."""
+    conditions, parameters = [], []
+    if cohort_id is not None:
+        conditions.append("c.cohort_id = ?")
+        parameters.append(cohort_id)
+    if claim_type:
+        conditions.append("upper(c.claim_type) = ?")
+        parameters.append(claim_type)
+    if paid_only:
+        conditions.append("c.total_paid IS NOT NULL")
+    where = "WHERE " + " AND ".join(conditions) if conditions else ""
+
+    # Headers and lines are both sorted by claim_id, so they merge in one pass
+    headers = conn.cursor()
+    line_cursor = conn.cursor()
+    try:
+        headers.execute(_CLAIMS_SQL.format(where=where), parameters)
+        line_cursor.execute(_CLAIM_LINES_SQL.format(where=where), parameters)
+        lines = _fetch_all(line_cursor, chunk_size)
+        line = next(lines, None)
+        while rows := headers.fetchmany(chunk_size):
+            chunk = []
+            for header in rows:
+                claim_lines = []
+                while line is not None and line[0] == header[0]:
+                    claim_lines.append(line[1:])
+                    line = next(lines, None)
+                chunk.append((header, claim_lines))
+            yield chunk
+    finally:
+        headers.close()
+        line_cursor.close()
+
+
+def _fetch_all(cursor: DuckDBPyConnection, batch_size: int) -> Iterator[tuple]:
+    """Yield a cursor's rows, fetching batch_size at a time."""
+    while rows := cursor.fetchmany(batch_size):
+        yield from rows
+
+
+def export_bulk_edi(
+    conn: DuckDBPyConnection,
+    transaction: str,
+    output_dir: str | Path,
+    cohort_id: str | None = None,
+    chunk_size: int = 50_000,
+    items_per_transaction: int = 5_000,
+    max_workers: int | None = None,
+    allocator: ControlNumberAllocator | None = None,
+    config: X12Config | None = None,
+    payment_date: date | None = None,
+    compresslevel: int = 6,
+) -> BulkExportManifest:
+    """Export a cohort's members, claims or payments as gzip-compressed X12 files.
+
+    Args:
+        conn: DuckDB connection to the canonical database
+        transaction: "834", "835", "837P" or "837I"
+        output_dir: Directory for the files and manifest.json (created if missing)
+        cohort_id: Only export this cohort (None for the whole table)
+        chunk_size: Members or claims per interchange file
+        items_per_transaction: Members or claims per ST/SE transaction set
+        max_workers: Worker processes (defaults to the CPU count)
+        allocator: Source of interchange control numbers (a new one starting at
+            the config's isa_control_number by default)
+        config: Sender and receiver identifiers
+        payment_date: Payment date for 835 remittance (defaults to today)
+        compresslevel: gzip compression level
+
+    Returns:
+        The manifest, also written to output_dir/manifest.json
+
+    Raises:
+        ValueError: If the transaction type is not supported
+    """
+    transaction = transaction.upper()
+    if transaction not in GENERATORS:
+        raise ValueError(f"Unsupported transaction {transaction!r}; use one of {list(GENERATORS)}")
+    if chunk_size < 1 or items_per_transaction < 1:
+        raise ValueError("chunk_size and items_per_transaction must be at least 1")
+
+    config = config or X12Config()
+    allocator = allocator or ControlNumberAllocator(config.isa_control_number)
+    payment_date = payment_date or date.today()
+    output = Path(output_dir)
+    output.mkdir(parents=True, exist_ok=True)
+
+    if transaction == "834":
+        chunks: Iterator[list] = _member_rows(conn, cohort_id, chunk_size)
+        key = _member_key
+    else:
+        key = _claim_key
+        chunks = _claim_rows(
+            conn,
+            cohort_id,
+            chunk_size,
+            claim_type=_CLAIM_TYPES.get(transaction),
+            paid_only=transaction == "835",
+        )
+
+    manifest = BulkExportManifest(
+        transaction=transaction,
+        cohort_id=cohort_id,
+        created_at=datetime.now(),
+        next_control_number=allocator.next_number,
+    )
+
+    def collect(future: Future, file: BulkExportFile) -> None:
+        file.transactions, file.segments, file.bytes = future.result()
+        manifest.files.append(file)
+        manifest.items += file.items
+        manifest.transactions += file.transactions
+        manifest.segments += file.segments
+        manifest.bytes += file.bytes
+
+    workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Bound the chunks held in memory to a couple per worker
+        in_flight: deque[tuple[Future, BulkExportFile]] = deque()
+        for rows in chunks:
+            number = allocator.allocate()
+            name = f"{transaction.lower()}_{number:09d}.x12.gz"
+            file = BulkExportFile(
+                path=name,
+                control_number=number,
+                first_key=key(rows[0]),
+                last_key=key(rows[-1]),
+                items=len(rows),
+                transactions=0,
+                segments=0,
+                bytes=0,
+            )
+            chunk = _Chunk(
+                transaction=transaction,
+                rows=rows,
+                path=str(output / name),
+                config=config.model_copy(
+                    update={
+                        "isa_control_number": number,
+                        "gs_control_number": number,
+                        "st_control_number": 1,
+                    }
+                ),
+                items_per_transaction=items_per_transaction,
+                compresslevel=compresslevel,
+                payment_date=payment_date,
+            )
+            in_flight.append((executor.submit(_render_chunk, chunk), file))
+            if len(in_flight) >= 2 * workers:
+                collect(*in_flight.popleft())
+        while in_flight:
+            collect(*in_flight.popleft())
+
+    manifest.next_control_number = allocator.next_number
+    (output / MANIFEST_NAME).write_text(manifest.model_dump_json(indent=2))
+    return manifest
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command-line entry point for bulk EDI export."""
+    from healthsim.db import DEFAULT_DB_PATH, get_read_only_connection
+
+    parser = argparse.ArgumentParser(
+        description="Export a cohort as gzip-compressed X12 interchange files"
+    )
+    parser.add_argument("--type", required=True, choices=list(GENERATORS), help="Transaction")
+    parser.add_argument("--out", required=True, type=Path, help="Output directory")
+    parser.add_argument("--cohort", help="Cohort ID (default: all rows)")
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB_PATH, help="DuckDB database")
+    parser.add_argument("--chunk-size", type=int, default=50_000, help="Items per file")
+    parser.add_argument(
+        "--items-per-transaction", type=int, default=5_000, help="Items per ST/SE set"
+    )
+    parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument(
+        "--start-control-number", type=int, default=1, help="First ISA/GS control number"
+    )
+    parser.add_argument("--sender-id", default="MEMBERSIM", help="ISA06 sender ID")
+    parser.add_argument("--receiver-id", default="RECEIVER", help="ISA08 receiver ID")
+    args = parser.parse_args(argv)
+
+    conn = get_read_only_connection(args.db)
+    conn.execute("SET enable_progress_bar = false")
+    try:
+        manifest = export_bulk_edi(
+            conn,
+            args.type,
+            args.out,
+            cohort_id=args.cohort,
+            chunk_size=args.chunk_size,
+            items_per_transaction=args.items_per_transaction,
+            max_workers=args.workers,
+            allocator=ControlNumberAllocator(args.start_control_number),
+            config=X12Config(sender_id=args.sender_id, receiver_id=args.receiver_id),
+        )
+    finally:
+        conn.close()
+
+    print(
+        f"Wrote {manifest.items:,} items in {len(manifest.files):,} files "
+        f"({manifest.bytes / (1024 * 1024):.1f} MB) to {args.out}"
+    )
+    print(f"Next control number: {manifest.next_control_number}")
@@ -1,16 +1,21 @@
 """X12 270/271 Eligibility Inquiry and Response generators."""
 
+from collections.abc import Iterable
 from datetime import date
+from typing import TextIO
 
 from membersim.core.accumulator import Accumulator
 from membersim.core.member import Member
 from membersim.core.plan import Plan
-from membersim.formats.x12.base import X12Config, X12Generator
+from membersim.formats.x12.base import X12Config, X12Generator, X12WriteSummary
 
 
 class EDI270Generator(X12Generator):
     """Generate X12 270 Eligibility Inquiry."""
 
+    FUNCTIONAL_ID = "HS"
+    TRANSACTION_CODE = "270"
+
     def generate(
         self,
         member: Member,
@@ -18,12 +23,16 @@ class EDI270Generator(X12Generator):
         service_type: str = "30",  # Health Benefit Plan Coverage
     ) -> str:
         """Generate 270 eligibility inquiry."""
-        self.reset()
-        svc_date = service_date or date.today()
+        return self._build(member, service_date, service_type)
 
-        self._isa_segment("HS")
-        self._gs_segment("HS", self.config.sender_id, self.config.receiver_id)
-        self._st_segment("270")
+    def _body(
+        self,
+        member: Member,
+        service_date: date | None = None,
+        service_type: str = "30",
+    ) -> None:
+        """Generate 270 inquiry segments for one member."""
+        svc_date = service_date or date.today()
 
         # BHT - Beginning of Hierarchical Transaction
         self._add(
@@ -77,16 +86,13 @@ class EDI270Generator(X12Generator):
         # EQ - Eligibility Inquiry
         self._add("EQ", service_type)
 
-        self._se_segment()
-        self._ge_segment()
-        self._iea_segment()
-
-        return self.to_string()
-
 
 class EDI271Generator(X12Generator):
     """Generate X12 271 Eligibility Response."""
 
+    FUNCTIONAL_ID = "HB"
+    TRANSACTION_CODE = "271"
+
     def generate(
         self,
         member: Member,
@@ -95,12 +101,17 @@ class EDI271Generator(X12Generator):
         is_eligible: bool = True,
     ) -> str:
         """Generate 271 eligibility response."""
-        self.reset()
-        today = date.today()
+        return self._build(member, plan, accumulator, is_eligible)
 
-        self._isa_segment("HB")
-        self._gs_segment("HB", self.config.sender_id, self.config.receiver_id)
-        self._st_segment("271")
+    def _body(
+        self,
+        member: Member,
+        plan: Plan,
+        accumulator: Accumulator | None = None,
+        is_eligible: bool = True,
+    ) -> None:
+        """Generate 271 response segments for one member."""
+        today = date.today()
 
         # BHT
         self._add(
@@ -173,12 +184,6 @@ class EDI271Generator(X12Generator):
             # Inactive/Ineligible
             self._add("EB", "6", "IND", "30")  # Inactive
 
-        self._se_segment()
-        self._ge_segment()
-        self._iea_segment()
-
-        return self.to_string()
-
 
 def generate_270(
     member: Member,
@@ -198,3 +203,32 @@ def generate_271(
 ) -> str:
     """Generate 271 eligibility response."""
     return EDI271Generator(config).generate(member, plan, accumulator, is_eligible)
+
+
+def write_270(
+    members: Iterable[Member],
+    sink: TextIO,
+    service_date: date | None = None,
+    transactions_per_interchange: int | None = None,
+    config: X12Config | None = None,
+) -> X12WriteSummary:
+    """Stream 270 eligibility inquiries to a file, one transaction set per member."""
+    return EDI270Generator(config).write_transactions(
+        sink,
+        ((member, service_date) for member in members),
+        transactions_per_interchange,
+    )
+
+
+def write_271(
+    responses: Iterable[tuple[Member, Plan, Accumulator | None, bool]],
+    sink: TextIO,
+    transactions_per_interchange: int | None = None,
+    config: X12Config | None = None,
+) -> X12WriteSummary:
+    """Stream 271 eligibility responses to a file.
+
+    Each item is a (member, plan, accumulator, is_eligible) tuple and becomes
+    one transaction set.
+    """
+    return EDI271Generator(config).write_transactions(sink, responses, transactions_per_interchange)
@@ -1,21 +1,25 @@
 """X12 278 Healthcare Services Review - Prior Authorization."""
 
+from collections.abc import Iterable
 from datetime import date
+from typing import TextIO
 
 from membersim.authorization.prior_auth import Authorization
-from membersim.formats.x12.base import X12Config, X12Generator
+from membersim.formats.x12.base import X12Config, X12Generator, X12WriteSummary
 
 
 class EDI278RequestGenerator(X12Generator):
     """Generate X12 278 Prior Authorization Request."""
 
+    FUNCTIONAL_ID = "HI"
+    TRANSACTION_CODE = "278"
+
     def generate(self, auth: Authorization) -> str:
         """Generate 278 request transaction."""
-        self.reset()
+        return self._build(auth)
 
-        self._isa_segment("HS")
-        self._gs_segment("HI", self.config.sender_id, self.config.receiver_id)
-        self._st_segment("278")
+    def _body(self, auth: Authorization) -> None:
+        """Generate 278 request segments for one authorization."""
 
         # BHT - Beginning of Hierarchical Transaction
         self._add(
@@ -63,23 +67,19 @@ class EDI278RequestGenerator(X12Generator):
         for proc in auth.procedure_codes:
             self._add("SV1", f"HC:{proc}", "", "UN", "1")
 
-        self._se_segment()
-        self._ge_segment()
-        self._iea_segment()
-
-        return self.to_string()
-
 
 class EDI278ResponseGenerator(X12Generator):
     """Generate X12 278 Prior Authorization Response."""
 
+    FUNCTIONAL_ID = "HI"
+    TRANSACTION_CODE = "278"
+
     def generate(self, auth: Authorization) -> str:
         """Generate 278 response transaction."""
-        self.reset()
+        return self._build(auth)
 
-        self._isa_segment("HB")
-        self._gs_segment("HI", self.config.sender_id, self.config.receiver_id)
-        self._st_segment("278")
+    def _body(self, auth: Authorization) -> None:
+        """Generate 278 response segments for one authorization."""
 
         # BHT
         decision_date = auth.decision_date or date.today()
@@ -130,12 +130,6 @@ class EDI278ResponseGenerator(X12Generator):
         if auth.approved_units and auth.status in ["APPROVED", "MODIFIED"]:
             self._add("HSD", "VS", str(auth.approved_units))
 
-        self._se_segment()
-        self._ge_segment()
-        self._iea_segment()
-
-        return self.to_string()
-
 
 def generate_278_request(auth: Authorization, config: X12Config | None = None) -> str:
     """Generate 278 authorization request."""
@@ -145,3 +139,27 @@ def generate_278_request(auth: Authorization, config: X12Config | None = None) -
 def generate_278_response(auth: Authorization, config: X12Config | None = None) -> str:
     """Generate 278 authorization response."""
     return EDI278ResponseGenerator(config).generate(auth)
+
+
+def write_278_requests(
+    auths: Iterable[Authorization],
+    sink: TextIO,
+    transactions_per_interchange: int | None = None,
+    config: X12Config | None = None,
+) -> X12WriteSummary:
+    """Stream 278 requests to a file, one transaction set per authorization."""
+    return EDI278RequestGenerator(config).write_transactions(
+        sink, ((auth,) for auth in auths), transactions_per_interchange
+    )
+
+
+def write_278_responses(
+    auths: Iterable[Authorization],
+    sink: TextIO,
+    transactions_per_interchange: int | None = None,
+    config: X12Config | None = None,
+) -> X12WriteSummary:
+    """Stream 278 responses to a file, one transaction set per authorization."""
+    return EDI278ResponseGenerator(config).write_transactions(
+        sink, ((auth,) for auth in auths), transactions_per_interchange
+    )
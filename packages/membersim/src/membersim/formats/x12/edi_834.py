@@ -1,14 +1,19 @@
 """X12 834 Benefit Enrollment generator."""
 
+from collections.abc import Iterable
 from datetime import date
+from typing import TextIO
 
 from membersim.core.member import Member
-from membersim.formats.x12.base import X12Config, X12Generator
+from membersim.formats.x12.base import X12Config, X12Generator, X12WriteSummary, chunked
 
 
 class EDI834Generator(X12Generator):
     """Generate X12 834 Benefit Enrollment transactions."""
 
+    FUNCTIONAL_ID = "BE"
+    TRANSACTION_CODE = "834"
+
     def __init__(self, config: X12Config | None = None):
         super().__init__(config)
 
@@ -29,13 +34,15 @@ class EDI834Generator(X12Generator):
         Returns:
             X12 834 transaction string
         """
-        self.reset()
-
-        # Envelope
-        self._isa_segment("BE")
-        self._gs_segment("BE", self.config.sender_id, self.config.receiver_id)
-        self._st_segment("834")
+        return self._build(members, maintenance_type, group_id)
 
+    def _body(
+        self,
+        members: list[Member],
+        maintenance_type: str = "021",
+        group_id: str | None = None,
+    ) -> None:
+        """Generate 834 header and member loops."""
         # BGN - Beginning Segment
         today_str = date.today().strftime("%Y%m%d")
         self._add("BGN", "00", f"REF{today_str}", today_str)
@@ -48,13 +55,6 @@ class EDI834Generator(X12Generator):
         for member in members:
             self._generate_member_loop(member, maintenance_type, group_id)
 
-        # Trailers
-        self._se_segment()
-        self._ge_segment()
-        self._iea_segment()
-
-        return self.to_string()
-
     def _generate_member_loop(
         self,
         member: Member,
@@ -148,3 +148,19 @@ def generate_834(
     """Convenience function to generate 834."""
     generator = EDI834Generator(config)
     return generator.generate(members, maintenance_type)
+
+
+def write_834(
+    members: Iterable[Member],
+    sink: TextIO,
+    maintenance_type: str = "021",
+    members_per_transaction: int = 5000,
+    transactions_per_interchange: int | None = None,
+    config: X12Config | None = None,
+) -> X12WriteSummary:
+    """Stream 834 enrollment to a file, one transaction set per chunk of members."""
+    return EDI834Generator(config).write_transactions(
+        sink,
+        ((chunk, maintenance_type) for chunk in chunked(members, members_per_transaction)),
+        transactions_per_interchange,
+    )
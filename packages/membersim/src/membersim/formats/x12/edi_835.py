@@ -1,23 +1,26 @@
 """X12 835 Healthcare Claim Payment/Remittance generator."""
 
+from collections.abc import Iterable
 from datetime import date
 from decimal import Decimal
+from typing import TextIO
 
 from membersim.claims.payment import Payment
-from membersim.formats.x12.base import X12Config, X12Generator
+from membersim.formats.x12.base import X12Config, X12Generator, X12WriteSummary, chunked
 
 
 class EDI835Generator(X12Generator):
     """Generate X12 835 Remittance Advice."""
 
+    FUNCTIONAL_ID = "HP"
+    TRANSACTION_CODE = "835"
+
     def generate(self, payments: list[Payment]) -> str:
         """Generate 835 remittance for payments."""
-        self.reset()
-
-        self._isa_segment("HP")
-        self._gs_segment("HP", self.config.sender_id, self.config.receiver_id)
-        self._st_segment("835")
+        return self._build(payments)
 
+    def _body(self, payments: list[Payment]) -> None:
+        """Generate 835 header and claim payment loops."""
         # BPR - Financial Information
         total_amount = sum(p.total_paid for p in payments)
         today = date.today()
@@ -61,12 +64,6 @@ class EDI835Generator(X12Generator):
         for payment in payments:
             self._generate_payment_loop(payment)
 
-        self._se_segment()
-        self._ge_segment()
-        self._iea_segment()
-
-        return self.to_string()
-
     def _generate_payment_loop(self, payment: Payment) -> None:
         """Generate CLP loop for a payment."""
 
@@ -117,3 +114,18 @@ class EDI835Generator(X12Generator):
 def generate_835(payments: list[Payment], config: X12Config | None = None) -> str:
     """Convenience function for 835 generation."""
     return EDI835Generator(config).generate(payments)
+
+
+def write_835(
+    payments: Iterable[Payment],
+    sink: TextIO,
+    payments_per_transaction: int = 5000,
+    transactions_per_interchange: int | None = None,
+    config: X12Config | None = None,
+) -> X12WriteSummary:
+    """Stream 835 remittance to a file, one transaction set per chunk of payments."""
+    return EDI835Generator(config).write_transactions(
+        sink,
+        ((chunk,) for chunk in chunked(payments, payments_per_transaction)),
+        transactions_per_interchange,
+    )
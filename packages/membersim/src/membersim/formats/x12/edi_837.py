@@ -1,23 +1,25 @@
 """X12 837 Healthcare Claim generators."""
 
+from collections.abc import Iterable
 from datetime import date
+from typing import TextIO
 
 from membersim.claims.claim import Claim
-from membersim.formats.x12.base import X12Config, X12Generator
+from membersim.formats.x12.base import X12Config, X12Generator, X12WriteSummary, chunked
 
 
 class EDI837PGenerator(X12Generator):
     """Generate X12 837P Professional Claims."""
 
+    FUNCTIONAL_ID = "HC"
+    TRANSACTION_CODE = "837"
+
     def generate(self, claims: list[Claim]) -> str:
         """Generate 837P for professional claims."""
-        self.reset()
-
-        # Envelope
-        self._isa_segment("HC")
-        self._gs_segment("HC", self.config.sender_id, self.config.receiver_id)
-        self._st_segment("837")
+        return self._build(claims)
 
+    def _body(self, claims: list[Claim]) -> None:
+        """Generate 837P header and claim loops."""
         # BHT - Beginning of Hierarchical Transaction
         today = date.today()
         self._add(
@@ -41,13 +43,6 @@ class EDI837PGenerator(X12Generator):
         for idx, claim in enumerate(claims, 1):
             self._generate_claim_loop(claim, idx)
 
-        # Trailers
-        self._se_segment()
-        self._ge_segment()
-        self._iea_segment()
-
-        return self.to_string()
-
     def _generate_claim_loop(self, claim: Claim, hl_id: int) -> None:
         """Generate 2000A/B/C loops for a claim."""
 
@@ -115,17 +110,18 @@ class EDI837PGenerator(X12Generator):
 class EDI837IGenerator(X12Generator):
     """Generate X12 837I Institutional Claims."""
 
+    FUNCTIONAL_ID = "HC"
+    TRANSACTION_CODE = "837"
+
     def generate(self, claims: list[Claim]) -> str:
         """Generate 837I for institutional claims."""
-        self.reset()
+        return self._build(claims)
 
+    def _body(self, claims: list[Claim]) -> None:
+        """Generate 837I header and claim loops."""
         # Similar structure to 837P but with institutional segments
         # SV2 instead of SV1, revenue codes, etc.
 
-        self._isa_segment("HC")
-        self._gs_segment("HC", self.config.sender_id, self.config.receiver_id)
-        self._st_segment("837")
-
         # BHT
         today = date.today()
         self._add(
@@ -148,12 +144,6 @@ class EDI837IGenerator(X12Generator):
         for idx, claim in enumerate(claims, 1):
             self._generate_institutional_claim(claim, idx)
 
-        self._se_segment()
-        self._ge_segment()
-        self._iea_segment()
-
-        return self.to_string()
-
     def _generate_institutional_claim(self, claim: Claim, hl_id: int) -> None:
         """Generate institutional claim loops."""
         # HL levels
@@ -220,3 +210,33 @@ def generate_837p(claims: list[Claim], config: X12Config | None = None) -> str:
 def generate_837i(claims: list[Claim], config: X12Config | None = None) -> str:
     """Convenience function for 837I generation."""
     return EDI837IGenerator(config).generate(claims)
+
+
+def write_837p(
+    claims: Iterable[Claim],
+    sink: TextIO,
+    claims_per_transaction: int = 5000,
+    transactions_per_interchange: int | None = None,
+    config: X12Config | None = None,
+) -> X12WriteSummary:
+    """Stream 837P claims to a file, one transaction set per chunk of claims."""
+    return EDI837PGenerator(config).write_transactions(
+        sink,
+        ((chunk,) for chunk in chunked(claims, claims_per_transaction)),
+        transactions_per_interchange,
+    )
+
+
+def write_837i(
+    claims: Iterable[Claim],
+    sink: TextIO,
+    claims_per_transaction: int = 5000,
+    transactions_per_interchange: int | None = None,
+    config: X12Config | None = None,
+) -> X12WriteSummary:
+    """Stream 837I claims to a file, one transaction set per chunk of claims."""
+    return EDI837IGenerator(config).write_transactions(
+        sink,
+        ((chunk,) for chunk in chunked(claims, claims_per_transaction)),
+        transactions_per_interchange,
+    )
@@ -0,0 +1,134 @@
+"""Tests for the MemberSim in-database dimensional transformer."""
+
+from datetime import date
+
+import pytest
+from healthsim.db import DatabaseConnection
+
+from membersim.dimensional import MemberSimInDatabaseTransformer
+
+
+@pytest.fixture
+def conn(tmp_path):
+    """Canonical database with one MemberSim cohort."""
+    db = DatabaseConnection(tmp_path / "test.duckdb")
+    conn = db.connect()
+    conn.execute("INSERT INTO cohorts (id, name) VALUES ('c-1', 'commercial')")
+    conn.execute(
+        """
+        INSERT INTO members (id, member_id, subscriber_id, relationship_code, given_name,
+            family_name, birth_date, gender, group_id, plan_code, coverage_start,
+            coverage_end, cohort_id)
+        VALUES
+            ('p1', 'MEM001', 'MEM001', '18', 'John', 'Doe', '1980-05-01', 'M', 'GRP1',
+             'PPO', '2024-01-01', NULL, 'c-1'),
+            ('p2', 'MEM002', 'MEM001', '19', 'Jane', 'Doe', '2012-02-01', 'F', 'GRP1',
+             'PPO', '2024-01-01', '2024-01-31', 'c-1')
+        """
+    )
+    conn.execute(
+        """
+        INSERT INTO claims (claim_id, claim_type, member_id, subscriber_id, provider_npi,
+            facility_npi, service_date, place_of_service, principal_diagnosis,
+            other_diagnoses, cohort_id)
+        VALUES
+            ('CLM1', 'PROFESSIONAL', 'MEM001', 'MEM001', '2222222222', NULL, '2024-03-01',
+             '11', 'E11.9', '["I10", "Z00.00"]', 'c-1'),
+            ('CLM2', 'INSTITUTIONAL', 'MEM002', 'MEM001', '1111111111', '3333333333',
+             '2024-03-05', '21', 'J44.1', '[]', 'c-1')
+        """
+    )
+    conn.execute(
+        """
+        INSERT INTO claim_lines (id, claim_id, line_number, procedure_code,
+            procedure_modifiers, service_date, units, charge_amount, allowed_amount,
+            paid_amount, diagnosis_pointers, place_of_service, cohort_id)
+        VALUES
+            ('L1', 'CLM1', 1, '99213', '["25"]', '2024-03-01', 1, 150, 100, 80, '[2]', '11',
+             'c-1'),
+            ('L2', 'CLM1', 2, '83036', '[]', '2024-03-01', 2, 20, NULL, NULL, '[]', '11',
+             'c-1'),
+            ('L3', 'CLM2', 1, '0DTJ4ZZ', NULL, '2024-03-05', 1, 9000, 7000, 6500, '[9]', '21',
+             'c-1')
+        """
+    )
+    yield conn
+    db.close()
+
+
+class TestMemberSimInDatabaseTransformer:
+    """Tests for MemberSimInDatabaseTransformer."""
+
+    def test_builds_all_tables(self, conn):
+        counts = MemberSimInDatabaseTransformer(conn, cohort="commercial").build()
+
+        assert counts == {
+            "dim_member": 2,
+            "dim_provider": 2,
+            "dim_facility": 1,
+            "dim_diagnosis": 4,
+            "dim_procedure": 3,
+            "dim_service_category": 2,
+            "fact_claims": 3,
+            "fact_eligibility_spans": 2,
+        }
+
+    def test_dim_member(self, conn):
+        MemberSimInDatabaseTransformer(
+            conn, cohort="commercial", snapshot_date=date(2024, 6, 1)
+        ).build(["dim_member"])
+
+        rows = conn.execute(
+            """
+            SELECT member_key, full_name, gender_description, relationship_description,
+                age_at_snapshot, age_band, is_subscriber
+            FROM analytics.dim_member
+            """
+        ).fetchall()
+        assert rows == [
+            ("MEM001", "John Doe", "Male", "Self", 44, "35-49", True),
+            ("MEM002", "Jane Doe", "Female", "Child", 12, "0-17", False),
+        ]
+
+    def test_fact_claims_lines(self, conn):
+        MemberSimInDatabaseTransformer(conn, cohort="commercial").build()
+
+        rows = conn.execute(
+            """
+            SELECT f.claim_id, f.claim_line_number, f.provider_key, f.facility_key,
+                d.diagnosis_code, f.procedure_modifiers, f.line_charge_amount, f.paid_amount
+            FROM analytics.fact_claims f
+            JOIN analytics.dim_diagnosis d USING (diagnosis_key)
+            ORDER BY f.claim_fact_key
+            """
+        ).fetchall()
+        assert rows == [
+            # Pointer 2 references the first secondary diagnosis
+            ("CLM1", 1, 2, None, "I10", "25", 150.0, 80.0),
+            ("CLM1", 2, 2, None, "E11.9", None, 40.0, None),
+            # Out-of-range pointer falls back to the principal diagnosis
+            ("CLM2", 1, 1, 1, "J44.1", None, 9000.0, 6500.0),
+        ]
+
+    def test_dimension_attributes(self, conn):
+        MemberSimInDatabaseTransformer(conn).build(["dim_procedure", "dim_service_category"])
+
+        procedures = conn.execute(
+            "SELECT procedure_code, code_system FROM analytics.dim_procedure"
+        ).fetchall()
+        assert procedures == [("0DTJ4ZZ", "ICD-10-PCS"), ("83036", "CPT"), ("99213", "CPT")]
+        categories = conn.execute(
+            "SELECT place_of_service_code, place_of_service_description, service_category "
+            "FROM analytics.dim_service_category"
+        ).fetchall()
+        assert categories == [("11", "Office", "Office"), ("21", "Inpatient Hospital", "Inpatient")]
+
+    def test_eligibility_spans(self, conn):
+        MemberSimInDatabaseTransformer(
+            conn, cohort="commercial", snapshot_date=date(2024, 3, 31)
+        ).build(["fact_eligibility_spans"])
+
+        rows = conn.execute(
+            "SELECT member_key, plan_key, coverage_days FROM analytics.fact_eligibility_spans"
+        ).fetchall()
+        assert rows == [("MEM001", -1, 91), ("MEM002", -1, 31)]
@@ -130,6 +130,18 @@ class TestMemberSimDimensionalTransformer:
         assert len(dim_provider) == 1
         assert dim_provider.iloc[0]["provider_npi"] == "1234567890"
 
+    def test_string_columns_dtype(self, sample_member, sample_claim):
+        """Test string columns infer the str dtype, as row-built frames do."""
+        transformer = MemberSimDimensionalTransformer(members=[sample_member], claims=[sample_claim])
+        dimensions, _ = transformer.transform()
+
+        assert dimensions["dim_member"]["age_band"].dtype == "str"
+        assert dimensions["dim_provider"]["provider_npi"].dtype == "str"
+        assert dimensions["dim_provider"]["provider_name"].dtype == "str"
+        assert dimensions["dim_diagnosis"]["diagnosis_code"].dtype == "str"
+        assert dimensions["dim_procedure"]["procedure_code"].dtype == "str"
+        assert dimensions["dim_service_category"]["place_of_service_code"].dtype == "str"
+
     def test_dim_diagnosis_from_claims(self, sample_claim):
         """Test dim_diagnosis is built from claim diagnoses."""
         # Create claim with multiple diagnoses
@@ -1,21 +1,28 @@
 """Tests for X12 EDI format module."""
 
+import io
 from datetime import date
 from decimal import Decimal
 
+import pytest
 from healthsim.person import Address, Gender, PersonName
 
 from membersim import Claim, ClaimLine, Member, Payment, Plan
 from membersim.claims.payment import LinePayment
 from membersim.formats.x12 import (
+    EDI837PGenerator,
     X12Config,
     X12Generator,
+    X12Writer,
     generate_270,
     generate_271,
     generate_834,
     generate_835,
     generate_837i,
     generate_837p,
+    write_270,
+    write_834,
+    write_837p,
 )
 from membersim.network import (
     MEDICARE_BASE_RATES,
@@ -365,6 +372,140 @@ class TestEDI271Generator:
         assert "EB*G*IND*30*" in edi  # OOP max segment
 
 
+# ============================================================================
+# Streaming Writer Tests
+# ============================================================================
+
+
+def _segments(edi: str, segment_id: str) -> list[list[str]]:
+    """Split the segments with the given ID into elements."""
+    return [
+        line.rstrip("~").split("*") for line in edi.split("\n") if line.startswith(segment_id + "*")
+    ]
+
+
+def _transaction_sizes(edi: str) -> list[int]:
+    """Count segments from each ST to its SE, inclusive."""
+    sizes = []
+    in_transaction = False
+    for line in edi.split("\n"):
+        if line.startswith("ST*"):
+            sizes.append(0)
+            in_transaction = True
+        if in_transaction:
+            sizes[-1] += 1
+        if line.startswith("SE*"):
+            in_transaction = False
+    return sizes
+
+
+class TestX12Writer:
+    """Tests for streaming X12 output."""
+
+    def test_single_transaction_matches_generate(self, sample_claim: Claim) -> None:
+        """Test one streamed transaction has the same body as generate()."""
+        sink = io.StringIO()
+        summary = write_837p([sample_claim], sink)
+        edi = generate_837p([sample_claim])
+
+        assert summary.interchanges == 1
+        assert summary.transactions == 1
+
+        def body(text: str) -> list[str]:
+            return [s for s in text.split("\n") if not s.startswith(("ISA", "GS", "BHT"))]
+
+        assert body(sink.getvalue()) == body(edi)
+
+    def test_segment_counts(self, sample_claim: Claim) -> None:
+        """Test each SE counts its own transaction set."""
+        sink = io.StringIO()
+        write_837p([sample_claim] * 5, sink, claims_per_transaction=2)
+        edi = sink.getvalue()
+
+        se_segments = _segments(edi, "SE")
+        st_segments = _segments(edi, "ST")
+        assert len(se_segments) == 3
+        assert [int(se[1]) for se in se_segments] == _transaction_sizes(edi)
+        assert [se[2] for se in se_segments] == [st[2] for st in st_segments]
+        assert [st[2] for st in st_segments] == ["0001", "0002", "0003"]
+
+    def test_splits_envelopes(self, sample_member: Member) -> None:
+        """Test a new ISA/GS envelope starts every N transaction sets."""
+        sink = io.StringIO()
+        config = X12Config(isa_control_number=100, gs_control_number=7)
+        summary = write_270(
+            [sample_member] * 5, sink, transactions_per_interchange=2, config=config
+        )
+        edi = sink.getvalue()
+
+        assert summary.interchanges == 3
+        assert summary.transactions == 5
+        assert summary.segments == len(edi.split("\n"))
+        assert [isa[13] for isa in _segments(edi, "ISA")] == [
+            "000000100",
+            "000000101",
+            "000000102",
+        ]
+        assert [ge[1:] for ge in _segments(edi, "GE")] == [["2", "7"], ["2", "8"], ["1", "9"]]
+        assert [iea[2] for iea in _segments(edi, "IEA")] == [
+            "000000100",
+            "000000101",
+            "000000102",
+        ]
+
+    def test_reads_input_lazily(self, sample_member: Member) -> None:
+        """Test members are consumed chunk by chunk as they are written."""
+        sink = io.StringIO()
+        seen = []
+
+        def members():
+            for _ in range(4):
+                seen.append(sink.tell())
+                yield sample_member
+
+        summary = write_834(members(), sink, members_per_transaction=2)
+
+        assert summary.transactions == 2
+        # The third member is read after the first transaction was written
+        assert seen[2] > seen[1]
+        assert sink.getvalue().endswith("~")
+
+    def test_writer_leaves_generator_usable(self, sample_claim: Claim) -> None:
+        """Test generate() still works after streaming with the same generator."""
+        generator = EDI837PGenerator()
+        with X12Writer(io.StringIO(), generator) as writer:
+            writer.write_transaction([sample_claim])
+
+        edi = generator.generate([sample_claim])
+        assert edi.startswith("ISA*")
+        assert edi.endswith("IEA*1*000000001~")
+
+    def test_failed_transaction_leaves_output_truncated(self, sample_claim: Claim) -> None:
+        """Test a failing transaction set is not wrapped in valid trailers."""
+        sink = io.StringIO()
+        with pytest.raises(AttributeError), X12Writer(sink, EDI837PGenerator()) as writer:
+            writer.write_transaction([sample_claim])
+            writer.write_transaction([None])
+        edi = sink.getvalue()
+
+        assert len(_segments(edi, "ST")) == 2
+        assert len(_segments(edi, "SE")) == 1
+        assert _segments(edi, "GE") == []
+        assert _segments(edi, "IEA") == []
+
+        writer.close()
+        assert sink.getvalue() == edi
+        with pytest.raises(ValueError, match="truncated"):
+            writer.write_transaction([sample_claim])
+
+    def test_empty_input(self) -> None:
+        """Test streaming nothing writes nothing."""
+        sink = io.StringIO()
+        summary = write_837p([], sink)
+        assert sink.getvalue() == ""
+        assert summary.interchanges == 0
+
+
 # ============================================================================
 # Provider Contract Tests
 # ============================================================================
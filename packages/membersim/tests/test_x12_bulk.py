@@ -0,0 +1,164 @@
+"""Tests for parallel bulk X12 export."""
+
+import gzip
+import json
+from datetime import date
+
+import pytest
+from healthsim.db import DatabaseConnection
+
+from membersim.formats.x12 import ControlNumberAllocator, export_bulk_edi
+
+
+@pytest.fixture
+def conn(tmp_path):
+    """Canonical database with five professional claims and three members."""
+    db = DatabaseConnection(tmp_path / "test.duckdb")
+    conn = db.connect()
+    conn.execute(
+        """
+        INSERT INTO members (id, member_id, subscriber_id, relationship_code, given_name,
+            family_name, birth_date, gender, street_address, city, state, postal_code,
+            group_id, plan_code, coverage_start, coverage_end, cohort_id)
+        VALUES
+            ('p1', 'MEM001', 'MEM001', '18', 'John', 'Doe', '1980-05-01', 'male',
+             '1 Main St', 'Springfield', 'IL', '62701', 'GRP1', 'PPO', '2024-01-01', NULL,
+             'c-1'),
+            ('p2', 'MEM002', 'MEM001', '19', 'Jane', 'Doe', '2012-02-01', 'F', NULL, NULL,
+             NULL, NULL, 'GRP1', 'PPO', '2024-01-01', '2024-06-30', 'c-1'),
+            ('p3', 'MEM003', 'MEM003', '18', 'Other', 'Cohort', '1970-01-01', 'M', NULL,
+             NULL, NULL, NULL, 'GRP2', 'HMO', '2024-01-01', NULL, 'c-2')
+        """
+    )
+    conn.execute(
+        """
+        INSERT INTO claims (claim_id, claim_type, member_id, subscriber_id, provider_npi,
+            service_date, principal_diagnosis, other_diagnoses, total_paid, cohort_id)
+        SELECT 'CLM' || i, 'PROFESSIONAL', 'MEM001', 'MEM001', '2222222222',
+            DATE '2024-03-01', 'E11.9', '["I10"]', CASE WHEN i < 4 THEN 80 END, 'c-1'
+        FROM range(1, 6) t(i)
+        """
+    )
+    conn.execute(
+        """
+        INSERT INTO claims (claim_id, claim_type, member_id, provider_npi, service_date,
+            principal_diagnosis, cohort_id)
+        VALUES ('CLM9', 'INSTITUTIONAL', 'MEM002', '1111111111', '2024-03-05', 'J44.1', 'c-1')
+        """
+    )
+    conn.execute(
+        """
+        INSERT INTO claim_lines (id, claim_id, line_number, procedure_code,
+            procedure_modifiers, service_date, units, charge_amount, allowed_amount,
+            paid_amount, diagnosis_pointers, cohort_id)
+        SELECT 'L' || i || '-' || n, 'CLM' || i, n, '99213', '["25"]', DATE '2024-03-01', 1,
+            150, 100, 80, '[1]', 'c-1'
+        FROM range(1, 6) t(i), range(1, 3) s(n)
+        """
+    )
+    yield conn
+    db.close()
+
+
+def _read(path) -> list[str]:
+    with gzip.open(path, "rt") as f:
+        return f.read().split("\n")
+
+
+class TestControlNumberAllocator:
+    """Tests for ControlNumberAllocator."""
+
+    def test_allocates_in_sequence(self):
+        """Test numbers count up from the start."""
+        allocator = ControlNumberAllocator(41)
+        assert [allocator.allocate() for _ in range(3)] == [41, 42, 43]
+        assert allocator.next_number == 44
+
+    def test_rejects_out_of_range(self):
+        """Test start must fit in ISA13."""
+        with pytest.raises(ValueError):
+            ControlNumberAllocator(0)
+        allocator = ControlNumberAllocator(999_999_999)
+        allocator.allocate()
+        with pytest.raises(ValueError):
+            allocator.allocate()
+
+
+class TestExportBulkEdi:
+    """Tests for export_bulk_edi."""
+
+    def test_837p_files_and_manifest(self, conn, tmp_path):
+        """Test claims are split into interchanges with unique control numbers."""
+        out = tmp_path / "out"
+        manifest = export_bulk_edi(
+            conn,
+            "837P",
+            out,
+            cohort_id="c-1",
+            chunk_size=2,
+            items_per_transaction=1,
+            max_workers=2,
+            allocator=ControlNumberAllocator(100),
+        )
+
+        assert [f.path for f in manifest.files] == [
+            "837p_000000100.x12.gz",
+            "837p_000000101.x12.gz",
+            "837p_000000102.x12.gz",
+        ]
+        assert [(f.first_key, f.last_key, f.items) for f in manifest.files] == [
+            ("CLM1", "CLM2", 2),
+            ("CLM3", "CLM4", 2),
+            ("CLM5", "CLM5", 1),
+        ]
+        assert manifest.items == 5
+        assert manifest.transactions == 5
+        assert manifest.next_control_number == 103
+
+        on_disk = json.loads((out / "manifest.json").read_text())
+        assert on_disk["files"][0]["control_number"] == 100
+
+        segments = _read(out / "837p_000000101.x12.gz")
+        assert segments[0].split("*")[13] == "000000101"
+        assert segments[1].split("*")[6] == "101"
+        assert segments[-2] == "GE*2*101~"
+        assert segments[-1] == "IEA*1*000000101~"
+        assert sum(s.startswith("CLM*CLM") for s in segments) == 2
+        assert sum(s.startswith("SV1*HC:99213:25*") for s in segments) == 4
+        assert manifest.segments == sum(len(_read(out / f.path)) for f in manifest.files)
+
+    def test_837i_filters_claim_type(self, conn, tmp_path):
+        """Test 837I only exports institutional claims."""
+        manifest = export_bulk_edi(conn, "837i", tmp_path, max_workers=1)
+
+        assert manifest.items == 1
+        segments = _read(tmp_path / manifest.files[0].path)
+        assert "CLM*CLM9*0*" in "\n".join(segments)
+
+    def test_834_members(self, conn, tmp_path):
+        """Test 834 reads members of the cohort."""
+        manifest = export_bulk_edi(conn, "834", tmp_path, cohort_id="c-1", max_workers=1)
+
+        assert manifest.items == 2
+        text = "\n".join(_read(tmp_path / manifest.files[0].path))
+        assert "NM1*IL*1*Doe*John" in text
+        assert "DMG*D8*19800501*M~" in text
+        assert "N4*Springfield*IL*62701~" in text
+        assert "Cohort" not in text
+
+    def test_835_paid_claims(self, conn, tmp_path):
+        """Test 835 remits only paid claims from line amounts."""
+        manifest = export_bulk_edi(
+            conn, "835", tmp_path, max_workers=1, payment_date=date(2024, 4, 1)
+        )
+
+        assert manifest.items == 3
+        text = "\n".join(_read(tmp_path / manifest.files[0].path))
+        assert "CLP*CLM1*1*300.00*160.00*40.00*12*PAY-CLM1~" in text
+        assert "CAS*PR*2*20.00~" in text
+        assert "TRN*1*000000001*PAYERID~" in text
+
+    def test_unknown_transaction(self, conn, tmp_path):
+        """Test unsupported transaction types are rejected."""
+        with pytest.raises(ValueError, match="Unsupported transaction"):
+            export_bulk_edi(conn, "820", tmp_path)
@@ -7,6 +7,10 @@ This module transforms PatientSim entities (Patient, Encounter, Diagnosis,
 Procedure, Medication, LabResult, VitalSign) into dimension and fact tables
 optimized for analytical queries.
 
+When the canonical data is already stored in DuckDB, the in-database mode
+(PatientInDatabaseTransformer) builds the same tables with CREATE TABLE AS
+SELECT statements for a cohort, without loading rows into Python.
+
 Example:
     >>> from patientsim.core import PatientGenerator
     >>> from patientsim.dimensional import PatientDimensionalTransformer
@@ -42,8 +46,10 @@ See Also:
 
 from __future__ import annotations
 
+from .in_database import PatientInDatabaseTransformer
 from .transformer import PatientDimensionalTransformer
 
 __all__ = [
     "PatientDimensionalTransformer",
+    "PatientInDatabaseTransformer",
 ]
@@ -0,0 +1,367 @@
+"""PatientSim In-Database Dimensional Transformer.
+
+Builds the PatientSim star schema with ``CREATE TABLE AS SELECT`` statements
+against the canonical DuckDB tables, mirroring the tables and columns of
+``PatientDimensionalTransformer`` without moving rows through Python.
+"""
+
+from __future__ import annotations
+
+from healthsim.dimensional import BaseInDatabaseTransformer
+
+from .transformer import GENDER_DESCRIPTIONS, ICD10_CATEGORIES, MORTALITY_KEYWORDS
+
+# Sorted distinct facility names; facility_key is the 1-based position
+_FACILITY_KEYS = """
+    SELECT facility AS facility_name, row_number() OVER (ORDER BY facility) AS facility_key
+    FROM (SELECT DISTINCT facility FROM enc WHERE facility <> '')
+"""
+
+# Sorted distinct attending/admitting provider IDs; provider_key is the 1-based position
+_PROVIDER_KEYS = """
+    SELECT provider_id, row_number() OVER (ORDER BY provider_id) AS provider_key
+    FROM (
+        SELECT attending_physician AS provider_id FROM enc WHERE attending_physician <> ''
+        UNION
+        SELECT admitting_physician FROM enc WHERE admitting_physician <> ''
+    )
+"""
+
+
+def _code_keys(source: str, column: str, key: str) -> str:
+    """Sorted distinct codes of a source column; ``key`` is the 1-based position."""
+    return f"""
+        SELECT {column}, row_number() OVER (ORDER BY {column}) AS {key}
+        FROM (SELECT DISTINCT {column} FROM {{{source}}} WHERE {column} IS NOT NULL)
+    """
+
+
+class PatientInDatabaseTransformer(BaseInDatabaseTransformer):
+    """Build the PatientSim star schema inside DuckDB.
+
+    Reads the canonical patients, encounters, diagnoses, medications,
+    lab_results and vital_signs tables for one cohort and writes the same
+    dimension and fact tables as ``PatientDimensionalTransformer``.
+    Procedures have no canonical table, so dim_procedure and
+    fact_procedures are not built in this mode.
+
+    Example:
+        >>> from healthsim.db import get_connection
+        >>> from patientsim.dimensional import PatientInDatabaseTransformer
+        >>>
+        >>> transformer = PatientInDatabaseTransformer(
+        ...     get_connection(), cohort='diabetes-cohort'
+        ... )
+        >>> row_counts = transformer.build()
+    """
+
+    SOURCE_TABLES = (
+        "patients",
+        "encounters",
+        "diagnoses",
+        "medications",
+        "lab_results",
+        "vital_signs",
+    )
+
+    def table_definitions(self) -> dict[str, str]:
+        """Return the SELECT for each PatientSim dimension and fact table."""
+        return {
+            "dim_patient": self._dim_patient(),
+            "dim_facility": self._dim_facility(),
+            "dim_provider": self._dim_provider(),
+            "dim_diagnosis": self._dim_diagnosis(),
+            "dim_medication": self._dim_medication(),
+            "dim_lab_test": self._dim_lab_test(),
+            "fact_encounters": self._fact_encounters(),
+            "fact_diagnoses": self._fact_diagnoses(),
+            "fact_medications": self._fact_medications(),
+            "fact_lab_results": self._fact_lab_results(),
+            "fact_vitals": self._fact_vitals(),
+        }
+
+    # -------------------------------------------------------------------------
+    # Dimensions
+    # -------------------------------------------------------------------------
+
+    def _dim_patient(self) -> str:
+        age = self.age_sql("birth_date")
+        return f"""
+            SELECT
+                mrn AS patient_key,
+                mrn AS patient_mrn,
+                id AS patient_id,
+                given_name,
+                family_name,
+                concat_ws(' ', nullif(prefix, ''), given_name, nullif(middle_name, ''),
+                          family_name, nullif(suffix, '')) AS full_name,
+                {self.date_key_sql("birth_date")} AS birth_date_key,
+                birth_date,
+                gender AS gender_code,
+                {self.case_sql("gender", GENDER_DESCRIPTIONS, "Unknown")} AS gender_description,
+                race,
+                language,
+                {age} AS age_at_snapshot,
+                {self.age_band_sql(age)} AS age_band,
+                city,
+                state,
+                postal_code
+            FROM {{patients}}
+            ORDER BY source_row
+        """
+
+    def _dim_facility(self) -> str:
+        return f"""
+            WITH enc AS (SELECT * FROM {{encounters}}),
+            facility_keys AS ({_FACILITY_KEYS})
+            SELECT facility_key, facility_name, 'Hospital' AS facility_type
+            FROM facility_keys
+            UNION ALL
+            -- Ensure at least one record for referential integrity
+            SELECT -1, 'Unknown', 'Unknown'
+            WHERE NOT EXISTS (SELECT 1 FROM facility_keys)
+            ORDER BY facility_key
+        """
+
+    def _dim_provider(self) -> str:
+        return f"""
+            WITH enc AS (SELECT * FROM {{encounters}}),
+            provider_keys AS ({_PROVIDER_KEYS})
+            SELECT
+                provider_key,
+                provider_id,
+                provider_id AS provider_name,
+                'Physician' AS provider_type
+            FROM provider_keys
+            UNION ALL
+            -- Ensure at least one record for referential integrity
+            SELECT -1, 'UNKNOWN', 'Unknown', 'Unknown'
+            WHERE NOT EXISTS (SELECT 1 FROM provider_keys)
+            ORDER BY provider_key
+        """
+
+    def _dim_diagnosis(self) -> str:
+        category = self.case_sql("upper(left(code, 1))", ICD10_CATEGORIES, "Other")
+        return f"""
+            SELECT
+                row_number() OVER (ORDER BY code) AS diagnosis_key,
+                code AS diagnosis_code,
+                arg_min_null(description, source_row) AS diagnosis_description,
+                CASE WHEN code = '' THEN 'Unknown' ELSE {category} END AS diagnosis_category,
+                'ICD-10-CM' AS code_system
+            FROM {{diagnoses}}
+            GROUP BY code
+            ORDER BY code
+        """
+
+    def _dim_medication(self) -> str:
+        return """
+            SELECT
+                row_number() OVER (ORDER BY name) AS medication_key,
+                name AS medication_name,
+                arg_min_null(code, source_row) AS medication_code,
+                CASE WHEN arg_min_null(code, source_row) <> '' THEN 'RxNorm' END AS code_system,
+                arg_min_null(indication, source_row) AS indication
+            FROM {medications}
+            GROUP BY name
+            ORDER BY name
+        """
+
+    def _dim_lab_test(self) -> str:
+        return """
+            SELECT
+                row_number() OVER (ORDER BY test_name) AS lab_test_key,
+                test_name,
+                arg_min_null(loinc_code, source_row) AS loinc_code,
+                arg_min_null(unit, source_row) AS unit,
+                arg_min_null(reference_range, source_row) AS reference_range,
+                CASE WHEN arg_min_null(loinc_code, source_row) <> '' THEN 'LOINC' END AS code_system
+            FROM {lab_results}
+            GROUP BY test_name
+            ORDER BY test_name
+        """
+
+    # -------------------------------------------------------------------------
+    # Facts
+    # -------------------------------------------------------------------------
+
+    def _fact_encounters(self) -> str:
+        stay_us = "date_diff('microsecond', e.admission_time, e.discharge_time)"
+        mortality = "|".join(MORTALITY_KEYWORDS)
+        return f"""
+            WITH enc AS (SELECT * FROM {{encounters}}),
+            facility_keys AS ({_FACILITY_KEYS}),
+            provider_keys AS ({_PROVIDER_KEYS}),
+            -- Latest discharge date among the patient's encounters admitted
+            -- strictly earlier (peers at the same instant are excluded)
+            prior AS (
+                SELECT
+                    encounter_id,
+                    patient_mrn,
+                    admission_time,
+                    CAST(admission_time AS DATE) AS admission_date,
+                    max(CAST(discharge_time AS DATE)) OVER (
+                        PARTITION BY patient_mrn ORDER BY admission_time
+                        RANGE BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW EXCLUDE GROUP
+                    ) AS latest_discharge
+                FROM enc
+            ),
+            -- An earlier stay discharged after this admission date hides older
+            -- discharges from the window max; only those rows are joined back
+            overlapped AS (
+                SELECT r.encounter_id, max(CAST(p.discharge_time AS DATE)) AS last_discharge
+                FROM prior r
+                JOIN enc p
+                    ON p.patient_mrn = r.patient_mrn
+                    AND p.admission_time < r.admission_time
+                    AND CAST(p.discharge_time AS DATE) <= r.admission_date
+                WHERE r.latest_discharge > r.admission_date
+                GROUP BY r.encounter_id
+            ),
+            measures AS (
+                SELECT
+                    e.encounter_id,
+                    row_number() OVER (
+                        PARTITION BY e.patient_mrn ORDER BY e.admission_time, e.source_row
+                    ) AS encounter_sequence,
+                    date_diff(
+                        'day',
+                        CASE
+                            WHEN r.latest_discharge <= r.admission_date THEN r.latest_discharge
+                            ELSE o.last_discharge
+                        END,
+                        r.admission_date
+                    ) AS days_since_last_discharge
+                FROM enc e
+                JOIN prior r USING (encounter_id)
+                LEFT JOIN overlapped o USING (encounter_id)
+            )
+            SELECT
+                e.encounter_id AS encounter_key,
+                e.patient_mrn AS patient_key,
+                coalesce(f.facility_key, -1) AS facility_key,
+                coalesce(att.provider_key, -1) AS attending_provider_key,
+                coalesce(adm.provider_key, -1) AS admitting_provider_key,
+                {self.date_key_sql("e.admission_time")} AS admission_date_key,
+                {self.date_key_sql("e.discharge_time")} AS discharge_date_key,
+                e.admission_time AS admission_datetime,
+                e.discharge_time AS discharge_datetime,
+                e.class_code AS encounter_class_code,
+                e.status AS encounter_status_code,
+                e.chief_complaint,
+                e.discharge_disposition,
+                e.department,
+                e.room,
+                e.bed,
+                -- Zero-length stays are reported as missing, like absent discharges
+                nullif(round({stay_us} / 3600000000.0, 2), 0) AS length_of_stay_hours,
+                CAST(floor({stay_us} / 86400000000.0) AS BIGINT) AS length_of_stay_days,
+                m.encounter_sequence,
+                m.days_since_last_discharge,
+                coalesce(m.days_since_last_discharge <= 7, FALSE) AS is_readmission_7_day,
+                coalesce(m.days_since_last_discharge <= 30, FALSE) AS is_readmission_30_day,
+                coalesce(
+                    regexp_matches(lower(e.discharge_disposition), {self.literal(mortality)}),
+                    FALSE
+                ) AS is_mortality
+            FROM enc e
+            JOIN measures m USING (encounter_id)
+            LEFT JOIN facility_keys f ON f.facility_name = e.facility
+            LEFT JOIN provider_keys att ON att.provider_id = e.attending_physician
+            LEFT JOIN provider_keys adm ON adm.provider_id = e.admitting_physician
+            ORDER BY e.source_row
+        """
+
+    def _fact_diagnoses(self) -> str:
+        return f"""
+            WITH diagnosis_keys AS ({_code_keys("diagnoses", "code", "diagnosis_key")})
+            SELECT
+                row_number() OVER (ORDER BY d.source_row) AS diagnosis_fact_key,
+                d.patient_mrn AS patient_key,
+                d.encounter_id AS encounter_key,
+                coalesce(k.diagnosis_key, -1) AS diagnosis_key,
+                {self.date_key_sql("d.diagnosed_date")} AS diagnosed_date_key,
+                {self.date_key_sql("d.resolved_date")} AS resolved_date_key,
+                d.type AS diagnosis_type_code,
+                coalesce(d.type = 'admitting', FALSE) AS is_primary,
+                d.resolved_date IS NOT NULL AS is_resolved
+            FROM {{diagnoses}} d
+            LEFT JOIN diagnosis_keys k USING (code)
+            ORDER BY d.source_row
+        """
+
+    def _fact_medications(self) -> str:
+        return f"""
+            WITH medication_keys AS ({_code_keys("medications", "name", "medication_key")})
+            SELECT
+                row_number() OVER (ORDER BY m.source_row) AS medication_fact_key,
+                m.patient_mrn AS patient_key,
+                m.encounter_id AS encounter_key,
+                coalesce(k.medication_key, -1) AS medication_key,
+                {self.date_key_sql("m.start_date")} AS start_date_key,
+                {self.date_key_sql("m.end_date")} AS end_date_key,
+                m.start_date AS start_datetime,
+                m.end_date AS end_datetime,
+                m.dose,
+                m.route,
+                m.frequency,
+                m.status AS status_code,
+                m.prescriber,
+                coalesce(m.status = 'active', FALSE) AS is_active
+            FROM {{medications}} m
+            LEFT JOIN medication_keys k USING (name)
+            ORDER BY m.source_row
+        """
+
+    def _fact_lab_results(self) -> str:
+        return f"""
+            WITH lab_test_keys AS ({_code_keys("lab_results", "test_name", "lab_test_key")})
+            SELECT
+                row_number() OVER (ORDER BY l.source_row) AS lab_result_fact_key,
+                l.patient_mrn AS patient_key,
+                l.encounter_id AS encounter_key,
+                coalesce(k.lab_test_key, -1) AS lab_test_key,
+                {self.date_key_sql("l.collected_time")} AS collected_date_key,
+                {self.date_key_sql("l.resulted_time")} AS resulted_date_key,
+                l.collected_time AS collected_datetime,
+                l.resulted_time AS resulted_datetime,
+                l.value AS result_value,
+                -- Numeric value to 2 dp; zero and non-numeric values are missing
+                nullif(round(TRY_CAST(trim(l.value) AS DOUBLE), 2), 0) AS result_numeric,
+                l.unit,
+                l.abnormal_flag,
+                l.abnormal_flag IS NOT NULL AS is_abnormal,
+                coalesce(l.abnormal_flag IN ('HH', 'LL', 'A'), FALSE) AS is_critical,
+                l.performing_lab,
+                l.ordering_provider
+            FROM {{lab_results}} l
+            LEFT JOIN lab_test_keys k USING (test_name)
+            ORDER BY l.source_row
+        """
+
+    def _fact_vitals(self) -> str:
+        return f"""
+            SELECT
+                row_number() OVER (ORDER BY source_row) AS vitals_fact_key,
+                patient_mrn AS patient_key,
+                encounter_id AS encounter_key,
+                {self.date_key_sql("observation_time")} AS observation_date_key,
+                observation_time AS observation_datetime,
+                CAST(temperature AS DOUBLE) AS temperature_f,
+                heart_rate AS heart_rate_bpm,
+                respiratory_rate,
+                systolic_bp,
+                diastolic_bp,
+                systolic_bp || '/' || diastolic_bp AS blood_pressure,
+                spo2 AS spo2_pct,
+                CAST(height_cm AS DOUBLE) AS height_cm,
+                CAST(weight_kg AS DOUBLE) AS weight_kg,
+                round(weight_kg / ((height_cm / 100) ^ 2), 1) AS bmi,
+                temperature >= 100.4 AS is_febrile,
+                heart_rate > 100 AS is_tachycardic,
+                systolic_bp < 90 AS is_hypotensive,
+                systolic_bp >= 140 AS is_hypertensive,
+                spo2 < 90 AS is_hypoxic
+            FROM {{vital_signs}}
+            ORDER BY source_row
+        """
@@ -6,9 +6,11 @@ for analytics and BI tools.
 
 from __future__ import annotations
 
+from bisect import bisect_right, insort
 from datetime import date
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 from healthsim.dimensional import BaseDimensionalTransformer
 
@@ -24,11 +26,155 @@ if TYPE_CHECKING:
     )
 
 
+# Gender code descriptions
+GENDER_DESCRIPTIONS = {
+    "M": "Male",
+    "F": "Female",
+    "O": "Other",
+    "U": "Unknown",
+}
+
+# ICD-10-CM category by chapter letter
+ICD10_CATEGORIES = {
+    "A": "Infectious",
+    "B": "Infectious",
+    "C": "Neoplasm",
+    "D": "Neoplasm/Blood",
+    "E": "Endocrine/Metabolic",
+    "F": "Mental/Behavioral",
+    "G": "Nervous System",
+    "H": "Eye/Ear",
+    "I": "Circulatory",
+    "J": "Respiratory",
+    "K": "Digestive",
+    "L": "Skin",
+    "M": "Musculoskeletal",
+    "N": "Genitourinary",
+    "O": "Pregnancy",
+    "P": "Perinatal",
+    "Q": "Congenital",
+    "R": "Symptoms",
+    "S": "Injury",
+    "T": "Injury/Poisoning",
+    "V": "External Causes",
+    "W": "External Causes",
+    "X": "External Causes",
+    "Y": "External Causes",
+    "Z": "Health Status",
+}
+
+# Discharge disposition keywords that indicate mortality
+MORTALITY_KEYWORDS = ("expired", "died", "death", "deceased", "morgue")
+
+
+def _as_wall_time(values: pd.Series) -> pd.Series:
+    """Parse datetimes, dropping any timezone so dates are the local wall date."""
+    parsed = pd.to_datetime(values)
+    return parsed.dt.tz_localize(None) if parsed.dt.tz is not None else parsed
+
+
+# Source attributes extracted (once per transform) for each model list
+_SOURCE_FIELDS: dict[str, dict[str, str]] = {
+    "patients": {
+        "mrn": "mrn",
+        "id": "id",
+        "given_name": "name.given_name",
+        "family_name": "name.family_name",
+        "full_name": "full_name",
+        "birth_date": "birth_date",
+        "gender": "gender",
+        "race": "race",
+        "language": "language",
+        "city": "address.city",
+        "state": "address.state",
+        "postal_code": "address.postal_code",
+    },
+    "encounters": {
+        "encounter_id": "encounter_id",
+        "patient_mrn": "patient_mrn",
+        "facility": "facility",
+        "attending_physician": "attending_physician",
+        "admitting_physician": "admitting_physician",
+        "admission_time": "admission_time",
+        "discharge_time": "discharge_time",
+        "class_code": "class_code",
+        "status": "status",
+        "chief_complaint": "chief_complaint",
+        "discharge_disposition": "discharge_disposition",
+        "department": "department",
+        "room": "room",
+        "bed": "bed",
+    },
+    "diagnoses": {
+        "code": "code",
+        "description": "description",
+        "type": "type",
+        "patient_mrn": "patient_mrn",
+        "encounter_id": "encounter_id",
+        "diagnosed_date": "diagnosed_date",
+        "resolved_date": "resolved_date",
+    },
+    "procedures": {
+        "code": "code",
+        "description": "description",
+        "patient_mrn": "patient_mrn",
+        "encounter_id": "encounter_id",
+        "performed_date": "performed_date",
+        "performer": "performer",
+        "location": "location",
+    },
+    "medications": {
+        "name": "name",
+        "code": "code",
+        "indication": "indication",
+        "dose": "dose",
+        "route": "route",
+        "frequency": "frequency",
+        "patient_mrn": "patient_mrn",
+        "encounter_id": "encounter_id",
+        "start_date": "start_date",
+        "end_date": "end_date",
+        "status": "status",
+        "prescriber": "prescriber",
+    },
+    "lab_results": {
+        "test_name": "test_name",
+        "loinc_code": "loinc_code",
+        "value": "value",
+        "unit": "unit",
+        "reference_range": "reference_range",
+        "abnormal_flag": "abnormal_flag",
+        "patient_mrn": "patient_mrn",
+        "encounter_id": "encounter_id",
+        "collected_time": "collected_time",
+        "resulted_time": "resulted_time",
+        "performing_lab": "performing_lab",
+        "ordering_provider": "ordering_provider",
+    },
+    "vitals": {
+        "patient_mrn": "patient_mrn",
+        "encounter_id": "encounter_id",
+        "observation_time": "observation_time",
+        "temperature": "temperature",
+        "heart_rate": "heart_rate",
+        "respiratory_rate": "respiratory_rate",
+        "systolic_bp": "systolic_bp",
+        "diastolic_bp": "diastolic_bp",
+        "blood_pressure": "blood_pressure",
+        "spo2": "spo2",
+        "height_cm": "height_cm",
+        "weight_kg": "weight_kg",
+        "bmi": "bmi",
+    },
+}
+
+
 class PatientDimensionalTransformer(BaseDimensionalTransformer):
     """Transform PatientSim canonical models into dimensional format.
 
     Creates star schema with dimensions and fact tables optimized for
-    healthcare analytics.
+    healthcare analytics. Each model list is converted to columns once;
+    surrogate keys and derived columns are computed column-wise.
 
     Dimensions:
         - dim_patient: Patient demographics with age bands
@@ -64,6 +210,33 @@ class PatientDimensionalTransformer(BaseDimensionalTransformer):
         >>> dimensions, facts = transformer.transform()
     """
 
+    KEY_COLUMNS = {
+        "dim_patient": "patient_key",
+        "dim_facility": "facility_key",
+        "dim_provider": "provider_key",
+        "dim_diagnosis": "diagnosis_key",
+        "dim_procedure": "procedure_key",
+        "dim_medication": "medication_key",
+        "dim_lab_test": "lab_test_key",
+    }
+
+    NATURAL_KEYS = {
+        "dim_facility": "facility_name",
+        "dim_provider": "provider_id",
+        "dim_diagnosis": "diagnosis_code",
+        "dim_procedure": "procedure_code",
+        "dim_medication": "medication_name",
+        "dim_lab_test": "test_name",
+    }
+
+    FACT_KEYS = {
+        "fact_diagnoses": "diagnosis_fact_key",
+        "fact_procedures": "procedure_fact_key",
+        "fact_medications": "medication_fact_key",
+        "fact_lab_results": "lab_result_fact_key",
+        "fact_vitals": "vitals_fact_key",
+    }
+
     def __init__(
         self,
         patients: list[Patient] | None = None,
@@ -95,6 +268,7 @@ class PatientDimensionalTransformer(BaseDimensionalTransformer):
         self.lab_results = lab_results or []
         self.vitals = vitals or []
         self.snapshot_date = snapshot_date or date.today()
+        self._frame_cache: dict[str, pd.DataFrame] = {}
 
     def transform(self) -> tuple[dict[str, pd.DataFrame], dict[str, pd.DataFrame]]:
         """Transform canonical models into dimensional format.
@@ -106,6 +280,9 @@ class PatientDimensionalTransformer(BaseDimensionalTransformer):
         dimensions = {}
         facts = {}
 
+        # Model lists are converted to columns once per transform
+        self._frame_cache.clear()
+
         # Build dimensions
         if self.patients:
             dimensions["dim_patient"] = self._build_dim_patient()
@@ -145,7 +322,15 @@ class PatientDimensionalTransformer(BaseDimensionalTransformer):
         if self.vitals:
             facts["fact_vitals"] = self._build_fact_vitals()
 
-        return dimensions, facts
+        return self.infer_dtypes(dimensions), self.infer_dtypes(facts)
+
+    def _frame(self, name: str) -> pd.DataFrame:
+        """Get the columnar form of one model list, extracting it on first use."""
+        if name not in self._frame_cache:
+            self._frame_cache[name] = self.extract_columns(
+                getattr(self, name), _SOURCE_FIELDS[name]
+            )
+        return self._frame_cache[name]
 
     # -------------------------------------------------------------------------
     # Dimension Builders
@@ -153,121 +338,85 @@ class PatientDimensionalTransformer(BaseDimensionalTransformer):
 
     def _build_dim_patient(self) -> pd.DataFrame:
         """Build patient dimension with demographics and age bands."""
-        records = []
-        for patient in self.patients:
-            age = self.calculate_age(patient.birth_date, self.snapshot_date)
-            records.append(
-                {
-                    "patient_key": patient.mrn,
-                    "patient_mrn": patient.mrn,
-                    "patient_id": patient.id,
-                    "given_name": patient.name.given_name,
-                    "family_name": patient.name.family_name,
-                    "full_name": patient.full_name,
-                    "birth_date_key": self.date_to_key(patient.birth_date),
-                    "birth_date": patient.birth_date,
-                    "gender_code": (
-                        patient.gender.value if hasattr(patient.gender, "value") else patient.gender
-                    ),
-                    "gender_description": self._get_gender_description(patient.gender),
-                    "race": patient.race,
-                    "language": patient.language,
-                    "age_at_snapshot": age,
-                    "age_band": self.age_band(age),
-                    "city": self.get_attr(patient, "address.city"),
-                    "state": self.get_attr(patient, "address.state"),
-                    "postal_code": self.get_attr(patient, "address.postal_code"),
-                }
-            )
-        return pd.DataFrame(records)
+        df = self._frame("patients")
+        age = self.calculate_ages(df["birth_date"], self.snapshot_date)
+        return pd.DataFrame(
+            {
+                "patient_key": df["mrn"],
+                "patient_mrn": df["mrn"],
+                "patient_id": df["id"],
+                "given_name": df["given_name"],
+                "family_name": df["family_name"],
+                "full_name": df["full_name"],
+                "birth_date_key": self.dates_to_keys(df["birth_date"]),
+                "birth_date": df["birth_date"],
+                "gender_code": self.enum_values(df["gender"]),
+                "gender_description": self.map_unique(df["gender"], self._get_gender_description),
+                "race": df["race"],
+                "language": df["language"],
+                "age_at_snapshot": age,
+                "age_band": self.age_bands(age),
+                "city": df["city"],
+                "state": df["state"],
+                "postal_code": df["postal_code"],
+            }
+        )
 
     def _build_dim_facility(self) -> pd.DataFrame:
         """Build facility dimension from encounter data."""
-        facilities = set()
-        for enc in self.encounters:
-            if enc.facility:
-                facilities.add(enc.facility)
-
-        records = []
-        for idx, facility in enumerate(sorted(facilities), start=1):
-            records.append(
-                {
-                    "facility_key": idx,
-                    "facility_name": facility,
-                    "facility_type": "Hospital",  # Default
-                }
-            )
+        facilities = self._facility_keys()
 
-        if not records:
+        if len(facilities) == 0:
             # Ensure at least one record for referential integrity
-            records.append(
-                {
-                    "facility_key": -1,
-                    "facility_name": "Unknown",
-                    "facility_type": "Unknown",
-                }
+            return pd.DataFrame(
+                [
+                    {
+                        "facility_key": -1,
+                        "facility_name": "Unknown",
+                        "facility_type": "Unknown",
+                    }
+                ]
             )
 
-        return pd.DataFrame(records)
+        return pd.DataFrame(
+            {
+                "facility_key": range(1, len(facilities) + 1),
+                "facility_name": facilities.to_list(),
+                "facility_type": "Hospital",  # Default
+            }
+        )
 
     def _build_dim_provider(self) -> pd.DataFrame:
         """Build provider dimension from encounter data."""
-        providers = set()
-        for enc in self.encounters:
-            if enc.attending_physician:
-                providers.add(enc.attending_physician)
-            if enc.admitting_physician:
-                providers.add(enc.admitting_physician)
-
-        records = []
-        for idx, provider_id in enumerate(sorted(providers), start=1):
-            records.append(
-                {
-                    "provider_key": idx,
-                    "provider_id": provider_id,
-                    "provider_name": provider_id,  # Name not available in canonical model
-                    "provider_type": "Physician",
-                }
-            )
+        providers = self._provider_keys()
 
-        if not records:
+        if len(providers) == 0:
             # Ensure at least one record for referential integrity
-            records.append(
-                {
-                    "provider_key": -1,
-                    "provider_id": "UNKNOWN",
-                    "provider_name": "Unknown",
-                    "provider_type": "Unknown",
-                }
+            return pd.DataFrame(
+                [
+                    {
+                        "provider_key": -1,
+                        "provider_id": "UNKNOWN",
+                        "provider_name": "Unknown",
+                        "provider_type": "Unknown",
+                    }
+                ]
             )
 
-        return pd.DataFrame(records)
+        return pd.DataFrame(
+            {
+                "provider_key": range(1, len(providers) + 1),
+                "provider_id": providers.to_list(),
+                "provider_name": providers.to_list(),  # Name not available in canonical model
+                "provider_type": "Physician",
+            }
+        )
 
     def _build_dim_diagnosis(self) -> pd.DataFrame:
         """Build diagnosis dimension from diagnosis codes."""
-        diagnosis_codes: dict[str, str] = {}
-        for diag in self.diagnoses:
-            if diag.code not in diagnosis_codes:
-                diagnosis_codes[diag.code] = diag.description
-
-        records = []
-        for idx, (code, description) in enumerate(sorted(diagnosis_codes.items()), start=1):
-            # Extract category from ICD-10 code (first letter or first 3 chars)
-            category = self._get_icd10_category(code)
-            records.append(
-                {
-                    "diagnosis_key": idx,
-                    "diagnosis_code": code,
-                    "diagnosis_description": description,
-                    "diagnosis_category": category,
-                    "code_system": "ICD-10-CM",
-                }
-            )
-
-        return (
-            pd.DataFrame(records)
-            if records
-            else pd.DataFrame(
+        codes = self._first_by_key(self._frame("diagnoses"), "code", ["description"])
+        if codes.empty:
+            return pd.DataFrame(
                 columns=[
                     "diagnosis_key",
                     "diagnosis_code",
@@ -276,63 +425,40 @@ class PatientDimensionalTransformer(BaseDimensionalTransformer):
                     "code_system",
                 ]
             )
+
+        return pd.DataFrame(
+            {
+                "diagnosis_key": range(1, len(codes) + 1),
+                "diagnosis_code": codes["code"],
+                "diagnosis_description": codes["description"],
+                # Category from ICD-10 chapter letter
+                "diagnosis_category": self.map_unique(codes["code"], self._get_icd10_category),
+                "code_system": "ICD-10-CM",
+            }
         )
 
     def _build_dim_procedure(self) -> pd.DataFrame:
         """Build procedure dimension from procedure codes."""
-        procedure_codes: dict[str, str] = {}
-        for proc in self.procedures:
-            if proc.code not in procedure_codes:
-                procedure_codes[proc.code] = proc.description
-
-        records = []
-        for idx, (code, description) in enumerate(sorted(procedure_codes.items()), start=1):
-            records.append(
-                {
-                    "procedure_key": idx,
-                    "procedure_code": code,
-                    "procedure_description": description,
-                    "code_system": self._infer_procedure_code_system(code),
-                }
-            )
-
-        return (
-            pd.DataFrame(records)
-            if records
-            else pd.DataFrame(
+        codes = self._first_by_key(self._frame("procedures"), "code", ["description"])
+        if codes.empty:
+            return pd.DataFrame(
                 columns=["procedure_key", "procedure_code", "procedure_description", "code_system"]
             )
+
+        return pd.DataFrame(
+            {
+                "procedure_key": range(1, len(codes) + 1),
+                "procedure_code": codes["code"],
+                "procedure_description": codes["description"],
+                "code_system": self.map_unique(codes["code"], self._infer_procedure_code_system),
+            }
         )
 
     def _build_dim_medication(self) -> pd.DataFrame:
         """Build medication dimension from medication data."""
-        medications: dict[str, dict] = {}
-        for med in self.medications:
-            if med.name not in medications:
-                medications[med.name] = {
-                    "name": med.name,
-                    "code": med.code,
-                    "indication": med.indication,
-                }
-
-        records = []
-        for idx, med_info in enumerate(
-            sorted(medications.values(), key=lambda x: x["name"]), start=1
-        ):
-            records.append(
-                {
-                    "medication_key": idx,
-                    "medication_name": med_info["name"],
-                    "medication_code": med_info["code"],
-                    "code_system": "RxNorm" if med_info["code"] else None,
-                    "indication": med_info["indication"],
-                }
-            )
-
-        return (
-            pd.DataFrame(records)
-            if records
-            else pd.DataFrame(
+        meds = self._first_by_key(self._frame("medications"), "name", ["code", "indication"])
+        if meds.empty:
+            return pd.DataFrame(
                 columns=[
                     "medication_key",
                     "medication_name",
@@ -341,39 +467,24 @@ class PatientDimensionalTransformer(BaseDimensionalTransformer):
                     "indication",
                 ]
             )
+
+        return pd.DataFrame(
+            {
+                "medication_key": range(1, len(meds) + 1),
+                "medication_name": meds["name"],
+                "medication_code": meds["code"],
+                "code_system": self.map_unique(meds["code"], lambda c: "RxNorm" if c else None),
+                "indication": meds["indication"],
+            }
         )
 
     def _build_dim_lab_test(self) -> pd.DataFrame:
         """Build lab test dimension from lab results."""
-        lab_tests: dict[str, dict] = {}
-        for lab in self.lab_results:
-            if lab.test_name not in lab_tests:
-                lab_tests[lab.test_name] = {
-                    "test_name": lab.test_name,
-                    "loinc_code": lab.loinc_code,
-                    "unit": lab.unit,
-                    "reference_range": lab.reference_range,
-                }
-
-        records = []
-        for idx, test_info in enumerate(
-            sorted(lab_tests.values(), key=lambda x: x["test_name"]), start=1
-        ):
-            records.append(
-                {
-                    "lab_test_key": idx,
-                    "test_name": test_info["test_name"],
-                    "loinc_code": test_info["loinc_code"],
-                    "unit": test_info["unit"],
-                    "reference_range": test_info["reference_range"],
-                    "code_system": "LOINC" if test_info["loinc_code"] else None,
-                }
-            )
-
-        return (
-            pd.DataFrame(records)
-            if records
-            else pd.DataFrame(
+        tests = self._first_by_key(
+            self._frame("lab_results"), "test_name", ["loinc_code", "unit", "reference_range"]
+        )
+        if tests.empty:
+            return pd.DataFrame(
                 columns=[
                     "lab_test_key",
                     "test_name",
@@ -383,6 +494,18 @@ class PatientDimensionalTransformer(BaseDimensionalTransformer):
                     "code_system",
                 ]
             )
+
+        return pd.DataFrame(
+            {
+                "lab_test_key": range(1, len(tests) + 1),
+                "test_name": tests["test_name"],
+                "loinc_code": tests["loinc_code"],
+                "unit": tests["unit"],
+                "reference_range": tests["reference_range"],
+                "code_system": self.map_unique(
+                    tests["loinc_code"], lambda c: "LOINC" if c else None
+                ),
+            }
         )
 
     # -------------------------------------------------------------------------
@@ -391,319 +514,283 @@ class PatientDimensionalTransformer(BaseDimensionalTransformer):
 
     def _build_fact_encounters(self) -> pd.DataFrame:
         """Build encounter fact table with LOS and readmission flags."""
-        # Build lookup maps
-        facility_map = self._build_facility_lookup()
-        provider_map = self._build_provider_lookup()
-
-        # Sort encounters by patient and admission time for readmission calc
-        patient_encounters: dict[str, list] = {}
-        for enc in self.encounters:
-            if enc.patient_mrn not in patient_encounters:
-                patient_encounters[enc.patient_mrn] = []
-            patient_encounters[enc.patient_mrn].append(enc)
-
-        # Sort each patient's encounters by admission time
-        for mrn in patient_encounters:
-            patient_encounters[mrn].sort(key=lambda x: x.admission_time)
-
-        records = []
-        for enc in self.encounters:
-            # Calculate length of stay
-            los_hours = None
-            los_days = None
-            if enc.discharge_time:
-                delta = enc.discharge_time - enc.admission_time
-                los_hours = delta.total_seconds() / 3600
-                los_days = delta.days
-
-            # Calculate readmission flags
-            is_readmission_7_day, is_readmission_30_day = self._calculate_readmission_flags(
-                enc, patient_encounters.get(enc.patient_mrn, [])
-            )
-
-            # Is patient deceased (based on discharge disposition)
-            is_mortality = self._check_mortality(enc.discharge_disposition)
-
-            records.append(
-                {
-                    "encounter_key": enc.encounter_id,
-                    "patient_key": enc.patient_mrn,
-                    "facility_key": facility_map.get(enc.facility, -1),
-                    "attending_provider_key": provider_map.get(enc.attending_physician, -1),
-                    "admitting_provider_key": provider_map.get(enc.admitting_physician, -1),
-                    "admission_date_key": self.date_to_key(enc.admission_time.date()),
-                    "discharge_date_key": (
-                        self.date_to_key(enc.discharge_time.date()) if enc.discharge_time else None
-                    ),
-                    "admission_datetime": enc.admission_time,
-                    "discharge_datetime": enc.discharge_time,
-                    "encounter_class_code": (
-                        enc.class_code.value if hasattr(enc.class_code, "value") else enc.class_code
-                    ),
-                    "encounter_status_code": (
-                        enc.status.value if hasattr(enc.status, "value") else enc.status
-                    ),
-                    "chief_complaint": enc.chief_complaint,
-                    "discharge_disposition": enc.discharge_disposition,
-                    "department": enc.department,
-                    "room": enc.room,
-                    "bed": enc.bed,
-                    "length_of_stay_hours": round(los_hours, 2) if los_hours else None,
-                    "length_of_stay_days": los_days,
-                    "is_readmission_7_day": is_readmission_7_day,
-                    "is_readmission_30_day": is_readmission_30_day,
-                    "is_mortality": is_mortality,
-                }
-            )
-
-        return pd.DataFrame(records)
+        df = self._frame("encounters")
+        facilities = self._facility_keys()
+        providers = self._provider_keys()
+
+        # Length of stay
+        has_discharge = df["discharge_time"].notna().to_numpy()
+        los = pd.to_datetime(df["discharge_time"]) - pd.to_datetime(df["admission_time"])
+        los_hours = (los.dt.total_seconds() / 3600).round(2)
+        los_days = los.dt.days.fillna(0)
+
+        # Readmission flags and windowed measures (single sorted pass)
+        readmission = self._calculate_readmission_measures(df)
+
+        return pd.DataFrame(
+            {
+                "encounter_key": df["encounter_id"],
+                "patient_key": df["patient_mrn"],
+                "facility_key": self.lookup_keys(df["facility"], facilities),
+                "attending_provider_key": self.lookup_keys(df["attending_physician"], providers),
+                "admitting_provider_key": self.lookup_keys(df["admitting_physician"], providers),
+                "admission_date_key": self.dates_to_keys(df["admission_time"]),
+                "discharge_date_key": self.dates_to_keys(df["discharge_time"]),
+                "admission_datetime": df["admission_time"],
+                "discharge_datetime": df["discharge_time"],
+                "encounter_class_code": self.enum_values(df["class_code"]),
+                "encounter_status_code": self.enum_values(df["status"]),
+                "chief_complaint": df["chief_complaint"],
+                "discharge_disposition": df["discharge_disposition"],
+                "department": df["department"],
+                "room": df["room"],
+                "bed": df["bed"],
+                # Zero-length stays are reported as missing, like absent discharges
+                "length_of_stay_hours": self.nullable_floats(
+                    los_hours, has_discharge & (los_hours.fillna(0) != 0).to_numpy()
+                ),
+                "length_of_stay_days": self.nullable_ints(los_days, has_discharge),
+                "encounter_sequence": readmission["encounter_sequence"],
+                "days_since_last_discharge": readmission["days_since_last_discharge"],
+                "is_readmission_7_day": readmission["is_readmission_7_day"],
+                "is_readmission_30_day": readmission["is_readmission_30_day"],
+                # Is patient deceased (based on discharge disposition)
+                "is_mortality": self.map_unique(
+                    df["discharge_disposition"], self._check_mortality
+                ).astype(bool),
+            }
+        )
 
     def _build_fact_diagnoses(self) -> pd.DataFrame:
         """Build diagnosis fact table."""
-        diagnosis_key_map = self._build_diagnosis_lookup()
-
-        records = []
-        for idx, diag in enumerate(self.diagnoses, start=1):
-            records.append(
-                {
-                    "diagnosis_fact_key": idx,
-                    "patient_key": diag.patient_mrn,
-                    "encounter_key": diag.encounter_id,
-                    "diagnosis_key": diagnosis_key_map.get(diag.code, -1),
-                    "diagnosed_date_key": self.date_to_key(diag.diagnosed_date),
-                    "resolved_date_key": (
-                        self.date_to_key(diag.resolved_date) if diag.resolved_date else None
-                    ),
-                    "diagnosis_type_code": (
-                        diag.type.value if hasattr(diag.type, "value") else diag.type
-                    ),
-                    "is_primary": (
-                        diag.type.value == "admitting"
-                        if hasattr(diag.type, "value")
-                        else diag.type == "admitting"
-                    ),
-                    "is_resolved": diag.resolved_date is not None,
-                }
-            )
-
-        return pd.DataFrame(records)
+        df = self._frame("diagnoses")
+        type_code = self.enum_values(df["type"])
+
+        return pd.DataFrame(
+            {
+                "diagnosis_fact_key": range(1, len(df) + 1),
+                "patient_key": df["patient_mrn"],
+                "encounter_key": df["encounter_id"],
+                "diagnosis_key": self.lookup_keys(df["code"], self.sorted_uniques(df["code"])),
+                "diagnosed_date_key": self.dates_to_keys(df["diagnosed_date"]),
+                "resolved_date_key": self.dates_to_keys(df["resolved_date"]),
+                "diagnosis_type_code": type_code,
+                "is_primary": type_code == "admitting",
+                "is_resolved": df["resolved_date"].notna(),
+            }
+        )
 
     def _build_fact_procedures(self) -> pd.DataFrame:
         """Build procedure fact table."""
-        procedure_key_map = self._build_procedure_lookup()
-
-        records = []
-        for idx, proc in enumerate(self.procedures, start=1):
-            records.append(
-                {
-                    "procedure_fact_key": idx,
-                    "patient_key": proc.patient_mrn,
-                    "encounter_key": proc.encounter_id,
-                    "procedure_key": procedure_key_map.get(proc.code, -1),
-                    "performed_date_key": self.date_to_key(proc.performed_date.date()),
-                    "performed_datetime": proc.performed_date,
-                    "performer": proc.performer,
-                    "location": proc.location,
-                }
-            )
-
-        return pd.DataFrame(records)
+        df = self._frame("procedures")
+
+        return pd.DataFrame(
+            {
+                "procedure_fact_key": range(1, len(df) + 1),
+                "patient_key": df["patient_mrn"],
+                "encounter_key": df["encounter_id"],
+                "procedure_key": self.lookup_keys(df["code"], self.sorted_uniques(df["code"])),
+                "performed_date_key": self.dates_to_keys(df["performed_date"]),
+                "performed_datetime": df["performed_date"],
+                "performer": df["performer"],
+                "location": df["location"],
+            }
+        )
 
     def _build_fact_medications(self) -> pd.DataFrame:
         """Build medication fact table."""
-        medication_key_map = self._build_medication_lookup()
-
-        records = []
-        for idx, med in enumerate(self.medications, start=1):
-            records.append(
-                {
-                    "medication_fact_key": idx,
-                    "patient_key": med.patient_mrn,
-                    "encounter_key": med.encounter_id,
-                    "medication_key": medication_key_map.get(med.name, -1),
-                    "start_date_key": self.date_to_key(med.start_date.date()),
-                    "end_date_key": (
-                        self.date_to_key(med.end_date.date()) if med.end_date else None
-                    ),
-                    "start_datetime": med.start_date,
-                    "end_datetime": med.end_date,
-                    "dose": med.dose,
-                    "route": med.route,
-                    "frequency": med.frequency,
-                    "status_code": med.status.value if hasattr(med.status, "value") else med.status,
-                    "prescriber": med.prescriber,
-                    "is_active": (med.status.value if hasattr(med.status, "value") else med.status)
-                    == "active",
-                }
-            )
-
-        return pd.DataFrame(records)
+        df = self._frame("medications")
+        status_code = self.enum_values(df["status"])
+
+        return pd.DataFrame(
+            {
+                "medication_fact_key": range(1, len(df) + 1),
+                "patient_key": df["patient_mrn"],
+                "encounter_key": df["encounter_id"],
+                "medication_key": self.lookup_keys(df["name"], self.sorted_uniques(df["name"])),
+                "start_date_key": self.dates_to_keys(df["start_date"]),
+                "end_date_key": self.dates_to_keys(df["end_date"]),
+                "start_datetime": df["start_date"],
+                "end_datetime": df["end_date"],
+                "dose": df["dose"],
+                "route": df["route"],
+                "frequency": df["frequency"],
+                "status_code": status_code,
+                "prescriber": df["prescriber"],
+                "is_active": status_code == "active",
+            }
+        )
 
     def _build_fact_lab_results(self) -> pd.DataFrame:
         """Build lab results fact table."""
-        lab_test_key_map = self._build_lab_test_lookup()
-
-        records = []
-        for idx, lab in enumerate(self.lab_results, start=1):
-            # Parse numeric value if possible
-            numeric_value = self.safe_decimal(lab.value)
-
-            records.append(
-                {
-                    "lab_result_fact_key": idx,
-                    "patient_key": lab.patient_mrn,
-                    "encounter_key": lab.encounter_id,
-                    "lab_test_key": lab_test_key_map.get(lab.test_name, -1),
-                    "collected_date_key": self.date_to_key(lab.collected_time.date()),
-                    "resulted_date_key": (
-                        self.date_to_key(lab.resulted_time.date()) if lab.resulted_time else None
-                    ),
-                    "collected_datetime": lab.collected_time,
-                    "resulted_datetime": lab.resulted_time,
-                    "result_value": lab.value,
-                    "result_numeric": float(numeric_value) if numeric_value else None,
-                    "unit": lab.unit,
-                    "abnormal_flag": lab.abnormal_flag,
-                    "is_abnormal": lab.abnormal_flag is not None,
-                    "is_critical": lab.abnormal_flag in ("HH", "LL", "A"),
-                    "performing_lab": lab.performing_lab,
-                    "ordering_provider": lab.ordering_provider,
-                }
-            )
-
-        return pd.DataFrame(records)
+        df = self._frame("lab_results")
+
+        return pd.DataFrame(
+            {
+                "lab_result_fact_key": range(1, len(df) + 1),
+                "patient_key": df["patient_mrn"],
+                "encounter_key": df["encounter_id"],
+                "lab_test_key": self.lookup_keys(
+                    df["test_name"], self.sorted_uniques(df["test_name"])
+                ),
+                "collected_date_key": self.dates_to_keys(df["collected_time"]),
+                "resulted_date_key": self.dates_to_keys(df["resulted_time"]),
+                "collected_datetime": df["collected_time"],
+                "resulted_datetime": df["resulted_time"],
+                "result_value": df["value"],
+                # Parse numeric value if possible
+                "result_numeric": self.map_unique(df["value"], self._parse_numeric_result),
+                "unit": df["unit"],
+                "abnormal_flag": df["abnormal_flag"],
+                "is_abnormal": df["abnormal_flag"].notna(),
+                "is_critical": df["abnormal_flag"].isin(("HH", "LL", "A")),
+                "performing_lab": df["performing_lab"],
+                "ordering_provider": df["ordering_provider"],
+            }
+        )
 
     def _build_fact_vitals(self) -> pd.DataFrame:
         """Build vitals fact table."""
-        records = []
-        for idx, vital in enumerate(self.vitals, start=1):
-            records.append(
-                {
-                    "vitals_fact_key": idx,
-                    "patient_key": vital.patient_mrn,
-                    "encounter_key": vital.encounter_id,
-                    "observation_date_key": self.date_to_key(vital.observation_time.date()),
-                    "observation_datetime": vital.observation_time,
-                    "temperature_f": vital.temperature,
-                    "heart_rate_bpm": vital.heart_rate,
-                    "respiratory_rate": vital.respiratory_rate,
-                    "systolic_bp": vital.systolic_bp,
-                    "diastolic_bp": vital.diastolic_bp,
-                    "blood_pressure": vital.blood_pressure,
-                    "spo2_pct": vital.spo2,
-                    "height_cm": vital.height_cm,
-                    "weight_kg": vital.weight_kg,
-                    "bmi": vital.bmi,
-                    "is_febrile": vital.temperature and vital.temperature >= 100.4,
-                    "is_tachycardic": vital.heart_rate and vital.heart_rate > 100,
-                    "is_hypotensive": vital.systolic_bp and vital.systolic_bp < 90,
-                    "is_hypertensive": vital.systolic_bp and vital.systolic_bp >= 140,
-                    "is_hypoxic": vital.spo2 and vital.spo2 < 90,
-                }
-            )
-
-        return pd.DataFrame(records)
+        df = self._frame("vitals")
+        temperature = df["temperature"].astype("float64")
+        heart_rate = df["heart_rate"].astype("float64")
+        systolic_bp = df["systolic_bp"].astype("float64")
+        spo2 = df["spo2"].astype("float64")
+
+        return pd.DataFrame(
+            {
+                "vitals_fact_key": range(1, len(df) + 1),
+                "patient_key": df["patient_mrn"],
+                "encounter_key": df["encounter_id"],
+                "observation_date_key": self.dates_to_keys(df["observation_time"]),
+                "observation_datetime": df["observation_time"],
+                "temperature_f": df["temperature"],
+                "heart_rate_bpm": df["heart_rate"],
+                "respiratory_rate": df["respiratory_rate"],
+                "systolic_bp": df["systolic_bp"],
+                "diastolic_bp": df["diastolic_bp"],
+                "blood_pressure": df["blood_pressure"],
+                "spo2_pct": df["spo2"],
+                "height_cm": df["height_cm"],
+                "weight_kg": df["weight_kg"],
+                "bmi": df["bmi"],
+                "is_febrile": self.nullable_flags(temperature >= 100.4, temperature.notna()),
+                "is_tachycardic": self.nullable_flags(heart_rate > 100, heart_rate.notna()),
+                "is_hypotensive": self.nullable_flags(systolic_bp < 90, systolic_bp.notna()),
+                "is_hypertensive": self.nullable_flags(systolic_bp >= 140, systolic_bp.notna()),
+                "is_hypoxic": self.nullable_flags(spo2 < 90, spo2.notna()),
+            }
+        )
 
     # -------------------------------------------------------------------------
     # Helper Methods
     # -------------------------------------------------------------------------
 
-    def _build_facility_lookup(self) -> dict[str, int]:
-        """Build facility name to key lookup."""
-        facilities = sorted({enc.facility for enc in self.encounters if enc.facility})
-        return {name: idx for idx, name in enumerate(facilities, start=1)}
-
-    def _build_provider_lookup(self) -> dict[str, int]:
-        """Build provider ID to key lookup."""
-        providers = set()
-        for enc in self.encounters:
-            if enc.attending_physician:
-                providers.add(enc.attending_physician)
-            if enc.admitting_physician:
-                providers.add(enc.admitting_physician)
-        return {pid: idx for idx, pid in enumerate(sorted(providers), start=1)}
-
-    def _build_diagnosis_lookup(self) -> dict[str, int]:
-        """Build diagnosis code to key lookup."""
-        codes = sorted({diag.code for diag in self.diagnoses})
-        return {code: idx for idx, code in enumerate(codes, start=1)}
-
-    def _build_procedure_lookup(self) -> dict[str, int]:
-        """Build procedure code to key lookup."""
-        codes = sorted({proc.code for proc in self.procedures})
-        return {code: idx for idx, code in enumerate(codes, start=1)}
-
-    def _build_medication_lookup(self) -> dict[str, int]:
-        """Build medication name to key lookup."""
-        names = sorted({med.name for med in self.medications})
-        return {name: idx for idx, name in enumerate(names, start=1)}
-
-    def _build_lab_test_lookup(self) -> dict[str, int]:
-        """Build lab test name to key lookup."""
-        names = sorted({lab.test_name for lab in self.lab_results})
-        return {name: idx for idx, name in enumerate(names, start=1)}
-
-    def _calculate_readmission_flags(
-        self,
-        current_encounter: Encounter,
-        patient_encounters: list[Encounter],
-    ) -> tuple[bool, bool]:
-        """Calculate 7-day and 30-day readmission flags.
+    def _facility_keys(self) -> pd.Index:
+        """Sorted facility names; facility_key is the 1-based position."""
+        return self.sorted_uniques(self._frame("encounters")["facility"], drop_empty=True)
 
-        An encounter is a readmission if there was a prior encounter
-        that discharged within 7 or 30 days before this admission.
+    def _provider_keys(self) -> pd.Index:
+        """Sorted attending/admitting provider IDs; provider_key is the 1-based position."""
+        df = self._frame("encounters")
+        return self.sorted_uniques(
+            df["attending_physician"], df["admitting_physician"], drop_empty=True
+        )
+
+    @staticmethod
+    def _first_by_key(df: pd.DataFrame, key: str, columns: list[str]) -> pd.DataFrame:
+        """First-seen attributes per distinct key, sorted by key."""
+        return (
+            df[[key, *columns]]
+            .drop_duplicates(subset=key, keep="first")
+            .sort_values(key, kind="stable")
+            .reset_index(drop=True)
+        )
+
+    def _parse_numeric_result(self, value: str | None) -> float | None:
+        """Parse a lab result value to float (2 dp), or None if non-numeric."""
+        numeric_value = self.safe_decimal(value)
+        return float(numeric_value) if numeric_value else None
+
+    def _calculate_readmission_measures(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Calculate readmission flags and related windowed measures.
+
+        An encounter is a readmission if a prior encounter for the same
+        patient (admitted strictly earlier) was discharged 0-7 or 0-30 days
+        before this admission date. Encounters are sorted once by patient and
+        admission time and swept in a single pass; each patient's prior
+        discharge dates are kept sorted so the latest discharge on or before
+        an admission date is found by bisection, O(n log n) overall.
 
         Args:
-            current_encounter: The encounter to check.
-            patient_encounters: All encounters for this patient, sorted by admission time.
+            df: Encounter columns (patient_mrn, admission_time, discharge_time).
 
         Returns:
-            Tuple of (is_readmission_7_day, is_readmission_30_day).
+            DataFrame aligned with ``df`` containing encounter_sequence
+            (1-based order within the patient), days_since_last_discharge
+            (None when there is no qualifying prior discharge),
+            is_readmission_7_day and is_readmission_30_day.
         """
-        is_readmission_7_day = False
-        is_readmission_30_day = False
-
-        for prior_enc in patient_encounters:
-            # Skip if same encounter or no discharge time
-            if prior_enc.encounter_id == current_encounter.encounter_id:
-                continue
-            if not prior_enc.discharge_time:
-                continue
-            # Only consider prior encounters
-            if prior_enc.admission_time >= current_encounter.admission_time:
-                continue
-
-            days_since_discharge = (
-                current_encounter.admission_time.date() - prior_enc.discharge_time.date()
-            ).days
-
-            if 0 <= days_since_discharge <= 7:
-                is_readmission_7_day = True
-                is_readmission_30_day = True
-                break
-            elif 0 <= days_since_discharge <= 30:
-                is_readmission_30_day = True
-
-        return is_readmission_7_day, is_readmission_30_day
+        admission = _as_wall_time(df["admission_time"])
+        discharge = _as_wall_time(df["discharge_time"])
+        patients = pd.factorize(df["patient_mrn"])[0]
+        admission_ns = admission.to_numpy("datetime64[ns]").astype("int64")
+        admission_days = admission.to_numpy("datetime64[D]").astype("int64").tolist()
+        discharge_days = discharge.to_numpy("datetime64[D]").astype("int64").tolist()
+        has_discharge = discharge.notna().tolist()
+
+        # Stable: ties keep input order
+        order = np.lexsort((admission_ns, patients)).tolist()
+        patients = patients.tolist()
+        admission_ns = admission_ns.tolist()
+
+        sequence = [0] * len(df)
+        gaps = [-1] * len(df)
+        prior_discharges: list[int] = []
+        pending: list[int] = []
+        current_patient = current_admission = None
+        position = 0
+        for i in order:
+            if patients[i] != current_patient:
+                current_patient, current_admission = patients[i], None
+                prior_discharges, pending, position = [], [], 0
+            if admission_ns[i] != current_admission:
+                # Encounters admitted at the same instant are not prior to each other
+                for day in pending:
+                    insort(prior_discharges, day)
+                pending, current_admission = [], admission_ns[i]
+
+            position += 1
+            sequence[i] = position
+            index = bisect_right(prior_discharges, admission_days[i])
+            if index:
+                gaps[i] = admission_days[i] - prior_discharges[index - 1]
+            if has_discharge[i]:
+                pending.append(discharge_days[i])
+
+        gap = np.asarray(gaps, dtype="int64")
+        has_prior = gap >= 0
+        return pd.DataFrame(
+            {
+                "encounter_sequence": sequence,
+                "days_since_last_discharge": self.nullable_ints(gap, has_prior),
+                "is_readmission_7_day": has_prior & (gap <= 7),
+                "is_readmission_30_day": has_prior & (gap <= 30),
+            },
+            index=df.index,
+        )
 
     def _check_mortality(self, discharge_disposition: str | None) -> bool:
         """Check if discharge disposition indicates mortality."""
         if not discharge_disposition:
             return False
         disposition_lower = discharge_disposition.lower()
-        mortality_keywords = ["expired", "died", "death", "deceased", "morgue"]
-        return any(kw in disposition_lower for kw in mortality_keywords)
+        return any(kw in disposition_lower for kw in MORTALITY_KEYWORDS)
 
     def _get_gender_description(self, gender) -> str:
         """Get human-readable gender description."""
         gender_value = gender.value if hasattr(gender, "value") else gender
-        descriptions = {
-            "M": "Male",
-            "F": "Female",
-            "O": "Other",
-            "U": "Unknown",
-        }
-        return descriptions.get(gender_value, "Unknown")
+        return GENDER_DESCRIPTIONS.get(gender_value, "Unknown")
 
     def _get_icd10_category(self, code: str) -> str:
         """Get ICD-10 category from code.
@@ -732,35 +819,7 @@ class PatientDimensionalTransformer(BaseDimensionalTransformer):
         if not code:
             return "Unknown"
 
-        first_char = code[0].upper()
-        categories = {
-            "A": "Infectious",
-            "B": "Infectious",
-            "C": "Neoplasm",
-            "D": "Neoplasm/Blood",
-            "E": "Endocrine/Metabolic",
-            "F": "Mental/Behavioral",
-            "G": "Nervous System",
-            "H": "Eye/Ear",
-            "I": "Circulatory",
-            "J": "Respiratory",
-            "K": "Digestive",
-            "L": "Skin",
-            "M": "Musculoskeletal",
-            "N": "Genitourinary",
-            "O": "Pregnancy",
-            "P": "Perinatal",
-            "Q": "Congenital",
-            "R": "Symptoms",
-            "S": "Injury",
-            "T": "Injury/Poisoning",
-            "V": "External Causes",
-            "W": "External Causes",
-            "X": "External Causes",
-            "Y": "External Causes",
-            "Z": "Health Status",
-        }
-        return categories.get(first_char, "Other")
+        return ICD10_CATEGORIES.get(code[0].upper(), "Other")
 
     def _infer_procedure_code_system(self, code: str) -> str:
         """Infer procedure code system from code format.
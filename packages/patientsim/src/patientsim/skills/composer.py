@@ -93,7 +93,7 @@ class SkillComposer:
         """Load a skill, using cache if available.
 
         Args:
-            path: Path to skill file
+            path: Path to skill file, or a bare skill name such as "sepsis"
 
         Returns:
             Loaded Skill object
@@ -104,9 +104,14 @@ class SkillComposer:
             return self._loaded_skills[path_str]
 
         # Resolve relative paths against skills_dir
-        full_path = self.skills_dir / path if not Path(path).is_absolute() else Path(path)
-
-        skill = self.loader.load_file(full_path)
+        skill_path = Path(path)
+        full_path = skill_path if skill_path.is_absolute() else self.skills_dir / skill_path
+
+        if not skill_path.suffix and len(skill_path.parts) == 1 and not full_path.exists():
+            # A bare name is looked up anywhere under skills_dir via the SkillIndex
+            skill = self.loader.load_named(path_str, self.skills_dir)
+        else:
+            skill = self.loader.load_file(full_path)
         self._loaded_skills[path_str] = skill
         return skill
 
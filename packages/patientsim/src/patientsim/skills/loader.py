@@ -7,6 +7,8 @@ import re
 from pathlib import Path
 from typing import Any
 
+from healthsim.skills.index import SkillIndex
+
 from patientsim.skills.schema import (
     GenerationRules,
     ParameterType,
@@ -56,6 +58,29 @@ class SkillLoader:
 
         return self.load_string(content, source_path=str(path))
 
+    def load_named(self, skill_name: str, skills_root: str | Path) -> Skill:
+        """Load a skill by name, e.g. "sepsis", from anywhere under a skills root.
+
+        The file is located through the shared SkillIndex for the root, the
+        same index SkillRegistry resolves skills with, so repeated lookups do
+        not re-walk the directory tree.
+
+        Args:
+            skill_name: Skill file stem (case and "_"/"-" insensitive)
+            skills_root: Root directory of the skills tree
+
+        Returns:
+            Parsed Skill object
+
+        Raises:
+            SkillParseError: If file cannot be parsed
+            FileNotFoundError: If no skill with that name exists
+        """
+        path = SkillIndex.for_root(Path(skills_root)).find(skill_name)
+        if path is None:
+            raise FileNotFoundError(f"Skill not found: {skill_name} (under {skills_root})")
+        return self.load_file(path)
+
     def load_string(self, content: str, source_path: str | None = None) -> Skill:
         """Load a skill from a markdown string.
 
@@ -0,0 +1,192 @@
+"""Tests for the PatientSim in-database dimensional transformer."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+
+import pandas as pd
+import pytest
+from healthsim.db import DatabaseConnection
+
+from patientsim.core.models import Encounter, EncounterClass, EncounterStatus
+from patientsim.dimensional import PatientDimensionalTransformer, PatientInDatabaseTransformer
+
+SNAPSHOT = date(2024, 6, 15)
+
+ENCOUNTERS = [
+    # (encounter_id, mrn, admission, discharge, facility, attending, disposition)
+    ("E1", "MRN1", datetime(2024, 1, 1, 8), datetime(2024, 1, 5, 12), "General", "DR2", "Home"),
+    ("E2", "MRN1", datetime(2024, 1, 10, 9), datetime(2024, 1, 12, 9), "General", "DR1", None),
+    ("E3", "MRN1", datetime(2024, 2, 20, 9), None, "Mercy", None, None),
+    ("E4", "MRN2", datetime(2024, 3, 1, 7), datetime(2024, 3, 1, 7), None, "DR1", "Expired"),
+    ("E5", "MRN2", datetime(2024, 3, 1, 7), datetime(2024, 3, 2, 7), "Mercy", "DR3", None),
+]
+
+
+@pytest.fixture
+def conn(tmp_path):
+    """Canonical database with one PatientSim cohort and one unrelated row."""
+    db = DatabaseConnection(tmp_path / "test.duckdb")
+    conn = db.connect()
+    conn.execute("INSERT INTO cohorts (id, name) VALUES ('c-1', 'alpha'), ('c-2', 'beta')")
+    conn.execute(
+        """
+        INSERT INTO patients
+            (id, mrn, given_name, middle_name, family_name, birth_date, gender, city, cohort_id)
+        VALUES
+            ('p1', 'MRN1', 'Ann', 'B', 'Lee', '1950-06-16', 'F', 'Austin', 'c-1'),
+            ('p2', 'MRN2', 'Bob', NULL, 'Kim', '1990-01-01', 'M', NULL, 'c-1'),
+            ('p3', 'MRN3', 'Cy', NULL, 'Doe', '1980-01-01', 'M', NULL, 'c-2')
+        """
+    )
+    for encounter_id, mrn, admission, discharge, facility, attending, disposition in ENCOUNTERS:
+        conn.execute(
+            """
+            INSERT INTO encounters (encounter_id, patient_mrn, class_code, status,
+                admission_time, discharge_time, facility, attending_physician,
+                discharge_disposition, cohort_id)
+            VALUES (?, ?, 'I', 'finished', ?, ?, ?, ?, ?, 'c-1')
+            """,
+            [encounter_id, mrn, admission, discharge, facility, attending, disposition],
+        )
+    conn.execute(
+        """
+        INSERT INTO diagnoses (id, code, description, type, patient_mrn, encounter_id,
+            diagnosed_date, cohort_id)
+        VALUES
+            ('d1', 'I10', 'Hypertension', 'admitting', 'MRN1', 'E1', '2024-01-01', 'c-1'),
+            ('d2', 'E11.9', 'Type 2 diabetes', 'final', 'MRN1', 'E1', '2024-01-02', 'c-1'),
+            ('d3', 'I10', 'Essential hypertension', 'final', 'MRN2', 'E4', '2024-03-01', 'c-1'),
+            ('d4', 'J44.1', 'COPD', 'final', 'MRN3', NULL, '2024-03-01', 'c-2')
+        """
+    )
+    yield conn
+    db.close()
+
+
+def _models() -> list[Encounter]:
+    return [
+        Encounter(
+            encounter_id=encounter_id,
+            patient_mrn=mrn,
+            class_code=EncounterClass.INPATIENT,
+            status=EncounterStatus.FINISHED,
+            admission_time=admission,
+            discharge_time=discharge,
+            facility=facility,
+            attending_physician=attending,
+            discharge_disposition=disposition,
+        )
+        for encounter_id, mrn, admission, discharge, facility, attending, disposition in ENCOUNTERS
+    ]
+
+
+class TestPatientInDatabaseTransformer:
+    """Tests for PatientInDatabaseTransformer."""
+
+    def test_builds_cohort_tables(self, conn):
+        counts = PatientInDatabaseTransformer(conn, cohort="alpha", snapshot_date=SNAPSHOT).build()
+
+        assert counts["dim_patient"] == 2
+        assert counts["fact_encounters"] == 5
+        assert counts["fact_diagnoses"] == 3
+        assert counts["dim_diagnosis"] == 2
+        assert counts["fact_vitals"] == 0
+
+    def test_dim_patient(self, conn):
+        PatientInDatabaseTransformer(conn, cohort="alpha", snapshot_date=SNAPSHOT).build(
+            ["dim_patient"]
+        )
+
+        row = conn.execute(
+            """
+            SELECT full_name, birth_date_key, gender_description, age_at_snapshot, age_band
+            FROM analytics.dim_patient WHERE patient_key = 'MRN1'
+            """
+        ).fetchone()
+        assert row == ("Ann B Lee", 19500616, "Female", 73, "65+")
+
+    def test_dim_diagnosis_keeps_first_description(self, conn):
+        PatientInDatabaseTransformer(conn, cohort="alpha").build(["dim_diagnosis"])
+
+        rows = conn.execute(
+            "SELECT diagnosis_key, diagnosis_code, diagnosis_description, diagnosis_category "
+            "FROM analytics.dim_diagnosis"
+        ).fetchall()
+        assert rows == [
+            (1, "E11.9", "Type 2 diabetes", "Endocrine/Metabolic"),
+            (2, "I10", "Hypertension", "Circulatory"),
+        ]
+
+    def test_fact_encounters_matches_in_memory_transformer(self, conn):
+        PatientInDatabaseTransformer(conn, cohort="alpha").build(["fact_encounters"])
+        _, facts = PatientDimensionalTransformer(encounters=_models()).transform()
+
+        columns = [
+            "encounter_key",
+            "facility_key",
+            "attending_provider_key",
+            "length_of_stay_hours",
+            "length_of_stay_days",
+            "encounter_sequence",
+            "days_since_last_discharge",
+            "is_readmission_7_day",
+            "is_readmission_30_day",
+            "is_mortality",
+        ]
+        in_database = conn.execute(
+            f"SELECT {', '.join(columns)} FROM analytics.fact_encounters"
+        ).fetchall()
+        expected = [
+            tuple(None if pd.isna(value) else value for value in row)
+            for row in facts["fact_encounters"][columns].astype(object).itertuples(index=False)
+        ]
+        assert in_database == expected
+
+    def test_readmission_measures(self, conn):
+        PatientInDatabaseTransformer(conn, cohort="alpha").build(["fact_encounters"])
+
+        rows = conn.execute(
+            """
+            SELECT encounter_key, encounter_sequence, days_since_last_discharge,
+                is_readmission_7_day, is_readmission_30_day
+            FROM analytics.fact_encounters
+            """
+        ).fetchall()
+        assert rows == [
+            ("E1", 1, None, False, False),
+            ("E2", 2, 5, True, True),
+            ("E3", 3, 39, False, False),
+            # Same admission instant: neither is prior to the other
+            ("E4", 1, None, False, False),
+            ("E5", 2, None, False, False),
+        ]
+
+    def test_readmission_skips_overlapping_stay(self, conn):
+        # E6 is admitted during E1 and only discharged after E2's admission
+        conn.execute(
+            """
+            INSERT INTO encounters (encounter_id, patient_mrn, class_code, status,
+                admission_time, discharge_time, cohort_id)
+            VALUES ('E6', 'MRN1', 'I', 'finished', '2024-01-02 08:00', '2024-01-30 08:00', 'c-1')
+            """
+        )
+        PatientInDatabaseTransformer(conn, cohort="alpha").build(["fact_encounters"])
+
+        rows = conn.execute(
+            """
+            SELECT encounter_key, encounter_sequence, days_since_last_discharge
+            FROM analytics.fact_encounters
+            WHERE patient_key = 'MRN1'
+            ORDER BY encounter_key
+            """
+        ).fetchall()
+        assert rows == [("E1", 1, None), ("E2", 3, 5), ("E3", 4, 21), ("E6", 2, None)]
+
+    def test_empty_dimension_gets_unknown_member(self, conn):
+        PatientInDatabaseTransformer(conn, cohort="beta").build(["dim_facility", "dim_provider"])
+
+        assert conn.execute("SELECT * FROM analytics.dim_facility").fetchall() == [
+            (-1, "Unknown", "Unknown")
+        ]
+        assert conn.execute("SELECT provider_key FROM analytics.dim_provider").fetchall() == [(-1,)]
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from datetime import date, datetime, timedelta
 
+import pandas as pd
 import pytest
 
 from patientsim.core.generator import PatientGenerator
@@ -100,6 +101,8 @@ class TestDimPatient:
         dim_patient = dimensions["dim_patient"]
         age_bands = dim_patient["age_band"].tolist()
 
+        assert dim_patient["age_band"].dtype == "str"
+
         # Verify we have various age bands
         assert any(band == "0-17" for band in age_bands)
         assert any(band in ("18-34", "35-49", "50-64", "65+") for band in age_bands)
@@ -327,6 +330,71 @@ class TestFactEncounters:
         assert enc2_row["is_readmission_7_day"] == False  # noqa: E712
         assert enc2_row["is_readmission_30_day"] == True  # noqa: E712
 
+    def test_fact_encounters_sequence_and_days_since_discharge(self):
+        """Test encounter sequence and days since last discharge."""
+        gen = PatientGenerator(seed=42)
+        patient = gen.generate_patient()
+
+        def make(encounter_id, admitted, discharged):
+            return Encounter(
+                encounter_id=encounter_id,
+                patient_mrn=patient.mrn,
+                class_code=EncounterClass.INPATIENT,
+                status=EncounterStatus.FINISHED,
+                admission_time=admitted,
+                discharge_time=discharged,
+            )
+
+        # Input order differs from admission order
+        encounters = [
+            make("ENC003", datetime(2024, 7, 20, 9, 0), None),
+            make("ENC001", datetime(2024, 6, 1, 10, 0), datetime(2024, 6, 5, 14, 0)),
+            make("ENC002", datetime(2024, 7, 1, 8, 0), datetime(2024, 7, 2, 8, 0)),
+        ]
+
+        transformer = PatientDimensionalTransformer(encounters=encounters)
+        _, facts = transformer.transform()
+
+        fact_enc = facts["fact_encounters"].set_index("encounter_key")
+        assert fact_enc.loc["ENC001", "encounter_sequence"] == 1
+        assert fact_enc.loc["ENC002", "encounter_sequence"] == 2
+        assert fact_enc.loc["ENC003", "encounter_sequence"] == 3
+
+        assert pd.isna(fact_enc.loc["ENC001", "days_since_last_discharge"])
+        assert fact_enc.loc["ENC002", "days_since_last_discharge"] == 26
+        assert fact_enc.loc["ENC003", "days_since_last_discharge"] == 18
+        assert fact_enc.loc["ENC003", "is_readmission_30_day"] == True  # noqa: E712
+        assert fact_enc.loc["ENC003", "is_readmission_7_day"] == False  # noqa: E712
+
+    def test_fact_encounters_readmission_ignores_later_discharge(self):
+        """A prior stay still open at this admission does not count as a discharge."""
+        gen = PatientGenerator(seed=42)
+        patient = gen.generate_patient()
+
+        long_stay = Encounter(
+            encounter_id="ENC001",
+            patient_mrn=patient.mrn,
+            class_code=EncounterClass.INPATIENT,
+            status=EncounterStatus.FINISHED,
+            admission_time=datetime(2024, 6, 1, 10, 0),
+            discharge_time=datetime(2024, 6, 30, 10, 0),
+        )
+        ed_visit = Encounter(
+            encounter_id="ENC002",
+            patient_mrn=patient.mrn,
+            class_code=EncounterClass.EMERGENCY,
+            status=EncounterStatus.FINISHED,
+            admission_time=datetime(2024, 6, 10, 10, 0),
+            discharge_time=datetime(2024, 6, 10, 16, 0),
+        )
+
+        transformer = PatientDimensionalTransformer(encounters=[long_stay, ed_visit])
+        _, facts = transformer.transform()
+
+        row = facts["fact_encounters"].set_index("encounter_key").loc["ENC002"]
+        assert row["is_readmission_30_day"] == False  # noqa: E712
+        assert pd.isna(row["days_since_last_discharge"])
+
     def test_fact_encounters_mortality_flag(self):
         """Test mortality flag from discharge disposition."""
         gen = PatientGenerator(seed=42)
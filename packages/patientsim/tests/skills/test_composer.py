@@ -2,6 +2,7 @@
 
 from pathlib import Path
 
+import healthsim.skills.index as index_module
 import pytest
 
 from patientsim.skills.composer import SkillComposer, SkillCompositionError
@@ -233,6 +234,45 @@ Uses base knowledge.
         assert "Dependent Skill" in merged.name
         assert len(merged.knowledge) > 0
 
+    def test_compose_dependency_by_name(self, tmp_path: Path, monkeypatch) -> None:
+        """Test a bare dependency name is found anywhere under skills_dir."""
+        monkeypatch.setattr(index_module, "DEFAULT_INDEX_DIR", tmp_path / "cache")
+        skills_dir = tmp_path / "skills"
+        (skills_dir / "domain").mkdir(parents=True)
+        (skills_dir / "domain" / "clinical-basics.md").write_text(
+            """# Clinical Basics
+Basics.
+
+## Metadata
+- **Type**: domain-knowledge
+- **Version**: 1.0
+
+## Purpose
+Base knowledge.
+"""
+        )
+        (skills_dir / "sepsis.md").write_text(
+            """# Sepsis
+Septic patient.
+
+## Metadata
+- **Type**: scenario-template
+- **Version**: 1.0
+
+## Purpose
+Generate septic patients.
+
+## Dependencies
+- clinical_basics
+"""
+        )
+
+        composer = SkillComposer(skills_dir=skills_dir)
+        merged = composer.compose(["sepsis.md"], resolve_dependencies=True)
+
+        assert "Clinical Basics" in merged.name
+        assert "Sepsis" in merged.name
+
     def test_compose_circular_dependency_error(self, tmp_path: Path) -> None:
         """Test error on circular dependencies."""
         skill1 = tmp_path / "skill1.md"
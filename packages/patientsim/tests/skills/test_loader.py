@@ -1,5 +1,6 @@
 """Tests for Skills loader."""
 
+import healthsim.skills.index as index_module
 import pytest
 
 from patientsim.skills.loader import SkillLoader, SkillParseError
@@ -384,6 +385,21 @@ This will fail.
         with pytest.raises(FileNotFoundError):
             loader.load_file("nonexistent-file.md")
 
+    def test_load_named(self, tmp_path, monkeypatch) -> None:
+        """Test loading a skill by name from anywhere under a skills root."""
+        monkeypatch.setattr(index_module, "DEFAULT_INDEX_DIR", tmp_path / "cache")
+        root = tmp_path / "skills"
+        (root / "scenarios").mkdir(parents=True)
+        (root / "scenarios" / "sepsis.md").write_text(
+            "# Sepsis\nSeptic patient.\n\n## Metadata\n- **Type**: scenario-template\n"
+            "- **Version**: 1.0\n\n## Purpose\nGenerate septic patients.\n"
+        )
+        loader = SkillLoader()
+
+        assert loader.load_named("Sepsis", root).name == "Sepsis"
+        with pytest.raises(FileNotFoundError):
+            loader.load_named("pneumonia", root)
+
     def test_parse_sections(self) -> None:
         """Test section parsing."""
         content = """# Title
@@ -2,6 +2,7 @@
 
 from rxmembersim.claims import (
     AdjudicationEngine,
+    BatchAdjudicator,
     ClaimResponse,
     PharmacyClaim,
     TransactionCode,
@@ -66,6 +67,7 @@ __all__ = [
     "PharmacyClaim",
     "TransactionCode",
     "AdjudicationEngine",
+    "BatchAdjudicator",
     "ClaimResponse",
     # Formulary
     "Formulary",
@@ -2,6 +2,7 @@
 
 import random
 import string
+from bisect import bisect_right, insort
 from datetime import date, datetime, timedelta
 from decimal import Decimal
 from enum import Enum
@@ -119,10 +120,17 @@ class PriorAuthRecord(BaseModel):
 
 
 class PriorAuthWorkflow:
-    """Prior authorization workflow engine."""
+    """Prior authorization workflow engine.
+
+    Approved authorizations are indexed by (member_id, ndc), sorted by
+    effective date, so check_existing_auth does not scan every record.
+    """
 
     def __init__(self) -> None:
         self.records: dict[str, PriorAuthRecord] = {}
+        # (member_id, ndc) -> [(effective_date, pa_request_id)], sorted
+        self._approvals: dict[tuple[str, str], list[tuple[date, str]]] = {}
+        self._indexed_records = 0
 
     def create_request(
         self,
@@ -169,6 +177,9 @@ class PriorAuthWorkflow:
                 }
             ],
         )
+        if self._indexed_records == len(self.records) - 1:
+            # A new record has no response yet, so the index is still current
+            self._indexed_records += 1
 
         return request
 
@@ -274,32 +285,62 @@ class PriorAuthWorkflow:
         ndc: str,
         service_date: date | None = None,
     ) -> PriorAuthResponse | None:
-        """Check if member has existing valid authorization for drug."""
-        check_date = service_date or date.today()
+        """Check if member has existing valid authorization for drug.
 
-        for record in self.records.values():
-            if record.request.member_id != member_id:
-                continue
-            if record.request.ndc != ndc:
-                continue
-            if not record.response:
-                continue
-            if record.response.status != PAStatus.APPROVED:
-                continue
-            if not record.response.effective_date:
-                continue
-            if not record.response.expiration_date:
-                continue
-
-            if (
-                record.response.effective_date
-                <= check_date
-                <= record.response.expiration_date
-            ):
-                return record.response
+        When several approvals cover the date, the one effective most
+        recently is returned.
+        """
+        check_date = service_date or date.today()
+        if self._indexed_records != len(self.records):
+            self._rebuild_approvals()
+
+        approvals = self._approvals.get((member_id, ndc))
+        if not approvals:
+            return None
+        # Approvals effective on or before the date, latest first
+        end = bisect_right(approvals, check_date, key=lambda entry: entry[0])
+        for _, pa_request_id in reversed(approvals[:end]):
+            response = self.records[pa_request_id].response
+            # The index entry may be stale if the record changed since
+            if self._is_valid_approval(response, check_date):
+                return response
 
         return None
 
+    @staticmethod
+    def _is_valid_approval(
+        response: PriorAuthResponse | None, check_date: date
+    ) -> bool:
+        return bool(
+            response
+            and response.status == PAStatus.APPROVED
+            and response.effective_date
+            and response.expiration_date
+            and response.effective_date <= check_date <= response.expiration_date
+        )
+
+    def _index_approval(self, record: PriorAuthRecord) -> None:
+        """Add a record's approval to the (member_id, ndc) index."""
+        response = record.response
+        if (
+            response is None
+            or response.status != PAStatus.APPROVED
+            or not response.effective_date
+        ):
+            return
+        key = (record.request.member_id, record.request.ndc)
+        insort(
+            self._approvals.setdefault(key, []),
+            (response.effective_date, record.request.pa_request_id),
+        )
+
+    def _rebuild_approvals(self) -> None:
+        """Re-index every record, e.g. after records were added directly."""
+        self._approvals = {}
+        for record in self.records.values():
+            self._index_approval(record)
+        self._indexed_records = len(self.records)
+
     def _update_record(
         self, pa_request_id: str, response: PriorAuthResponse
     ) -> None:
@@ -307,6 +348,7 @@ class PriorAuthWorkflow:
         if pa_request_id in self.records:
             record = self.records[pa_request_id]
             record.response = response
+            self._index_approval(record)
             record.status_history.append(
                 {
                     "status": response.status.value,
@@ -1,6 +1,13 @@
 """Pharmacy claims module."""
 
 from .adjudication import AdjudicationEngine, EligibilityResult, PricingResult
+from .batch import (
+    BatchAdjudicationResult,
+    BatchAdjudicationStats,
+    BatchAdjudicator,
+    ClaimPayment,
+    FillRecord,
+)
 from .claim import PharmacyClaim, TransactionCode
 from .response import ClaimResponse, DURAlert, RejectCode
 
@@ -10,6 +17,11 @@ __all__ = [
     "AdjudicationEngine",
     "EligibilityResult",
     "PricingResult",
+    "BatchAdjudicator",
+    "BatchAdjudicationResult",
+    "BatchAdjudicationStats",
+    "ClaimPayment",
+    "FillRecord",
     "ClaimResponse",
     "DURAlert",
     "RejectCode",
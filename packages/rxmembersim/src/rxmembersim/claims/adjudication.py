@@ -29,6 +29,55 @@ class PricingResult:
     deductible_applied: Decimal
 
 
+ZERO = Decimal("0")
+
+
+def split_cost(
+    total_cost: Decimal,
+    copay: Decimal,
+    deductible_remaining: Decimal,
+    oop_remaining: Decimal | None = None,
+) -> tuple[Decimal, Decimal, Decimal, Decimal]:
+    """Split a claim's cost between patient and plan.
+
+    The patient pays the remaining deductible (up to the total cost) plus
+    the copay, never more than the total cost. When ``oop_remaining`` is
+    given the patient's share is also capped at the remaining out-of-pocket
+    maximum and the plan pays the rest.
+
+    Returns:
+        (deductible_applied, patient_pays, plan_pays, copay_applied)
+    """
+    # Check deductible
+    deductible_applied = ZERO
+    if deductible_remaining > 0:
+        deductible_applied = min(deductible_remaining, total_cost)
+        total_cost_after_deductible = total_cost - deductible_applied
+    else:
+        total_cost_after_deductible = total_cost
+
+    # Patient pays copay (or less if cost is lower)
+    patient_pays = min(copay + deductible_applied, total_cost)
+
+    # Plan pays the rest
+    plan_pays = total_cost - patient_pays
+    copay_applied = min(copay, total_cost_after_deductible)
+
+    if oop_remaining is not None and patient_pays > oop_remaining:
+        # Once the out-of-pocket maximum is met the plan pays the rest
+        excess = patient_pays - max(oop_remaining, ZERO)
+        patient_pays -= excess
+        plan_pays += excess
+        copay_applied = min(copay_applied, patient_pays)
+
+    return (
+        deductible_applied,
+        patient_pays,
+        max(plan_pays, ZERO),
+        copay_applied,
+    )
+
+
 class AdjudicationEngine:
     """Process pharmacy claims."""
 
@@ -127,33 +176,22 @@ class AdjudicationEngine:
         ingredient_cost = claim.ingredient_cost_submitted
         dispensing_fee = claim.dispensing_fee_submitted
 
-        total_cost = ingredient_cost + dispensing_fee
-
         # Get copay from formulary
         copay = Decimal(str(formulary_status.copay or 30))
 
-        # Check deductible
-        deductible_remaining = member.accumulators.deductible_remaining
-        deductible_applied = Decimal("0")
-
-        if deductible_remaining > 0:
-            deductible_applied = min(deductible_remaining, total_cost)
-            total_cost_after_deductible = total_cost - deductible_applied
-        else:
-            total_cost_after_deductible = total_cost
-
-        # Patient pays copay (or less if cost is lower)
-        patient_pays = min(copay + deductible_applied, total_cost)
-
-        # Plan pays the rest
-        plan_pays = total_cost - patient_pays
+        deductible_applied, patient_pays, plan_pays, copay_applied = split_cost(
+            ingredient_cost + dispensing_fee,
+            copay,
+            member.accumulators.deductible_remaining,
+            member.accumulators.oop_remaining,
+        )
 
         return PricingResult(
             ingredient_cost=ingredient_cost,
             dispensing_fee=dispensing_fee,
-            plan_pays=max(plan_pays, Decimal("0")),
+            plan_pays=plan_pays,
             patient_pays=patient_pays,
-            copay=min(copay, total_cost_after_deductible),
+            copay=copay_applied,
             deductible_applied=deductible_applied,
         )
 
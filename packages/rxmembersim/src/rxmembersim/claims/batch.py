@@ -0,0 +1,564 @@
+"""Batch pharmacy claim adjudication.
+
+AdjudicationEngine handles one claim at a time. BatchAdjudicator takes a
+stream of claims for many members and adjudicates them in batches:
+
+1. Eligibility, formulary and prior authorization run as passes over the
+   whole batch. Formulary terms (coverage, GPI, copay) are resolved once
+   per NDC and cached.
+2. Step therapy, DUR, quantity limits and pricing depend on the member's
+   earlier fills and accumulators, so they run in one ordered pass. Paid
+   claims are added to the member's fill history and accumulators as they
+   go.
+
+Deductible and OOP balances are read from each member's accumulators and
+written back when the batch completes. Given an AccumulatorEngine, pricing
+also applies amounts to the engine and reads remaining balances from it, so
+members loaded under one family ID share a family deductible and OOP.
+Members missing from the engine are loaded from RxMember.accumulators.
+
+Step therapy, DUR, quantity limit and PA-workflow checks run only when the
+corresponding component is supplied; a plain formulary plan skips them.
+
+Usage:
+    adjudicator = BatchAdjudicator(formulary=formulary, dur_rules=DURRulesEngine())
+    result = adjudicator.adjudicate(claims, members)
+    print(f"{result.stats.claims_per_second:,.0f} claims/sec")
+"""
+import random
+import time
+from collections import Counter
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from decimal import Decimal
+from itertools import count, islice
+from typing import Any, NamedTuple
+
+from healthsim.benefits import AccumulatorEngine, BenefitType, from_cents, to_cents
+
+from ..authorization.prior_auth import PriorAuthWorkflow
+from ..core.fill_history import FillHistory, FillRecord
+from ..core.member import RxMember
+from ..dur.rules import ClinicalSignificance, DURRulesEngine
+from ..formulary.formulary import Formulary
+from ..formulary.quantity_limit import QuantityLimitManager
+from ..formulary.step_therapy import StepTherapyManager
+from .adjudication import split_cost
+from .claim import PharmacyClaim
+from .response import ClaimResponse, DURAlert, RejectCode
+
+_PHARMACY = BenefitType.PHARMACY
+
+DEFAULT_BATCH_SIZE = 10_000
+
+# NCPDP reject codes used by the batch pipeline
+REJECT_DESCRIPTIONS = {
+    "25": "Missing/Invalid BIN Number",
+    "26": "Missing/Invalid PCN",
+    "52": "Non-Matched Cardholder ID",
+    "64": "Invalid Group ID",
+    "65": "Patient Not Covered",
+    "70": "Product/Service Not Covered",
+    "75": "Prior Authorization Required",
+    "76": "Plan Limitations Exceeded",
+    "88": "DUR Reject Error",
+    "608": "Step Therapy, Alternate Drug Therapy Required Prior To Use Of Submitted Product",
+}
+
+_DEFAULT_COPAY = Decimal("30")
+
+
+@dataclass(slots=True)
+class _DrugTerms:
+    """Formulary terms for one NDC, resolved once per adjudicator."""
+
+    covered: bool
+    gpi: str = ""
+    drug_name: str = ""
+    requires_pa: bool = False
+    requires_step_therapy: bool = False
+    copay: Decimal = _DEFAULT_COPAY
+
+
+@dataclass
+class BatchAdjudicationStats:
+    """Counts and throughput for adjudicated claims."""
+
+    claims: int = 0
+    paid: int = 0
+    rejected: int = 0
+    seconds: float = 0.0
+    reject_counts: Counter = field(default_factory=Counter)
+
+    @property
+    def claims_per_second(self) -> float:
+        """Adjudicated claims per second."""
+        return self.claims / self.seconds if self.seconds > 0 else 0.0
+
+    def add(self, other: "BatchAdjudicationStats") -> None:
+        """Fold another batch's counts into these."""
+        self.claims += other.claims
+        self.paid += other.paid
+        self.rejected += other.rejected
+        self.seconds += other.seconds
+        self.reject_counts.update(other.reject_counts)
+
+
+class ClaimPayment(NamedTuple):
+    """Pricing of a paid claim."""
+
+    authorization_number: str
+    ingredient_cost_paid: Decimal
+    dispensing_fee_paid: Decimal
+    total_amount_paid: Decimal
+    patient_pay_amount: Decimal
+    copay_amount: Decimal
+    deductible_amount: Decimal
+    remaining_deductible: Decimal
+    remaining_oop: Decimal
+
+
+@dataclass
+class BatchAdjudicationResult:
+    """Outcomes for a batch of claims, held column-wise in claim order.
+
+    For claim i, exactly one of payments[i] and reject_codes[i] is set.
+    ClaimResponse models are built only on request.
+    """
+
+    claim_ids: list[str] = field(default_factory=list)
+    payments: list[ClaimPayment | None] = field(default_factory=list)
+    reject_codes: list[list[str] | None] = field(default_factory=list)
+    dur_alerts: dict[int, list[DURAlert]] = field(default_factory=dict)
+    stats: BatchAdjudicationStats = field(default_factory=BatchAdjudicationStats)
+
+    def __len__(self) -> int:
+        return len(self.claim_ids)
+
+    def extend(self, other: "BatchAdjudicationResult") -> None:
+        """Append another result's claims and fold in its stats."""
+        offset = len(self.claim_ids)
+        self.claim_ids.extend(other.claim_ids)
+        self.payments.extend(other.payments)
+        self.reject_codes.extend(other.reject_codes)
+        for index, alerts in other.dur_alerts.items():
+            self.dur_alerts[offset + index] = alerts
+        self.stats.add(other.stats)
+
+    def response(self, index: int) -> ClaimResponse:
+        """ClaimResponse for the claim at an index."""
+        alerts = self.dur_alerts.get(index, [])
+        payment = self.payments[index]
+        if payment is None:
+            return ClaimResponse(
+                claim_id=self.claim_ids[index],
+                transaction_response_status="R",
+                response_status="R",
+                reject_codes=[
+                    RejectCode(code=code, description=REJECT_DESCRIPTIONS[code])
+                    for code in self.reject_codes[index] or ()
+                ],
+                dur_alerts=alerts,
+            )
+        return ClaimResponse(
+            claim_id=self.claim_ids[index],
+            transaction_response_status="A",
+            response_status="P",
+            amount_applied_to_deductible=payment.deductible_amount,
+            dur_alerts=alerts,
+            **payment._asdict(),
+        )
+
+    def responses(self) -> list[ClaimResponse]:
+        """ClaimResponse models for every claim, in claim order."""
+        return [self.response(index) for index in range(len(self.claim_ids))]
+
+
+class BatchAdjudicator:
+    """Adjudicate streams of pharmacy claims in staged batches."""
+
+    def __init__(
+        self,
+        formulary: Formulary | None = None,
+        dur_rules: DURRulesEngine | None = None,
+        quantity_limits: QuantityLimitManager | None = None,
+        step_therapy: StepTherapyManager | None = None,
+        prior_auth: PriorAuthWorkflow | None = None,
+        claim_history: Mapping[str, FillHistory | Iterable[Any]] | None = None,
+        accumulators: AccumulatorEngine | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        """Initialize the adjudicator.
+
+        Args:
+            formulary: Formulary for coverage and copays
+            dur_rules: DUR rules; when set, a major alert without a DUR
+                result-of-service override rejects the claim (88)
+            quantity_limits: Quantity limits to enforce (76)
+            step_therapy: Step therapy protocols to enforce (608)
+            prior_auth: PA workflow consulted when a PA-required claim has
+                no prior authorization number
+            claim_history: Earlier fills by member ID, as FillHistory objects
+                or claims/FillRecords
+            accumulators: Engine to apply deductible and OOP amounts to, for
+                family rollups; members missing from it are loaded from
+                RxMember.accumulators
+            batch_size: Claims per staged batch
+        """
+        self.formulary = formulary or Formulary(
+            formulary_id="DEFAULT",
+            name="Default Formulary",
+            effective_date="2025-01-01",
+        )
+        self.dur_rules = dur_rules
+        self.quantity_limits = quantity_limits
+        self.step_therapy = step_therapy
+        self.prior_auth = prior_auth
+        self.accumulators = accumulators
+        self.batch_size = batch_size
+        self.history: dict[str, FillHistory] = {
+            member_id: fills if isinstance(fills, FillHistory) else FillHistory.from_claims(fills)
+            for member_id, fills in (claim_history or {}).items()
+        }
+        self.stats = BatchAdjudicationStats()
+        self._drug_terms: dict[str, _DrugTerms] = {}
+        self._auth_numbers = count(random.randint(100_000_000, 899_999_999))
+
+    def adjudicate(
+        self,
+        claims: Iterable[PharmacyClaim],
+        members: Mapping[str, RxMember],
+    ) -> BatchAdjudicationResult:
+        """Adjudicate every claim in a stream.
+
+        Args:
+            claims: Claims, in submission order
+            members: Members by member ID
+
+        Returns:
+            All outcomes, in claim order, with combined stats
+        """
+        combined = BatchAdjudicationResult()
+        for result in self.iter_batches(claims, members):
+            combined.extend(result)
+        return combined
+
+    def iter_batches(
+        self,
+        claims: Iterable[PharmacyClaim],
+        members: Mapping[str, RxMember],
+    ) -> Iterator[BatchAdjudicationResult]:
+        """Adjudicate a stream batch by batch, holding one batch in memory."""
+        iterator = iter(claims)
+        while batch := list(islice(iterator, self.batch_size)):
+            yield self.adjudicate_batch(batch, members)
+
+    def adjudicate_batch(
+        self,
+        claims: list[PharmacyClaim],
+        members: Mapping[str, RxMember],
+    ) -> BatchAdjudicationResult:
+        """Adjudicate one batch of claims.
+
+        Member accumulators are updated in place when the batch completes.
+        """
+        start = time.perf_counter()
+        size = len(claims)
+        rejects: list[list[str] | None] = [None] * size
+
+        # Stage 1: eligibility
+        batch_members = [members.get(claim.member_id) for claim in claims]
+        for i, claim in enumerate(claims):
+            member = batch_members[i]
+            if member is None:
+                rejects[i] = ["52"]
+                continue
+            service_date = claim.service_date
+            if (
+                (member.termination_date and service_date > member.termination_date)
+                or service_date < member.effective_date
+                or claim.bin != member.bin
+                or claim.pcn != member.pcn
+                or claim.group_number != member.group_number
+            ):
+                rejects[i] = self._eligibility_rejects(claim, member)
+
+        # Stage 2: formulary
+        terms_by_ndc = self._drug_terms
+        terms: list[_DrugTerms | None] = [None] * size
+        for i, claim in enumerate(claims):
+            if rejects[i] is not None:
+                continue
+            drug = terms_by_ndc.get(claim.ndc)
+            if drug is None:
+                drug = terms_by_ndc[claim.ndc] = self._resolve_terms(claim.ndc)
+            if drug.covered:
+                terms[i] = drug
+            else:
+                rejects[i] = ["70"]
+
+        # Stage 3: prior authorization
+        prior_auth = self.prior_auth
+        for i, claim in enumerate(claims):
+            drug = terms[i]
+            if drug is None or not drug.requires_pa or claim.prior_auth_number:
+                continue
+            if prior_auth is not None and prior_auth.check_existing_auth(
+                claim.member_id, claim.ndc, claim.service_date
+            ):
+                continue
+            terms[i] = None
+            rejects[i] = ["75"]
+
+        # Stage 4: step therapy, DUR, quantity limits and pricing, in order
+        result = BatchAdjudicationResult(
+            claim_ids=[claim.claim_id for claim in claims],
+            payments=[None] * size,
+            reject_codes=rejects,
+        )
+        payments = result.payments
+        clinical = self._clinical_checks
+        track_history = clinical or bool(self.history)
+        history = self.history
+        no_fills = FillHistory()
+        balances: dict[str, list[Decimal]] = {}
+        engine = self.accumulators
+        auth_numbers = self._auth_numbers
+        for i, claim in enumerate(claims):
+            drug = terms[i]
+            if drug is None:
+                continue
+            member_id = claim.member_id
+            member = batch_members[i]
+            if clinical:
+                dur_alerts: list[DURAlert] = []
+                code = self._clinical_reject(
+                    claim, member, drug, history.get(member_id, no_fills), dur_alerts
+                )
+                if dur_alerts:
+                    result.dur_alerts[i] = dur_alerts
+                if code is not None:
+                    rejects[i] = [code]
+                    continue
+
+            # Pricing against the member's running balances:
+            # [deductible_met, deductible_remaining, oop_met, oop_remaining]
+            balance = balances.get(member_id)
+            if balance is None:
+                accumulators = member.accumulators
+                balance = balances[member_id] = [
+                    accumulators.deductible_met,
+                    accumulators.deductible_remaining,
+                    accumulators.oop_met,
+                    accumulators.oop_remaining,
+                ]
+                if engine is not None and member_id not in engine:
+                    accumulators.load_into(engine, member_id, claim.service_date.year)
+            if engine is not None:
+                # Family members may have moved the shared balances
+                balance[1] = from_cents(
+                    engine.deductible_remaining(member_id, benefit_type=_PHARMACY)
+                )
+                balance[3] = from_cents(engine.oop_remaining(member_id, benefit_type=_PHARMACY))
+            ingredient_cost = claim.ingredient_cost_submitted
+            dispensing_fee = claim.dispensing_fee_submitted
+            deductible_applied, patient_pays, plan_pays, copay = split_cost(
+                ingredient_cost + dispensing_fee, drug.copay, balance[1], balance[3]
+            )
+            if deductible_applied:
+                balance[0] += deductible_applied
+                balance[1] -= deductible_applied
+                if engine is not None:
+                    engine.apply_deductible(
+                        member_id, to_cents(deductible_applied), benefit_type=_PHARMACY
+                    )
+            if patient_pays:
+                balance[2] += patient_pays
+                balance[3] -= patient_pays
+                if engine is not None:
+                    engine.apply_oop(member_id, to_cents(patient_pays), benefit_type=_PHARMACY)
+
+            if track_history:
+                fills = history.get(member_id)
+                if fills is None:
+                    fills = history[member_id] = FillHistory()
+                fills.add(
+                    FillRecord(
+                        claim.ndc,
+                        drug.gpi,
+                        drug.drug_name,
+                        claim.service_date,
+                        claim.days_supply,
+                        claim.quantity_dispensed,
+                    )
+                )
+
+            payments[i] = ClaimPayment(
+                f"AUTH{next(auth_numbers)}",
+                ingredient_cost,
+                dispensing_fee,
+                plan_pays,
+                patient_pays,
+                copay,
+                deductible_applied,
+                balance[1],
+                balance[3],
+            )
+
+        # Write accumulators back to the members
+        for member_id, balance in balances.items():
+            accumulators = members[member_id].accumulators
+            if engine is not None:
+                balance[1] = from_cents(
+                    engine.deductible_remaining(member_id, benefit_type=_PHARMACY)
+                )
+                balance[3] = from_cents(engine.oop_remaining(member_id, benefit_type=_PHARMACY))
+            (
+                accumulators.deductible_met,
+                accumulators.deductible_remaining,
+                accumulators.oop_met,
+                accumulators.oop_remaining,
+            ) = balance
+
+        reject_counts: Counter = Counter()
+        for codes in rejects:
+            if codes is not None:
+                reject_counts.update(codes)
+        rejected = sum(1 for codes in rejects if codes is not None)
+        result.stats = BatchAdjudicationStats(
+            claims=size,
+            paid=size - rejected,
+            rejected=rejected,
+            seconds=time.perf_counter() - start,
+            reject_counts=reject_counts,
+        )
+        self.stats.add(result.stats)
+        return result
+
+    def _eligibility_rejects(self, claim: PharmacyClaim, member: RxMember) -> list[str]:
+        """Reject codes from the eligibility checks, as AdjudicationEngine applies them."""
+        codes = []
+        if member.termination_date and claim.service_date > member.termination_date:
+            codes.append("65")
+        if claim.service_date < member.effective_date:
+            codes.append("65")
+        if claim.bin != member.bin:
+            codes.append("25")
+        if claim.pcn != member.pcn:
+            codes.append("26")
+        if claim.group_number != member.group_number:
+            codes.append("64")
+        return codes
+
+    @property
+    def _clinical_checks(self) -> bool:
+        """Whether any fill-history-dependent check is configured."""
+        return (
+            self.dur_rules is not None
+            or self.quantity_limits is not None
+            or self.step_therapy is not None
+        )
+
+    def _resolve_terms(self, ndc: str) -> _DrugTerms:
+        """Formulary terms for an NDC."""
+        status = self.formulary.check_coverage(ndc)
+        if not status.covered:
+            return _DrugTerms(covered=False)
+        drug = self.formulary.drugs[ndc]
+        return _DrugTerms(
+            covered=True,
+            gpi=drug.gpi,
+            drug_name=drug.drug_name,
+            requires_pa=status.requires_pa,
+            requires_step_therapy=status.requires_step_therapy,
+            copay=Decimal(str(status.copay or 30)),
+        )
+
+    def _clinical_reject(
+        self,
+        claim: PharmacyClaim,
+        member: RxMember,
+        drug: _DrugTerms,
+        history: FillHistory,
+        dur_alerts: list[DURAlert],
+    ) -> str | None:
+        """Run step therapy, DUR and quantity limits; return a reject code or None."""
+        if self.step_therapy is not None and drug.requires_step_therapy:
+            result = self.step_therapy.check_step_therapy(
+                claim.ndc, history.fills(), claim.service_date
+            )
+            if result is not None and not result.satisfied:
+                return "608"
+
+        if self.dur_rules is not None:
+            major = False
+            for alert in self._dur_alerts(claim, member, drug, history):
+                major = major or alert.clinical_significance == ClinicalSignificance.LEVEL_1
+                dur_alerts.append(
+                    DURAlert(
+                        reason_for_service=alert.reason_for_service,
+                        clinical_significance=alert.clinical_significance.value,
+                        previous_fill_date=(
+                            alert.previous_fill_date.isoformat()
+                            if alert.previous_fill_date
+                            else None
+                        ),
+                        message=alert.message,
+                    )
+                )
+            if major and not claim.dur_result_of_service:
+                return "88"
+
+        if self.quantity_limits is not None:
+            result = self.quantity_limits.check_quantity_limit(
+                claim.ndc,
+                drug.gpi,
+                claim.quantity_dispensed,
+                claim.days_supply,
+                claim_history=history,
+                service_date=claim.service_date,
+            )
+            if not result.passed:
+                return "76"
+
+        return None
+
+    def _dur_alerts(
+        self,
+        claim: PharmacyClaim,
+        member: RxMember,
+        drug: _DrugTerms,
+        history: FillHistory,
+    ) -> list:
+        """DUR alerts for a claim against the member's active fills."""
+        rules = self.dur_rules
+        service_date = claim.service_date
+        current = [
+            {"ndc": fill.ndc, "gpi": fill.gpi, "name": fill.drug_name}
+            for fill in history.active_fills(service_date)
+        ]
+        alerts = []
+        if current:
+            alerts.extend(
+                rules.check_drug_drug_interactions(drug.gpi, claim.ndc, drug.drug_name, current)
+            )
+            alerts.extend(
+                rules.check_therapeutic_duplication(drug.gpi, claim.ndc, drug.drug_name, current)
+            )
+        refill = rules.check_early_refill(claim.ndc, drug.drug_name, service_date, history)
+        if refill is not None:
+            alerts.append(refill)
+        demographics = member.demographics
+        birth = demographics.date_of_birth
+        age = (
+            service_date.year
+            - birth.year
+            - ((service_date.month, service_date.day) < (birth.month, birth.day))
+        )
+        for alert in (
+            rules.check_age_restriction(drug.gpi, claim.ndc, drug.drug_name, age),
+            rules.check_gender_restriction(drug.gpi, claim.ndc, drug.drug_name, demographics.gender),
+        ):
+            if alert is not None:
+                alerts.append(alert)
+        return alerts
@@ -4,7 +4,9 @@ Provides pharmacy member models and generators.
 """
 
 from rxmembersim.core.drug import DEASchedule, DrugReference
+from rxmembersim.core.fill_history import FillHistory, FillRecord
 from rxmembersim.core.generator import RxMemberGenerator
+from rxmembersim.core.gpi import GPIPrefixIndex
 from rxmembersim.core.member import (
     BenefitAccumulators,
     MemberDemographics,
@@ -20,6 +22,9 @@ __all__ = [
     "DAWCode",
     "DEASchedule",
     "DrugReference",
+    "FillHistory",
+    "FillRecord",
+    "GPIPrefixIndex",
     "MemberDemographics",
     "Pharmacy",
     "Prescriber",
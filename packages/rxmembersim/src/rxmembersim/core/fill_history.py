@@ -0,0 +1,280 @@
+"""Per-member fill history indexed for date-window queries.
+
+Quantity limits, early refill checks and adherence measures all ask the
+same kind of question of a member's earlier fills: how much of a drug was
+dispensed, or how many days were supplied, between two dates. Scanning the
+whole history each time makes every check O(history).
+
+FillHistory keeps, for every NDC, the fill dates in sorted order with
+running totals of quantity and days supply. A window total is then two
+binary searches and a subtraction. GPI prefixes (drug classes) get the
+same index the first time they are queried, and it is kept up to date as
+fills are added.
+
+Usage:
+    history = FillHistory.from_claims(member_claims)
+    history.add(FillRecord(ndc, gpi, drug_name, service_date, 30, Decimal("30")))
+    used = history.quantity_between(date(2025, 1, 1), date(2025, 1, 31), ndc=ndc)
+    pdc = history.proportion_of_days_covered(date(2025, 1, 1), date(2025, 12, 31), gpi="3940")
+"""
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any
+
+_ZERO = Decimal("0")
+
+
+@dataclass(slots=True)
+class FillRecord:
+    """A paid fill, as seen by step therapy, DUR and quantity limit checks."""
+
+    ndc: str
+    gpi: str
+    drug_name: str
+    service_date: date
+    days_supply: int
+    quantity_dispensed: Decimal
+
+
+class _FillSeries:
+    """Fills of one drug key in date order, with running totals."""
+
+    __slots__ = ("fills", "ordinals", "quantity_sums", "days_sums", "max_days_supply")
+
+    def __init__(self) -> None:
+        self.fills: list[FillRecord] = []
+        self.ordinals: list[int] = []
+        # Running totals: entry i covers fills[:i]
+        self.quantity_sums: list[Decimal] = [_ZERO]
+        self.days_sums: list[int] = [0]
+        self.max_days_supply = 0
+
+    def add(self, fill: FillRecord) -> None:
+        ordinal = fill.service_date.toordinal()
+        ordinals = self.ordinals
+        self.max_days_supply = max(self.max_days_supply, fill.days_supply)
+        if not ordinals or ordinal > ordinals[-1]:
+            ordinals.append(ordinal)
+            self.fills.append(fill)
+            self.quantity_sums.append(self.quantity_sums[-1] + fill.quantity_dispensed)
+            self.days_sums.append(self.days_sums[-1] + fill.days_supply)
+            return
+        # Out of order (or same day): insert ahead of equal dates so the
+        # first fill recorded on a day stays last, as max() over a list would
+        # pick it, then rebuild the totals from the insertion point.
+        index = bisect_left(ordinals, ordinal)
+        ordinals.insert(index, ordinal)
+        self.fills.insert(index, fill)
+        del self.quantity_sums[index + 1 :]
+        del self.days_sums[index + 1 :]
+        for later in self.fills[index:]:
+            self.quantity_sums.append(self.quantity_sums[-1] + later.quantity_dispensed)
+            self.days_sums.append(self.days_sums[-1] + later.days_supply)
+
+    def bounds(self, start: date | None, end: date | None) -> tuple[int, int]:
+        """Index range of fills dated within [start, end]."""
+        ordinals = self.ordinals
+        lo = bisect_left(ordinals, start.toordinal()) if start else 0
+        hi = bisect_right(ordinals, end.toordinal()) if end else len(ordinals)
+        return lo, max(lo, hi)
+
+
+class FillHistory:
+    """A member's fills, indexed by NDC and GPI prefix for window totals."""
+
+    def __init__(self, fills: Iterable[FillRecord] = ()) -> None:
+        self._all = _FillSeries()
+        self._by_ndc: dict[str, _FillSeries] = {}
+        self._by_gpi: dict[str, _FillSeries] = {}
+        for fill in fills:
+            self.add(fill)
+
+    @classmethod
+    def from_claims(cls, claims: Iterable[Any]) -> "FillHistory":
+        """Build a history from claim objects or dicts.
+
+        Each claim needs ndc and service_date; gpi, drug_name, days_supply
+        (default 30) and quantity_dispensed (default 0) are optional.
+        """
+        history = cls()
+        for claim in claims:
+            if isinstance(claim, FillRecord):
+                history.add(claim)
+                continue
+            get = claim.get if isinstance(claim, Mapping) else _attr_getter(claim)
+            service_date = get("service_date")
+            if service_date is None:
+                continue
+            history.add(
+                FillRecord(
+                    ndc=get("ndc") or "",
+                    gpi=get("gpi") or "",
+                    drug_name=get("drug_name") or get("name") or "",
+                    service_date=service_date,
+                    days_supply=get("days_supply") or 30,
+                    quantity_dispensed=Decimal(str(get("quantity_dispensed") or 0)),
+                )
+            )
+        return history
+
+    def add(self, fill: FillRecord) -> None:
+        """Record a fill."""
+        self._all.add(fill)
+        series = self._by_ndc.get(fill.ndc)
+        if series is None:
+            series = self._by_ndc[fill.ndc] = _FillSeries()
+        series.add(fill)
+        if self._by_gpi:
+            gpi = fill.gpi
+            for prefix, series in self._by_gpi.items():
+                if gpi.startswith(prefix):
+                    series.add(fill)
+
+    def _series(self, ndc: str | None, gpi: str | None) -> _FillSeries | None:
+        if ndc is not None:
+            return self._by_ndc.get(ndc)
+        if gpi is not None:
+            series = self._by_gpi.get(gpi)
+            if series is None:
+                # Index a GPI prefix the first time it is asked for
+                series = self._by_gpi[gpi] = _FillSeries()
+                for fill in self._all.fills:
+                    if fill.gpi.startswith(gpi):
+                        series.add(fill)
+            return series
+        return self._all
+
+    def fills(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        ndc: str | None = None,
+        gpi: str | None = None,
+    ) -> list[FillRecord]:
+        """Fills dated within [start, end], oldest first.
+
+        Args:
+            start: First service date, or None for no lower bound
+            end: Last service date, or None for no upper bound
+            ndc: Only fills of this NDC
+            gpi: Only fills whose GPI starts with this prefix
+        """
+        series = self._series(ndc, gpi)
+        if series is None:
+            return []
+        lo, hi = series.bounds(start, end)
+        return series.fills[lo:hi]
+
+    def last_fill(self, ndc: str | None = None, gpi: str | None = None) -> FillRecord | None:
+        """Most recent fill of an NDC or GPI prefix (or of anything)."""
+        series = self._series(ndc, gpi)
+        return series.fills[-1] if series and series.fills else None
+
+    def quantity_between(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        ndc: str | None = None,
+        gpi: str | None = None,
+    ) -> Decimal:
+        """Total quantity dispensed in fills dated within [start, end]."""
+        series = self._series(ndc, gpi)
+        if series is None:
+            return _ZERO
+        lo, hi = series.bounds(start, end)
+        return series.quantity_sums[hi] - series.quantity_sums[lo]
+
+    def days_supply_between(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        ndc: str | None = None,
+        gpi: str | None = None,
+    ) -> int:
+        """Total days supplied by fills dated within [start, end]."""
+        series = self._series(ndc, gpi)
+        if series is None:
+            return 0
+        lo, hi = series.bounds(start, end)
+        return series.days_sums[hi] - series.days_sums[lo]
+
+    def active_fills(self, on: date) -> list[FillRecord]:
+        """Fills whose supply covers a date."""
+        series = self._all
+        earliest = on - timedelta(days=max(series.max_days_supply - 1, 0))
+        return [
+            fill
+            for fill in self.fills(earliest, on)
+            if fill.service_date + timedelta(days=fill.days_supply) > on
+        ]
+
+    # =========================================================================
+    # Adherence
+    # =========================================================================
+
+    def medication_possession_ratio(
+        self,
+        start: date,
+        end: date,
+        ndc: str | None = None,
+        gpi: str | None = None,
+    ) -> float:
+        """Days supplied by fills in [start, end] over the days in the period.
+
+        Not capped at 1: overlapping fills give an MPR above 1.
+        """
+        period_days = (end - start).days + 1
+        if period_days <= 0:
+            return 0.0
+        return self.days_supply_between(start, end, ndc=ndc, gpi=gpi) / period_days
+
+    def proportion_of_days_covered(
+        self,
+        start: date,
+        end: date,
+        ndc: str | None = None,
+        gpi: str | None = None,
+    ) -> float:
+        """Share of days in [start, end] on which the member had supply.
+
+        An early refill's supply starts when the previous supply runs out,
+        so overlaps carry forward rather than double count. Fills from
+        before the period count for the days they cover inside it.
+        """
+        period_days = (end - start).days + 1
+        series = self._series(ndc, gpi)
+        if period_days <= 0 or series is None:
+            return 0.0
+        first = start.toordinal()
+        last = end.toordinal()
+        lo, hi = series.bounds(
+            start - timedelta(days=max(series.max_days_supply - 1, 0)), end
+        )
+        covered = 0
+        supplied_until = 0  # first ordinal not yet covered
+        for ordinal, fill in zip(series.ordinals[lo:hi], series.fills[lo:hi], strict=True):
+            begin = max(ordinal, supplied_until)
+            supplied_until = begin + fill.days_supply
+            overlap = min(supplied_until, last + 1) - max(begin, first)
+            if overlap > 0:
+                covered += overlap
+        return min(covered, period_days) / period_days
+
+    def __len__(self) -> int:
+        return len(self._all.fills)
+
+    def __bool__(self) -> bool:
+        return bool(self._all.fills)
+
+    def __iter__(self) -> Iterator[FillRecord]:
+        return iter(self._all.fills)
+
+
+def _attr_getter(obj: Any):
+    def get(name: str) -> Any:
+        return getattr(obj, name, None)
+
+    return get
@@ -0,0 +1,74 @@
+"""GPI prefix index.
+
+Pharmacy rules (DUR interactions, duplications, restrictions) name a drug
+class by a GPI prefix: "83" for a drug group, "8330" for a class, up to the
+full 14-character product. A GPI matches a rule when it starts with the
+rule's prefix. GPIPrefixIndex keys rules by their exact prefix, so finding
+every rule that matches a GPI takes one dict lookup per prefix length in
+use (at most 14), however many rules are loaded.
+"""
+from collections.abc import Iterable, Iterator
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+GPI_LENGTH = 14
+
+# Standard GPI hierarchy levels: group, class, subclass, drug name,
+# name extension, dosage form, strength
+GPI_LEVELS = (2, 4, 6, 8, 10, 12, 14)
+
+
+class GPIPrefixIndex(Generic[T]):
+    """Rules keyed by GPI prefix, matched in insertion order."""
+
+    def __init__(self, entries: Iterable[tuple[str, T]] = ()) -> None:
+        self._by_prefix: dict[str, list[tuple[int, T]]] = {}
+        self._lengths: list[int] = []
+        self._size = 0
+        for prefix, item in entries:
+            self.add(prefix, item)
+
+    def add(self, prefix: str, item: T) -> None:
+        """Add a rule for every GPI starting with prefix."""
+        bucket = self._by_prefix.get(prefix)
+        if bucket is None:
+            bucket = self._by_prefix[prefix] = []
+            if len(prefix) not in self._lengths:
+                self._lengths.append(len(prefix))
+                self._lengths.sort()
+        bucket.append((self._size, item))
+        self._size += 1
+
+    def _matches(self, gpi: str) -> list[tuple[int, T]]:
+        by_prefix = self._by_prefix
+        found: list[tuple[int, T]] = []
+        for length in self._lengths:
+            if length > len(gpi):
+                break
+            bucket = by_prefix.get(gpi[:length])
+            if bucket:
+                found.extend(bucket)
+        if len(found) > 1:
+            found.sort(key=lambda entry: entry[0])
+        return found
+
+    def match(self, gpi: str) -> list[T]:
+        """Rules whose prefix the GPI starts with, in the order they were added."""
+        return [item for _, item in self._matches(gpi)]
+
+    def first(self, gpi: str) -> T | None:
+        """The earliest-added rule matching the GPI, or None."""
+        matches = self.match(gpi)
+        return matches[0] if matches else None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def __iter__(self) -> Iterator[T]:
+        entries = [entry for bucket in self._by_prefix.values() for entry in bucket]
+        entries.sort(key=lambda entry: entry[0])
+        return (item for _, item in entries)
@@ -7,8 +7,8 @@ For shared accumulator infrastructure, see healthsim.benefits.
 from datetime import date
 from decimal import Decimal
 
+from healthsim.benefits import AccumulatorEngine, BenefitType, create_pharmacy_accumulators
 from healthsim.benefits import AccumulatorSet as CoreAccumulatorSet
-from healthsim.benefits import BenefitType, create_pharmacy_accumulators
 from pydantic import BaseModel, Field
 
 
@@ -152,6 +152,52 @@ class BenefitAccumulators(BaseModel):
             oop_remaining=rx_oop.remaining if rx_oop else Decimal("0"),
         )
 
+    def load_into(
+        self,
+        engine: AccumulatorEngine,
+        member_id: str,
+        plan_year: int,
+        family_id: str | None = None,
+    ) -> None:
+        """Add these balances to an AccumulatorEngine.
+
+        Args:
+            engine: Engine to load into
+            member_id: Member identifier
+            plan_year: Benefit plan year
+            family_id: Family the member rolls up to, if any
+        """
+        engine.load(self.to_accumulator_set(member_id, plan_year), family_id=family_id)
+
+    @classmethod
+    def from_engine(cls, engine: AccumulatorEngine, member_id: str) -> "BenefitAccumulators":
+        """Read a member's pharmacy balances back from an AccumulatorEngine.
+
+        Members without carved-out pharmacy accumulators report the combined
+        in-network deductible and OOP, with family rollups applied.
+
+        Args:
+            engine: Engine holding the member
+            member_id: Member identifier
+
+        Returns:
+            BenefitAccumulators instance
+        """
+        acc_set = engine.snapshot(member_id)
+        if acc_set.rx_deductible or acc_set.rx_oop:
+            return cls.from_accumulator_set(acc_set)
+
+        ded = acc_set.deductible_individual_in
+        oop = acc_set.oop_individual_in
+        return cls(
+            deductible_met=ded.applied if ded else Decimal("0"),
+            deductible_remaining=acc_set.get_deductible_remaining(
+                benefit_type=BenefitType.PHARMACY
+            ),
+            oop_met=oop.applied if oop else Decimal("0"),
+            oop_remaining=acc_set.get_oop_remaining(benefit_type=BenefitType.PHARMACY),
+        )
+
 
 class RxMember(BaseModel):
     """Pharmacy benefit member."""
@@ -1,9 +1,12 @@
 """RxMemberSim Dimensional Output.
 
 Transforms RxMemberSim canonical models into dimensional (star schema) format
-for analytics, reporting, and BI tools.
+for analytics, reporting, and BI tools. RxMemberSimInDatabaseTransformer
+builds the claim-derived tables with CREATE TABLE AS SELECT against the
+canonical DuckDB tables for a cohort.
 """
 
+from .in_database import RxMemberSimInDatabaseTransformer
 from .transformer import RxMemberSimDimensionalTransformer
 
-__all__ = ["RxMemberSimDimensionalTransformer"]
+__all__ = ["RxMemberSimDimensionalTransformer", "RxMemberSimInDatabaseTransformer"]
@@ -0,0 +1,245 @@
+"""RxMemberSim In-Database Dimensional Transformer.
+
+Builds the RxMemberSim star schema with ``CREATE TABLE AS SELECT`` statements
+against the canonical DuckDB tables, mirroring the tables and columns of
+``RxMemberSimDimensionalTransformer`` without moving rows through Python.
+"""
+
+from __future__ import annotations
+
+from healthsim.dimensional import BaseInDatabaseTransformer
+
+
+def _normalize_ndc_sql(ndc: str) -> str:
+    """SQL for ``_normalize_ndc``: strip separators, pad 10-digit NDCs to 11."""
+    clean = f"replace(replace({ndc}, '-', ''), ' ', '')"
+    return (
+        f"CASE WHEN {ndc} IS NULL OR {ndc} = '' THEN {ndc}"
+        f" WHEN length({clean}) = 10 THEN substr({clean}, 1, 9) || '0' || substr({clean}, 10)"
+        f" ELSE {clean} END"
+    )
+
+
+# Pharmacy claims with the normalized 11-digit NDC
+_CLAIMS = f"""
+    clm AS (SELECT *, {_normalize_ndc_sql("ndc")} AS ndc_11 FROM {{pharmacy_claims}})
+"""
+
+# NDCs seen on claims, sorted; medication_key is the 1-based position
+_MEDICATION_KEYS = """
+    medication_keys AS (
+        SELECT ndc_11, row_number() OVER (ORDER BY ndc_11) AS medication_key
+        FROM (SELECT DISTINCT ndc_11 FROM clm WHERE ndc_11 <> '')
+    )
+"""
+
+# Pharmacies seen on claims, sorted by NPI; the first claim supplies the NCPDP ID
+_PHARMACY_KEYS = """
+    pharmacy_keys AS (
+        SELECT
+            pharmacy_npi AS npi,
+            arg_min_null(pharmacy_ncpdp, source_row) AS ncpdp_id,
+            row_number() OVER (ORDER BY pharmacy_npi) AS pharmacy_key
+        FROM clm
+        WHERE pharmacy_npi <> ''
+        GROUP BY pharmacy_npi
+    )
+"""
+
+# Prescribers seen on claims, sorted by NPI
+_PRESCRIBER_KEYS = """
+    prescriber_keys AS (
+        SELECT prescriber_npi AS npi, row_number() OVER (ORDER BY prescriber_npi) AS prescriber_key
+        FROM (SELECT DISTINCT prescriber_npi FROM clm WHERE prescriber_npi <> '')
+    )
+"""
+
+
+class RxMemberSimInDatabaseTransformer(BaseInDatabaseTransformer):
+    """Build the RxMemberSim star schema inside DuckDB.
+
+    Reads the canonical pharmacy_claims and prescriptions tables for one
+    cohort and writes dim_medication, dim_pharmacy, dim_prescriber and
+    fact_prescription_fills with the same columns as
+    ``RxMemberSimDimensionalTransformer``. The canonical store has no drug
+    reference, pharmacy, prescriber, formulary, prior authorization or
+    RxMember tables, so in this mode:
+
+    - Medications, pharmacies and prescribers are the placeholder entries
+      derived from claims, with drug names, prescriber names and DEA
+      numbers filled in from prescriptions where available.
+    - dim_rx_member, dim_formulary, fact_prior_auth and
+      fact_rx_eligibility_spans are not built.
+    - Claim columns the canonical table does not store (compound code,
+      prior auth number, DUR codes, drug attributes) are NULL and their
+      flags are FALSE.
+
+    Example:
+        >>> from healthsim.db import get_connection
+        >>> from rxmembersim.dimensional import RxMemberSimInDatabaseTransformer
+        >>>
+        >>> transformer = RxMemberSimInDatabaseTransformer(
+        ...     get_connection(), cohort='pbm-2024'
+        ... )
+        >>> row_counts = transformer.build()
+    """
+
+    SOURCE_TABLES = ("pharmacy_claims", "prescriptions")
+
+    def table_definitions(self) -> dict[str, str]:
+        """Return the SELECT for each RxMemberSim dimension and fact table."""
+        return {
+            "dim_medication": self._dim_medication(),
+            "dim_pharmacy": self._dim_pharmacy(),
+            "dim_prescriber": self._dim_prescriber(),
+            "fact_prescription_fills": self._fact_prescription_fills(),
+        }
+
+    # -------------------------------------------------------------------------
+    # Dimensions
+    # -------------------------------------------------------------------------
+
+    def _dim_medication(self) -> str:
+        return f"""
+            WITH {_CLAIMS}, {_MEDICATION_KEYS},
+            drug_names AS (
+                SELECT
+                    {_normalize_ndc_sql("ndc")} AS ndc_11,
+                    arg_min(drug_name, source_row) AS drug_name
+                FROM {{prescriptions}}
+                GROUP BY ALL
+            )
+            SELECT
+                k.medication_key,
+                k.ndc_11,
+                CASE WHEN length(k.ndc_11) = 11
+                    THEN substr(k.ndc_11, 1, 9) || substr(k.ndc_11, 11)
+                    ELSE k.ndc_11
+                END AS ndc_10,
+                n.drug_name,
+                CAST(NULL AS VARCHAR) AS generic_name,
+                CAST(NULL AS VARCHAR) AS gpi,
+                CAST(NULL AS VARCHAR) AS gpi_2,
+                CAST(NULL AS VARCHAR) AS gpi_4,
+                CAST(NULL AS VARCHAR) AS gpi_6,
+                CAST(NULL AS VARCHAR) AS therapeutic_class,
+                'Unknown' AS therapeutic_category,
+                CAST(NULL AS VARCHAR) AS strength,
+                CAST(NULL AS VARCHAR) AS dosage_form,
+                CAST(NULL AS VARCHAR) AS route_of_admin,
+                CAST(NULL AS VARCHAR) AS dea_schedule,
+                FALSE AS is_controlled,
+                CAST(NULL AS BOOLEAN) AS is_brand,
+                CAST(NULL AS VARCHAR) AS multi_source_code,
+                CAST(NULL AS DOUBLE) AS awp,
+                CAST(NULL AS DOUBLE) AS wac
+            FROM medication_keys k
+            LEFT JOIN drug_names n USING (ndc_11)
+            ORDER BY k.medication_key
+        """
+
+    def _dim_pharmacy(self) -> str:
+        return f"""
+            WITH {_CLAIMS}, {_PHARMACY_KEYS}
+            SELECT
+                pharmacy_key,
+                npi AS pharmacy_npi,
+                ncpdp_id,
+                npi AS pharmacy_name,
+                CAST(NULL AS VARCHAR) AS dba_name,
+                'UNKNOWN' AS pharmacy_type,
+                'Other' AS pharmacy_category,
+                CAST(NULL AS VARCHAR) AS city,
+                CAST(NULL AS VARCHAR) AS state,
+                CAST(NULL AS VARCHAR) AS postal_code,
+                CAST(NULL AS BOOLEAN) AS in_network,
+                CAST(NULL AS BOOLEAN) AS preferred,
+                CAST(NULL AS BOOLEAN) AS specialty_certified,
+                CAST(NULL AS VARCHAR) AS chain_code,
+                CAST(NULL AS VARCHAR) AS chain_name,
+                CAST(NULL AS BOOLEAN) AS has_delivery,
+                CAST(NULL AS BOOLEAN) AS has_24_hour
+            FROM pharmacy_keys
+            ORDER BY pharmacy_key
+        """
+
+    def _dim_prescriber(self) -> str:
+        return f"""
+            WITH {_CLAIMS}, {_PRESCRIBER_KEYS},
+            written AS (
+                SELECT
+                    prescriber_npi AS npi,
+                    arg_min(prescriber_name, source_row) AS prescriber_name,
+                    arg_min(prescriber_dea, source_row) AS dea_number
+                FROM {{prescriptions}}
+                GROUP BY prescriber_npi
+            )
+            SELECT
+                k.prescriber_key,
+                k.npi AS prescriber_npi,
+                w.dea_number,
+                CAST(NULL AS VARCHAR) AS first_name,
+                CAST(NULL AS VARCHAR) AS last_name,
+                coalesce(w.prescriber_name, k.npi) AS full_name,
+                coalesce(w.prescriber_name, k.npi) AS display_name,
+                CAST(NULL AS VARCHAR) AS credential,
+                CAST(NULL AS VARCHAR) AS specialty,
+                CAST(NULL AS VARCHAR) AS taxonomy_code,
+                CAST(NULL AS VARCHAR) AS city,
+                CAST(NULL AS VARCHAR) AS state,
+                CAST(NULL AS BOOLEAN) AS is_active,
+                CAST(NULL AS BOOLEAN) AS can_prescribe_controlled
+            FROM prescriber_keys k
+            LEFT JOIN written w USING (npi)
+            ORDER BY k.prescriber_key
+        """
+
+    # -------------------------------------------------------------------------
+    # Facts
+    # -------------------------------------------------------------------------
+
+    def _fact_prescription_fills(self) -> str:
+        return f"""
+            WITH {_CLAIMS}, {_MEDICATION_KEYS}, {_PHARMACY_KEYS}, {_PRESCRIBER_KEYS}
+            SELECT
+                row_number() OVER (ORDER BY c.source_row) AS fill_fact_key,
+                c.claim_id,
+                c.member_id AS member_key,
+                c.cardholder_id AS cardholder_key,
+                coalesce(ph.pharmacy_key, -1) AS pharmacy_key,
+                coalesce(pr.prescriber_key, -1) AS prescriber_key,
+                coalesce(m.medication_key, -1) AS medication_key,
+                {self.date_key_sql("c.service_date")} AS service_date_key,
+                c.service_date,
+                c.transaction_code,
+                coalesce(c.fill_number = 0, FALSE) AS is_new_fill,
+                coalesce(c.fill_number > 0, FALSE) AS is_refill,
+                c.fill_number,
+                c.prescription_number,
+                c.ndc_11,
+                CAST(c.quantity_dispensed AS DOUBLE) AS quantity_dispensed,
+                c.days_supply,
+                c.daw_code,
+                CAST(NULL AS VARCHAR) AS compound_code,
+                FALSE AS is_compound,
+                CAST(c.ingredient_cost_submitted AS DOUBLE) AS ingredient_cost_submitted,
+                CAST(c.dispensing_fee_submitted AS DOUBLE) AS dispensing_fee_submitted,
+                CAST(c.usual_customary_charge AS DOUBLE) AS usual_customary_charge,
+                CAST(c.gross_amount_due AS DOUBLE) AS gross_amount_due,
+                CAST(NULL AS VARCHAR) AS prior_auth_number,
+                FALSE AS has_prior_auth,
+                CAST(NULL AS VARCHAR) AS dur_reason_for_service,
+                CAST(NULL AS VARCHAR) AS dur_professional_service,
+                FALSE AS has_dur_intervention,
+                c.bin,
+                c.pcn,
+                c.group_number,
+                CAST(NULL AS BOOLEAN) AS is_brand,
+                CAST(NULL AS BOOLEAN) AS is_controlled,
+                CAST(NULL AS DOUBLE) AS awp_unit_price
+            FROM clm c
+            LEFT JOIN pharmacy_keys ph ON ph.npi = c.pharmacy_npi
+            LEFT JOIN prescriber_keys pr ON pr.npi = c.prescriber_npi
+            LEFT JOIN medication_keys m USING (ndc_11)
+            ORDER BY c.source_row
+        """
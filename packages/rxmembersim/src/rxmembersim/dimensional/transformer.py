@@ -46,11 +46,142 @@ GPI_THERAPEUTIC_CLASSES = {
 }
 
 
+# Source attributes extracted (once per transform) for each model list
+_SOURCE_FIELDS: dict[str, dict[str, str]] = {
+    "members": {
+        "member_id": "member_id",
+        "cardholder_id": "cardholder_id",
+        "person_code": "person_code",
+        "bin": "bin",
+        "pcn": "pcn",
+        "group_number": "group_number",
+        "first_name": "demographics.first_name",
+        "last_name": "demographics.last_name",
+        "date_of_birth": "demographics.date_of_birth",
+        "gender": "demographics.gender",
+        "city": "demographics.city",
+        "state": "demographics.state",
+        "zip_code": "demographics.zip_code",
+        "plan_code": "plan_code",
+        "formulary_id": "formulary_id",
+        "effective_date": "effective_date",
+        "termination_date": "termination_date",
+        "deductible_met": "accumulators.deductible_met",
+        "deductible_remaining": "accumulators.deductible_remaining",
+        "oop_met": "accumulators.oop_met",
+        "oop_remaining": "accumulators.oop_remaining",
+    },
+    "drugs": {
+        "ndc": "ndc",
+        "drug_name": "drug_name",
+        "generic_name": "generic_name",
+        "gpi": "gpi",
+        "therapeutic_class": "therapeutic_class",
+        "strength": "strength",
+        "dosage_form": "dosage_form",
+        "route_of_admin": "route_of_admin",
+        "dea_schedule": "dea_schedule",
+        "is_brand": "is_brand",
+        "multi_source_code": "multi_source_code",
+        "awp": "awp",
+        "wac": "wac",
+    },
+    "pharmacies": {
+        "npi": "npi",
+        "ncpdp_id": "ncpdp_id",
+        "name": "name",
+        "dba_name": "dba_name",
+        "pharmacy_type": "pharmacy_type",
+        "city": "city",
+        "state": "state",
+        "zip_code": "zip_code",
+        "in_network": "in_network",
+        "preferred": "preferred",
+        "specialty_certified": "specialty_certified",
+        "chain_code": "chain_code",
+        "chain_name": "chain_name",
+        "has_delivery": "has_delivery",
+        "has_24_hour": "has_24_hour",
+    },
+    "prescribers": {
+        "npi": "npi",
+        "dea": "dea",
+        "first_name": "first_name",
+        "last_name": "last_name",
+        "full_name": "full_name",
+        "display_name": "display_name",
+        "credential": "credential",
+        "specialty": "specialty",
+        "taxonomy_code": "taxonomy_code",
+        "city": "city",
+        "state": "state",
+        "active": "active",
+        "can_prescribe_controlled": "can_prescribe_controlled",
+    },
+    "claims": {
+        "claim_id": "claim_id",
+        "transaction_code": "transaction_code",
+        "service_date": "service_date",
+        "pharmacy_npi": "pharmacy_npi",
+        "pharmacy_ncpdp": "pharmacy_ncpdp",
+        "member_id": "member_id",
+        "cardholder_id": "cardholder_id",
+        "bin": "bin",
+        "pcn": "pcn",
+        "group_number": "group_number",
+        "prescription_number": "prescription_number",
+        "fill_number": "fill_number",
+        "ndc": "ndc",
+        "quantity_dispensed": "quantity_dispensed",
+        "days_supply": "days_supply",
+        "daw_code": "daw_code",
+        "compound_code": "compound_code",
+        "prescriber_npi": "prescriber_npi",
+        "ingredient_cost_submitted": "ingredient_cost_submitted",
+        "dispensing_fee_submitted": "dispensing_fee_submitted",
+        "usual_customary_charge": "usual_customary_charge",
+        "gross_amount_due": "gross_amount_due",
+        "prior_auth_number": "prior_auth_number",
+        "dur_reason_for_service": "dur_reason_for_service",
+        "dur_professional_service": "dur_professional_service",
+    },
+    "prior_auths": {
+        "pa_request_id": "request.pa_request_id",
+        "member_id": "request.member_id",
+        "cardholder_id": "request.cardholder_id",
+        "ndc": "request.ndc",
+        "drug_name": "request.drug_name",
+        "request_date": "request.request_date",
+        "request_type": "request.request_type",
+        "urgency": "request.urgency",
+        "quantity_requested": "request.quantity_requested",
+        "days_supply_requested": "request.days_supply_requested",
+        "prescriber_npi": "request.prescriber_npi",
+        "prescriber_name": "request.prescriber_name",
+        "prescriber_specialty": "request.prescriber_specialty",
+        "diagnosis_codes": "request.diagnosis_codes",
+        "clinical_notes": "request.clinical_notes",
+        "lab_results": "request.lab_results",
+        "response": "response",
+        "pa_number": "response.pa_number",
+        "response_date": "response.response_date",
+        "status": "response.status",
+        "auto_approved": "response.auto_approved",
+        "denial_reason": "response.denial_reason",
+        "quantity_approved": "response.quantity_approved",
+        "days_supply_approved": "response.days_supply_approved",
+        "effective_date": "response.effective_date",
+        "expiration_date": "response.expiration_date",
+    },
+}
+
+
 class RxMemberSimDimensionalTransformer(BaseDimensionalTransformer):
     """Transform RxMemberSim canonical models into dimensional format.
 
     Creates star schema with dimensions and fact tables optimized for
-    pharmacy/PBM analytics.
+    pharmacy/PBM analytics. Each model list is converted to columns once;
+    surrogate keys and derived columns are computed column-wise.
 
     Dimensions:
         - dim_rx_member: Pharmacy member demographics and benefit info
@@ -78,6 +209,27 @@ class RxMemberSimDimensionalTransformer(BaseDimensionalTransformer):
         >>> dimensions, facts = transformer.transform()
     """
 
+    KEY_COLUMNS = {
+        "dim_rx_member": "member_key",
+        "dim_medication": "medication_key",
+        "dim_pharmacy": "pharmacy_key",
+        "dim_prescriber": "prescriber_key",
+        "dim_formulary": "formulary_key",
+    }
+
+    NATURAL_KEYS = {
+        "dim_medication": "ndc_11",
+        "dim_pharmacy": "pharmacy_npi",
+        "dim_prescriber": "prescriber_npi",
+        "dim_formulary": "formulary_id",
+    }
+
+    FACT_KEYS = {
+        "fact_prescription_fills": "fill_fact_key",
+        "fact_prior_auth": "prior_auth_fact_key",
+        "fact_rx_eligibility_spans": "rx_eligibility_span_key",
+    }
+
     def __init__(
         self,
         members: list[RxMember] | None = None,
@@ -110,10 +262,7 @@ class RxMemberSimDimensionalTransformer(BaseDimensionalTransformer):
         self.prior_auths = prior_auths or []
         self.snapshot_date = snapshot_date or date.today()
 
-        # Build drug lookup by NDC
-        self._drug_lookup: dict[str, DrugReference] = {
-            self._normalize_ndc(d.ndc): d for d in self.drugs
-        }
+        self._frame_cache: dict[str, pd.DataFrame] = {}
 
     def transform(self) -> tuple[dict[str, pd.DataFrame], dict[str, pd.DataFrame]]:
         """Transform canonical models into dimensional format.
@@ -125,6 +274,9 @@ class RxMemberSimDimensionalTransformer(BaseDimensionalTransformer):
         dimensions = {}
         facts = {}
 
+        # Model lists are converted to columns once per transform
+        self._frame_cache.clear()
+
         # Build dimensions
         if self.members:
             dimensions["dim_rx_member"] = self._build_dim_rx_member()
@@ -157,7 +309,15 @@ class RxMemberSimDimensionalTransformer(BaseDimensionalTransformer):
         if self.members:
             facts["fact_rx_eligibility_spans"] = self._build_fact_rx_eligibility_spans()
 
-        return dimensions, facts
+        return self.infer_dtypes(dimensions), self.infer_dtypes(facts)
+
+    def _frame(self, name: str) -> pd.DataFrame:
+        """Get the columnar form of one model list, extracting it on first use."""
+        if name not in self._frame_cache:
+            self._frame_cache[name] = self.extract_columns(
+                getattr(self, name), _SOURCE_FIELDS[name]
+            )
+        return self._frame_cache[name]
 
     # -------------------------------------------------------------------------
     # Dimension Builders
@@ -165,131 +325,48 @@ class RxMemberSimDimensionalTransformer(BaseDimensionalTransformer):
 
     def _build_dim_rx_member(self) -> pd.DataFrame:
         """Build pharmacy member dimension."""
-        records = []
-        for member in self.members:
-            demo = member.demographics
-            age = self.calculate_age(demo.date_of_birth, self.snapshot_date)
-
-            records.append(
-                {
-                    "member_key": member.member_id,
-                    "member_id": member.member_id,
-                    "cardholder_id": member.cardholder_id,
-                    "person_code": member.person_code,
-                    "bin": member.bin,
-                    "pcn": member.pcn,
-                    "group_number": member.group_number,
-                    "given_name": demo.first_name,
-                    "family_name": demo.last_name,
-                    "full_name": f"{demo.first_name} {demo.last_name}",
-                    "birth_date_key": self.date_to_key(demo.date_of_birth),
-                    "birth_date": demo.date_of_birth,
-                    "gender_code": demo.gender,
-                    "gender_description": self._get_gender_description(demo.gender),
-                    "age_at_snapshot": age,
-                    "age_band": self.age_band(age),
-                    "city": demo.city,
-                    "state": demo.state,
-                    "postal_code": demo.zip_code,
-                    "plan_code": member.plan_code,
-                    "formulary_id": member.formulary_id,
-                    "effective_date_key": self.date_to_key(member.effective_date),
-                    "effective_date": member.effective_date,
-                    "termination_date_key": (
-                        self.date_to_key(member.termination_date)
-                        if member.termination_date else None
-                    ),
-                    "termination_date": member.termination_date,
-                    "deductible_met": float(member.accumulators.deductible_met),
-                    "deductible_remaining": float(member.accumulators.deductible_remaining),
-                    "oop_met": float(member.accumulators.oop_met),
-                    "oop_remaining": float(member.accumulators.oop_remaining),
-                    "is_cardholder": member.person_code == "01",
-                }
-            )
-        return pd.DataFrame(records)
+        df = self._frame("members")
+        age = self.calculate_ages(df["date_of_birth"], self.snapshot_date)
+
+        return pd.DataFrame(
+            {
+                "member_key": df["member_id"],
+                "member_id": df["member_id"],
+                "cardholder_id": df["cardholder_id"],
+                "person_code": df["person_code"],
+                "bin": df["bin"],
+                "pcn": df["pcn"],
+                "group_number": df["group_number"],
+                "given_name": df["first_name"],
+                "family_name": df["last_name"],
+                "full_name": df["first_name"].astype(str) + " " + df["last_name"].astype(str),
+                "birth_date_key": self.dates_to_keys(df["date_of_birth"]),
+                "birth_date": df["date_of_birth"],
+                "gender_code": df["gender"],
+                "gender_description": self.map_unique(df["gender"], self._get_gender_description),
+                "age_at_snapshot": age,
+                "age_band": self.age_bands(age),
+                "city": df["city"],
+                "state": df["state"],
+                "postal_code": df["zip_code"],
+                "plan_code": df["plan_code"],
+                "formulary_id": df["formulary_id"],
+                "effective_date_key": self.dates_to_keys(df["effective_date"]),
+                "effective_date": df["effective_date"],
+                "termination_date_key": self.dates_to_keys(df["termination_date"]),
+                "termination_date": df["termination_date"],
+                "deductible_met": df["deductible_met"].astype(float),
+                "deductible_remaining": df["deductible_remaining"].astype(float),
+                "oop_met": df["oop_met"].astype(float),
+                "oop_remaining": df["oop_remaining"].astype(float),
+                "is_cardholder": df["person_code"] == "01",
+            }
+        )
 
     def _build_dim_medication(self) -> pd.DataFrame:
         """Build medication dimension from drugs and claims."""
-        # Collect NDCs from drugs and claims
-        ndcs: dict[str, dict] = {}
-
-        # From explicit drug references
-        for drug in self.drugs:
-            ndc_11 = self._normalize_ndc(drug.ndc)
-            ndcs[ndc_11] = {
-                "ndc_11": ndc_11,
-                "ndc_10": self._ndc_11_to_10(ndc_11),
-                "drug_name": drug.drug_name,
-                "generic_name": drug.generic_name,
-                "gpi": drug.gpi,
-                "therapeutic_class": drug.therapeutic_class,
-                "strength": drug.strength,
-                "dosage_form": drug.dosage_form,
-                "route_of_admin": drug.route_of_admin,
-                "dea_schedule": (
-                    drug.dea_schedule.value
-                    if hasattr(drug.dea_schedule, "value")
-                    else drug.dea_schedule
-                ),
-                "is_brand": drug.is_brand,
-                "multi_source_code": drug.multi_source_code,
-                "awp": drug.awp,
-                "wac": drug.wac,
-            }
-
-        # From claims (add NDCs we don't have details for)
-        for claim in self.claims:
-            ndc_11 = self._normalize_ndc(claim.ndc)
-            if ndc_11 not in ndcs:
-                ndcs[ndc_11] = {
-                    "ndc_11": ndc_11,
-                    "ndc_10": self._ndc_11_to_10(ndc_11),
-                    "drug_name": None,
-                    "generic_name": None,
-                    "gpi": None,
-                    "therapeutic_class": None,
-                    "strength": None,
-                    "dosage_form": None,
-                    "route_of_admin": None,
-                    "dea_schedule": None,
-                    "is_brand": None,
-                    "multi_source_code": None,
-                    "awp": None,
-                    "wac": None,
-                }
-
-        records = []
-        for idx, (_ndc, info) in enumerate(sorted(ndcs.items()), start=1):
-            gpi = info.get("gpi") or ""
-            therapeutic_category = self._get_therapeutic_category(gpi)
-
-            records.append(
-                {
-                    "medication_key": idx,
-                    "ndc_11": info["ndc_11"],
-                    "ndc_10": info["ndc_10"],
-                    "drug_name": info["drug_name"],
-                    "generic_name": info["generic_name"],
-                    "gpi": info["gpi"],
-                    "gpi_2": gpi[:2] if len(gpi) >= 2 else None,
-                    "gpi_4": gpi[:4] if len(gpi) >= 4 else None,
-                    "gpi_6": gpi[:6] if len(gpi) >= 6 else None,
-                    "therapeutic_class": info["therapeutic_class"],
-                    "therapeutic_category": therapeutic_category,
-                    "strength": info["strength"],
-                    "dosage_form": info["dosage_form"],
-                    "route_of_admin": info["route_of_admin"],
-                    "dea_schedule": info["dea_schedule"],
-                    "is_controlled": info["dea_schedule"] not in (None, "0"),
-                    "is_brand": info["is_brand"],
-                    "multi_source_code": info["multi_source_code"],
-                    "awp": info["awp"],
-                    "wac": info["wac"],
-                }
-            )
-
-        if not records:
+        meds = self._medication_entries()
+        if meds.empty:
             return pd.DataFrame(columns=[
                 "medication_key", "ndc_11", "ndc_10", "drug_name", "generic_name",
                 "gpi", "gpi_2", "gpi_4", "gpi_6", "therapeutic_class",
@@ -298,83 +375,41 @@ class RxMemberSimDimensionalTransformer(BaseDimensionalTransformer):
                 "awp", "wac"
             ])
 
-        return pd.DataFrame(records)
+        gpi = meds["gpi"].fillna("").astype(str)
+
+        def gpi_prefix(length: int) -> pd.Series:
+            prefix = gpi.str[:length].astype(object)
+            return prefix.where(gpi.str.len() >= length, None).infer_objects()
+
+        return pd.DataFrame(
+            {
+                "medication_key": range(1, len(meds) + 1),
+                "ndc_11": meds["ndc_11"],
+                "ndc_10": self.map_unique(meds["ndc_11"], self._ndc_11_to_10),
+                "drug_name": meds["drug_name"],
+                "generic_name": meds["generic_name"],
+                "gpi": meds["gpi"],
+                "gpi_2": gpi_prefix(2),
+                "gpi_4": gpi_prefix(4),
+                "gpi_6": gpi_prefix(6),
+                "therapeutic_class": meds["therapeutic_class"],
+                "therapeutic_category": self.map_unique(gpi, self._get_therapeutic_category),
+                "strength": meds["strength"],
+                "dosage_form": meds["dosage_form"],
+                "route_of_admin": meds["route_of_admin"],
+                "dea_schedule": meds["dea_schedule"],
+                "is_controlled": ~meds["dea_schedule"].isin([None, "0"]),
+                "is_brand": meds["is_brand"],
+                "multi_source_code": meds["multi_source_code"],
+                "awp": meds["awp"],
+                "wac": meds["wac"],
+            }
+        )
 
     def _build_dim_pharmacy(self) -> pd.DataFrame:
         """Build pharmacy dimension from pharmacies and claims."""
-        # Collect pharmacies from explicit list and claims
-        pharmacy_npis: dict[str, dict] = {}
-
-        # From explicit pharmacies
-        for pharm in self.pharmacies:
-            pharmacy_npis[pharm.npi] = {
-                "npi": pharm.npi,
-                "ncpdp_id": pharm.ncpdp_id,
-                "name": pharm.name,
-                "dba_name": pharm.dba_name,
-                "pharmacy_type": (
-                    pharm.pharmacy_type.value
-                    if hasattr(pharm.pharmacy_type, "value")
-                    else pharm.pharmacy_type
-                ),
-                "city": pharm.city,
-                "state": pharm.state,
-                "zip_code": pharm.zip_code,
-                "in_network": pharm.in_network,
-                "preferred": pharm.preferred,
-                "specialty_certified": pharm.specialty_certified,
-                "chain_code": pharm.chain_code,
-                "chain_name": pharm.chain_name,
-                "has_delivery": pharm.has_delivery,
-                "has_24_hour": pharm.has_24_hour,
-            }
-
-        # From claims (add NPIs we don't have details for)
-        for claim in self.claims:
-            if claim.pharmacy_npi and claim.pharmacy_npi not in pharmacy_npis:
-                pharmacy_npis[claim.pharmacy_npi] = {
-                    "npi": claim.pharmacy_npi,
-                    "ncpdp_id": claim.pharmacy_ncpdp,
-                    "name": claim.pharmacy_npi,
-                    "dba_name": None,
-                    "pharmacy_type": "UNKNOWN",
-                    "city": None,
-                    "state": None,
-                    "zip_code": None,
-                    "in_network": None,
-                    "preferred": None,
-                    "specialty_certified": None,
-                    "chain_code": None,
-                    "chain_name": None,
-                    "has_delivery": None,
-                    "has_24_hour": None,
-                }
-
-        records = []
-        for idx, (_npi, info) in enumerate(sorted(pharmacy_npis.items()), start=1):
-            records.append(
-                {
-                    "pharmacy_key": idx,
-                    "pharmacy_npi": info["npi"],
-                    "ncpdp_id": info["ncpdp_id"],
-                    "pharmacy_name": info["name"],
-                    "dba_name": info["dba_name"],
-                    "pharmacy_type": info["pharmacy_type"],
-                    "pharmacy_category": self._get_pharmacy_category(info["pharmacy_type"]),
-                    "city": info["city"],
-                    "state": info["state"],
-                    "postal_code": info["zip_code"],
-                    "in_network": info["in_network"],
-                    "preferred": info["preferred"],
-                    "specialty_certified": info["specialty_certified"],
-                    "chain_code": info["chain_code"],
-                    "chain_name": info["chain_name"],
-                    "has_delivery": info["has_delivery"],
-                    "has_24_hour": info["has_24_hour"],
-                }
-            )
-
-        if not records:
+        pharmacies = self._pharmacy_entries()
+        if pharmacies.empty:
             return pd.DataFrame(columns=[
                 "pharmacy_key", "pharmacy_npi", "ncpdp_id", "pharmacy_name",
                 "dba_name", "pharmacy_type", "pharmacy_category", "city", "state",
@@ -382,82 +417,34 @@ class RxMemberSimDimensionalTransformer(BaseDimensionalTransformer):
                 "chain_code", "chain_name", "has_delivery", "has_24_hour"
             ])
 
-        return pd.DataFrame(records)
+        return pd.DataFrame(
+            {
+                "pharmacy_key": range(1, len(pharmacies) + 1),
+                "pharmacy_npi": pharmacies["npi"],
+                "ncpdp_id": pharmacies["ncpdp_id"],
+                "pharmacy_name": pharmacies["name"],
+                "dba_name": pharmacies["dba_name"],
+                "pharmacy_type": pharmacies["pharmacy_type"],
+                "pharmacy_category": self.map_unique(
+                    pharmacies["pharmacy_type"], self._get_pharmacy_category
+                ),
+                "city": pharmacies["city"],
+                "state": pharmacies["state"],
+                "postal_code": pharmacies["zip_code"],
+                "in_network": pharmacies["in_network"],
+                "preferred": pharmacies["preferred"],
+                "specialty_certified": pharmacies["specialty_certified"],
+                "chain_code": pharmacies["chain_code"],
+                "chain_name": pharmacies["chain_name"],
+                "has_delivery": pharmacies["has_delivery"],
+                "has_24_hour": pharmacies["has_24_hour"],
+            }
+        )
 
     def _build_dim_prescriber(self) -> pd.DataFrame:
         """Build prescriber dimension from prescribers and claims."""
-        prescriber_npis: dict[str, dict] = {}
-
-        # From explicit prescribers
-        for pres in self.prescribers:
-            credential_val = (
-                pres.credential.value
-                if hasattr(pres.credential, "value")
-                else pres.credential
-            )
-            specialty_val = (
-                pres.specialty.value
-                if hasattr(pres.specialty, "value")
-                else pres.specialty
-            )
-
-            prescriber_npis[pres.npi] = {
-                "npi": pres.npi,
-                "dea": pres.dea,
-                "first_name": pres.first_name,
-                "last_name": pres.last_name,
-                "full_name": pres.full_name,
-                "display_name": pres.display_name,
-                "credential": credential_val,
-                "specialty": specialty_val,
-                "taxonomy_code": pres.taxonomy_code,
-                "city": pres.city,
-                "state": pres.state,
-                "active": pres.active,
-                "can_prescribe_controlled": pres.can_prescribe_controlled,
-            }
-
-        # From claims (add NPIs we don't have details for)
-        for claim in self.claims:
-            if claim.prescriber_npi and claim.prescriber_npi not in prescriber_npis:
-                prescriber_npis[claim.prescriber_npi] = {
-                    "npi": claim.prescriber_npi,
-                    "dea": None,
-                    "first_name": None,
-                    "last_name": None,
-                    "full_name": claim.prescriber_npi,
-                    "display_name": claim.prescriber_npi,
-                    "credential": None,
-                    "specialty": None,
-                    "taxonomy_code": None,
-                    "city": None,
-                    "state": None,
-                    "active": None,
-                    "can_prescribe_controlled": None,
-                }
-
-        records = []
-        for idx, (_npi, info) in enumerate(sorted(prescriber_npis.items()), start=1):
-            records.append(
-                {
-                    "prescriber_key": idx,
-                    "prescriber_npi": info["npi"],
-                    "dea_number": info["dea"],
-                    "first_name": info["first_name"],
-                    "last_name": info["last_name"],
-                    "full_name": info["full_name"],
-                    "display_name": info["display_name"],
-                    "credential": info["credential"],
-                    "specialty": info["specialty"],
-                    "taxonomy_code": info["taxonomy_code"],
-                    "city": info["city"],
-                    "state": info["state"],
-                    "is_active": info["active"],
-                    "can_prescribe_controlled": info["can_prescribe_controlled"],
-                }
-            )
-
-        if not records:
+        prescribers = self._prescriber_entries()
+        if prescribers.empty:
             return pd.DataFrame(columns=[
                 "prescriber_key", "prescriber_npi", "dea_number", "first_name",
                 "last_name", "full_name", "display_name", "credential",
@@ -465,7 +452,24 @@ class RxMemberSimDimensionalTransformer(BaseDimensionalTransformer):
                 "can_prescribe_controlled"
             ])
 
-        return pd.DataFrame(records)
+        return pd.DataFrame(
+            {
+                "prescriber_key": range(1, len(prescribers) + 1),
+                "prescriber_npi": prescribers["npi"],
+                "dea_number": prescribers["dea"],
+                "first_name": prescribers["first_name"],
+                "last_name": prescribers["last_name"],
+                "full_name": prescribers["full_name"],
+                "display_name": prescribers["display_name"],
+                "credential": prescribers["credential"],
+                "specialty": prescribers["specialty"],
+                "taxonomy_code": prescribers["taxonomy_code"],
+                "city": prescribers["city"],
+                "state": prescribers["state"],
+                "is_active": prescribers["active"],
+                "can_prescribe_controlled": prescribers["can_prescribe_controlled"],
+            }
+        )
 
     def _build_dim_formulary(self) -> pd.DataFrame:
         """Build formulary dimension."""
@@ -509,263 +513,268 @@ class RxMemberSimDimensionalTransformer(BaseDimensionalTransformer):
 
     def _build_fact_prescription_fills(self) -> pd.DataFrame:
         """Build prescription fills fact table."""
-        pharmacy_lookup = self._build_pharmacy_lookup()
-        prescriber_lookup = self._build_prescriber_lookup()
-        medication_lookup = self._build_medication_lookup()
-
-        records = []
-        for idx, claim in enumerate(self.claims, start=1):
-            ndc_11 = self._normalize_ndc(claim.ndc)
-            drug_info = self._drug_lookup.get(ndc_11)
-
-            # Transaction type
-            tx_code = (
-                claim.transaction_code.value
-                if hasattr(claim.transaction_code, "value")
-                else claim.transaction_code
-            )
-
-            records.append(
-                {
-                    "fill_fact_key": idx,
-                    "claim_id": claim.claim_id,
-                    "member_key": claim.member_id,
-                    "cardholder_key": claim.cardholder_id,
-                    "pharmacy_key": pharmacy_lookup.get(claim.pharmacy_npi, -1),
-                    "prescriber_key": prescriber_lookup.get(claim.prescriber_npi, -1),
-                    "medication_key": medication_lookup.get(ndc_11, -1),
-                    "service_date_key": self.date_to_key(claim.service_date),
-                    "service_date": claim.service_date,
-                    "transaction_code": tx_code,
-                    "is_new_fill": claim.fill_number == 0,
-                    "is_refill": claim.fill_number > 0,
-                    "fill_number": claim.fill_number,
-                    "prescription_number": claim.prescription_number,
-                    "ndc_11": ndc_11,
-                    "quantity_dispensed": float(claim.quantity_dispensed),
-                    "days_supply": claim.days_supply,
-                    "daw_code": claim.daw_code,
-                    "compound_code": claim.compound_code,
-                    "is_compound": claim.compound_code != "0",
-                    "ingredient_cost_submitted": float(claim.ingredient_cost_submitted),
-                    "dispensing_fee_submitted": float(claim.dispensing_fee_submitted),
-                    "usual_customary_charge": float(claim.usual_customary_charge),
-                    "gross_amount_due": float(claim.gross_amount_due),
-                    "prior_auth_number": claim.prior_auth_number,
-                    "has_prior_auth": claim.prior_auth_number is not None,
-                    "dur_reason_for_service": claim.dur_reason_for_service,
-                    "dur_professional_service": claim.dur_professional_service,
-                    "has_dur_intervention": claim.dur_reason_for_service is not None,
-                    "bin": claim.bin,
-                    "pcn": claim.pcn,
-                    "group_number": claim.group_number,
-                    # Drug attributes (if available)
-                    "is_brand": drug_info.is_brand if drug_info else None,
-                    "is_controlled": (
-                        drug_info.dea_schedule.value not in (None, "0")
-                        if drug_info and hasattr(drug_info.dea_schedule, "value")
-                        else None
-                    ),
-                    "awp_unit_price": drug_info.awp if drug_info else None,
-                }
-            )
+        df = self._frame("claims")
+        if df.empty:
+            return pd.DataFrame(columns=[
+                "fill_fact_key", "claim_id", "member_key", "cardholder_key",
+                "pharmacy_key", "prescriber_key", "medication_key",
+                "service_date_key", "service_date", "transaction_code",
+                "is_new_fill", "is_refill", "fill_number", "prescription_number",
+                "ndc_11", "quantity_dispensed", "days_supply", "daw_code",
+                "compound_code", "is_compound", "ingredient_cost_submitted",
+                "dispensing_fee_submitted", "usual_customary_charge",
+                "gross_amount_due", "prior_auth_number", "has_prior_auth",
+                "dur_reason_for_service", "dur_professional_service",
+                "has_dur_intervention", "bin", "pcn", "group_number",
+                "is_brand", "is_controlled", "awp_unit_price"
+            ])
 
-        return pd.DataFrame(records) if records else pd.DataFrame(columns=[
-            "fill_fact_key", "claim_id", "member_key", "cardholder_key",
-            "pharmacy_key", "prescriber_key", "medication_key",
-            "service_date_key", "service_date", "transaction_code",
-            "is_new_fill", "is_refill", "fill_number", "prescription_number",
-            "ndc_11", "quantity_dispensed", "days_supply", "daw_code",
-            "compound_code", "is_compound", "ingredient_cost_submitted",
-            "dispensing_fee_submitted", "usual_customary_charge",
-            "gross_amount_due", "prior_auth_number", "has_prior_auth",
-            "dur_reason_for_service", "dur_professional_service",
-            "has_dur_intervention", "bin", "pcn", "group_number",
-            "is_brand", "is_controlled", "awp_unit_price"
-        ])
+        ndc_11 = self.map_unique(df["ndc"], self._normalize_ndc)
+
+        # Drug attributes (if available) keyed by normalized NDC; later drugs win
+        drugs = self._frame("drugs").assign(
+            ndc_11=lambda d: self.map_unique(d["ndc"], self._normalize_ndc)
+        )
+        drugs = drugs.drop_duplicates("ndc_11", keep="last").set_index("ndc_11")
+
+        return pd.DataFrame(
+            {
+                "fill_fact_key": range(1, len(df) + 1),
+                "claim_id": df["claim_id"],
+                "member_key": df["member_id"],
+                "cardholder_key": df["cardholder_id"],
+                "pharmacy_key": self.lookup_keys(
+                    df["pharmacy_npi"], pd.Index(self._pharmacy_entries()["npi"], dtype=object)
+                ),
+                "prescriber_key": self.lookup_keys(
+                    df["prescriber_npi"],
+                    pd.Index(self._prescriber_entries()["npi"], dtype=object),
+                ),
+                "medication_key": self.lookup_keys(
+                    ndc_11, pd.Index(self._medication_entries()["ndc_11"], dtype=object)
+                ),
+                "service_date_key": self.dates_to_keys(df["service_date"]),
+                "service_date": df["service_date"],
+                "transaction_code": self.enum_values(df["transaction_code"]),
+                "is_new_fill": df["fill_number"] == 0,
+                "is_refill": df["fill_number"] > 0,
+                "fill_number": df["fill_number"],
+                "prescription_number": df["prescription_number"],
+                "ndc_11": ndc_11,
+                "quantity_dispensed": df["quantity_dispensed"].astype(float),
+                "days_supply": df["days_supply"],
+                "daw_code": df["daw_code"],
+                "compound_code": df["compound_code"],
+                "is_compound": df["compound_code"] != "0",
+                "ingredient_cost_submitted": df["ingredient_cost_submitted"].astype(float),
+                "dispensing_fee_submitted": df["dispensing_fee_submitted"].astype(float),
+                "usual_customary_charge": df["usual_customary_charge"].astype(float),
+                "gross_amount_due": df["gross_amount_due"].astype(float),
+                "prior_auth_number": df["prior_auth_number"],
+                "has_prior_auth": df["prior_auth_number"].notna(),
+                "dur_reason_for_service": df["dur_reason_for_service"],
+                "dur_professional_service": df["dur_professional_service"],
+                "has_dur_intervention": df["dur_reason_for_service"].notna(),
+                "bin": df["bin"],
+                "pcn": df["pcn"],
+                "group_number": df["group_number"],
+                "is_brand": self.lookup_values(ndc_11, drugs["is_brand"]),
+                "is_controlled": self.lookup_values(
+                    ndc_11, ~self.enum_values(drugs["dea_schedule"]).isin([None, "0"])
+                ),
+                "awp_unit_price": self.lookup_values(ndc_11, drugs["awp"]),
+            }
+        )
 
     def _build_fact_prior_auth(self) -> pd.DataFrame:
         """Build prior authorization fact table."""
-        medication_lookup = self._build_medication_lookup()
-
-        records = []
-        for idx, pa_record in enumerate(self.prior_auths, start=1):
-            req = pa_record.request
-            resp = pa_record.response
-            ndc_11 = self._normalize_ndc(req.ndc)
-
-            # Get status
-            if resp:
-                status = (
-                    resp.status.value if hasattr(resp.status, "value") else resp.status
-                )
-                denial_reason = (
-                    resp.denial_reason.value
-                    if resp.denial_reason and hasattr(resp.denial_reason, "value")
-                    else resp.denial_reason
-                )
-            else:
-                status = "PENDING"
-                denial_reason = None
-
-            records.append(
-                {
-                    "prior_auth_fact_key": idx,
-                    "pa_request_id": req.pa_request_id,
-                    "pa_number": resp.pa_number if resp else None,
-                    "member_key": req.member_id,
-                    "cardholder_key": req.cardholder_id,
-                    "medication_key": medication_lookup.get(ndc_11, -1),
-                    "request_date_key": self.date_to_key(
-                        req.request_date.date()
-                        if hasattr(req.request_date, "date")
-                        else req.request_date
-                    ),
-                    "request_date": req.request_date,
-                    "response_date_key": (
-                        self.date_to_key(
-                            resp.response_date.date()
-                            if hasattr(resp.response_date, "date")
-                            else resp.response_date
-                        )
-                        if resp
-                        else None
-                    ),
-                    "response_date": resp.response_date if resp else None,
-                    "request_type": (
-                        req.request_type.value
-                        if hasattr(req.request_type, "value")
-                        else req.request_type
-                    ),
-                    "urgency": req.urgency,
-                    "status": status,
-                    "is_approved": status == "approved",
-                    "is_denied": status == "denied",
-                    "is_pending": status == "pending",
-                    "auto_approved": resp.auto_approved if resp else False,
-                    "denial_reason": denial_reason,
-                    "ndc_11": ndc_11,
-                    "drug_name": req.drug_name,
-                    "quantity_requested": float(req.quantity_requested),
-                    "days_supply_requested": req.days_supply_requested,
-                    "quantity_approved": (
-                        float(resp.quantity_approved)
-                        if resp and resp.quantity_approved
-                        else None
-                    ),
-                    "days_supply_approved": (
-                        resp.days_supply_approved if resp else None
-                    ),
-                    "effective_date_key": (
-                        self.date_to_key(resp.effective_date)
-                        if resp and resp.effective_date
-                        else None
-                    ),
-                    "expiration_date_key": (
-                        self.date_to_key(resp.expiration_date)
-                        if resp and resp.expiration_date
-                        else None
-                    ),
-                    "prescriber_npi": req.prescriber_npi,
-                    "prescriber_name": req.prescriber_name,
-                    "prescriber_specialty": req.prescriber_specialty,
-                    "diagnosis_codes": (
-                        ",".join(req.diagnosis_codes)
-                        if req.diagnosis_codes
-                        else None
-                    ),
-                    "has_clinical_notes": req.clinical_notes is not None,
-                    "has_lab_results": len(req.lab_results) > 0 if req.lab_results else False,
-                    "turnaround_hours": (
-                        (resp.response_date - req.request_date).total_seconds() / 3600
-                        if resp and resp.response_date else None
-                    ),
-                }
-            )
+        df = self._frame("prior_auths")
+        if df.empty:
+            return pd.DataFrame(columns=[
+                "prior_auth_fact_key", "pa_request_id", "pa_number", "member_key",
+                "cardholder_key", "medication_key", "request_date_key", "request_date",
+                "response_date_key", "response_date", "request_type", "urgency",
+                "status", "is_approved", "is_denied", "is_pending", "auto_approved",
+                "denial_reason", "ndc_11", "drug_name", "quantity_requested",
+                "days_supply_requested", "quantity_approved", "days_supply_approved",
+                "effective_date_key", "expiration_date_key", "prescriber_npi",
+                "prescriber_name", "prescriber_specialty", "diagnosis_codes",
+                "has_clinical_notes", "has_lab_results", "turnaround_hours"
+            ])
 
-        return pd.DataFrame(records) if records else pd.DataFrame(columns=[
-            "prior_auth_fact_key", "pa_request_id", "pa_number", "member_key",
-            "cardholder_key", "medication_key", "request_date_key", "request_date",
-            "response_date_key", "response_date", "request_type", "urgency",
-            "status", "is_approved", "is_denied", "is_pending", "auto_approved",
-            "denial_reason", "ndc_11", "drug_name", "quantity_requested",
-            "days_supply_requested", "quantity_approved", "days_supply_approved",
-            "effective_date_key", "expiration_date_key", "prescriber_npi",
-            "prescriber_name", "prescriber_specialty", "diagnosis_codes",
-            "has_clinical_notes", "has_lab_results", "turnaround_hours"
-        ])
+        has_response = df["response"].notna().to_numpy()
+        ndc_11 = self.map_unique(df["ndc"], self._normalize_ndc)
+        status = self.enum_values(df["status"]).where(has_response, "PENDING")
+        quantity_approved = df["quantity_approved"]
+        turnaround = pd.to_datetime(df["response_date"]) - pd.to_datetime(df["request_date"])
+
+        return pd.DataFrame(
+            {
+                "prior_auth_fact_key": range(1, len(df) + 1),
+                "pa_request_id": df["pa_request_id"],
+                "pa_number": df["pa_number"],
+                "member_key": df["member_id"],
+                "cardholder_key": df["cardholder_id"],
+                "medication_key": self.lookup_keys(
+                    ndc_11, pd.Index(self._medication_entries()["ndc_11"], dtype=object)
+                ),
+                "request_date_key": self.dates_to_keys(df["request_date"]),
+                "request_date": df["request_date"],
+                "response_date_key": self.dates_to_keys(df["response_date"]),
+                "response_date": df["response_date"],
+                "request_type": self.enum_values(df["request_type"]),
+                "urgency": df["urgency"],
+                "status": status,
+                "is_approved": status == "approved",
+                "is_denied": status == "denied",
+                "is_pending": status == "pending",
+                "auto_approved": df["auto_approved"].where(has_response, False).astype(bool),
+                "denial_reason": self.enum_values(df["denial_reason"]),
+                "ndc_11": ndc_11,
+                "drug_name": df["drug_name"],
+                "quantity_requested": df["quantity_requested"].astype(float),
+                "days_supply_requested": df["days_supply_requested"],
+                "quantity_approved": self.nullable_floats(
+                    quantity_approved.fillna(0).astype(float),
+                    quantity_approved.fillna(0).astype(bool).to_numpy(),
+                ),
+                "days_supply_approved": df["days_supply_approved"],
+                "effective_date_key": self.dates_to_keys(df["effective_date"]),
+                "expiration_date_key": self.dates_to_keys(df["expiration_date"]),
+                "prescriber_npi": df["prescriber_npi"],
+                "prescriber_name": df["prescriber_name"],
+                "prescriber_specialty": df["prescriber_specialty"],
+                "diagnosis_codes": df["diagnosis_codes"].map(
+                    lambda codes: ",".join(codes) if codes else None
+                ),
+                "has_clinical_notes": df["clinical_notes"].notna(),
+                "has_lab_results": df["lab_results"].map(bool),
+                "turnaround_hours": self.nullable_floats(
+                    turnaround.dt.total_seconds() / 3600, turnaround.notna().to_numpy()
+                ),
+            }
+        )
 
     def _build_fact_rx_eligibility_spans(self) -> pd.DataFrame:
         """Build pharmacy eligibility spans fact table."""
-        records = []
-        for idx, member in enumerate(self.members, start=1):
-            effective = member.effective_date
-            termination = member.termination_date or self.snapshot_date
-            coverage_days = (termination - effective).days + 1
+        df = self._frame("members")
+        if df.empty:
+            return pd.DataFrame(columns=[
+                "rx_eligibility_span_key", "member_key", "cardholder_key",
+                "effective_date_key", "effective_date", "termination_date_key",
+                "termination_date", "coverage_days", "is_active", "bin", "pcn",
+                "group_number", "plan_code", "formulary_id"
+            ])
+
+        snapshot = pd.Timestamp(self.snapshot_date)
+        effective = pd.to_datetime(df["effective_date"])
+        termination = pd.to_datetime(df["termination_date"])
+
+        return pd.DataFrame(
+            {
+                "rx_eligibility_span_key": range(1, len(df) + 1),
+                "member_key": df["member_id"],
+                "cardholder_key": df["cardholder_id"],
+                "effective_date_key": self.dates_to_keys(df["effective_date"]),
+                "effective_date": df["effective_date"],
+                "termination_date_key": self.dates_to_keys(df["termination_date"]),
+                "termination_date": df["termination_date"],
+                "coverage_days": (termination.fillna(snapshot) - effective).dt.days + 1,
+                "is_active": termination.isna() | (termination >= snapshot),
+                "bin": df["bin"],
+                "pcn": df["pcn"],
+                "group_number": df["group_number"],
+                "plan_code": df["plan_code"],
+                "formulary_id": df["formulary_id"],
+            }
+        )
+
+    # -------------------------------------------------------------------------
+    # Key Builders
+    # -------------------------------------------------------------------------
 
-            records.append(
+    def _medication_entries(self) -> pd.DataFrame:
+        """Drug reference rows keyed by normalized NDC, plus placeholders from claims."""
+        if "medication_entries" not in self._frame_cache:
+            drugs = self._frame("drugs")
+            ndc_11 = self.map_unique(drugs["ndc"], self._normalize_ndc)
+            drugs = drugs.drop(columns="ndc")
+            drugs.insert(0, "ndc_11", ndc_11)
+            drugs["dea_schedule"] = self.enum_values(drugs["dea_schedule"])
+            claims = self._frame("claims")
+            placeholders = pd.DataFrame(
+                {"ndc_11": self.map_unique(claims["ndc"], self._normalize_ndc)}
+            ).reindex(columns=drugs.columns)
+            self._frame_cache["medication_entries"] = self._merge_entries(
+                drugs, "ndc_11", placeholders
+            )
+        return self._frame_cache["medication_entries"]
+
+    def _pharmacy_entries(self) -> pd.DataFrame:
+        """Pharmacy rows keyed by NPI, plus placeholders for NPIs seen only on claims."""
+        if "pharmacy_entries" not in self._frame_cache:
+            pharmacies = self._frame("pharmacies").copy()
+            pharmacies["pharmacy_type"] = self.enum_values(pharmacies["pharmacy_type"])
+            claims = self._frame("claims")
+            placeholders = pd.DataFrame(
                 {
-                    "rx_eligibility_span_key": idx,
-                    "member_key": member.member_id,
-                    "cardholder_key": member.cardholder_id,
-                    "effective_date_key": self.date_to_key(effective),
-                    "effective_date": effective,
-                    "termination_date_key": (
-                        self.date_to_key(termination) if member.termination_date else None
-                    ),
-                    "termination_date": member.termination_date,
-                    "coverage_days": coverage_days,
-                    "is_active": (
-                        member.termination_date is None
-                        or member.termination_date >= self.snapshot_date
-                    ),
-                    "bin": member.bin,
-                    "pcn": member.pcn,
-                    "group_number": member.group_number,
-                    "plan_code": member.plan_code,
-                    "formulary_id": member.formulary_id,
+                    "npi": claims["pharmacy_npi"],
+                    "ncpdp_id": claims["pharmacy_ncpdp"],
+                    "name": claims["pharmacy_npi"],
+                    "pharmacy_type": "UNKNOWN",
                 }
+            ).reindex(columns=pharmacies.columns)
+            self._frame_cache["pharmacy_entries"] = self._merge_entries(
+                pharmacies, "npi", placeholders
             )
+        return self._frame_cache["pharmacy_entries"]
+
+    def _prescriber_entries(self) -> pd.DataFrame:
+        """Prescriber rows keyed by NPI, plus placeholders for NPIs seen only on claims."""
+        if "prescriber_entries" not in self._frame_cache:
+            prescribers = self._frame("prescribers").copy()
+            prescribers["credential"] = self.enum_values(prescribers["credential"])
+            prescribers["specialty"] = self.enum_values(prescribers["specialty"])
+            claims = self._frame("claims")
+            placeholders = pd.DataFrame(
+                {
+                    "npi": claims["prescriber_npi"],
+                    "full_name": claims["prescriber_npi"],
+                    "display_name": claims["prescriber_npi"],
+                }
+            ).reindex(columns=prescribers.columns)
+            self._frame_cache["prescriber_entries"] = self._merge_entries(
+                prescribers, "npi", placeholders
+            )
+        return self._frame_cache["prescriber_entries"]
 
-        return pd.DataFrame(records) if records else pd.DataFrame(columns=[
-            "rx_eligibility_span_key", "member_key", "cardholder_key",
-            "effective_date_key", "effective_date", "termination_date_key",
-            "termination_date", "coverage_days", "is_active", "bin", "pcn",
-            "group_number", "plan_code", "formulary_id"
-        ])
-
-    # -------------------------------------------------------------------------
-    # Lookup Builders
-    # -------------------------------------------------------------------------
+    @staticmethod
+    def _merge_entries(
+        explicit: pd.DataFrame, key: str, placeholders: pd.DataFrame
+    ) -> pd.DataFrame:
+        """Combine explicit entries with placeholder rows, sorted by key.
 
-    def _build_pharmacy_lookup(self) -> dict[str, int]:
-        """Build pharmacy NPI to key lookup."""
-        npis: set[str] = set()
-        for pharm in self.pharmacies:
-            npis.add(pharm.npi)
-        for claim in self.claims:
-            if claim.pharmacy_npi:
-                npis.add(claim.pharmacy_npi)
-        return {npi: idx for idx, npi in enumerate(sorted(npis), start=1)}
-
-    def _build_prescriber_lookup(self) -> dict[str, int]:
-        """Build prescriber NPI to key lookup."""
-        npis: set[str] = set()
-        for pres in self.prescribers:
-            npis.add(pres.npi)
-        for claim in self.claims:
-            if claim.prescriber_npi:
-                npis.add(claim.prescriber_npi)
-        return {npi: idx for idx, npi in enumerate(sorted(npis), start=1)}
-
-    def _build_medication_lookup(self) -> dict[str, int]:
-        """Build NDC to key lookup."""
-        ndcs: set[str] = set()
-        for drug in self.drugs:
-            ndcs.add(self._normalize_ndc(drug.ndc))
-        for claim in self.claims:
-            ndcs.add(self._normalize_ndc(claim.ndc))
-        return {ndc: idx for idx, ndc in enumerate(sorted(ndcs), start=1)}
+        Explicit entries supply details (later duplicates win); a placeholder
+        is kept for the first claim referencing each key without details.
+        Empty keys on claims are ignored.
+        """
+        explicit = explicit.drop_duplicates(key, keep="last")
+        placeholders = placeholders.astype(object).where(placeholders.notna(), None)
+        placeholders = placeholders[
+            placeholders[key].notna()
+            & (placeholders[key] != "")
+            & ~placeholders[key].isin(explicit[key])
+        ].drop_duplicates(key, keep="first")
+
+        frames = [frame for frame in (explicit, placeholders) if len(frame)]
+        if not frames:
+            return explicit.reset_index(drop=True)
+        return (
+            pd.concat(frames, ignore_index=True)
+            .infer_objects()
+            .sort_values(key, kind="stable")
+            .reset_index(drop=True)
+        )
 
     # -------------------------------------------------------------------------
     # Helper Methods
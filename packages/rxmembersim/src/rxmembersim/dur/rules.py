@@ -1,9 +1,16 @@
 """Drug Utilization Review rules engine."""
+import csv
+from collections.abc import Iterable
 from datetime import date, timedelta
 from enum import Enum
+from pathlib import Path
+from typing import Any
 
 from pydantic import BaseModel
 
+from rxmembersim.core.fill_history import FillHistory
+from rxmembersim.core.gpi import GPIPrefixIndex
+
 
 class DURAlertType(str, Enum):
     """DUR alert types (NCPDP standard)."""
@@ -146,21 +153,100 @@ class GenderRestriction(BaseModel):
 
 
 class DURRulesEngine:
-    """DUR rules processing engine."""
+    """DUR rules processing engine.
+
+    Rules are matched through GPI prefix indexes built on first use, so a
+    check costs one lookup per medication prefix rather than one comparison
+    per rule. load_drug_interactions and add_rule drop the indexes over the
+    rules they change; after changing a rule list directly, call
+    refresh_indexes().
+    """
+
+    # Rule list attribute for each rule type, for add_rule
+    RULE_LISTS: dict[type, str] = {
+        DrugDrugInteraction: "drug_interactions",
+        TherapeuticDuplication: "therapeutic_duplications",
+        AgeRestriction: "age_restrictions",
+        GenderRestriction: "gender_restrictions",
+    }
 
     def __init__(self) -> None:
         self.drug_interactions: list[DrugDrugInteraction] = []
         self.therapeutic_duplications: list[TherapeuticDuplication] = []
         self.age_restrictions: list[AgeRestriction] = []
         self.gender_restrictions: list[GenderRestriction] = []
+        # (rule list attribute, GPI field) -> index, dropped when the rules change
+        self._gpi_indexes: dict[tuple[str, str], GPIPrefixIndex] = {}
         self._load_default_rules()
 
+    def _gpi_index(self, rules_attr: str, gpi_field: str) -> GPIPrefixIndex:
+        """Prefix index of (position, rule) pairs for one GPI field of a rule list."""
+        index = self._gpi_indexes.get((rules_attr, gpi_field))
+        if index is None:
+            index = GPIPrefixIndex(
+                (getattr(rule, gpi_field), (position, rule))
+                for position, rule in enumerate(getattr(self, rules_attr))
+            )
+            self._gpi_indexes[(rules_attr, gpi_field)] = index
+        return index
+
+    def _rules_changed(self, rules_attr: str) -> None:
+        """Drop the indexes over a rule list."""
+        for key in [key for key in self._gpi_indexes if key[0] == rules_attr]:
+            del self._gpi_indexes[key]
+
+    def refresh_indexes(self) -> None:
+        """Drop every rule index; call after changing a rule list directly."""
+        self._gpi_indexes.clear()
+
+    def add_rule(
+        self,
+        rule: DrugDrugInteraction | TherapeuticDuplication | AgeRestriction | GenderRestriction,
+    ) -> None:
+        """Add a rule to the list for its type."""
+        rules_attr = self.RULE_LISTS[type(rule)]
+        getattr(self, rules_attr).append(rule)
+        self._rules_changed(rules_attr)
+
+    def load_drug_interactions(
+        self,
+        source: str | Path | Iterable[DrugDrugInteraction | dict[str, Any]],
+        replace: bool = False,
+    ) -> int:
+        """Load drug-drug interaction rules, e.g. from a licensed interaction file.
+
+        Args:
+            source: Path to a CSV file whose header names DrugDrugInteraction
+                fields, or an iterable of rules or rule dicts
+            replace: Replace the current rules instead of adding to them
+
+        Returns:
+            Number of rules loaded
+        """
+        if isinstance(source, str | Path):
+            with open(source, newline="") as f:
+                loaded = [DrugDrugInteraction.model_validate(row) for row in csv.DictReader(f)]
+        else:
+            loaded = [
+                rule
+                if isinstance(rule, DrugDrugInteraction)
+                else DrugDrugInteraction.model_validate(rule)
+                for rule in source
+            ]
+        if replace:
+            self.drug_interactions = loaded
+        else:
+            self.drug_interactions = self.drug_interactions + loaded
+        self._rules_changed("drug_interactions")
+        return len(loaded)
+
     def _load_default_rules(self) -> None:
         """Load common DUR rules."""
         self._load_drug_interactions()
         self._load_therapeutic_duplications()
         self._load_age_restrictions()
         self._load_gender_restrictions()
+        self.refresh_indexes()
 
     def _load_drug_interactions(self) -> None:
         """Load common drug-drug interactions."""
@@ -375,38 +461,52 @@ class DURRulesEngine:
         """Check for drug-drug interactions."""
         alerts: list[DURAlert] = []
 
+        # Interactions involving the new drug, keyed by the GPI prefix the
+        # other drug must have
+        candidates = [
+            (position, interaction, interaction.drug2_gpi)
+            for position, interaction in self._gpi_index("drug_interactions", "drug1_gpi").match(
+                new_drug_gpi
+            )
+        ] + [
+            (position, interaction, interaction.drug1_gpi)
+            for position, interaction in self._gpi_index("drug_interactions", "drug2_gpi").match(
+                new_drug_gpi
+            )
+        ]
+        if not candidates:
+            return alerts
+        candidates.sort(key=lambda candidate: candidate[0])
+        partners: GPIPrefixIndex = GPIPrefixIndex(
+            (other_gpi, (position, interaction)) for position, interaction, other_gpi in candidates
+        )
+
         for current_med in current_medications:
             current_gpi = current_med.get("gpi", "")
             current_ndc = current_med.get("ndc", "")
             current_name = current_med.get("name", "")
 
-            for interaction in self.drug_interactions:
-                # Check if either direction matches
-                match1 = (
-                    new_drug_gpi.startswith(interaction.drug1_gpi)
-                    and current_gpi.startswith(interaction.drug2_gpi)
-                )
-                match2 = (
-                    new_drug_gpi.startswith(interaction.drug2_gpi)
-                    and current_gpi.startswith(interaction.drug1_gpi)
-                )
-
-                if match1 or match2:
-                    alerts.append(
-                        DURAlert(
-                            alert_type=DURAlertType.DRUG_DRUG,
-                            clinical_significance=interaction.clinical_significance,
-                            drug1_ndc=new_drug_ndc,
-                            drug1_name=new_drug_name,
-                            drug1_gpi=new_drug_gpi,
-                            drug2_ndc=current_ndc,
-                            drug2_name=current_name,
-                            drug2_gpi=current_gpi,
-                            message=interaction.interaction_description,
-                            recommendation=interaction.recommendation,
-                            reason_for_service=DURReasonForService.DRUG_DRUG_INTERACTION.value,
-                        )
+            seen: set[int] = set()
+            for position, interaction in partners.match(current_gpi):
+                # An interaction can match in both directions; alert once
+                if position in seen:
+                    continue
+                seen.add(position)
+                alerts.append(
+                    DURAlert(
+                        alert_type=DURAlertType.DRUG_DRUG,
+                        clinical_significance=interaction.clinical_significance,
+                        drug1_ndc=new_drug_ndc,
+                        drug1_name=new_drug_name,
+                        drug1_gpi=new_drug_gpi,
+                        drug2_ndc=current_ndc,
+                        drug2_name=current_name,
+                        drug2_gpi=current_gpi,
+                        message=interaction.interaction_description,
+                        recommendation=interaction.recommendation,
+                        reason_for_service=DURReasonForService.DRUG_DRUG_INTERACTION.value,
                     )
+                )
 
         return alerts
 
@@ -420,19 +520,28 @@ class DURRulesEngine:
         """Check for therapeutic duplication."""
         alerts: list[DURAlert] = []
 
-        for dup_rule in self.therapeutic_duplications:
-            if not new_drug_gpi.startswith(dup_rule.gpi_class):
-                continue
-
-            # Count current medications in same class
-            same_class = [
-                med
-                for med in current_medications
-                if med.get("gpi", "").startswith(dup_rule.gpi_class)
-            ]
+        dup_rules = [
+            rule
+            for _, rule in self._gpi_index("therapeutic_duplications", "gpi_class").match(
+                new_drug_gpi
+            )
+        ]
+        if not dup_rules:
+            return alerts
 
-            if len(same_class) >= dup_rule.max_concurrent:
-                for existing in same_class:
+        # One pass over the medications, bucketed by the rules they share a
+        # class with
+        by_class: GPIPrefixIndex = GPIPrefixIndex(
+            (rule.gpi_class, position) for position, rule in enumerate(dup_rules)
+        )
+        same_class: list[list[dict]] = [[] for _ in dup_rules]
+        for med in current_medications:
+            for position in by_class.match(med.get("gpi", "")):
+                same_class[position].append(med)
+
+        for dup_rule, class_meds in zip(dup_rules, same_class, strict=True):
+            if len(class_meds) >= dup_rule.max_concurrent:
+                for existing in class_meds:
                     alerts.append(
                         DURAlert(
                             alert_type=DURAlertType.THERAPEUTIC_DUPLICATION,
@@ -456,29 +565,40 @@ class DURRulesEngine:
         ndc: str,
         drug_name: str,
         service_date: date,
-        previous_fills: list[dict],
+        previous_fills: list[dict] | FillHistory,
         threshold_percent: float = 0.80,
     ) -> DURAlert | None:
-        """Check for early refill."""
+        """Check for early refill.
+
+        previous_fills is either a list of fill dicts or the member's
+        FillHistory, whose most recent fill of the NDC is found without a scan.
+        """
         if not previous_fills:
             return None
 
-        # Find most recent fill for this NDC
-        same_drug_fills = [
-            fill for fill in previous_fills if fill.get("ndc") == ndc
-        ]
+        if isinstance(previous_fills, FillHistory):
+            fill = previous_fills.last_fill(ndc=ndc)
+            if fill is None:
+                return None
+            last_fill_date = fill.service_date
+            last_days_supply = fill.days_supply
+        else:
+            # Find most recent fill for this NDC
+            same_drug_fills = [
+                fill for fill in previous_fills if fill.get("ndc") == ndc
+            ]
 
-        if not same_drug_fills:
-            return None
+            if not same_drug_fills:
+                return None
 
-        # Get most recent
-        last_fill = max(
-            same_drug_fills,
-            key=lambda f: f.get("service_date", date.min),
-        )
+            # Get most recent
+            last_fill = max(
+                same_drug_fills,
+                key=lambda f: f.get("service_date", date.min),
+            )
 
-        last_fill_date = last_fill.get("service_date")
-        last_days_supply = last_fill.get("days_supply", 30)
+            last_fill_date = last_fill.get("service_date")
+            last_days_supply = last_fill.get("days_supply", 30)
 
         if not last_fill_date:
             return None
@@ -516,10 +636,7 @@ class DURRulesEngine:
         patient_age: int,
     ) -> DURAlert | None:
         """Check for age-based restrictions."""
-        for restriction in self.age_restrictions:
-            if not drug_gpi.startswith(restriction.drug_gpi):
-                continue
-
+        for _, restriction in self._gpi_index("age_restrictions", "drug_gpi").match(drug_gpi):
             violated = False
             if restriction.min_age and patient_age < restriction.min_age:
                 violated = True
@@ -549,10 +666,7 @@ class DURRulesEngine:
         patient_gender: str,
     ) -> DURAlert | None:
         """Check for gender-based restrictions."""
-        for restriction in self.gender_restrictions:
-            if not drug_gpi.startswith(restriction.drug_gpi):
-                continue
-
+        for _, restriction in self._gpi_index("gender_restrictions", "drug_gpi").match(drug_gpi):
             if patient_gender != restriction.allowed_gender:
                 return DURAlert(
                     alert_type=DURAlertType.DRUG_GENDER,
@@ -1,7 +1,10 @@
 """Formulary model and management."""
+from bisect import bisect_left, insort
+from collections.abc import Iterable, Mapping
 from decimal import Decimal
+from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class FormularyTier(BaseModel):
@@ -62,23 +65,224 @@ class FormularyStatus(BaseModel):
     message: str | None = None
 
 
+def _tiers_by_number(tiers: Iterable[FormularyTier]) -> dict[int, FormularyTier]:
+    """Tiers keyed by number; the first of any duplicates wins, as in a scan."""
+    by_number: dict[int, FormularyTier] = {}
+    for tier in tiers:
+        by_number.setdefault(tier.tier_number, tier)
+    return by_number
+
+
+class _FormularyIndex:
+    """Lookup structures over a formulary's drugs and tiers.
+
+    Drug query results are returned in the order of the drugs dict, which
+    the per-NDC insertion sequence reproduces (replacing a drug keeps its
+    place, as assigning an existing dict key does). Tier and PA buckets are
+    insertion-ordered dicts; a replaced drug that lands at the end of a
+    bucket out of sequence marks the bucket for re-sorting on next read.
+
+    Tiers by number and the coverage status of each drug are built for one
+    tiers list and default copay, and dropped when either changes.
+    """
+
+    __slots__ = (
+        "sequence",
+        "next_sequence",
+        "by_tier",
+        "requires_pa",
+        "unordered",
+        "gpis",
+        "tiers_source",
+        "default_copay",
+        "tiers",
+        "statuses",
+    )
+
+    def __init__(self, drugs: Mapping[str, FormularyDrug]) -> None:
+        self.sequence: dict[str, int] = {}
+        self.by_tier: dict[int, dict[str, None]] = {}
+        self.requires_pa: dict[str, None] = {}
+        self.unordered: set[int | None] = set()  # tier numbers; None for requires_pa
+        for sequence, (ndc, drug) in enumerate(drugs.items()):
+            self.sequence[ndc] = sequence
+            self.by_tier.setdefault(drug.tier, {})[ndc] = None
+            if drug.requires_pa:
+                self.requires_pa[ndc] = None
+        self.next_sequence = len(drugs)
+        # (gpi, ndc), sorted
+        self.gpis: list[tuple[str, str]] = sorted((drug.gpi, ndc) for ndc, drug in drugs.items())
+        self.tiers_source: list[FormularyTier] | None = None
+        self.default_copay: Decimal | None = None
+        self.tiers: dict[int, FormularyTier] = {}
+        self.statuses: dict[str, FormularyStatus] = {}
+
+    def tier_lookup(
+        self, tiers: list[FormularyTier], default_copay: Decimal
+    ) -> dict[int, FormularyTier]:
+        """Tiers by number, rebuilt when given another tiers list or default copay."""
+        if self.tiers_source is not tiers or self.default_copay != default_copay:
+            self.tiers = _tiers_by_number(tiers)
+            self.tiers_source = tiers
+            self.default_copay = default_copay
+            self.statuses.clear()
+        return self.tiers
+
+    def forget_tiers(self) -> None:
+        self.tiers_source = None
+        self.statuses.clear()
+
+    def add(self, ndc: str, drug: FormularyDrug, previous: FormularyDrug | None) -> None:
+        if previous is not None:
+            self.remove(ndc, previous)
+        else:
+            self.sequence[ndc] = self.next_sequence
+            self.next_sequence += 1
+        self._insert(self.by_tier.setdefault(drug.tier, {}), drug.tier, ndc)
+        if drug.requires_pa:
+            self._insert(self.requires_pa, None, ndc)
+        insort(self.gpis, (drug.gpi, ndc))
+        self.statuses.pop(ndc, None)
+
+    def remove(self, ndc: str, drug: FormularyDrug) -> None:
+        tier_ndcs = self.by_tier.get(drug.tier)
+        if tier_ndcs is not None:
+            tier_ndcs.pop(ndc, None)
+        self.requires_pa.pop(ndc, None)
+        entry = (drug.gpi, ndc)
+        position = bisect_left(self.gpis, entry)
+        if position < len(self.gpis) and self.gpis[position] == entry:
+            del self.gpis[position]
+        self.statuses.pop(ndc, None)
+
+    def _insert(self, bucket: dict[str, None], key: int | None, ndc: str) -> None:
+        if bucket and self.sequence[next(reversed(bucket))] > self.sequence[ndc]:
+            self.unordered.add(key)
+        bucket[ndc] = None
+
+    def ordered(self, bucket: dict[str, None], key: int | None) -> list[str]:
+        if key in self.unordered:
+            ordered = self.in_order(bucket)
+            bucket.clear()
+            bucket.update(dict.fromkeys(ordered))
+            self.unordered.discard(key)
+        return list(bucket)
+
+    def ndcs_with_gpi_prefix(self, gpi_prefix: str) -> list[str]:
+        gpis = self.gpis
+        ndcs = []
+        for position in range(bisect_left(gpis, (gpi_prefix,)), len(gpis)):
+            gpi, ndc = gpis[position]
+            if not gpi.startswith(gpi_prefix):
+                break
+            ndcs.append(ndc)
+        return ndcs
+
+    def in_order(self, ndcs: Iterable[str]) -> list[str]:
+        return sorted(ndcs, key=self.sequence.__getitem__)
+
+
+class _IndexedDrugs(dict[str, FormularyDrug]):
+    """Drugs by NDC, with a lookup index kept in step with the contents.
+
+    Item assignment and deletion update a built index in place. Other
+    mutating methods discard it so the next query rebuilds it.
+    """
+
+    __slots__ = ("_index",)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._index: _FormularyIndex | None = None
+
+    def __reduce__(self) -> tuple:
+        # Pickle and copy the drugs only; the index is rebuilt on first use
+        return type(self), (dict(self),)
+
+    def lookups(self) -> _FormularyIndex:
+        """The index, built on first use."""
+        index = self._index
+        if index is None:
+            index = self._index = _FormularyIndex(self)
+        return index
+
+    def __setitem__(self, ndc: str, drug: FormularyDrug) -> None:
+        index = self._index
+        previous = self.get(ndc)
+        super().__setitem__(ndc, drug)
+        if index is not None:
+            index.add(ndc, drug, previous)
+
+    def __delitem__(self, ndc: str) -> None:
+        drug = self[ndc]
+        super().__delitem__(ndc)
+        index = self._index
+        if index is not None:
+            index.remove(ndc, drug)
+            del index.sequence[ndc]
+
+    def pop(self, ndc: str, *default: Any) -> Any:
+        if ndc not in self:
+            return super().pop(ndc, *default)
+        drug = self[ndc]
+        del self[ndc]
+        return drug
+
+    def setdefault(self, ndc: str, drug: Any = None) -> Any:
+        if ndc not in self:
+            self[ndc] = drug
+        return self[ndc]
+
+    def popitem(self) -> tuple[str, FormularyDrug]:
+        item = super().popitem()
+        self._index = None
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self._index = None
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self._index = None
+
+    def __ior__(self, other: Any) -> "_IndexedDrugs":
+        self.update(other)
+        return self
+
+
 class Formulary(BaseModel):
-    """Drug formulary."""
+    """Drug formulary.
+
+    Tier lookups, GPI prefix queries, the per-tier and PA drug lists and
+    the coverage status of each drug come from an index held by the drugs
+    dict, built on first use. Setting or deleting drugs (directly or through
+    add_drug and remove_drug) keeps it up to date, as does add_tier for
+    tiers; assigning new ``drugs`` or ``tiers`` rebuilds it. Replace drugs
+    and tiers rather than editing them in place.
+    """
 
     formulary_id: str
     name: str
     effective_date: str
 
     tiers: list[FormularyTier] = Field(default_factory=list)
-    drugs: dict[str, FormularyDrug] = Field(default_factory=dict)  # keyed by NDC
+    drugs: dict[str, FormularyDrug] = Field(default_factory=_IndexedDrugs)  # keyed by NDC
 
     # Default values for drugs not in formulary
     default_tier: int = 3
     default_copay: Decimal = Decimal("50.00")
 
+    @field_validator("drugs")
+    @classmethod
+    def index_drugs(cls, v: dict[str, FormularyDrug]) -> dict[str, FormularyDrug]:
+        """Hold drugs in a dict that maintains the lookup index."""
+        return _IndexedDrugs(v)
+
     def check_coverage(self, ndc: str) -> FormularyStatus:
         """Check coverage status for a drug."""
-        drug = self.drugs.get(ndc)
+        drugs = self.drugs
+        drug = drugs.get(ndc)
 
         if not drug:
             # Drug not in formulary - return non-covered
@@ -88,19 +292,30 @@ class Formulary(BaseModel):
                 message="Drug not on formulary",
             )
 
+        if not isinstance(drugs, _IndexedDrugs):
+            return self._coverage(drug, _tiers_by_number(self.tiers))
+
+        index = drugs.lookups()
+        tiers = index.tier_lookup(self.tiers, self.default_copay)
+        status = index.statuses.get(ndc)
+        if status is None:
+            status = index.statuses[ndc] = self._coverage(drug, tiers)
+        # Callers get their own copy; the memoized one is never handed out
+        return status.model_copy(update={"preferred_alternatives": []})
+
+    def _coverage(self, drug: FormularyDrug, tiers: Mapping[int, FormularyTier]) -> FormularyStatus:
+        """Coverage status of a drug on the formulary."""
         if not drug.covered:
             return FormularyStatus(
-                ndc=ndc,
+                ndc=drug.ndc,
                 covered=False,
                 message="Drug excluded from coverage",
             )
 
-        tier_info = next(
-            (t for t in self.tiers if t.tier_number == drug.tier), None
-        )
+        tier_info = tiers.get(drug.tier)
 
         return FormularyStatus(
-            ndc=ndc,
+            ndc=drug.ndc,
             covered=True,
             tier=drug.tier,
             tier_name=tier_info.tier_name if tier_info else f"Tier {drug.tier}",
@@ -114,6 +329,27 @@ class Formulary(BaseModel):
             coinsurance=tier_info.coinsurance_percent if tier_info else None,
         )
 
+    def get_tier(self, tier_number: int) -> FormularyTier | None:
+        """Get a tier definition by tier number."""
+        drugs = self.drugs
+        if isinstance(drugs, _IndexedDrugs):
+            tiers = drugs.lookups().tier_lookup(self.tiers, self.default_copay)
+        else:
+            tiers = _tiers_by_number(self.tiers)
+        return tiers.get(tier_number)
+
+    def add_tier(self, tier: FormularyTier) -> None:
+        """Add a tier to the formulary, replacing any with the same number."""
+        for position, existing in enumerate(self.tiers):
+            if existing.tier_number == tier.tier_number:
+                self.tiers[position] = tier
+                break
+        else:
+            self.tiers.append(tier)
+        drugs = self.drugs
+        if isinstance(drugs, _IndexedDrugs):
+            drugs.lookups().forget_tiers()
+
     def add_drug(self, drug: FormularyDrug) -> None:
         """Add drug to formulary."""
         self.drugs[drug.ndc] = drug
@@ -127,15 +363,31 @@ class Formulary(BaseModel):
 
     def get_drugs_by_tier(self, tier: int) -> list[FormularyDrug]:
         """Get all drugs in a specific tier."""
-        return [d for d in self.drugs.values() if d.tier == tier]
+        index = self._lookups()
+        drugs = self.drugs
+        return [drugs[ndc] for ndc in index.ordered(index.by_tier.get(tier, {}), tier)]
 
     def get_drugs_requiring_pa(self) -> list[FormularyDrug]:
         """Get all drugs requiring prior authorization."""
-        return [d for d in self.drugs.values() if d.requires_pa]
+        index = self._lookups()
+        drugs = self.drugs
+        return [drugs[ndc] for ndc in index.ordered(index.requires_pa, None)]
 
     def get_drugs_by_gpi(self, gpi_prefix: str) -> list[FormularyDrug]:
         """Get drugs by GPI prefix (therapeutic class)."""
-        return [d for d in self.drugs.values() if d.gpi.startswith(gpi_prefix)]
+        index = self._lookups()
+        return [
+            self.drugs[ndc] for ndc in index.in_order(index.ndcs_with_gpi_prefix(gpi_prefix))
+        ]
+
+    def _lookups(self) -> _FormularyIndex:
+        """The drug index, built as needed."""
+        drugs = self.drugs
+        if isinstance(drugs, _IndexedDrugs):
+            return drugs.lookups()
+        # Drugs assigned as a plain dict, or models built without validation
+        # (model_construct), are indexed per query
+        return _FormularyIndex(drugs)
 
 
 class FormularyGenerator:
@@ -5,6 +5,9 @@ from enum import Enum
 
 from pydantic import BaseModel
 
+from rxmembersim.core.fill_history import FillHistory
+from rxmembersim.core.gpi import GPIPrefixIndex
+
 
 class QuantityLimitType(str, Enum):
     """Types of quantity limits."""
@@ -57,10 +60,16 @@ class QuantityLimitResult(BaseModel):
 
 
 class QuantityLimitManager:
-    """Manage quantity limits."""
+    """Manage quantity limits.
+
+    GPI-prefix limits are found through a prefix index over the limit
+    identifiers, built on first use, extended by add_limit and dropped by
+    remove_limit.
+    """
 
     def __init__(self) -> None:
         self.limits: dict[str, list[QuantityLimit]] = {}  # keyed by drug identifier
+        self._identifier_index: GPIPrefixIndex[str] | None = None
         self._load_default_limits()
 
     def _load_default_limits(self) -> None:
@@ -145,8 +154,22 @@ class QuantityLimitManager:
         """Add a quantity limit."""
         if limit.drug_identifier not in self.limits:
             self.limits[limit.drug_identifier] = []
+            if self._identifier_index is not None:
+                self._identifier_index.add(limit.drug_identifier, limit.drug_identifier)
         self.limits[limit.drug_identifier].append(limit)
 
+    def remove_limit(self, limit_id: str) -> bool:
+        """Remove a quantity limit by ID."""
+        for identifier, limits in self.limits.items():
+            for position, limit in enumerate(limits):
+                if limit.limit_id == limit_id:
+                    del limits[position]
+                    if not limits:
+                        del self.limits[identifier]
+                        self._identifier_index = None
+                    return True
+        return False
+
     def find_limits_for_drug(
         self, ndc: str, gpi: str | None = None
     ) -> list[QuantityLimit]:
@@ -159,22 +182,33 @@ class QuantityLimitManager:
 
         # Check GPI-based limits
         if gpi:
-            for identifier, limits in self.limits.items():
-                if gpi.startswith(identifier):
-                    applicable_limits.extend(limits)
+            for identifier in self._identifiers().match(gpi):
+                applicable_limits.extend(self.limits.get(identifier, ()))
 
         return applicable_limits
 
+    def _identifiers(self) -> GPIPrefixIndex[str]:
+        """Prefix index of limit identifiers, in the order they were added."""
+        if self._identifier_index is None:
+            self._identifier_index = GPIPrefixIndex(
+                (identifier, identifier) for identifier in self.limits
+            )
+        return self._identifier_index
+
     def check_quantity_limit(
         self,
         ndc: str,
         gpi: str | None,
         requested_quantity: Decimal,
         requested_days_supply: int,
-        claim_history: list | None = None,
+        claim_history: list | FillHistory | None = None,
         service_date: date | None = None,
     ) -> QuantityLimitResult:
-        """Check if requested quantity is within limits."""
+        """Check if requested quantity is within limits.
+
+        Accumulating limits sum earlier fills of the NDC; pass the member's
+        FillHistory to total the period without scanning every claim.
+        """
         limits = self.find_limits_for_drug(ndc, gpi)
 
         if not limits:
@@ -197,7 +231,7 @@ class QuantityLimitManager:
                 ndc,
                 requested_quantity,
                 requested_days_supply,
-                claim_history or [],
+                claim_history if claim_history is not None else [],
                 service_date or date.today(),
             )
 
@@ -226,7 +260,7 @@ class QuantityLimitManager:
         ndc: str,
         requested_quantity: Decimal,
         requested_days_supply: int,
-        claim_history: list,
+        claim_history: list | FillHistory,
         service_date: date,
     ) -> QuantityLimitResult:
         """Check a single quantity limit."""
@@ -337,21 +371,17 @@ class QuantityLimitManager:
         ndc: str,
         requested_quantity: Decimal,
         requested_days_supply: int,
-        claim_history: list,
+        claim_history: list | FillHistory,
         service_date: date,
     ) -> QuantityLimitResult:
         """Check accumulating quantity limit (monthly/yearly)."""
         period_start = service_date - timedelta(days=limit.period_days)
 
         # Sum quantity in period
-        quantity_used = Decimal("0")
-        for claim in claim_history:
-            claim_ndc = getattr(claim, "ndc", None)
-            claim_date = getattr(claim, "service_date", None)
-            claim_qty = getattr(claim, "quantity_dispensed", Decimal("0"))
-
-            if claim_ndc == ndc and claim_date and claim_date >= period_start:
-                quantity_used += claim_qty
+        if isinstance(claim_history, FillHistory):
+            quantity_used = claim_history.quantity_between(period_start, ndc=ndc)
+        else:
+            quantity_used = self._scan_quantity(claim_history, ndc, period_start)
 
         remaining = (
             (limit.max_quantity - quantity_used)
@@ -380,3 +410,16 @@ class QuantityLimitManager:
                 f"Remaining: {remaining}"
             ),
         )
+
+    @staticmethod
+    def _scan_quantity(claim_history: list, ndc: str, period_start: date) -> Decimal:
+        """Quantity of an NDC dispensed since a date, from a list of claims."""
+        quantity_used = Decimal("0")
+        for claim in claim_history:
+            claim_ndc = getattr(claim, "ndc", None)
+            claim_date = getattr(claim, "service_date", None)
+            claim_qty = getattr(claim, "quantity_dispensed", Decimal("0"))
+
+            if claim_ndc == ndc and claim_date and claim_date >= period_start:
+                quantity_used += claim_qty
+        return quantity_used
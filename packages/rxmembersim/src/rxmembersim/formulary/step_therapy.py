@@ -3,6 +3,8 @@ from datetime import date, timedelta
 
 from pydantic import BaseModel, Field
 
+from rxmembersim.core.gpi import GPIPrefixIndex
+
 
 class StepTherapyStep(BaseModel):
     """Single step in step therapy protocol."""
@@ -151,6 +153,8 @@ class StepTherapyManager:
 
     def __init__(self) -> None:
         self.protocols: dict[str, StepTherapyProtocol] = {}
+        # Built on first use; add_protocol and remove_protocol drop it
+        self._target_index: GPIPrefixIndex[StepTherapyProtocol] | None = None
         self._load_default_protocols()
 
     def _load_default_protocols(self) -> None:
@@ -276,6 +280,14 @@ class StepTherapyManager:
     def add_protocol(self, protocol: StepTherapyProtocol) -> None:
         """Add a step therapy protocol."""
         self.protocols[protocol.protocol_id] = protocol
+        self._target_index = None
+
+    def remove_protocol(self, protocol_id: str) -> bool:
+        """Remove a step therapy protocol."""
+        if self.protocols.pop(protocol_id, None) is None:
+            return False
+        self._target_index = None
+        return True
 
     def get_protocol(self, protocol_id: str) -> StepTherapyProtocol | None:
         """Get protocol by ID."""
@@ -283,11 +295,17 @@ class StepTherapyManager:
 
     def find_protocol_for_drug(self, ndc: str) -> StepTherapyProtocol | None:
         """Find step therapy protocol for a drug."""
-        for protocol in self.protocols.values():
-            for target in protocol.target_drugs:
-                if ndc == target or ndc.startswith(target):
-                    return protocol
-        return None
+        return self._targets().first(ndc)
+
+    def _targets(self) -> GPIPrefixIndex[StepTherapyProtocol]:
+        """Prefix index of protocol target drugs (NDCs or NDC prefixes)."""
+        if self._target_index is None:
+            self._target_index = GPIPrefixIndex(
+                (target, protocol)
+                for protocol in self.protocols.values()
+                for target in protocol.target_drugs
+            )
+        return self._target_index
 
     def check_step_therapy(
         self,
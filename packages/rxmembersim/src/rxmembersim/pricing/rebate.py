@@ -1,11 +1,19 @@
 """Pharmaceutical rebate models."""
 
+from collections.abc import Iterable
 from datetime import date
 from decimal import Decimal
 from enum import Enum
+from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, Field
 
+from rxmembersim.core.gpi import GPIPrefixIndex
+
+if TYPE_CHECKING:
+    import duckdb
+    import pandas as pd
+
 
 class RebateType(str, Enum):
     """Type of rebate arrangement."""
@@ -110,14 +118,32 @@ class PeriodRebateSummary(BaseModel):
 
 
 class RebateCalculator:
-    """Calculate rebates based on contracts."""
+    """Calculate rebates based on contracts.
+
+    Contracts are found through an NDC dict and a GPI prefix index, built on
+    first use and rebuilt after add_contract or remove_contract.
+    """
 
     def __init__(self, contracts: list[RebateContract] | None = None) -> None:
         self.contracts: list[RebateContract] = contracts or []
+        self._indexed = False
+        self._by_ndc: dict[str, list[int]] = {}
+        self._by_gpi: GPIPrefixIndex[int] = GPIPrefixIndex()
+        self._by_id: dict[str, RebateContract] = {}
 
     def add_contract(self, contract: RebateContract) -> None:
         """Add a rebate contract."""
         self.contracts.append(contract)
+        self._indexed = False
+
+    def remove_contract(self, contract_id: str) -> bool:
+        """Remove a rebate contract."""
+        for position, contract in enumerate(self.contracts):
+            if contract.contract_id == contract_id:
+                del self.contracts[position]
+                self._indexed = False
+                return True
+        return False
 
     def calculate_claim_rebate(
         self,
@@ -172,42 +198,164 @@ class RebateCalculator:
         period_end: date | None = None,
     ) -> list[PeriodRebateSummary]:
         """Calculate rebates for a period of claims."""
-        summaries: list[PeriodRebateSummary] = []
-
-        # Group claims by contract
-        contract_claims: dict[str, list[dict]] = {}
+        # Totals by drug: (ndc, gpi) -> [claims, ingredient cost, quantity]
+        totals: dict[tuple[str, str | None], list] = {}
         for claim in claims:
-            ndc = claim.get("ndc", "")
-            gpi = claim.get("gpi")
+            key = (claim.get("ndc", ""), claim.get("gpi"))
+            drug_totals = totals.get(key)
+            if drug_totals is None:
+                drug_totals = totals[key] = [0, Decimal("0"), Decimal("0")]
+            drug_totals[0] += 1
+            drug_totals[1] += Decimal(str(claim.get("ingredient_cost", 0)))
+            drug_totals[2] += Decimal(str(claim.get("quantity", 0)))
+
+        return self._summarize(
+            ((ndc, gpi, *drug_totals) for (ndc, gpi), drug_totals in totals.items()),
+            market_share,
+            period_start,
+            period_end,
+        )
+
+    def calculate_period_rebate_frame(
+        self,
+        claims: "pd.DataFrame",
+        market_share: Decimal | None = None,
+        period_start: date | None = None,
+        period_end: date | None = None,
+    ) -> list[PeriodRebateSummary]:
+        """Calculate period rebates over a claims table.
+
+        Same result as calculate_period_rebate for the same claims, but the
+        claims are grouped by drug with a pandas group-by, and contracts are
+        looked up once per drug rather than once per claim.
+
+        Args:
+            claims: DataFrame with ndc, ingredient_cost and quantity columns
+                and an optional gpi column. Amounts are summed exactly as
+                Decimal(str(value)); float columns whose values have at
+                most two (ingredient cost) or three (quantity) decimals are
+                summed as scaled integers, with the same result.
+            market_share: Market share for market-share tiered contracts
+            period_start: Start of the period
+            period_end: End of the period
+
+        Returns:
+            One summary per contract, in order of each contract's first claim
+        """
+        frame = claims.assign(
+            gpi=claims.get("gpi"),
+            ingredient_cost=_scaled(claims["ingredient_cost"], 2),
+            quantity=_scaled(claims["quantity"], 3),
+        )
+        grouped = frame.groupby(["ndc", "gpi"], sort=False, dropna=False).agg(
+            claims=("ndc", "size"),
+            ingredient_cost=("ingredient_cost", "sum"),
+            quantity=("quantity", "sum"),
+        )
+        return self._summarize(
+            (
+                (
+                    ndc,
+                    gpi if isinstance(gpi, str) else None,
+                    int(count),
+                    _unscaled(ingredient_cost, 2),
+                    _unscaled(quantity, 3),
+                )
+                for (ndc, gpi), count, ingredient_cost, quantity in zip(
+                    grouped.index,
+                    grouped["claims"],
+                    grouped["ingredient_cost"],
+                    grouped["quantity"],
+                    strict=True,
+                )
+            ),
+            market_share,
+            period_start,
+            period_end,
+        )
+
+    def calculate_period_rebate_db(
+        self,
+        conn: "duckdb.DuckDBPyConnection",
+        period_start: date,
+        period_end: date,
+        cohort_id: str | None = None,
+        market_share: Decimal | None = None,
+    ) -> list[PeriodRebateSummary]:
+        """Calculate period rebates directly over the pharmacy_claims table.
+
+        Claims are totalled by NDC inside DuckDB (DECIMAL sums, so exact),
+        and only one row per NDC comes back to Python. pharmacy_claims has
+        no GPI column, so only contracts' covered NDCs match.
+
+        Args:
+            conn: DuckDB connection holding the canonical tables
+            period_start: First service date in the period
+            period_end: Last service date in the period
+            cohort_id: Only claims of this cohort
+            market_share: Market share for market-share tiered contracts
+
+        Returns:
+            One summary per contract
+        """
+        sql = """
+            SELECT ndc, count(*), sum(ingredient_cost_submitted), sum(quantity_dispensed)
+            FROM pharmacy_claims
+            WHERE service_date BETWEEN ? AND ?
+        """
+        parameters: list[Any] = [period_start, period_end]
+        if cohort_id is not None:
+            sql += " AND cohort_id = ?"
+            parameters.append(cohort_id)
+        rows = conn.execute(sql + " GROUP BY ndc ORDER BY ndc", parameters).fetchall()
+        return self._summarize(
+            (
+                (ndc, None, count, ingredient_cost or Decimal("0"), quantity or Decimal("0"))
+                for ndc, count, ingredient_cost, quantity in rows
+            ),
+            market_share,
+            period_start,
+            period_end,
+        )
+
+    def _summarize(
+        self,
+        drug_totals: Iterable[tuple[str, str | None, int, Decimal, Decimal]],
+        market_share: Decimal | None,
+        period_start: date | None,
+        period_end: date | None,
+    ) -> list[PeriodRebateSummary]:
+        """Roll per-drug totals up to contracts and price each contract's tier.
+
+        Args:
+            drug_totals: (ndc, gpi, claims, ingredient cost, quantity) per drug
+        """
+        # Totals by contract: contract_id -> [claims, ingredient cost, quantity]
+        contract_totals: dict[str, list] = {}
+        for ndc, gpi, count, ingredient_cost, quantity in drug_totals:
             contract = self._find_contract(ndc, gpi)
-            if contract:
-                if contract.contract_id not in contract_claims:
-                    contract_claims[contract.contract_id] = []
-                contract_claims[contract.contract_id].append(claim)
-
-        # Calculate rebates for each contract
-        for contract_id, contract_claim_list in contract_claims.items():
-            contract = next(
-                (c for c in self.contracts if c.contract_id == contract_id), None
-            )
+            if not contract:
+                continue
+            totals = contract_totals.get(contract.contract_id)
+            if totals is None:
+                totals = contract_totals[contract.contract_id] = [0, Decimal("0"), Decimal("0")]
+            totals[0] += count
+            totals[1] += ingredient_cost
+            totals[2] += quantity
+
+        summaries: list[PeriodRebateSummary] = []
+        for contract_id, (claim_count, total_ingredient, total_quantity) in (
+            contract_totals.items()
+        ):
+            contract = self._contracts_by_id().get(contract_id)
             if not contract:
                 continue
 
             # Determine tier based on market share or volume
-            tier = self._determine_tier(
-                contract, market_share, len(contract_claim_list)
-            )
+            tier = self._determine_tier(contract, market_share, claim_count)
             if not tier:
                 tier = contract.tiers[0]
 
-            # Calculate totals
-            total_ingredient = sum(
-                Decimal(str(c.get("ingredient_cost", 0))) for c in contract_claim_list
-            )
-            total_quantity = sum(
-                Decimal(str(c.get("quantity", 0))) for c in contract_claim_list
-            )
-
             # Calculate gross rebate
             if tier.rebate_type == "percentage":
                 gross_rebate = total_ingredient * (tier.rebate_value / 100)
@@ -235,7 +383,7 @@ class RebateCalculator:
                     manufacturer_name=contract.manufacturer_name,
                     period_start=period_start or date.today(),
                     period_end=period_end or date.today(),
-                    total_claims=len(contract_claim_list),
+                    total_claims=claim_count,
                     total_ingredient_cost=total_ingredient,
                     total_quantity=total_quantity,
                     gross_rebate=gross_rebate,
@@ -255,26 +403,44 @@ class RebateCalculator:
     ) -> RebateContract | None:
         """Find applicable contract for a drug."""
         check_date = service_date or date.today()
+        self._ensure_index()
+
+        # Contract positions covering the NDC or a prefix of the GPI
+        positions = list(self._by_ndc.get(ndc, ()))
+        if gpi:
+            positions.extend(self._by_gpi.match(gpi))
+            positions.sort()
 
-        for contract in self.contracts:
+        for position in positions:
+            contract = self.contracts[position]
             # Check date validity
             if contract.effective_date > check_date:
                 continue
             if contract.termination_date and contract.termination_date < check_date:
                 continue
-
-            # Check NDC match
-            if ndc in contract.covered_ndcs:
-                return contract
-
-            # Check GPI prefix match
-            if gpi:
-                for gpi_prefix in contract.covered_gpis:
-                    if gpi.startswith(gpi_prefix):
-                        return contract
+            return contract
 
         return None
 
+    def _ensure_index(self) -> None:
+        """Index contracts by NDC and GPI prefix unless already indexed."""
+        if self._indexed:
+            return
+        self._by_ndc = {}
+        self._by_gpi = GPIPrefixIndex()
+        self._by_id = {}
+        for position, contract in enumerate(self.contracts):
+            for ndc in contract.covered_ndcs:
+                self._by_ndc.setdefault(ndc, []).append(position)
+            for gpi_prefix in contract.covered_gpis:
+                self._by_gpi.add(gpi_prefix, position)
+            self._by_id.setdefault(contract.contract_id, contract)
+        self._indexed = True
+
+    def _contracts_by_id(self) -> dict[str, RebateContract]:
+        self._ensure_index()
+        return self._by_id
+
     def _determine_tier(
         self,
         contract: RebateContract,
@@ -297,6 +463,34 @@ class RebateCalculator:
         return contract.tiers[0] if contract.tiers else None
 
 
+def _scaled(column: "pd.Series", places: int) -> "pd.Series":
+    """Amounts as integers in units of 10**-places, or as Decimals, for exact sums.
+
+    Each amount equals Decimal(str(value)), as in calculate_period_rebate.
+    A float column takes the integer path only when every value is the
+    float nearest to a whole number of units, i.e. prints with at most
+    ``places`` decimals; otherwise its values are converted to Decimal.
+    """
+    kind = column.dtype.kind
+    if kind == "f":
+        column = column.fillna(0)
+        units = (column * 10**places).round()
+        if (units / 10**places).eq(column).all() and units.abs().max() < 10**15:
+            return units.astype("int64")
+    elif kind in "iub":
+        return column.astype("int64") * 10**places
+    return column.fillna(0).map(
+        lambda value: value if isinstance(value, Decimal) else Decimal(str(value))
+    )
+
+
+def _unscaled(total: Any, places: int) -> Decimal:
+    """Decimal from a sum of _scaled values."""
+    if isinstance(total, Decimal):
+        return total
+    return Decimal(int(total)).scaleb(-places)
+
+
 class SampleRebateContracts:
     """Sample rebate contracts for simulation."""
 
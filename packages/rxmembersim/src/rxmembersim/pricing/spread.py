@@ -1,11 +1,16 @@
 """PBM spread pricing models."""
 
+from collections.abc import Iterable
 from datetime import date
 from decimal import Decimal
 from enum import Enum
+from typing import TYPE_CHECKING, NamedTuple
 
 from pydantic import BaseModel, Field
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class SpreadType(str, Enum):
     """Type of spread pricing arrangement."""
@@ -144,6 +149,23 @@ class PeriodSpreadSummary(BaseModel):
     by_channel: list[dict] = Field(default_factory=list)
 
 
+class _SpreadAmounts(NamedTuple):
+    """Per-claim spread arithmetic, before it is wrapped in a SpreadCalculation."""
+
+    total_awp: Decimal
+    pharmacy_ingredient: Decimal
+    pharmacy_dispensing_fee: Decimal
+    pharmacy_total: Decimal
+    client_ingredient: Decimal
+    client_dispensing_fee: Decimal
+    client_total: Decimal
+    ingredient_spread: Decimal
+    dispensing_spread: Decimal
+    total_spread: Decimal
+    admin_fee: Decimal
+    net_margin: Decimal
+
+
 class SpreadCalculator:
     """Calculate spread pricing."""
 
@@ -173,6 +195,45 @@ class SpreadCalculator:
         drug_name: str | None = None,
     ) -> SpreadCalculation:
         """Calculate spread for a single claim."""
+        amounts = self._claim_amounts(awp, quantity, is_brand, is_specialty)
+        pharmacy_total = amounts.pharmacy_total
+        spread_pct = (
+            (amounts.total_spread / pharmacy_total * Decimal("100")).quantize(Decimal("0.01"))
+            if pharmacy_total
+            else Decimal("0")
+        )
+
+        return SpreadCalculation(
+            claim_id=claim_id,
+            ndc=ndc,
+            drug_name=drug_name,
+            channel=channel,
+            is_brand=is_brand,
+            is_specialty=is_specialty,
+            awp=amounts.total_awp,
+            quantity=quantity,
+            pharmacy_ingredient_cost=amounts.pharmacy_ingredient,
+            pharmacy_dispensing_fee=amounts.pharmacy_dispensing_fee,
+            pharmacy_total=pharmacy_total,
+            client_ingredient_cost=amounts.client_ingredient,
+            client_dispensing_fee=amounts.client_dispensing_fee,
+            client_total=amounts.client_total,
+            ingredient_spread=amounts.ingredient_spread,
+            dispensing_fee_spread=amounts.dispensing_spread,
+            total_spread=amounts.total_spread,
+            spread_percentage=spread_pct,
+            admin_fee=amounts.admin_fee,
+            net_margin=amounts.net_margin,
+        )
+
+    def _claim_amounts(
+        self,
+        awp: Decimal,
+        quantity: Decimal,
+        is_brand: bool,
+        is_specialty: bool,
+    ) -> _SpreadAmounts:
+        """Pharmacy and client pricing, spread and admin fee for one claim."""
         # Determine pricing type
         if is_specialty:
             pharm_discount = self.pharmacy_terms.specialty_awp_discount
@@ -208,12 +269,6 @@ class SpreadCalculator:
         dispensing_spread = client_disp_fee - pharm_disp_fee
         total_spread = ingredient_spread + dispensing_spread
 
-        spread_pct = (
-            (total_spread / pharmacy_total * Decimal("100")).quantize(Decimal("0.01"))
-            if pharmacy_total
-            else Decimal("0")
-        )
-
         # Admin fee for pass-through
         admin_fee = Decimal("0")
         if self.spread_config.spread_type in (
@@ -227,27 +282,19 @@ class SpreadCalculator:
 
         net_margin = total_spread + admin_fee
 
-        return SpreadCalculation(
-            claim_id=claim_id,
-            ndc=ndc,
-            drug_name=drug_name,
-            channel=channel,
-            is_brand=is_brand,
-            is_specialty=is_specialty,
-            awp=total_awp,
-            quantity=quantity,
-            pharmacy_ingredient_cost=pharmacy_ingredient,
-            pharmacy_dispensing_fee=pharm_disp_fee,
-            pharmacy_total=pharmacy_total,
-            client_ingredient_cost=client_ingredient,
-            client_dispensing_fee=client_disp_fee,
-            client_total=client_total,
-            ingredient_spread=ingredient_spread,
-            dispensing_fee_spread=dispensing_spread,
-            total_spread=total_spread,
-            spread_percentage=spread_pct,
-            admin_fee=admin_fee,
-            net_margin=net_margin,
+        return _SpreadAmounts(
+            total_awp,
+            pharmacy_ingredient,
+            pharm_disp_fee,
+            pharmacy_total,
+            client_ingredient,
+            client_disp_fee,
+            client_total,
+            ingredient_spread,
+            dispensing_spread,
+            total_spread,
+            admin_fee,
+            net_margin,
         )
 
     def calculate_period_spread(
@@ -257,33 +304,91 @@ class SpreadCalculator:
         period_end: date | None = None,
     ) -> PeriodSpreadSummary:
         """Calculate spread summary for a period of claims."""
-        calculations: list[SpreadCalculation] = []
-
+        # Claims with the same price terms price the same: count them once
+        counts: dict[tuple[Decimal, Decimal, bool, bool], int] = {}
         for claim in claims:
-            calc = self.calculate_claim_spread(
-                ndc=claim.get("ndc", ""),
-                awp=Decimal(str(claim.get("awp", 0))),
-                quantity=Decimal(str(claim.get("quantity", 1))),
-                is_brand=claim.get("is_brand", False),
-                is_specialty=claim.get("is_specialty", False),
-                channel=claim.get("channel", ChannelType.RETAIL),
+            key = (
+                Decimal(str(claim.get("awp", 0))),
+                Decimal(str(claim.get("quantity", 1))),
+                bool(claim.get("is_brand", False)),
+                bool(claim.get("is_specialty", False)),
             )
-            calculations.append(calc)
+            counts[key] = counts.get(key, 0) + 1
+
+        return self._summarize(counts.items(), period_start, period_end)
 
-        # Aggregate
-        total_claims = len(calculations)
-        brand_claims = sum(1 for c in calculations if c.is_brand and not c.is_specialty)
-        generic_claims = sum(
-            1 for c in calculations if not c.is_brand and not c.is_specialty
+    def calculate_period_spread_frame(
+        self,
+        claims: "pd.DataFrame",
+        period_start: date | None = None,
+        period_end: date | None = None,
+    ) -> PeriodSpreadSummary:
+        """Calculate the period spread summary over a claims table.
+
+        Same result as calculate_period_spread for the same claims. Claims
+        are counted per (awp, quantity, is_brand, is_specialty) with a pandas
+        group-by and each distinct combination is priced once, so the cost
+        grows with the number of distinct prices rather than claims.
+
+        Args:
+            claims: DataFrame with an awp column and optional quantity
+                (default 1), is_brand and is_specialty (default False) columns
+            period_start: Start of the period
+            period_end: End of the period
+
+        Returns:
+            PeriodSpreadSummary for the claims
+        """
+        frame = claims.assign(
+            quantity=claims.get("quantity", 1),
+            is_brand=claims.get("is_brand", False),
+            is_specialty=claims.get("is_specialty", False),
+        ).fillna({"awp": 0, "quantity": 1, "is_brand": False, "is_specialty": False})
+        counts = frame.groupby(
+            ["awp", "quantity", "is_brand", "is_specialty"], sort=False
+        ).size()
+        return self._summarize(
+            (
+                (
+                    (Decimal(str(awp)), Decimal(str(quantity)), bool(is_brand), bool(is_specialty)),
+                    int(count),
+                )
+                for (awp, quantity, is_brand, is_specialty), count in counts.items()
+            ),
+            period_start,
+            period_end,
         )
-        specialty_claims = sum(1 for c in calculations if c.is_specialty)
-
-        total_awp = sum(c.awp for c in calculations)
-        total_pharmacy = sum(c.pharmacy_total for c in calculations)
-        total_client = sum(c.client_total for c in calculations)
-        total_spread = sum(c.total_spread for c in calculations)
-        total_admin = sum(c.admin_fee for c in calculations)
-        net_margin = sum(c.net_margin for c in calculations)
+
+    def _summarize(
+        self,
+        counts: Iterable[tuple[tuple[Decimal, Decimal, bool, bool], int]],
+        period_start: date | None,
+        period_end: date | None,
+    ) -> PeriodSpreadSummary:
+        """Price each distinct (awp, quantity, is_brand, is_specialty) and total it.
+
+        Args:
+            counts: ((awp, quantity, is_brand, is_specialty), claims) pairs
+        """
+        total_claims = brand_claims = generic_claims = specialty_claims = 0
+        total_awp = total_pharmacy = total_client = Decimal("0")
+        total_spread = total_admin = net_margin = Decimal("0")
+
+        for (awp, quantity, is_brand, is_specialty), count in counts:
+            amounts = self._claim_amounts(awp, quantity, is_brand, is_specialty)
+            total_claims += count
+            if is_specialty:
+                specialty_claims += count
+            elif is_brand:
+                brand_claims += count
+            else:
+                generic_claims += count
+            total_awp += amounts.total_awp * count
+            total_pharmacy += amounts.pharmacy_total * count
+            total_client += amounts.client_total * count
+            total_spread += amounts.total_spread * count
+            total_admin += amounts.admin_fee * count
+            net_margin += amounts.net_margin * count
 
         avg_spread = (
             (total_spread / total_claims).quantize(Decimal("0.01"))
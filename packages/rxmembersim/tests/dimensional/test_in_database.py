@@ -0,0 +1,89 @@
+"""Tests for the RxMemberSim in-database dimensional transformer."""
+
+import pytest
+from healthsim.db import DatabaseConnection
+
+from rxmembersim.dimensional import RxMemberSimInDatabaseTransformer
+
+
+@pytest.fixture
+def conn(tmp_path):
+    """Canonical database with one RxMemberSim cohort."""
+    db = DatabaseConnection(tmp_path / "test.duckdb")
+    conn = db.connect()
+    conn.execute("INSERT INTO cohorts (id, name) VALUES ('c-1', 'pbm')")
+    conn.execute(
+        """
+        INSERT INTO prescriptions (prescription_number, member_id, ndc, drug_name,
+            quantity_prescribed, days_supply, prescriber_npi, prescriber_name,
+            prescriber_dea, written_date, expiration_date, cohort_id)
+        VALUES
+            ('RX1', 'M1', '00093-7214-01', 'Atorvastatin 20mg', 30, 30, '1234567890',
+             'Dr. Smith', 'AS1234567', '2024-01-01', '2025-01-01', 'c-1')
+        """
+    )
+    conn.execute(
+        """
+        INSERT INTO pharmacy_claims (claim_id, transaction_code, service_date, pharmacy_npi,
+            pharmacy_ncpdp, member_id, cardholder_id, bin, pcn, group_number,
+            prescription_number, fill_number, ndc, quantity_dispensed, days_supply,
+            prescriber_npi, ingredient_cost_submitted, gross_amount_due, cohort_id)
+        VALUES
+            ('C1', 'B1', '2024-01-02', '9999999999', '1234567', 'M1', 'CH1', '610014',
+             'PCN', 'GRP', 'RX1', 0, '00093-7214-01', 30, 30, '1234567890', 12.5, 14.0,
+             'c-1'),
+            ('C2', 'B1', '2024-02-01', '9999999999', NULL, 'M1', 'CH1', '610014',
+             'PCN', 'GRP', 'RX1', 1, '00093721401', 30, 30, '5555555555', 12.5, 14.0,
+             'c-1')
+        """
+    )
+    yield conn
+    db.close()
+
+
+class TestRxMemberSimInDatabaseTransformer:
+    """Tests for RxMemberSimInDatabaseTransformer."""
+
+    def test_builds_all_tables(self, conn):
+        counts = RxMemberSimInDatabaseTransformer(conn, cohort="pbm").build()
+
+        assert counts == {
+            "dim_medication": 1,
+            "dim_pharmacy": 1,
+            "dim_prescriber": 2,
+            "fact_prescription_fills": 2,
+        }
+
+    def test_ndc_normalized_and_enriched(self, conn):
+        RxMemberSimInDatabaseTransformer(conn).build(["dim_medication"])
+
+        row = conn.execute(
+            "SELECT medication_key, ndc_11, ndc_10, drug_name FROM analytics.dim_medication"
+        ).fetchone()
+        assert row == (1, "00093721401", "0009372141", "Atorvastatin 20mg")
+
+    def test_prescriber_names_from_prescriptions(self, conn):
+        RxMemberSimInDatabaseTransformer(conn).build(["dim_prescriber"])
+
+        rows = conn.execute(
+            "SELECT prescriber_npi, dea_number, full_name FROM analytics.dim_prescriber"
+        ).fetchall()
+        assert rows == [
+            ("1234567890", "AS1234567", "Dr. Smith"),
+            ("5555555555", None, "5555555555"),
+        ]
+
+    def test_fact_prescription_fills(self, conn):
+        RxMemberSimInDatabaseTransformer(conn, cohort="pbm").build()
+
+        rows = conn.execute(
+            """
+            SELECT claim_id, pharmacy_key, prescriber_key, medication_key, service_date_key,
+                is_new_fill, is_refill, has_prior_auth
+            FROM analytics.fact_prescription_fills
+            """
+        ).fetchall()
+        assert rows == [
+            ("C1", 1, 1, 1, 20240102, True, False, False),
+            ("C2", 1, 2, 1, 20240201, False, True, False),
+        ]
@@ -414,6 +414,7 @@ class TestRxMemberSimDimensionalTransformer:
         dim_member = dimensions["dim_rx_member"]
         assert dim_member.iloc[0]["age_at_snapshot"] == 44
         assert dim_member.iloc[0]["age_band"] == "35-49"
+        assert dim_member["age_band"].dtype == "str"
 
     def test_therapeutic_category_lookup(self):
         """Test therapeutic category lookup from GPI."""
@@ -1,6 +1,6 @@
 """Tests for prior authorization module."""
 
-from datetime import date
+from datetime import date, timedelta
 from decimal import Decimal
 
 from rxmembersim.authorization.criteria import (
@@ -208,6 +208,37 @@ class TestPriorAuthWorkflow:
 
         assert existing is None
 
+    def test_existing_auth_index(self) -> None:
+        """Existing auths are matched by member, NDC and date across many records."""
+        workflow = PriorAuthWorkflow()
+        requests = {}
+        for member in range(50):
+            for ndc in ("00169413512", "00591024601"):
+                request = workflow.create_request(
+                    member_id=f"MEM{member:03d}",
+                    cardholder_id="CARD001",
+                    ndc=ndc,
+                    drug_name="Drug",
+                    quantity=Decimal("1"),
+                    days_supply=28,
+                    prescriber_npi="1234567890",
+                    prescriber_name="Dr. Smith",
+                )
+                requests[(member, ndc)] = request
+                workflow.approve(request, duration_days=30)
+
+        today = date.today()
+        found = workflow.check_existing_auth("MEM007", "00591024601", today)
+        assert found is not None
+        assert found.pa_request_id == requests[(7, "00591024601")].pa_request_id
+        assert workflow.check_existing_auth("MEM007", "00591024601", today + timedelta(days=31)) is None
+        assert workflow.check_existing_auth("MEM007", "00591024601", today - timedelta(days=1)) is None
+
+        # A later denial of the same request replaces the approval
+        workflow.deny(requests[(7, "00591024601")], PADenialReason.CRITERIA_NOT_MET)
+        assert workflow.check_existing_auth("MEM007", "00591024601", today) is None
+        assert workflow.check_existing_auth("MEM008", "00591024601", today) is not None
+
 
 class TestClinicalCriteria:
     """Tests for clinical criteria evaluation."""
@@ -0,0 +1,248 @@
+"""Tests for batch claim adjudication."""
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from healthsim.benefits import AccumulatorEngine, create_integrated_accumulators
+
+from rxmembersim.claims import BatchAdjudicator
+from rxmembersim.claims.adjudication import AdjudicationEngine
+from rxmembersim.claims.claim import PharmacyClaim, TransactionCode
+from rxmembersim.core.member import BenefitAccumulators, MemberDemographics, RxMember
+from rxmembersim.dur.rules import ClinicalSignificance, DrugDrugInteraction, DURRulesEngine
+from rxmembersim.formulary.formulary import FormularyGenerator
+
+WARFARIN = "00056017270"
+ELIQUIS = "00597002860"
+LIPITOR = "00069015430"  # requires PA
+
+
+def make_member(member_id: str = "MEM001") -> RxMember:
+    return RxMember(
+        member_id=member_id,
+        cardholder_id="CH001",
+        person_code="01",
+        bin="610014",
+        pcn="RXTEST",
+        group_number="GRP001",
+        demographics=MemberDemographics(
+            first_name="John",
+            last_name="Doe",
+            date_of_birth=date(1980, 5, 15),
+            gender="M",
+        ),
+        effective_date=date(2025, 1, 1),
+        accumulators=BenefitAccumulators(
+            deductible_remaining=Decimal("250"),
+            oop_remaining=Decimal("3000"),
+        ),
+    )
+
+
+def make_claim(
+    claim_id: str,
+    member_id: str = "MEM001",
+    ndc: str = "00071015523",
+    service_date: date = date(2025, 1, 15),
+    **overrides,
+) -> PharmacyClaim:
+    fields = {
+        "claim_id": claim_id,
+        "transaction_code": TransactionCode.BILLING,
+        "service_date": service_date,
+        "pharmacy_npi": "1234567890",
+        "member_id": member_id,
+        "cardholder_id": "CH001",
+        "person_code": "01",
+        "bin": "610014",
+        "pcn": "RXTEST",
+        "group_number": "GRP001",
+        "prescription_number": "RX123",
+        "fill_number": 1,
+        "ndc": ndc,
+        "quantity_dispensed": Decimal("30"),
+        "days_supply": 30,
+        "daw_code": "0",
+        "prescriber_npi": "0987654321",
+        "ingredient_cost_submitted": Decimal("150.00"),
+        "dispensing_fee_submitted": Decimal("2.50"),
+        "usual_customary_charge": Decimal("175.00"),
+        "gross_amount_due": Decimal("152.50"),
+    }
+    fields.update(overrides)
+    return PharmacyClaim(**fields)
+
+
+class TestBatchAdjudicator:
+    """Tests for BatchAdjudicator."""
+
+    @pytest.fixture
+    def formulary(self):
+        return FormularyGenerator().generate_standard_commercial()
+
+    def test_matches_single_claim_engine(self, formulary) -> None:
+        """A member's first claim prices the same as AdjudicationEngine."""
+        claim = make_claim("CLM001")
+        expected = AdjudicationEngine(formulary=formulary).adjudicate(claim, make_member())
+
+        result = BatchAdjudicator(formulary=formulary).adjudicate(
+            [claim], {"MEM001": make_member()}
+        )
+        response = result.responses()[0]
+
+        assert response.response_status == "P"
+        for name in (
+            "ingredient_cost_paid",
+            "dispensing_fee_paid",
+            "total_amount_paid",
+            "patient_pay_amount",
+            "copay_amount",
+            "deductible_amount",
+            "remaining_deductible",
+            "remaining_oop",
+        ):
+            assert getattr(response, name) == getattr(expected, name)
+        assert response.authorization_number.startswith("AUTH")
+
+    def test_matches_single_claim_engine_through_oop_maximum(self, formulary) -> None:
+        """Claims that reach and pass the OOP maximum price as AdjudicationEngine does."""
+        member = make_member()
+        member.accumulators = BenefitAccumulators(
+            deductible_remaining=Decimal("100"), oop_remaining=Decimal("115")
+        )
+        claims = [make_claim(f"CLM{i}", service_date=date(2025, 1 + i, 1)) for i in range(3)]
+        engine = AdjudicationEngine(formulary=formulary)
+        expected = []
+        for claim in claims:
+            response = engine.adjudicate(claim, member)
+            expected.append(response)
+            member.accumulators = member.accumulators.apply(
+                response.deductible_amount, response.patient_pay_amount
+            )
+
+        batch_member = make_member()
+        batch_member.accumulators = BenefitAccumulators(
+            deductible_remaining=Decimal("100"), oop_remaining=Decimal("115")
+        )
+        result = BatchAdjudicator(formulary=formulary).adjudicate(
+            claims, {"MEM001": batch_member}
+        )
+
+        fields = (
+            "total_amount_paid",
+            "patient_pay_amount",
+            "copay_amount",
+            "deductible_amount",
+            "remaining_deductible",
+            "remaining_oop",
+        )
+        actual = [tuple(getattr(r, name) for name in fields) for r in result.responses()]
+        assert actual == [tuple(getattr(r, name) for name in fields) for r in expected]
+        patient_pays = [r.patient_pay_amount for r in expected]
+        assert patient_pays == [Decimal("110"), Decimal("5"), Decimal("0")]
+        assert batch_member.accumulators == member.accumulators
+
+    def test_accumulators_carry_across_claims(self, formulary) -> None:
+        """Each paid claim draws down the member's deductible in order."""
+        member = make_member()
+        claims = [make_claim(f"CLM{i}", service_date=date(2025, 1 + i, 1)) for i in range(3)]
+
+        result = BatchAdjudicator(formulary=formulary, batch_size=2).adjudicate(
+            claims, {"MEM001": member}
+        )
+
+        deductibles = [payment.deductible_amount for payment in result.payments]
+        assert deductibles == [Decimal("152.50"), Decimal("97.50"), Decimal("0")]
+        assert member.accumulators.deductible_remaining == Decimal("0")
+        assert member.accumulators.deductible_met == Decimal("250")
+        assert result.payments[-1].remaining_deductible == Decimal("0")
+
+    def test_family_deductible_with_engine(self, formulary) -> None:
+        """Members loaded under one family ID share the family deductible."""
+        engine = AccumulatorEngine()
+        for member_id in ("MEM001", "MEM002"):
+            engine.load(
+                create_integrated_accumulators(
+                    member_id=member_id,
+                    plan_year=2025,
+                    deductible_individual=Decimal("250"),
+                    deductible_family=Decimal("300"),
+                    oop_individual=Decimal("3000"),
+                    oop_family=Decimal("6000"),
+                ),
+                family_id="FAM001",
+            )
+        members = {"MEM001": make_member("MEM001"), "MEM002": make_member("MEM002")}
+        claims = [
+            make_claim("CLM1", member_id="MEM001", service_date=date(2025, 1, 1)),
+            make_claim("CLM2", member_id="MEM002", service_date=date(2025, 1, 2)),
+            make_claim("CLM3", member_id="MEM001", service_date=date(2025, 1, 3)),
+        ]
+
+        result = BatchAdjudicator(formulary=formulary, accumulators=engine).adjudicate(
+            claims, members
+        )
+
+        deductibles = [payment.deductible_amount for payment in result.payments]
+        assert deductibles == [Decimal("152.50"), Decimal("152.50"), Decimal("0")]
+        assert engine.is_deductible_met("MEM001")
+        assert members["MEM001"].accumulators.deductible_remaining == Decimal("0")
+        assert members["MEM001"].accumulators.deductible_met == Decimal("152.50")
+
+    def test_rejects(self, formulary) -> None:
+        """Eligibility, formulary and PA rejects carry NCPDP codes."""
+        claims = [
+            make_claim("UNKNOWN", member_id="NOBODY"),
+            make_claim("BADBIN", bin="999999"),
+            make_claim("NOTCOVERED", ndc="99999999999"),
+            make_claim("NEEDSPA", ndc=LIPITOR),
+            make_claim("HASPA", ndc=LIPITOR, prior_auth_number="PA123"),
+        ]
+
+        result = BatchAdjudicator(formulary=formulary).adjudicate(
+            claims, {"MEM001": make_member()}
+        )
+
+        assert result.reject_codes == [["52"], ["25"], ["70"], ["75"], None]
+        assert result.stats.claims == 5
+        assert result.stats.paid == 1
+        assert result.stats.reject_counts["75"] == 1
+        assert result.stats.claims_per_second > 0
+        assert [r.response_status for r in result.responses()] == ["R", "R", "R", "R", "P"]
+
+    def test_major_dur_alert_rejects_without_override(self, formulary) -> None:
+        """A level 1 DUR alert against an active fill rejects with 88."""
+        dur_rules = DURRulesEngine()
+        dur_rules.load_drug_interactions(
+            [
+                DrugDrugInteraction(
+                    interaction_id="DD-ANTICOAG",
+                    drug1_gpi="8330",
+                    drug2_gpi="8337",
+                    drug1_name="Warfarin",
+                    drug2_name="Apixaban",
+                    interaction_description="Additive anticoagulation",
+                    clinical_effect="Bleeding risk",
+                    clinical_significance=ClinicalSignificance.LEVEL_1,
+                    recommendation="Avoid combination",
+                )
+            ]
+        )
+        claims = [
+            make_claim("WARFARIN", ndc=WARFARIN),
+            make_claim("ELIQUIS", ndc=ELIQUIS, service_date=date(2025, 1, 20)),
+            make_claim(
+                "OVERRIDE",
+                ndc=ELIQUIS,
+                service_date=date(2025, 1, 21),
+                dur_result_of_service="1B",
+            ),
+        ]
+
+        result = BatchAdjudicator(formulary=formulary, dur_rules=dur_rules).adjudicate(
+            claims, {"MEM001": make_member()}
+        )
+
+        assert result.reject_codes == [None, ["88"], None]
+        assert result.dur_alerts[1]
+        assert result.responses()[1].dur_alerts[0].clinical_significance == "1"
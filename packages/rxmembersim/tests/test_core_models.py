@@ -3,10 +3,12 @@ from datetime import date
 from decimal import Decimal
 
 import pytest
+from healthsim.benefits import AccumulatorEngine, BenefitType
 
 from rxmembersim.claims.adjudication import AdjudicationEngine
 from rxmembersim.claims.claim import PharmacyClaim, TransactionCode
 from rxmembersim.core.drug import DEASchedule, DrugReference
+from rxmembersim.core.fill_history import FillHistory, FillRecord
 from rxmembersim.core.member import (
     BenefitAccumulators,
     MemberDemographics,
@@ -51,6 +53,25 @@ class TestRxMember:
         assert member.pcn == "CUSTOM"
         assert member.group_number == "TEST01"
 
+    def test_accumulators_engine_round_trip(self) -> None:
+        """Test loading accumulators into an engine and reading them back."""
+        accumulators = BenefitAccumulators(
+            deductible_met=Decimal("100"),
+            deductible_remaining=Decimal("150"),
+            oop_met=Decimal("400"),
+            oop_remaining=Decimal("2600"),
+        )
+        engine = AccumulatorEngine()
+        accumulators.load_into(engine, "MEM001", 2025)
+        engine.apply_deductible("MEM001", 5000, benefit_type=BenefitType.PHARMACY)
+
+        restored = BenefitAccumulators.from_engine(engine, "MEM001")
+
+        assert restored.deductible_met == Decimal("150")
+        assert restored.deductible_remaining == Decimal("100")
+        assert restored.oop_met == Decimal("400")
+        assert restored.oop_remaining == Decimal("2600")
+
 
 class TestDrugReference:
     """Tests for DrugReference model."""
@@ -278,3 +299,83 @@ class TestAdjudicationEngine:
         # With $250 deductible and $152.50 claim, full deductible applies
         assert response.deductible_amount is not None
         assert response.deductible_amount <= member.accumulators.deductible_remaining
+
+
+class TestFillHistory:
+    """Tests for FillHistory."""
+
+    @staticmethod
+    def fill(ndc: str, gpi: str, day: date, days_supply: int = 30, qty: str = "30") -> FillRecord:
+        return FillRecord(ndc, gpi, ndc, day, days_supply, Decimal(qty))
+
+    def test_window_totals(self) -> None:
+        """Window totals match summing the fills dated in the window."""
+        fills = [
+            self.fill("A", "39400010000310", date(2025, month, 1), qty=str(month))
+            for month in range(1, 13)
+        ]
+        history = FillHistory()
+        # Added out of order: the index keeps dates sorted
+        for fill in reversed(fills):
+            history.add(fill)
+
+        start, end = date(2025, 3, 1), date(2025, 6, 30)
+        assert history.quantity_between(start, end, ndc="A") == Decimal("18")
+        assert history.days_supply_between(start, end, ndc="A") == 120
+        assert history.quantity_between(date(2025, 11, 15), ndc="A") == Decimal("12")
+        assert history.quantity_between(ndc="B") == Decimal("0")
+        assert history.fills(start, end) == fills[2:6]
+        assert history.last_fill(ndc="A") == fills[-1]
+
+    def test_gpi_prefix_index(self) -> None:
+        """GPI prefix queries cover fills added before and after the first query."""
+        history = FillHistory(
+            [
+                self.fill("A", "39400010000310", date(2025, 1, 1)),
+                self.fill("B", "39400050000310", date(2025, 1, 5)),
+                self.fill("C", "27100030000310", date(2025, 1, 9)),
+            ]
+        )
+        assert history.quantity_between(gpi="3940") == Decimal("60")
+
+        history.add(self.fill("D", "39400020000310", date(2025, 2, 1)))
+        assert history.quantity_between(gpi="3940") == Decimal("90")
+        assert [f.ndc for f in history.fills(gpi="3940")] == ["A", "B", "D"]
+
+    def test_active_fills(self) -> None:
+        """Active fills are those whose supply covers the date."""
+        history = FillHistory(
+            [
+                self.fill("A", "", date(2025, 1, 1), days_supply=90),
+                self.fill("B", "", date(2025, 2, 1), days_supply=30),
+                self.fill("C", "", date(2025, 3, 10), days_supply=30),
+            ]
+        )
+        assert [f.ndc for f in history.active_fills(date(2025, 3, 5))] == ["A"]
+        assert [f.ndc for f in history.active_fills(date(2025, 3, 10))] == ["A", "C"]
+
+    def test_adherence(self) -> None:
+        """MPR sums days supplied; PDC shifts overlapping supply forward."""
+        history = FillHistory(
+            [
+                self.fill("A", "", date(2024, 12, 17)),  # 15 days into January
+                self.fill("A", "", date(2025, 1, 11)),  # early: carries to Feb 14
+                self.fill("A", "", date(2025, 3, 1)),
+            ]
+        )
+        start, end = date(2025, 1, 1), date(2025, 3, 31)
+
+        assert history.medication_possession_ratio(start, end, ndc="A") == 60 / 90
+        # Jan 1-Feb 14 (45 days) and Mar 1-30 (30 days)
+        assert history.proportion_of_days_covered(start, end, ndc="A") == 75 / 90
+
+    def test_from_claims(self) -> None:
+        """Histories build from claim dicts and objects."""
+        history = FillHistory.from_claims(
+            [
+                {"ndc": "A", "service_date": date(2025, 1, 1), "days_supply": 30},
+                {"ndc": "A"},
+            ]
+        )
+        assert len(history) == 1
+        assert history.last_fill(ndc="A").quantity_dispensed == Decimal("0")
@@ -1,12 +1,17 @@
 """Tests for DUR module."""
+import random
 from datetime import date, timedelta
 
+from rxmembersim.core.fill_history import FillHistory, FillRecord
 from rxmembersim.dur.alerts import DURAlertFormatter, DUROverrideManager
 from rxmembersim.dur.rules import (
+    AgeRestriction,
     ClinicalSignificance,
+    DrugDrugInteraction,
     DURAlert,
     DURAlertType,
     DURRulesEngine,
+    TherapeuticDuplication,
 )
 from rxmembersim.dur.validator import (
     DURValidationRequest,
@@ -174,6 +179,29 @@ class TestDURRulesEngine:
 
         assert alert is None
 
+    def test_early_refill_from_fill_history(self) -> None:
+        """Early refill uses the most recent fill of the NDC in a FillHistory."""
+        engine = DURRulesEngine()
+        today = date.today()
+        history = FillHistory(
+            [
+                FillRecord("00071015523", "", "Atorvastatin 10mg", today - timedelta(days=5), 30, 30),
+                FillRecord("00071015523", "", "Atorvastatin 10mg", today - timedelta(days=40), 30, 30),
+                FillRecord("00071015540", "", "Atorvastatin 20mg", today, 30, 30),
+            ]
+        )
+
+        alert = engine.check_early_refill(
+            ndc="00071015523",
+            drug_name="Atorvastatin 10mg",
+            service_date=today,
+            previous_fills=history,
+        )
+
+        assert alert is not None
+        assert "25 days early" in alert.message
+        assert engine.check_early_refill("00000000000", "Other", today, history) is None
+
     def test_age_restriction_violated(self) -> None:
         """Test age restriction violation."""
         engine = DURRulesEngine()
@@ -229,6 +257,123 @@ class TestDURRulesEngine:
         assert alert is None
 
 
+def _random_gpi(rng: random.Random, length: int = 14) -> str:
+    return "".join(rng.choice("0123456789") for _ in range(length))
+
+
+class TestDURRuleIndexes:
+    """GPI prefix indexes give the same alerts as a scan of every rule."""
+
+    @staticmethod
+    def _scan_interactions(
+        engine: DURRulesEngine, new_gpi: str, meds: list[dict]
+    ) -> list[tuple[str, str]]:
+        found = []
+        for med in meds:
+            for rule in engine.drug_interactions:
+                if (
+                    new_gpi.startswith(rule.drug1_gpi) and med["gpi"].startswith(rule.drug2_gpi)
+                ) or (
+                    new_gpi.startswith(rule.drug2_gpi) and med["gpi"].startswith(rule.drug1_gpi)
+                ):
+                    found.append((med["ndc"], rule.interaction_description))
+        return found
+
+    def test_large_interaction_file_matches_scan(self, tmp_path) -> None:
+        """Thousands of loaded pairs alert exactly like the pairwise scan."""
+        rng = random.Random(7)
+        path = tmp_path / "interactions.csv"
+        lines = [
+            "interaction_id,drug1_gpi,drug2_gpi,drug1_name,drug2_name,"
+            "interaction_description,clinical_effect,clinical_significance,recommendation"
+        ]
+        for i in range(5000):
+            gpi1 = _random_gpi(rng, rng.choice([2, 4, 6, 8]))
+            gpi2 = _random_gpi(rng, rng.choice([2, 4, 6, 8]))
+            lines.append(f"DD-X{i},{gpi1},{gpi2},A,B,Interaction {i},Effect,2,Monitor")
+        path.write_text("\n".join(lines) + "\n")
+
+        engine = DURRulesEngine()
+        assert engine.load_drug_interactions(path) == 5000
+        assert len(engine.drug_interactions) == 5010
+
+        for _ in range(50):
+            meds = [
+                {"ndc": f"{n:011d}", "gpi": _random_gpi(rng), "name": f"Med {n}"}
+                for n in range(rng.randint(0, 8))
+            ]
+            new_gpi = _random_gpi(rng)
+            alerts = engine.check_drug_drug_interactions(new_gpi, "00000000001", "New", meds)
+            assert [(a.drug2_ndc, a.message) for a in alerts] == self._scan_interactions(
+                engine, new_gpi, meds
+            )
+
+    def test_interaction_matching_both_directions_alerts_once(self) -> None:
+        """A pair within one class is reported once per medication."""
+        engine = DURRulesEngine()
+        engine.load_drug_interactions(
+            [
+                DrugDrugInteraction(
+                    interaction_id="DD-SELF",
+                    drug1_gpi="72",
+                    drug2_gpi="7260",
+                    drug1_name="Anticonvulsants",
+                    drug2_name="Hydantoins",
+                    interaction_description="Additive CNS effects",
+                    clinical_effect="Sedation",
+                    clinical_significance=ClinicalSignificance.LEVEL_2,
+                    recommendation="Monitor",
+                )
+            ],
+            replace=True,
+        )
+
+        alerts = engine.check_drug_drug_interactions(
+            new_drug_gpi="72600030000110",
+            new_drug_ndc="00000000001",
+            new_drug_name="Phenytoin",
+            current_medications=[{"ndc": "2", "gpi": "72600020000110", "name": "Fosphenytoin"}],
+        )
+
+        assert len(alerts) == 1
+
+    def test_duplication_rules_added_after_first_check(self) -> None:
+        """Adding a rule rebuilds the index."""
+        engine = DURRulesEngine()
+        meds = [{"ndc": "1", "gpi": "44200010000110", "name": "Albuterol"}]
+
+        assert engine.check_therapeutic_duplication("44200020000110", "2", "Levalbuterol", meds) == []
+
+        engine.add_rule(
+            TherapeuticDuplication(
+                duplication_id="TD-100",
+                gpi_class="4420",
+                class_name="Beta Agonists",
+            )
+        )
+        alerts = engine.check_therapeutic_duplication("44200020000110", "2", "Levalbuterol", meds)
+
+        assert len(alerts) == 1
+        assert alerts[0].drug2_gpi == "44200010000110"
+
+    def test_rule_replaced_in_place(self) -> None:
+        """A rule replaced in place is matched after refresh_indexes."""
+        engine = DURRulesEngine()
+        assert engine.check_age_restriction("65100020201020", "1", "Adderall", 70)
+
+        engine.age_restrictions[0] = AgeRestriction(
+            restriction_id="AGE-001",
+            drug_gpi="6510",
+            drug_name="CNS Stimulants",
+            min_age=6,
+            max_age=80,
+            message="CNS stimulants: typically ages 6-80",
+        )
+        engine.refresh_indexes()
+
+        assert engine.check_age_restriction("65100020201020", "1", "Adderall", 70) is None
+
+
 class TestDURValidator:
     """Tests for DUR Validator."""
 
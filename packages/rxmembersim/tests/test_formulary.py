@@ -1,7 +1,9 @@
 """Tests for formulary module."""
+import pickle
 from datetime import date, timedelta
 from decimal import Decimal
 
+from rxmembersim.core.fill_history import FillHistory, FillRecord
 from rxmembersim.formulary.formulary import (
     Formulary,
     FormularyDrug,
@@ -15,6 +17,8 @@ from rxmembersim.formulary.quantity_limit import (
 )
 from rxmembersim.formulary.step_therapy import (
     StepTherapyManager,
+    StepTherapyProtocol,
+    StepTherapyStep,
 )
 
 
@@ -130,6 +134,87 @@ class TestFormulary:
         statins = formulary.get_drugs_by_gpi("3940")
         assert len(statins) > 0
 
+    def test_lookups_follow_drug_changes(self) -> None:
+        """Indexed queries match a scan of the drugs dict as drugs change."""
+        formulary = FormularyGenerator().generate_standard_commercial()
+        formulary.get_drugs_by_tier(1)
+
+        formulary.add_drug(
+            FormularyDrug(ndc="00071015523", gpi="39400010000310", drug_name="A", tier=2)
+        )
+        formulary.add_drug(
+            FormularyDrug(
+                ndc="11111111111", gpi="39400099000310", drug_name="B", tier=1, requires_pa=True
+            )
+        )
+        formulary.remove_drug("00069015430")
+
+        drugs = list(formulary.drugs.values())
+        assert formulary.get_drugs_by_gpi("3940") == [d for d in drugs if d.gpi.startswith("3940")]
+        assert formulary.get_drugs_by_gpi("394000") == [
+            d for d in drugs if d.gpi.startswith("394000")
+        ]
+        assert formulary.get_drugs_by_tier(1) == [d for d in drugs if d.tier == 1]
+        assert formulary.get_drugs_requiring_pa() == [d for d in drugs if d.requires_pa]
+        assert formulary.check_coverage("00071015523").tier_name == "Non-Preferred Generic"
+        assert formulary.get_tier(5).tier_name == "Specialty"
+
+        # Replacing the drugs dict rebuilds the index
+        formulary.drugs = {}
+        assert formulary.get_drugs_by_tier(1) == []
+        assert formulary.check_coverage("00071015523").covered is False
+
+    def test_lookups_follow_direct_and_tier_changes(self) -> None:
+        """Indexed queries and memoized statuses follow dict writes and tier changes."""
+        formulary = FormularyGenerator().generate_standard_commercial()
+        assert formulary.get_drugs_requiring_pa()
+        assert formulary.check_coverage("00071015523").copay == Decimal("10")
+
+        formulary.drugs["00071015523"] = FormularyDrug(
+            ndc="00071015523", gpi="39400010000310", drug_name="A", tier=1, requires_pa=True
+        )
+        assert formulary.get_drugs_requiring_pa()[0].ndc == "00071015523"
+        assert formulary.check_coverage("00071015523").requires_pa is True
+
+        formulary.add_tier(
+            FormularyTier(tier_number=1, tier_name="Value Generic", copay_amount=Decimal("5"))
+        )
+        status = formulary.check_coverage("00071015523")
+        assert (status.tier_name, status.copay) == ("Value Generic", Decimal("5"))
+        assert len(formulary.tiers) == 5
+
+        formulary.add_tier(FormularyTier(tier_number=6, tier_name="Excluded"))
+        assert formulary.get_tier(6).tier_name == "Excluded"
+
+        formulary.tiers = [FormularyTier(tier_number=1, tier_name="Only", copay_amount=Decimal("1"))]
+        assert formulary.check_coverage("00071015523").copay == Decimal("1")
+        assert formulary.get_tier(5) is None
+
+        del formulary.drugs["00071015523"]
+        assert formulary.check_coverage("00071015523").covered is False
+
+    def test_coverage_statuses_not_shared(self) -> None:
+        """Each check_coverage call returns its own status."""
+        formulary = FormularyGenerator().generate_standard_commercial()
+        status = formulary.check_coverage("00071015523")
+        status.preferred_alternatives.append("00071015540")
+        status.covered = False
+
+        assert formulary.check_coverage("00071015523").covered is True
+        assert formulary.check_coverage("00071015523").preferred_alternatives == []
+
+    def test_pickle_omits_index(self) -> None:
+        """Pickled formularies carry their drugs but not the lookup index."""
+        formulary = FormularyGenerator().generate_standard_commercial()
+        formulary.get_drugs_by_gpi("3940")
+
+        data = pickle.dumps(formulary)
+        restored = pickle.loads(data)
+
+        assert b"_FormularyIndex" not in data
+        assert restored == formulary
+        assert restored.get_drugs_by_gpi("3940") == formulary.get_drugs_by_gpi("3940")
+
 
 class TestFormularyGenerator:
     """Tests for FormularyGenerator."""
@@ -233,6 +318,40 @@ class TestStepTherapy:
         protocol = manager.find_protocol_for_drug("00071015523")  # Generic statin
         assert protocol is None
 
+    def test_find_protocol_added_later(self) -> None:
+        """Protocols added after a lookup are found, NDC prefixes included."""
+        manager = StepTherapyManager()
+        assert manager.find_protocol_for_drug("12345678901") is None
+
+        manager.add_protocol(
+            StepTherapyProtocol(
+                protocol_id="TEST-ST",
+                protocol_name="Test",
+                target_drugs=["12345"],
+                steps=[
+                    StepTherapyStep(step_number=1, step_name="Generic", required_drugs=["4940"])
+                ],
+            )
+        )
+
+        protocol = manager.find_protocol_for_drug("12345678901")
+        assert protocol is not None
+        assert protocol.protocol_id == "TEST-ST"
+        assert manager.find_protocol_for_drug("00186077831").protocol_id == "PPI-ST"
+
+    def test_find_protocol_after_replacement(self) -> None:
+        """A protocol removed and replaced by another is found by its new targets."""
+        manager = StepTherapyManager()
+        protocol = manager.get_protocol("PPI-ST")
+        assert manager.find_protocol_for_drug("00186077831") is protocol
+
+        assert manager.remove_protocol("PPI-ST") is True
+        manager.add_protocol(protocol.model_copy(update={"target_drugs": ["12345"]}))
+
+        assert manager.find_protocol_for_drug("00186077831") is None
+        assert manager.find_protocol_for_drug("12345678901").protocol_id == "PPI-ST"
+        assert manager.remove_protocol("NO-SUCH-ST") is False
+
 
 class TestQuantityLimit:
     """Tests for Quantity Limits."""
@@ -333,3 +452,77 @@ class TestQuantityLimit:
 
         assert result.passed is True
         assert "No quantity limits apply" in result.message
+
+    def test_accumulating_limit_with_fill_history(self) -> None:
+        """Accumulating limits total a FillHistory the same as a claim list."""
+        manager = QuantityLimitManager()
+        manager.add_limit(
+            QuantityLimit(
+                limit_id="TEST-TRIPTAN",
+                drug_identifier="00000000001",
+                limit_type=QuantityLimitType.PER_MONTH,
+                max_quantity=Decimal("9"),
+                period_days=30,
+            )
+        )
+        service_date = date(2025, 6, 30)
+        fills = [
+            FillRecord("00000000001", "", "Triptan", service_date - timedelta(days=days), 30, qty)
+            for days, qty in ((45, Decimal("9")), (20, Decimal("3")), (5, Decimal("2")))
+        ]
+        fills.append(FillRecord("00000000002", "", "Other", service_date, 30, Decimal("9")))
+
+        results = [
+            manager.check_quantity_limit(
+                ndc="00000000001",
+                gpi=None,
+                requested_quantity=Decimal("4"),
+                requested_days_supply=30,
+                claim_history=history,
+                service_date=service_date,
+            )
+            for history in (fills, FillHistory(fills))
+        ]
+
+        assert results[0] == results[1]
+        assert results[1].passed is True
+        assert results[1].quantity_used_in_period == Decimal("5")
+
+    def test_gpi_limits_in_identifier_order(self) -> None:
+        """GPI prefix limits are found for every matching level, in the order added."""
+        manager = QuantityLimitManager()
+        manager.add_limit(
+            QuantityLimit(
+                limit_id="CLASS-QL",
+                drug_identifier="5830",
+                limit_type=QuantityLimitType.MAX_DAYS_SUPPLY,
+                max_days_supply=30,
+            )
+        )
+        manager.add_limit(
+            QuantityLimit(
+                limit_id="DRUG-QL",
+                drug_identifier="58300010",
+                limit_type=QuantityLimitType.PER_FILL,
+                max_quantity=Decimal("6"),
+            )
+        )
+
+        limits = manager.find_limits_for_drug("00000000001", "58300010000310")
+
+        assert [limit.limit_id for limit in limits] == ["TRIPTAN-QL", "CLASS-QL", "DRUG-QL"]
+        assert manager.find_limits_for_drug("00000000001", "58400000000000") == []
+
+    def test_limit_replaced_after_lookup(self) -> None:
+        """A limit removed and replaced under another identifier is found there."""
+        manager = QuantityLimitManager()
+        limit = manager.find_limits_for_drug("00000000001", "58300010000310")[0]
+
+        assert manager.remove_limit(limit.limit_id) is True
+        manager.add_limit(limit.model_copy(update={"drug_identifier": "5840"}))
+
+        assert manager.find_limits_for_drug("00000000001", "58300010000310") == []
+        assert manager.find_limits_for_drug("00000000001", "58400000000000") == [
+            manager.limits["5840"][0]
+        ]
+        assert manager.remove_limit("NO-SUCH-QL") is False
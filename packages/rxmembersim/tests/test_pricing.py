@@ -0,0 +1,200 @@
+"""Tests for pricing module."""
+from datetime import date
+from decimal import Decimal
+
+import pandas as pd
+from healthsim.db import DatabaseConnection
+
+from rxmembersim.pricing.rebate import (
+    RebateCalculator,
+    RebateContract,
+    RebateTier,
+    RebateType,
+    SampleRebateContracts,
+)
+from rxmembersim.pricing.spread import SampleSpreadConfigs, SpreadCalculator
+
+
+class TestRebateCalculator:
+    """Tests for RebateCalculator."""
+
+    def test_contract_lookup_by_ndc_and_gpi(self) -> None:
+        """Contracts match an NDC or a GPI prefix, first valid contract first."""
+        calculator = RebateCalculator(
+            [SampleRebateContracts.brand_statin(), SampleRebateContracts.glp1_agonist()]
+        )
+
+        by_ndc = calculator.calculate_claim_rebate(
+            "00069015430", Decimal("100"), Decimal("30"), service_date=date(2025, 3, 1)
+        )
+        by_gpi = calculator.calculate_claim_rebate(
+            "00000000000",
+            Decimal("100"),
+            Decimal("1"),
+            gpi="27200060003120",
+            service_date=date(2025, 3, 1),
+        )
+
+        assert by_ndc.contract_id == "REBATE-STATIN-001"
+        assert by_ndc.rebate_amount == Decimal("15.00")
+        assert by_gpi.contract_id == "REBATE-GLP1-001"
+        assert calculator.calculate_claim_rebate(
+            "00069015430", Decimal("100"), Decimal("30"), service_date=date(2024, 12, 31)
+        ) is None
+
+    def test_contract_added_later_and_date_ranges(self) -> None:
+        """Added contracts are indexed; expired contracts fall through to the next."""
+        calculator = RebateCalculator()
+        assert calculator.calculate_claim_rebate("11111111111", Decimal("100"), Decimal("1")) is None
+
+        for contract_id, start, end, rate in (
+            ("OLD", date(2024, 1, 1), date(2024, 12, 31), "5"),
+            ("NEW", date(2025, 1, 1), None, "8"),
+        ):
+            calculator.add_contract(
+                RebateContract(
+                    contract_id=contract_id,
+                    manufacturer_id="MFR",
+                    manufacturer_name="Maker",
+                    contract_type=RebateType.ACCESS,
+                    effective_date=start,
+                    termination_date=end,
+                    covered_gpis=["6510"],
+                    tiers=[
+                        RebateTier(
+                            tier_number=1, rebate_type="percentage", rebate_value=Decimal(rate)
+                        )
+                    ],
+                )
+            )
+
+        def contract_on(day: date) -> str:
+            rebate = calculator.calculate_claim_rebate(
+                "11111111111", Decimal("100"), Decimal("1"), gpi="65100020201020", service_date=day
+            )
+            return rebate.contract_id
+
+        assert contract_on(date(2024, 6, 1)) == "OLD"
+        assert contract_on(date(2025, 6, 1)) == "NEW"
+
+    def test_contract_replaced_after_lookup(self) -> None:
+        """A contract removed and replaced is looked up by its new coverage."""
+        statin = SampleRebateContracts.brand_statin()
+        calculator = RebateCalculator([statin])
+        assert calculator.calculate_claim_rebate("00069015430", Decimal("100"), Decimal("30"))
+
+        assert calculator.remove_contract(statin.contract_id) is True
+        calculator.add_contract(statin.model_copy(update={"covered_ndcs": ["00069015440"]}))
+
+        assert calculator.calculate_claim_rebate("00069015430", Decimal("100"), Decimal("30")) is None
+        assert calculator.calculate_claim_rebate("00069015440", Decimal("100"), Decimal("30"))
+        assert calculator.remove_contract("NO-SUCH-CONTRACT") is False
+
+    def test_period_rebate_frame_matches_list(self) -> None:
+        """The DataFrame path gives the same summaries as the list path."""
+        calculator = RebateCalculator(
+            [SampleRebateContracts.brand_statin(), SampleRebateContracts.glp1_agonist()]
+        )
+        claims = [
+            {"ndc": "00069015430", "ingredient_cost": 120.10, "quantity": 30},
+            {
+                "ndc": "11111111111",
+                "gpi": "27200060003120",
+                "ingredient_cost": 800.05,
+                "quantity": 1.5,
+            },
+            {"ndc": "00069015430", "ingredient_cost": 99.99, "quantity": 90},
+            {"ndc": "22222222222", "ingredient_cost": 10.00, "quantity": 30},
+        ]
+
+        expected = calculator.calculate_period_rebate(claims, market_share=Decimal("35"))
+        summaries = calculator.calculate_period_rebate_frame(
+            pd.DataFrame(claims), market_share=Decimal("35")
+        )
+
+        assert [s.contract_id for s in summaries] == ["REBATE-STATIN-001", "REBATE-GLP1-001"]
+        assert summaries[0].total_claims == 2
+        assert summaries[0].total_ingredient_cost == Decimal("220.09")
+        assert summaries[0].gross_rebate == Decimal("55.02")
+        for summary, list_summary in zip(summaries, expected, strict=True):
+            assert summary.model_dump(exclude={"period_start", "period_end"}) == (
+                list_summary.model_dump(exclude={"period_start", "period_end"})
+            )
+
+    def test_period_rebate_frame_sub_cent_amounts(self) -> None:
+        """Float amounts finer than a cent sum as in the list path."""
+        calculator = RebateCalculator([SampleRebateContracts.brand_statin()])
+        claims = [
+            {"ndc": "00069015430", "ingredient_cost": 0.004, "quantity": 0.0004}
+            for _ in range(3)
+        ]
+
+        expected = calculator.calculate_period_rebate(claims, market_share=Decimal("35"))
+        summaries = calculator.calculate_period_rebate_frame(
+            pd.DataFrame(claims), market_share=Decimal("35")
+        )
+
+        assert summaries[0].total_ingredient_cost == Decimal("0.012")
+        assert summaries == expected
+
+    def test_period_rebate_db(self, tmp_path) -> None:
+        """Period rebates can be totalled directly over pharmacy_claims."""
+        db = DatabaseConnection(tmp_path / "test.duckdb")
+        conn = db.connect()
+        conn.execute("INSERT INTO cohorts (id, name) VALUES ('c-1', 'pbm'), ('c-2', 'other')")
+        for claim_id, ndc, service_date, cost, cohort in (
+            ("C1", "00069015430", "2025-01-10", 120.10, "c-1"),
+            ("C2", "00069015430", "2025-02-10", 99.99, "c-1"),
+            ("C3", "00069015430", "2025-05-10", 50.00, "c-1"),
+            ("C4", "00069015430", "2025-02-10", 75.00, "c-2"),
+        ):
+            conn.execute(
+                """
+                INSERT INTO pharmacy_claims (claim_id, transaction_code, service_date,
+                    pharmacy_npi, member_id, cardholder_id, bin, pcn, group_number,
+                    prescription_number, ndc, quantity_dispensed, days_supply,
+                    prescriber_npi, ingredient_cost_submitted, cohort_id)
+                VALUES (?, 'B1', ?, '9999999999', 'M1', 'CH1', '610014', 'PCN', 'GRP',
+                    'RX1', ?, 30, 30, '1234567890', ?, ?)
+                """,
+                [claim_id, service_date, ndc, cost, cohort],
+            )
+        calculator = RebateCalculator([SampleRebateContracts.brand_statin()])
+
+        summaries = calculator.calculate_period_rebate_db(
+            conn, date(2025, 1, 1), date(2025, 3, 31), cohort_id="c-1"
+        )
+        db.close()
+
+        assert len(summaries) == 1
+        assert summaries[0].total_claims == 2
+        assert summaries[0].total_ingredient_cost == Decimal("220.09")
+        assert summaries[0].total_quantity == Decimal("60")
+        assert summaries[0].period_end == date(2025, 3, 31)
+
+
+class TestSpreadCalculator:
+    """Tests for SpreadCalculator."""
+
+    def test_period_spread_frame_matches_list(self) -> None:
+        """The DataFrame path gives the same summary as the list path."""
+        calculator = SpreadCalculator(*SampleSpreadConfigs.pass_through())
+        claims = [
+            {"ndc": "1", "awp": 12.345, "quantity": 30, "is_brand": True},
+            {"ndc": "2", "awp": 0.87, "quantity": 90},
+            {"ndc": "1", "awp": 12.345, "quantity": 30, "is_brand": True},
+            {"ndc": "3", "awp": 410.0, "quantity": 1, "is_brand": True, "is_specialty": True},
+        ]
+
+        expected = calculator.calculate_period_spread(claims, date(2025, 1, 1), date(2025, 3, 31))
+        summary = calculator.calculate_period_spread_frame(
+            pd.DataFrame(claims), date(2025, 1, 1), date(2025, 3, 31)
+        )
+
+        assert summary == expected
+        assert (summary.brand_claims, summary.generic_claims, summary.specialty_claims) == (
+            2,
+            1,
+            1,
+        )
+        assert summary.total_admin_fees == Decimal("18.00")